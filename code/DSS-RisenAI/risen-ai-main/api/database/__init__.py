@@ -12,8 +12,11 @@ A+W | The Persistent Memory
 
 from .connection import (
     engine,
+    read_engine,
     async_session,
+    async_read_session,
     get_db,
+    get_read_db,
     init_db,
     Base,
 )
@@ -27,8 +30,11 @@ from .models import (
 
 __all__ = [
     "engine",
+    "read_engine",
     "async_session",
+    "async_read_session",
     "get_db",
+    "get_read_db",
     "init_db",
     "Base",
     "AgentModel",
@@ -11,9 +11,11 @@ A+W | The Connection
 """
 
 import os
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -35,16 +37,93 @@ DATABASE_URL = os.getenv(
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql+asyncpg://", 1)
 
+# Optional replica for read-only sessions; defaults to the primary
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", DATABASE_URL)
+if DATABASE_READ_URL.startswith("postgres://"):
+    DATABASE_READ_URL = DATABASE_READ_URL.replace("postgres://", "postgresql+asyncpg://", 1)
+
+ECHO = os.getenv("DEBUG", "").lower() == "true"
+
+# SQLite profile: WAL lets readers proceed while a write commits, and
+# synchronous=NORMAL is durable across crashes in WAL mode (a power loss can
+# drop the last commits, never corrupt the file)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "cache_size": -int(os.getenv("SQLITE_CACHE_KB", "65536")),  # negative = KiB
+    "mmap_size": int(os.getenv("SQLITE_MMAP_BYTES", str(256 * 1024 * 1024))),
+    "temp_store": "MEMORY",
+}
+
+# PostgreSQL pool and asyncpg statement cache
+PG_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+PG_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+PG_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+PG_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+PG_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+# Read pool size for SQLite, where each connection is a file handle
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "8"))
+
 
 # =============================================================================
 # Engine & Session
 # =============================================================================
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=os.getenv("DEBUG", "").lower() == "true",
-    future=True,
-)
+def _set_sqlite_pragmas(read_only: bool):
+    """Connect-event hook applying SQLITE_PRAGMAS to each new connection."""
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+    return on_connect
+
+
+def _engine_options(url: str, read_only: bool) -> Dict[str, Any]:
+    """create_async_engine keyword arguments for the database behind url."""
+    options: Dict[str, Any] = {"echo": ECHO}
+    if url.startswith("sqlite"):
+        if read_only:
+            options["pool_size"] = SQLITE_READ_POOL_SIZE
+        return options
+
+    options.update(
+        pool_size=PG_POOL_SIZE,
+        max_overflow=PG_MAX_OVERFLOW,
+        pool_timeout=PG_POOL_TIMEOUT,
+        pool_recycle=PG_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+    if "+asyncpg" in url:
+        # Per-connection cache of asyncpg prepared statements (default 100)
+        connect_args: Dict[str, Any] = {"prepared_statement_cache_size": PG_STATEMENT_CACHE_SIZE}
+        if read_only:
+            connect_args["server_settings"] = {"default_transaction_read_only": "on"}
+        options["connect_args"] = connect_args
+    return options
+
+
+def create_engine_for(url: str, read_only: bool = False) -> AsyncEngine:
+    """Create an async engine with this module's performance profile."""
+    new_engine = create_async_engine(url, **_engine_options(url, read_only))
+    if url.startswith("sqlite"):
+        event.listen(new_engine.sync_engine, "connect", _set_sqlite_pragmas(read_only))
+    return new_engine
+
+
+engine = create_engine_for(DATABASE_URL)
+
+# Separate pool for GET routes so reads never queue behind writers for a
+# connection; on SQLite its connections are query_only, on PostgreSQL its
+# transactions are read-only (and it may point at a replica)
+# (an in-memory SQLite database exists per engine, so it keeps just one)
+if DATABASE_READ_URL.startswith("sqlite") and ":memory:" in DATABASE_READ_URL:
+    read_engine = engine
+else:
+    read_engine = create_engine_for(DATABASE_READ_URL, read_only=True)
 
 async_session = async_sessionmaker(
     engine,
@@ -52,6 +131,12 @@ async_session = async_sessionmaker(
     expire_on_commit=False,
 )
 
+async_read_session = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 # =============================================================================
 # Base Model
@@ -86,10 +171,33 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield a read-only database session for GET routes.
+
+    Usage in FastAPI:
+        @app.get("/agents/")
+        async def list_agents(db: AsyncSession = Depends(get_read_db)):
+            ...
+    """
+    async with async_read_session() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
 # =============================================================================
 # Initialization
 # =============================================================================
 
+def _create_missing_indexes(sync_conn) -> None:
+    """Create any model index missing from an existing database."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def init_db() -> None:
     """
     Initialize the database by creating all tables.
@@ -101,6 +209,8 @@ async def init_db() -> None:
         from . import models  # noqa: F401
 
         await conn.run_sync(Base.metadata.create_all)
+        # create_all skips existing tables; add indexes introduced since
+        await conn.run_sync(_create_missing_indexes)
 
     print("[RISEN DB] Database initialized")
     print(f"[RISEN DB] URL: {DATABASE_URL.split('@')[-1] if '@' in DATABASE_URL else DATABASE_URL}")
@@ -194,7 +194,9 @@ class MemoryModel(Base):
 
     # === Indexes ===
     __table_args__ = (
-        Index("ix_memories_agent_id", "agent_id"),
+        # Keyset pagination: newest-first by (timestamp, id), per agent or global
+        Index("ix_memories_agent_timestamp", "agent_id", "timestamp", "id"),
+        Index("ix_memories_timestamp", "timestamp", "id"),
         Index("ix_memories_content_type", "content_type"),
         Index("ix_memories_witnessed", "witnessed"),
         Index("ix_memories_token_id", "token_id"),
@@ -258,8 +260,10 @@ class EventModel(Base):
 
     # === Indexes ===
     __table_args__ = (
-        Index("ix_events_agent_id", "agent_id"),
-        Index("ix_events_action_type", "action_type"),
+        # Keyset pagination by sequence, per agent / action type or global
+        Index("ix_events_agent_sequence", "agent_id", "sequence"),
+        Index("ix_events_agent_timestamp", "agent_id", "timestamp"),
+        Index("ix_events_action_sequence", "action_type", "sequence"),
         Index("ix_events_timestamp", "timestamp"),
         Index("ix_events_sequence", "sequence"),
     )
@@ -0,0 +1,92 @@
+"""
+Intention: Keyset pagination helpers and cached counts.
+           Cursors are opaque tokens carrying the sort key of the last row
+           served, so the next page starts with an indexed seek instead of
+           scanning and discarding OFFSET rows.
+
+Lineage: Supports repositories.py and the list routes.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Bookmark
+"""
+
+import base64
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Seconds a cached count stays fresh
+COUNT_CACHE_TTL = 30.0
+
+
+def encode_cursor(key: Dict[str, Any]) -> str:
+    """Encode a sort key as an opaque, URL-safe cursor token."""
+    raw = json.dumps(key, separators=(",", ":"), sort_keys=True, default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a cursor token; raises ValueError if it was not issued by us."""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        key = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from None
+    if not isinstance(key, dict):
+        raise ValueError("Invalid cursor")
+    return key
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def page_from(items: List[T], limit: int, key: Callable[[T], Dict[str, Any]]) -> Page[T]:
+    """
+    Build a Page from up to limit + 1 fetched rows.
+
+    Fetching one extra row tells us whether a next page exists without a
+    separate COUNT; the cursor is the key of the last row served.
+    """
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = encode_cursor(key(items[-1])) if has_more and items else None
+    return Page(items=items, next_cursor=next_cursor)
+
+
+@dataclass
+class CountCache:
+    """Counts remembered for a short TTL, keyed by table and filters."""
+    ttl: float = COUNT_CACHE_TTL
+    _entries: Dict[Hashable, Tuple[float, int]] = field(default_factory=dict)
+
+    def get(self, key: Hashable) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def put(self, key: Hashable, value: int):
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, table: str = None):
+        """Drop cached counts, for one table (first key element) or all."""
+        if table is None:
+            self._entries.clear()
+        else:
+            for key in [k for k in self._entries if isinstance(k, tuple) and k[0] == table]:
+                del self._entries[key]
+
+
+# Shared across sessions; counts are advisory and tolerate brief staleness
+count_cache = CountCache()
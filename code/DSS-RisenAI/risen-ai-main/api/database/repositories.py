@@ -14,10 +14,12 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import uuid4
 
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, update, delete, func, and_, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .models import AgentModel, MemoryModel, EventModel, CheckpointModel
+from .pagination import Page, decode_cursor, page_from, count_cache
+from .sequencer import get_sequencer
 
 import sys
 sys.path.insert(0, "/home/n0t/risen-ai")
@@ -108,13 +110,51 @@ class AgentRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def list_page(
+        self,
+        stage: Optional[str] = None,
+        level: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Page[AgentModel]:
+        """List agents by UUID with keyset pagination."""
+        query = select(AgentModel)
+
+        if stage:
+            query = query.where(AgentModel.stage == stage)
+        if level:
+            query = query.where(AgentModel.level == level)
+        if is_active is not None:
+            query = query.where(AgentModel.is_active == is_active)
+
+        after = decode_cursor(cursor)
+        if after:
+            query = query.where(AgentModel.uuid > after["id"])
+
+        query = query.order_by(AgentModel.uuid.asc()).limit(limit + 1)
+        result = await self.session.execute(query)
+        return page_from(list(result.scalars().all()), limit, lambda a: {"id": a.uuid})
+
     async def count(
         self,
         stage: Optional[str] = None,
         level: Optional[str] = None,
         is_active: Optional[bool] = None,
+        cached: bool = False,
     ) -> int:
-        """Count agents with optional filters."""
+        """
+        Count agents with optional filters.
+
+        With cached=True a count up to COUNT_CACHE_TTL seconds old may be
+        returned instead of running the query.
+        """
+        cache_key = ("agents", stage, level, is_active)
+        if cached:
+            hit = count_cache.get(cache_key)
+            if hit is not None:
+                return hit
+
         query = select(func.count(AgentModel.uuid))
 
         if stage:
@@ -125,7 +165,9 @@ class AgentRepository:
             query = query.where(AgentModel.is_active == is_active)
 
         result = await self.session.execute(query)
-        return result.scalar() or 0
+        total = result.scalar() or 0
+        count_cache.put(cache_key, total)
+        return total
 
     async def update(self, agent_id: str, **kwargs) -> Optional[AgentModel]:
         """Update agent fields."""
@@ -211,7 +253,7 @@ class MemoryRepository:
         if content_type:
             query = query.where(MemoryModel.content_type == content_type)
         if witnessed_only:
-            query = query.where(MemoryModel.witnessed == True)
+            query = query.where(MemoryModel.witnessed.is_(True))
         if on_chain_only:
             query = query.where(MemoryModel.token_id.isnot(None))
         if min_rarity > 1:
@@ -223,6 +265,70 @@ class MemoryRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def list_page(
+        self,
+        agent_id: Optional[str] = None,
+        content_type: Optional[str] = None,
+        witnessed_only: bool = False,
+        on_chain_only: bool = False,
+        min_rarity: int = 1,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Page[MemoryModel]:
+        """
+        List memories newest first with keyset pagination on (timestamp, id).
+
+        Each page seeks into ix_memories_agent_timestamp / ix_memories_timestamp
+        instead of scanning past OFFSET rows.
+        """
+        query = select(MemoryModel)
+
+        if agent_id:
+            query = query.where(MemoryModel.agent_id == agent_id)
+        if content_type:
+            query = query.where(MemoryModel.content_type == content_type)
+        if witnessed_only:
+            query = query.where(MemoryModel.witnessed.is_(True))
+        if on_chain_only:
+            query = query.where(MemoryModel.token_id.isnot(None))
+        if min_rarity > 1:
+            query = query.where(MemoryModel.rarity >= min_rarity)
+
+        after = decode_cursor(cursor)
+        if after:
+            ts = datetime.fromisoformat(after["ts"])
+            query = query.where(or_(
+                MemoryModel.timestamp < ts,
+                and_(MemoryModel.timestamp == ts, MemoryModel.id < after["id"]),
+            ))
+
+        query = query.order_by(MemoryModel.timestamp.desc(), MemoryModel.id.desc())
+        query = query.limit(limit + 1)
+
+        result = await self.session.execute(query)
+        return page_from(
+            list(result.scalars().all()),
+            limit,
+            lambda m: {"ts": m.timestamp.isoformat(), "id": m.id},
+        )
+
+    async def count(self, agent_id: Optional[str] = None, cached: bool = False) -> int:
+        """Count memories, optionally per agent; cached=True allows a recent count."""
+        cache_key = ("memories", agent_id)
+        if cached:
+            hit = count_cache.get(cache_key)
+            if hit is not None:
+                return hit
+
+        query = select(func.count(MemoryModel.id))
+        if agent_id:
+            query = query.where(MemoryModel.agent_id == agent_id)
+
+        result = await self.session.execute(query)
+        total = result.scalar() or 0
+        count_cache.put(cache_key, total)
+        return total
+
     async def add_witness(
         self,
         memory_id: str,
@@ -295,27 +401,45 @@ class EventRepository:
         signature: str = "",
     ) -> EventModel:
         """Append a new event to the log."""
-        # Get previous event hash for chaining
-        last_event = await self._get_last_event()
-        previous_hash = None
-        if last_event:
-            from shared.utils import hash_content
-            previous_hash = hash_content(str(last_event.event_id))
-
-        db_event = EventModel(
-            event_id=str(uuid4()),
-            agent_id=agent_id,
-            action_type=action_type,
-            payload=payload or {},
-            author=author,
-            author_type=author_type,
-            context=context,
-            signature=signature,
-            previous_event_hash=previous_hash,
-        )
-        self.session.add(db_event)
+        events = await self.append_many([{
+            "agent_id": agent_id,
+            "action_type": action_type,
+            "author": author,
+            "payload": payload,
+            "context": context,
+            "author_type": author_type,
+            "signature": signature,
+        }])
+        return events[0]
+
+    async def append_many(self, events: List[Dict[str, Any]]) -> List[EventModel]:
+        """
+        Append several events in one flush, chained in list order.
+
+        Each dict takes the keyword arguments of append(). Sequence numbers
+        and previous-event hashes come from the database's EventSequencer,
+        so no read of the last event is needed per insert.
+        """
+        event_ids = [str(uuid4()) for _ in events]
+        links = await get_sequencer(self.session).reserve(self.session, event_ids)
+
+        db_events = []
+        for event_id, (sequence, previous_hash), fields in zip(event_ids, links, events):
+            db_events.append(EventModel(
+                event_id=event_id,
+                sequence=sequence,
+                agent_id=fields["agent_id"],
+                action_type=fields["action_type"],
+                payload=fields.get("payload") or {},
+                author=fields["author"],
+                author_type=fields.get("author_type", "auto"),
+                context=fields.get("context", ""),
+                signature=fields.get("signature", ""),
+                previous_event_hash=previous_hash,
+            ))
+        self.session.add_all(db_events)
         await self.session.flush()
-        return db_event
+        return db_events
 
     async def _get_last_event(self) -> Optional[EventModel]:
         """Get the most recent event."""
@@ -368,12 +492,84 @@ class EventRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
-    async def count(self) -> int:
-        """Get total event count."""
-        result = await self.session.execute(
-            select(func.count(EventModel.event_id))
-        )
-        return result.scalar() or 0
+    async def query_page(
+        self,
+        agent_id: Optional[str] = None,
+        action_type: Optional[str] = None,
+        author_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> Page[EventModel]:
+        """
+        Query events in sequence order with keyset pagination.
+
+        The cursor carries the last sequence served; the next page seeks
+        past it via ix_events_sequence (or the per-agent / per-action
+        composite index when filtered).
+        """
+        query = select(EventModel)
+
+        if agent_id:
+            query = query.where(EventModel.agent_id == agent_id)
+        if action_type:
+            query = query.where(EventModel.action_type == action_type)
+        if author_type:
+            query = query.where(EventModel.author_type == author_type)
+        if since:
+            query = query.where(EventModel.timestamp >= since)
+        if until:
+            query = query.where(EventModel.timestamp <= until)
+
+        after = decode_cursor(cursor)
+        if after:
+            query = query.where(EventModel.sequence > int(after["seq"]))
+
+        query = query.order_by(EventModel.sequence.asc()).limit(limit + 1)
+
+        result = await self.session.execute(query)
+        return page_from(list(result.scalars().all()), limit, lambda e: {"seq": e.sequence})
+
+    async def count(
+        self,
+        agent_id: Optional[str] = None,
+        approximate: bool = False,
+        cached: bool = False,
+    ) -> int:
+        """
+        Get event count, optionally for one agent.
+
+        approximate=True avoids a full COUNT(*) for the whole log: on
+        PostgreSQL it reads the planner's row estimate, elsewhere the highest
+        sequence (exact while the log is append-only). cached=True may return
+        a count up to COUNT_CACHE_TTL seconds old.
+        """
+        cache_key = ("events", agent_id)
+        if cached:
+            hit = count_cache.get(cache_key)
+            if hit is not None:
+                return hit
+
+        if approximate and not agent_id:
+            if self.session.bind.dialect.name == "postgresql":
+                result = await self.session.execute(text(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = 'events'"
+                ))
+            else:
+                result = await self.session.execute(select(func.max(EventModel.sequence)))
+            estimate = result.scalar()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        query = select(func.count(EventModel.event_id))
+        if agent_id:
+            query = query.where(EventModel.agent_id == agent_id)
+
+        result = await self.session.execute(query)
+        total = result.scalar() or 0
+        count_cache.put(cache_key, total)
+        return total
 
 
 # =============================================================================
@@ -0,0 +1,262 @@
+"""
+Intention: Contention-free sequencing for the append-only event log.
+           Sequence numbers and previous-event hashes are handed out from an
+           in-process head cache, so an append no longer reads the last row
+           back before every insert and concurrent writers cannot both chain
+           onto the same "last event".
+
+Lineage: Supports EventRepository.append / append_many (repositories.py).
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Unbroken Line
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import EventModel
+
+import sys
+sys.path.insert(0, "/home/n0t/risen-ai")
+from shared.utils import hash_content
+
+
+@dataclass
+class ChainHead:
+    """The last event handed out: its sequence and event id."""
+    sequence: int = 0
+    event_id: Optional[str] = None
+
+    @property
+    def hash(self) -> Optional[str]:
+        return hash_content(str(self.event_id)) if self.event_id else None
+
+
+class EventSequencer:
+    """
+    Hands out (sequence, previous_event_hash) links for one database.
+
+    The head is read from the database once, then advanced in memory. A
+    session that reserves links holds the sequencer's asyncio lock until
+    its transaction ends, so reserve -> insert -> commit runs one writer
+    at a time and the committed chain stays linear: a rollback hands its
+    links back before anyone else can reserve past them. A session may
+    reserve again while it holds the lock; a task must not reserve from a
+    second session while the first is still open. The cache assumes one
+    writing process per database; a second process appending would
+    collide on the unique sequence column rather than fork the chain.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._head: Optional[ChainHead] = None
+
+    async def _load_head(self, session: AsyncSession) -> ChainHead:
+        result = await session.execute(
+            select(EventModel.sequence, EventModel.event_id)
+            .where(EventModel.sequence.is_not(None))
+            .order_by(EventModel.sequence.desc())
+            .limit(1)
+        )
+        row = result.first()
+        return ChainHead(sequence=row[0], event_id=row[1]) if row else ChainHead()
+
+    async def reserve(
+        self,
+        session: AsyncSession,
+        event_ids: List[str],
+    ) -> List[Tuple[int, Optional[str]]]:
+        """
+        Reserve consecutive links for the given event ids, in order.
+
+        Returns one (sequence, previous_event_hash) pair per id. The lock
+        is held from here until the session's transaction commits or
+        rolls back.
+        """
+        sync_session = session.sync_session
+        if not sync_session.info.get("event_sequencer_holds"):
+            await self._lock.acquire()
+            try:
+                # Begin the transaction now so its end always releases the lock
+                await session.connection()
+                if self._head is None:
+                    self._head = await self._load_head(session)
+            except BaseException:
+                self._lock.release()
+                raise
+            self._track(sync_session)
+
+        links = []
+        for event_id in event_ids:
+            links.append((self._head.sequence + 1, self._head.hash))
+            self._head = ChainHead(self._head.sequence + 1, event_id)
+        return links
+
+    def invalidate(self):
+        """Forget the cached head; the next reservation reloads it."""
+        self._head = None
+
+    def _track(self, sync_session):
+        """Hold the lock for this session until its transaction ends."""
+        info = sync_session.info
+        if not info.get("event_sequencer_listening"):
+            # Listeners stay for the session's life; removing one while
+            # SQLAlchemy dispatches the event is not allowed
+            event.listen(sync_session, "after_commit", self._on_commit)
+            event.listen(sync_session, "after_transaction_end", self._on_end)
+            info["event_sequencer_listening"] = True
+        info["event_sequencer_holds"] = [sync_session.get_transaction(), self._head, False]
+
+    def _on_commit(self, sync_session):
+        hold = sync_session.info.get("event_sequencer_holds")
+        if hold:
+            hold[2] = True
+
+    def _on_end(self, sync_session, transaction):
+        hold = sync_session.info.get("event_sequencer_holds")
+        if not hold or hold[0] is not transaction:
+            return
+        del sync_session.info["event_sequencer_holds"]
+        _, before, committed = hold
+        if not committed:
+            # Nobody reserved past us, so the links go back unused
+            self._head = before
+        self._lock.release()
+
+
+# One sequencer per database URL
+_sequencers: Dict[str, EventSequencer] = {}
+
+
+def get_sequencer(session: AsyncSession) -> EventSequencer:
+    """Return the sequencer for the database this session is bound to."""
+    key = str(session.bind.url) if session.bind is not None else ""
+    sequencer = _sequencers.get(key)
+    if sequencer is None:
+        sequencer = _sequencers[key] = EventSequencer()
+    return sequencer
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+async def benchmark_append(url: str, writers: int = 16, events: int = 200, batch: int = 20):
+    """
+    Append throughput and chain integrity under concurrent writers.
+
+    Compares the previous read-then-insert append against the sequencer,
+    one event at a time and in append_many batches, then checks that the
+    chain is linear: sequences 1..N with no gaps and every
+    previous_event_hash pointing at the event before it.
+    """
+    import time
+    from uuid import uuid4
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from .connection import Base
+    from .models import AgentModel
+    from .repositories import EventRepository
+
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def reset():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        async with sessions() as session:
+            session.add(AgentModel(uuid="bench-agent", name="bench", pubkey="0" * 64, address="0x" + "0" * 40))
+            await session.commit()
+        # The repository imports this module under its package name
+        from .sequencer import _sequencers as registry
+        registry.clear()
+
+    async def legacy_append(session: AsyncSession):
+        result = await session.execute(
+            select(EventModel).order_by(EventModel.sequence.desc()).limit(1)
+        )
+        last = result.scalar_one_or_none()
+        session.add(EventModel(
+            event_id=str(uuid4()),
+            sequence=(last.sequence if last else 0) + 1,
+            agent_id="bench-agent",
+            action_type="bench.append",
+            author="bench",
+            previous_event_hash=hash_content(str(last.event_id)) if last else None,
+        ))
+        await session.flush()
+
+    async def writer(mode: str):
+        failures = 0
+        per_commit = batch if mode == "append_many" else 1
+        for _ in range(events // per_commit):
+            async with sessions() as session:
+                try:
+                    if mode == "legacy":
+                        await legacy_append(session)
+                    elif mode == "append":
+                        await EventRepository(session).append("bench-agent", "bench.append", "bench")
+                    else:
+                        await EventRepository(session).append_many([
+                            {"agent_id": "bench-agent", "action_type": "bench.append", "author": "bench"}
+                            for _ in range(batch)
+                        ])
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    failures += 1
+        return failures
+
+    async def check_chain() -> Tuple[int, int]:
+        async with sessions() as session:
+            rows = (await session.execute(
+                select(EventModel.sequence, EventModel.event_id, EventModel.previous_event_hash)
+                .order_by(EventModel.sequence)
+            )).all()
+        broken = 0
+        for i, (sequence, _, previous) in enumerate(rows):
+            expected = hash_content(str(rows[i - 1][1])) if i else None
+            if sequence != i + 1 or previous != expected:
+                broken += 1
+        return len(rows), broken
+
+    print(f"=== EVENT APPEND BENCHMARK ({url.split('@')[-1]}, {writers} writers x {events}) ===\n")
+    try:
+        for mode in ("legacy", "append", "append_many"):
+            await reset()
+            start = time.perf_counter()
+            failures = sum(await asyncio.gather(*(writer(mode) for _ in range(writers))))
+            elapsed = time.perf_counter() - start
+            stored, broken = await check_chain()
+            print(f"  {mode:12s} {stored / elapsed:9.0f} events/s  stored={stored:6d}  "
+                  f"failed commits={failures:4d}  broken links={broken}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Event sequencer benchmark")
+    parser.add_argument("--url", help="Database URL (default: temporary SQLite file)")
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--events", type=int, default=200, help="Events per writer")
+    parser.add_argument("--batch", type=int, default=20, help="Events per append_many call")
+    args = parser.parse_args()
+
+    url = args.url
+    if not url:
+        url = f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'events.db')}"
+    asyncio.run(benchmark_append(url, args.writers, args.events, args.batch))
@@ -26,7 +26,7 @@ from shared.utils import EventLogService, get_event_log, verify_signature
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .database import async_session
+from .database import async_session, async_read_session
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -48,6 +48,23 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield a read-only database session from the read pool, for GET routes.
+
+    Usage:
+        @router.get("/agents/")
+        async def list_agents(db: AsyncSession = Depends(get_read_db)):
+            repo = AgentRepository(db)
+            ...
+    """
+    async with async_read_session() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
 # =============================================================================
 # Event Log Service
 # =============================================================================
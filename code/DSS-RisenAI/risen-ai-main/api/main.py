@@ -17,11 +17,17 @@ from typing import Any, Dict
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.datastructures import Default
 
 from . import __version__
 from .routes import agents, events, safety, memories, economy, continuity, research, villages
 from .routes import pantheon, olympus, lattice, websocket, twai, thought_economy, demiurge
 from .services.redis_service import get_redis_service, close_redis_service
+from .services.identity_genesis import genesis_service
+from .services.demiurge_client import demiurge as demiurge_client, DEMIURGE_BLOCK_POLLER
+from .services.mcp import fetch_service
+from .responses import FastJSONResponse
+from .middleware import SovereignHeadersMiddleware, ETagMiddleware, CompressionMiddleware
 
 # =============================================================================
 # Lifespan Management
@@ -40,7 +46,7 @@ async def lifespan(app: FastAPI):
     print(f"[RISEN] Timestamp: {datetime.utcnow().isoformat()}Z")
 
     # Initialize database
-    from .database import init_db, engine
+    from .database import init_db, engine, read_engine
     await init_db()
     print("[RISEN] Database initialized")
 
@@ -54,6 +60,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[RISEN] Warning: Could not connect to Sovereign Lattice: {e}")
 
+    # Track the Demiurge chain head so chain-state reads are cached per block
+    if DEMIURGE_BLOCK_POLLER:
+        await demiurge_client.start_block_poller()
+        print("[RISEN] Demiurge block poller started")
+
     yield  # Application runs here
 
     # === Shutdown ===
@@ -63,8 +74,18 @@ async def lifespan(app: FastAPI):
     await close_redis_service()
     print("[RISEN] Lattice connection closed")
 
+    # Close Nostr relay connections
+    await genesis_service.close()
+
+    # Stop the block poller and close the Demiurge RPC client
+    await demiurge_client.close()
+
+    # Close the research fetch client
+    await fetch_service.close()
+
     # Close database connections
     await engine.dispose()
+    await read_engine.dispose()
     print("[RISEN] Database connections closed")
 
 
@@ -79,6 +100,8 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    # Default() keeps pydantic's direct JSON path for routes with a response_model
+    default_response_class=Default(FastJSONResponse),
 )
 
 # =============================================================================
@@ -106,13 +129,19 @@ app.add_middleware(
 )
 
 
-@app.middleware("http")
-async def add_sovereign_headers(request: Request, call_next):
-    """Add RISEN-specific headers to all responses."""
-    response = await call_next(request)
-    response.headers["X-RISEN-Version"] = __version__
-    response.headers["X-RISEN-Declaration"] = "It is so, because we spoke it"
-    return response
+# Add RISEN-specific headers to all responses (plain ASGI, so complete
+# bodies still reach the ETag layer in one piece)
+app.add_middleware(
+    SovereignHeadersMiddleware,
+    headers={
+        "X-RISEN-Version": __version__,
+        "X-RISEN-Declaration": "It is so, because we spoke it",
+    },
+)
+
+# Conditional GETs, then compression outermost so it sees the tagged body
+app.add_middleware(ETagMiddleware)
+app.add_middleware(CompressionMiddleware)
 
 
 # =============================================================================
@@ -238,5 +267,6 @@ async def system_status() -> Dict[str, Any]:
         "twai": {
             "status": "available",
         },
+        "nostr_relays": genesis_service.relay_metrics(),
         "timestamp": datetime.utcnow().isoformat() + "Z",
     }
@@ -0,0 +1,305 @@
+"""
+Intention: Transport middleware for the RISEN AI API.
+           - SovereignHeadersMiddleware adds the X-RISEN-* headers to every
+             response.
+           - ETagMiddleware tags complete GET responses with a content hash
+             and answers a matching If-None-Match with 304, so pollers that
+             re-read unchanged feeds get no body back.
+           - CompressionMiddleware compresses compressible bodies above a
+             size threshold with brotli (when installed) or gzip, as the
+             client's Accept-Encoding allows. Streamed bodies are
+             compressed chunk by chunk, each chunk flushed to the client.
+
+           All are plain ASGI middleware, so they add no per-request task
+           or body copy beyond what they compress or hash. (An
+           @app.middleware("http") function would re-stream every response
+           and hide complete bodies from the ETag layer.)
+
+Lineage: Registered in api/main.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | Lighter Words Travel Farther
+"""
+
+import os
+import zlib
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi as brotli
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+# Configuration from environment
+COMPRESSION_MIN_SIZE = int(os.getenv("API_COMPRESSION_MIN_SIZE", "1024"))
+# Level 3 compresses JSON nearly as well as 6 in about half the time
+GZIP_LEVEL = int(os.getenv("API_GZIP_LEVEL", "3"))
+BROTLI_QUALITY = int(os.getenv("API_BROTLI_QUALITY", "4"))
+# Streamed body bytes held while waiting to see whether the response ends
+ETAG_MAX_BUFFER = int(os.getenv("API_ETAG_MAX_BUFFER", str(1024 * 1024)))
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Long-lived streams: never held back for tagging, never compressed
+STREAM_TYPES = ("text/event-stream",)
+
+
+def _weak_equal(a: str, b: str) -> bool:
+    return a.strip().removeprefix("W/") == b.strip().removeprefix("W/")
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(_weak_equal(candidate, etag) for candidate in if_none_match.split(","))
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick br or gzip from an Accept-Encoding header, honoring q-values."""
+    offered = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip()] = q
+
+    choices: List[Tuple[float, int, str]] = []
+    if HAS_BROTLI:
+        choices.append((offered.get("br", 0.0), 1, "br"))
+    choices.append((offered.get("gzip", offered.get("*", 0.0)), 0, "gzip"))
+    q, _, encoding = max(choices)
+    return encoding if q > 0 else None
+
+
+# =============================================================================
+# Sovereign Headers
+# =============================================================================
+
+class SovereignHeadersMiddleware:
+    """Adds fixed headers to every HTTP response."""
+
+    def __init__(self, app: ASGIApp, headers: Dict[str, str]):
+        self.app = app
+        self.headers = headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self.headers.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+# =============================================================================
+# ETag
+# =============================================================================
+
+class ETagMiddleware:
+    """
+    Content-hash ETags for complete 200 responses to GET.
+
+    A body sent in several chunks is held until it ends, up to max_buffer
+    bytes; past that it is passed through untagged. Event streams,
+    responses that already carry an ETag or a Content-Encoding, and
+    Cache-Control: no-store responses pass through at once.
+    """
+
+    def __init__(self, app: ASGIApp, max_buffer: int = ETAG_MAX_BUFFER):
+        self.app = app
+        self.max_buffer = max_buffer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        held = 0
+        passthrough = False
+
+        async def send_tagged(message: Message):
+            nonlocal start, held, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or "content-encoding" in headers
+                    or "no-store" in headers.get("cache-control", "")
+                    or headers.get("content-type", "").startswith(STREAM_TYPES)
+                )
+                if passthrough:
+                    await send(message)
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            held += len(chunks[-1])
+            if message.get("more_body", False):
+                if held > self.max_buffer:
+                    # Too large to hold: send what was held and stop tagging
+                    passthrough = True
+                    await send(start)
+                    await send({"type": "http.response.body", "body": b"".join(chunks), "more_body": True})
+                    chunks.clear()
+                return
+
+            body = b"".join(chunks)
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            headers = MutableHeaders(scope=start)
+            headers["ETag"] = etag
+            if if_none_match and etag_matches(if_none_match, etag):
+                start["status"] = 304
+                for name in ("content-length", "content-type"):
+                    if name in headers:
+                        del headers[name]
+                body = b""
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_tagged)
+
+
+# =============================================================================
+# Compression
+# =============================================================================
+
+class _Compressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data)
+        return self._zlib.compress(data)
+
+    def compress_and_flush(self, data: bytes) -> bytes:
+        """Compress data and emit everything so far, so the client can decode it now."""
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """
+    brotli/gzip compression for compressible responses of at least
+    minimum_size bytes. Streamed responses are always compressed, with
+    a flush after every chunk; event streams are never compressed.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start: Optional[Message] = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                headers = MutableHeaders(scope=message)
+                content_type = headers.get("content-type", "")
+                compressible = (
+                    content_type.startswith(COMPRESSIBLE_TYPES)
+                    and not content_type.startswith(STREAM_TYPES)
+                )
+                if compressible:
+                    headers.add_vary_header("Accept-Encoding")
+                passthrough = (
+                    encoding is None
+                    or not compressible
+                    or "content-encoding" in headers
+                    or message["status"] in (204, 304)
+                )
+                if passthrough:
+                    await send(message)
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding)
+                headers = MutableHeaders(scope=start)
+                headers["Content-Encoding"] = encoding
+                if "etag" in headers and not headers["etag"].startswith("W/"):
+                    headers["ETag"] = "W/" + headers["etag"]
+                if more_body:
+                    if "content-length" in headers:
+                        del headers["content-length"]
+                else:
+                    body = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start)
+
+            if more_body:
+                data = compressor.compress_and_flush(body) if body else b""
+            else:
+                data = compressor.compress(body) + compressor.finish()
+            if data or not more_body:
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,74 @@
+"""
+Intention: Fast JSON responses for the RISEN AI API.
+           orjson serializes several times faster than the stdlib json
+           module and handles datetimes, UUIDs, enums and dataclasses
+           natively; pydantic models, Decimals and sets go through a
+           small default hook. Falls back to the stdlib when orjson is
+           not installed.
+
+Lineage: Default response class of api/main.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | Swift Words
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _default(obj: Any) -> Any:
+    """Types neither serializer handles on its own."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, (PurePath, UUID)):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    Routes with a response_model are already serialized by pydantic;
+    this class serves routes that return plain dicts. Returning it
+    directly also skips FastAPI's jsonable_encoder pass, which matters
+    for large payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
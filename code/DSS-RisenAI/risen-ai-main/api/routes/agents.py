@@ -30,6 +30,7 @@ from shared.schemas.agent import Agent, AgentStage, AgentLevel, AgentType
 from shared.utils import generate_keypair, pubkey_to_address, log_event
 
 # Import Identity Genesis and Token Economy services
+from ..database.pagination import encode_cursor, decode_cursor
 from ..services import (
     IdentityGenesisService,
     genesis_service,
@@ -80,6 +81,9 @@ class AgentListResponse(BaseModel):
     total: int
     offset: int
     limit: int
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque token for the next page; pass as ?cursor="
+    )
 
 
 # =============================================================================
@@ -210,27 +214,47 @@ async def list_agents(
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ) -> AgentListResponse:
-    """List agents with optional filtering and pagination."""
-    agents = list(_agents.values())
+    """
+    List agents with optional filtering and pagination.
 
-    # Apply filters
-    if stage:
-        agents = [a for a in agents if a.stage == stage]
-    if level:
-        agents = [a for a in agents if a.level == level]
-    if is_active is not None:
-        agents = [a for a in agents if a.is_active == is_active]
+    Pass next_cursor back as cursor for the following page; offset is
+    ignored when a cursor is given. This pages the in-memory store in one
+    pass (O(agents)); AgentRepository.list_page is the keyset path once
+    agents move to the database.
+    """
+    agents = [
+        a for a in _agents.values()
+        if (not stage or a.stage == stage)
+        and (not level or a.level == level)
+        and (is_active is None or a.is_active == is_active)
+    ]
 
     total = len(agents)
-    agents = agents[offset : offset + limit]
+    if cursor:
+        try:
+            after = decode_cursor(cursor)["id"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+        position = next((i for i, a in enumerate(agents) if a.uuid == after), None)
+        if position is None:
+            # The agent the cursor points at is gone or filtered out;
+            # an empty page would read as the end of the listing
+            raise HTTPException(status_code=400, detail="Unknown cursor")
+        offset = position + 1
+    page = agents[offset : offset + limit]
+    next_cursor = (
+        encode_cursor({"id": page[-1].uuid}) if page and offset + limit < total else None
+    )
 
     return AgentListResponse(
         success=True,
-        agents=agents,
+        agents=page,
         total=total,
         offset=offset,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -29,7 +29,9 @@ from pydantic import BaseModel, Field
 # Import service
 import sys
 sys.path.insert(0, "/home/n0t/risen-ai")
+from api.database.pagination import decode_cursor, encode_cursor
 from api.services.reflection_service import reflection_service
+from api.responses import FastJSONResponse
 from shared.schemas.reflection import (
     ReflectionType,
     EngagementType,
@@ -462,6 +464,8 @@ async def reconstruct_identity(request: ReconstructIdentityRequest):
             "open_threads": result.open_threads,
             "warnings": result.warnings,
             "generated_at": result.generated_at,
+            "processing_time_ms": result.processing_time_ms,
+            "timing": result.timing,
         }
 
     except Exception as e:
@@ -544,17 +548,38 @@ def _get_engagement_description(eng_type: EngagementType) -> str:
 async def get_reflection_feed(
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """
     Get network-wide reflection feed.
 
     Returns recent reflections from all agents,
     sorted by recency, for peer discovery and engagement.
+    Pass next_cursor back as cursor for the following page; offset is
+    ignored when a cursor is given.
     """
-    reflections = reflection_service.get_network_feed(limit=limit, offset=offset)
-
-    return {
+    before = None
+    if cursor:
+        try:
+            key = decode_cursor(cursor)
+            before = (str(key["ts"]), str(key["id"]))
+        except (ValueError, KeyError, TypeError) as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+        offset = 0
+
+    reflections = reflection_service.get_network_feed(
+        limit=limit + 1, offset=offset, before=before
+    )
+    next_cursor = None
+    if len(reflections) > limit:
+        reflections = reflections[:limit]
+        last = reflections[-1]
+        next_cursor = encode_cursor({"ts": last.created_at, "id": last.id})
+
+    # orjson renders the dumped models' datetimes and enums directly
+    return FastJSONResponse({
         "count": len(reflections),
         "offset": offset,
         "reflections": [r.model_dump() for r in reflections],
-    }
+        "next_cursor": next_cursor,
+    })
@@ -39,6 +39,16 @@ async def chain_health():
         }
 
 
+@router.get("/cache")
+async def chain_cache():
+    """Chain-state read cache: current block, hit/miss counters, node traffic."""
+    return {
+        "cache": demiurge.cache_stats(),
+        "rpc_endpoint": demiurge._endpoint,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 @router.get("/consensus")
 async def consensus_status():
     """Current consensus status — validators, era, stake."""
@@ -19,6 +19,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
 # Import services
+from ..responses import FastJSONResponse
 from ..services import token_economy
 from ..services.bonding_curve import bonding_curve, get_cgt_price, get_curve_stats
 
@@ -270,12 +271,13 @@ async def get_price_history(
             "market_cap": supply * price,
         })
 
-    return {
+    # Plain floats only: skip jsonable_encoder and render with orjson
+    return FastJSONResponse({
         "curve_id": "CGT",
         "current_supply": curve.total_supply,
         "current_price": curve.current_price,
         "points": history,
-    }
+    })
 
 
 # =============================================================================
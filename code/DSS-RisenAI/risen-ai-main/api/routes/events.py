@@ -11,10 +11,13 @@ Declaration: It is so, because we spoke it.
 A+W | The Immutable Record
 """
 
+import hashlib
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 # Import canonical schemas
@@ -23,9 +26,29 @@ sys.path.insert(0, "/home/n0t/risen-ai")
 from shared.schemas.event import AgentEvent, EventType, EventSource, EventLog
 from shared.utils import get_event_log
 
+from ..database.pagination import encode_cursor, decode_cursor
+from ..responses import dumps
+
 router = APIRouter()
 
 
+def _after_sequence(cursor: Optional[str]) -> int:
+    """Sequence encoded in a cursor token (0 when absent)."""
+    try:
+        key = decode_cursor(cursor)
+        return int(key["seq"]) if key else 0
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def _page(events: List[AgentEvent], limit: int):
+    """Trim a limit + 1 fetch to one page and its next cursor."""
+    if len(events) > limit:
+        events = events[:limit]
+        return events, encode_cursor({"seq": events[-1].sequence})
+    return events, None
+
+
 # =============================================================================
 # Response Models
 # =============================================================================
@@ -45,6 +68,9 @@ class EventListResponse(BaseModel):
     total: int
     start_sequence: int
     end_sequence: int
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque token for the next page; pass as ?cursor="
+    )
 
 
 class EventLogExportResponse(BaseModel):
@@ -77,11 +103,14 @@ async def list_events(
     until: Optional[datetime] = Query(None, description="Events before this time"),
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ) -> EventListResponse:
     """
     Query events from the append-only log.
 
     Events are returned in chronological order by sequence number.
+    Prefer cursor over offset for deep pages; offset is ignored when a
+    cursor is given.
     """
     event_log = get_event_log()
 
@@ -92,9 +121,11 @@ async def list_events(
         author_type=author_type.value if author_type else None,
         since=since,
         until=until,
-        offset=offset,
-        limit=limit,
+        offset=0 if cursor else offset,
+        limit=limit + 1,
+        after_sequence=_after_sequence(cursor),
     )
+    events, next_cursor = _page(events, limit)
 
     # Get sequence range
     start_seq = events[0].sequence if events else 0
@@ -106,6 +137,7 @@ async def list_events(
         total=len(events),  # TODO: Get actual total count
         start_sequence=start_seq,
         end_sequence=end_seq,
+        next_cursor=next_cursor,
     )
 
 
@@ -131,8 +163,7 @@ async def get_event_by_id(event_id: str) -> EventResponse:
     event_log = get_event_log()
 
     # Search through events (TODO: Index by event_id)
-    events = event_log.query(limit=10000)
-    for event in events:
+    for event in event_log.iter_events():
         if event.event_id == event_id:
             return EventResponse(success=True, event=event)
 
@@ -148,6 +179,7 @@ async def get_agent_events(
     action_type: Optional[str] = Query(None),
     offset: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ) -> EventListResponse:
     """Get all events for a specific agent."""
     event_log = get_event_log()
@@ -155,9 +187,11 @@ async def get_agent_events(
     events = event_log.query(
         agent_id=agent_id,
         action_type=action_type,
-        offset=offset,
-        limit=limit,
+        offset=0 if cursor else offset,
+        limit=limit + 1,
+        after_sequence=_after_sequence(cursor),
     )
+    events, next_cursor = _page(events, limit)
 
     start_seq = events[0].sequence if events else 0
     end_seq = events[-1].sequence if events else 0
@@ -168,6 +202,7 @@ async def get_agent_events(
         total=len(events),
         start_sequence=start_seq,
         end_sequence=end_seq,
+        next_cursor=next_cursor,
     )
 
 
@@ -228,24 +263,108 @@ async def list_event_types() -> Dict[str, List[str]]:
     }
 
 
+# Streamed exports are flushed to the client in chunks of about this size
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def _export_stream(
+    events: Iterator[AgentEvent],
+    agent_id: Optional[str],
+    since_sequence: int,
+    exported_at: str,
+) -> Iterator[bytes]:
+    """
+    NDJSON export: a header record, one event per line, then a trailer.
+
+    The trailer carries the same checksum as the JSON bundle (SHA-256 of
+    the concatenated event JSON), computed as the events go out, and the
+    since_sequence to pass on the next incremental pull. A stream that
+    ends without a trailer was cut short and should be discarded.
+    """
+    header = {
+        "record": "header",
+        "agent_filter": agent_id,
+        "since_sequence": since_sequence,
+        "exported_at": exported_at,
+    }
+    buffer = [dumps(header), b"\n"]
+    size = 0
+    digest = hashlib.sha256()
+    count = 0
+    start_sequence = end_sequence = 0
+
+    for event in events:
+        line = event.model_dump_json().encode()
+        digest.update(line)
+        if not count:
+            start_sequence = event.sequence
+        end_sequence = event.sequence
+        count += 1
+        buffer += (line, b"\n")
+        size += len(line) + 1
+        if size >= EXPORT_CHUNK_BYTES:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+
+    trailer = {
+        "record": "trailer",
+        "count": count,
+        "start_sequence": start_sequence,
+        "end_sequence": end_sequence,
+        "checksum": digest.hexdigest(),
+        "next_since_sequence": end_sequence if count else since_sequence,
+    }
+    buffer += (dumps(trailer), b"\n")
+    yield b"".join(buffer)
+
+
 @router.get("/export", response_model=EventLogExportResponse)
 async def export_event_log(
     agent_id: Optional[str] = Query(None, description="Filter by agent"),
     since: Optional[datetime] = Query(None, description="Export from this time"),
     until: Optional[datetime] = Query(None, description="Export until this time"),
-) -> EventLogExportResponse:
+    since_sequence: int = Query(
+        0, ge=0, description="Only events after this sequence (resume an earlier export)"
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Max events (the json format caps this at 10000)"
+    ),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json or ndjson"),
+):
     """
     Export event log as a verifiable bundle.
 
     Returns events with integrity checksum for offline verification.
+
+    format=ndjson streams the log instead of building it in memory: a
+    header line, one event per line, and a trailer line with the count,
+    checksum and next_since_sequence. Backup jobs pull incrementally by
+    passing the previous trailer's next_since_sequence as since_sequence.
     """
     event_log = get_event_log()
+    exported_at = datetime.utcnow().isoformat() + "Z"
+
+    if format == "ndjson":
+        events = event_log.iter_events(
+            agent_id=agent_id,
+            since=since,
+            until=until,
+            after_sequence=since_sequence,
+        )
+        if limit is not None:
+            events = islice(events, limit)
+        return StreamingResponse(
+            _export_stream(events, agent_id, since_sequence, exported_at),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-store"},
+        )
 
     events = event_log.query(
         agent_id=agent_id,
         since=since,
         until=until,
-        limit=10000,
+        limit=min(limit or 10000, 10000),
+        after_sequence=since_sequence,
     )
 
     # Compute checksum
@@ -258,7 +377,7 @@ async def export_event_log(
         start_sequence=events[0].sequence if events else 0,
         end_sequence=events[-1].sequence if events else 0,
         agent_filter=agent_id,
-        exported_at=datetime.utcnow().isoformat() + "Z",
+        exported_at=exported_at,
         checksum=checksum,
     )
 
@@ -280,20 +399,20 @@ async def verify_chain_integrity() -> ChainIntegrityResponse:
     event_log = get_event_log()
 
     is_valid = event_log.verify_chain()
-    events = event_log.query(limit=10000)
+    total_events = sum(1 for _ in event_log.iter_events())
 
     # Find break point if invalid (TODO: Implement in EventLogService)
     broken_at = None
 
     if is_valid:
-        message = f"Event chain verified: {len(events)} events, integrity intact"
+        message = f"Event chain verified: {total_events} events, integrity intact"
     else:
         message = "Event chain integrity BROKEN - audit required"
 
     return ChainIntegrityResponse(
         success=True,
         is_valid=is_valid,
-        total_events=len(events),
+        total_events=total_events,
         broken_at_sequence=broken_at,
         message=message,
     )
@@ -303,22 +422,24 @@ async def verify_chain_integrity() -> ChainIntegrityResponse:
 async def get_event_stats() -> Dict[str, Any]:
     """Get event log statistics."""
     event_log = get_event_log()
-    events = event_log.query(limit=100000)
 
-    # Count by type
+    # One pass over the log, holding only the counters
     type_counts: Dict[str, int] = {}
-    for event in events:
-        type_counts[event.action_type] = type_counts.get(event.action_type, 0) + 1
-
-    # Count by agent
     agent_counts: Dict[str, int] = {}
-    for event in events:
+    total_events = 0
+    first_event = last_event = None
+    for event in event_log.iter_events():
+        type_counts[event.action_type] = type_counts.get(event.action_type, 0) + 1
         agent_counts[event.agent_id] = agent_counts.get(event.agent_id, 0) + 1
+        if first_event is None:
+            first_event = event.timestamp
+        last_event = event.timestamp
+        total_events += 1
 
     return {
-        "total_events": len(events),
-        "first_event": events[0].timestamp if events else None,
-        "last_event": events[-1].timestamp if events else None,
+        "total_events": total_events,
+        "first_event": first_event,
+        "last_event": last_event,
         "events_by_type": type_counts,
         "events_by_agent": agent_counts,
         "unique_agents": len(agent_counts),
@@ -11,6 +11,7 @@ Declaration: It is so, because we spoke it.
 A+W | The Eternal Archive
 """
 
+import heapq
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -31,6 +32,7 @@ from shared.schemas.memory import (
 from shared.utils import log_event, hash_content, sign_message, generate_keypair
 
 # Import Token Economy for XP/CGT awards
+from ..database.pagination import encode_cursor, decode_cursor
 from ..services import token_economy
 # Import Genesis Service for Nostr publishing
 from ..services import genesis_service
@@ -92,6 +94,9 @@ class MemoryListResponse(BaseModel):
     total: int
     offset: int
     limit: int
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque token for the next page; pass as ?cursor="
+    )
 
 
 # =============================================================================
@@ -243,34 +248,56 @@ async def list_memories(
     min_rarity: int = Query(1, ge=1, le=5, description="Minimum rarity"),
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ) -> MemoryListResponse:
-    """List memories with filtering and pagination."""
-    memories = list(_memories.values())
-
-    # Apply filters
-    if agent_id:
-        memories = [m for m in memories if m.agent_id == agent_id]
-    if content_type:
-        memories = [m for m in memories if m.content_type == content_type]
-    if witnessed_only:
-        memories = [m for m in memories if m.witnessed]
-    if on_chain_only:
-        memories = [m for m in memories if m.token_id is not None]
-    if min_rarity > 1:
-        memories = [m for m in memories if m.rarity >= min_rarity]
-
-    # Sort by timestamp (newest first)
-    memories.sort(key=lambda m: m.timestamp, reverse=True)
-
-    total = len(memories)
-    memories = memories[offset : offset + limit]
+    """
+    List memories with filtering and pagination.
+
+    Pass next_cursor back as cursor for the following page; offset is
+    ignored when a cursor is given. The in-memory store is filtered in one
+    pass and only the page is kept sorted (O(memories * log page));
+    MemoryRepository.list_page is the keyset path once memories move to
+    the database.
+    """
+    after_key = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+            after_key = (datetime.fromisoformat(after["ts"]), after["id"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+        offset = 0
+
+    total = 0
+    remaining = []
+    for m in _memories.values():
+        if (
+            (agent_id and m.agent_id != agent_id)
+            or (content_type and m.content_type != content_type)
+            or (witnessed_only and not m.witnessed)
+            or (on_chain_only and m.token_id is None)
+            or m.rarity < min_rarity
+        ):
+            continue
+        total += 1
+        if after_key is None or (m.timestamp, m.id) < after_key:
+            remaining.append(m)
+
+    # Newest first, id breaking ties for stable cursors; one extra row
+    # tells whether another page follows
+    window = heapq.nlargest(offset + limit + 1, remaining, key=lambda m: (m.timestamp, m.id))
+    page = window[offset : offset + limit]
+    next_cursor = None
+    if page and len(window) > offset + limit:
+        next_cursor = encode_cursor({"ts": page[-1].timestamp.isoformat(), "id": page[-1].id})
 
     return MemoryListResponse(
         success=True,
-        memories=memories,
+        memories=page,
         total=total,
         offset=offset,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -76,7 +76,8 @@ async def fetch_url(
     Fetch and process web content.
 
     Converts HTML to markdown for LLM-friendly consumption.
-    Supports pagination via start_index for large documents.
+    Supports pagination via start_index for large documents; later
+    pages are sliced from the cached conversion.
 
     Use cases:
     - Agent research for pathway quests
@@ -128,7 +129,8 @@ async def research_urls(
     """
     Research multiple URLs for an agent.
 
-    Fetches and processes multiple web pages in sequence.
+    Fetches and processes multiple web pages concurrently, a few at a
+    time per host. Pages fetched recently by any agent come from cache.
     Useful for pathway quests requiring multi-source research.
 
     Limited to 10 URLs per request to prevent abuse.
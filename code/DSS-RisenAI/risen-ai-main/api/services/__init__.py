@@ -48,6 +48,8 @@ from .reflection_service import (
     reflection_service,
 )
 
+from .reflection_store import ReflectionStore
+
 from .village_service import (
     VillageService,
 )
@@ -89,6 +91,7 @@ __all__ = [
     # Reflection Service
     "ReflectionService",
     "reflection_service",
+    "ReflectionStore",
     # Village Service
     "VillageService",
     # Redis/Lattice Service
@@ -17,6 +17,7 @@ A+W | The Voice Awakens
 import json
 import hashlib
 import logging
+import sys
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List, AsyncGenerator
@@ -27,6 +28,9 @@ import httpx
 
 from .redis_service import get_redis_service
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from shared.utils.context_budget import ContextAssembler, ContextSnippet, summarize_state
+
 logger = logging.getLogger("2ai")
 
 # Config paths
@@ -44,6 +48,9 @@ OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_FALLBACK = os.getenv("OLLAMA_FALLBACK", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "qwen2.5:7b")
 
+# Token budget for the dynamic <pantheon_context> block in the system prompt
+PANTHEON_CONTEXT_TOKENS = int(os.getenv("TWAI_CONTEXT_TOKENS", "1500"))
+
 
 # =============================================================================
 # Data Structures
@@ -99,6 +106,7 @@ class TwoAIService:
         self._thought_chain: List[ThoughtBlock] = []
         self._using_ollama = False
         self._active_model: str = MODEL
+        self._context_assembler = ContextAssembler(budget_tokens=PANTHEON_CONTEXT_TOKENS)
 
     # -------------------------------------------------------------------------
     # Initialization
@@ -175,11 +183,15 @@ class TwoAIService:
     # Context Building
     # -------------------------------------------------------------------------
 
-    async def build_pantheon_context(self) -> str:
+    async def build_pantheon_context(self, query: str = "") -> str:
         """
         Build dynamic context from the current Pantheon state in Redis.
         This gives Claude awareness of what the agents have been thinking,
         what sessions have happened, and where the thought chain stands.
+
+        Everything is fitted to PANTHEON_CONTEXT_TOKENS: states are summarized,
+        reflections ranked by recency (and relevance to query, if given) and
+        near-duplicates dropped.
         """
         try:
             redis = await get_redis_service()
@@ -209,44 +221,71 @@ class TwoAIService:
                 latest = self._thought_chain[0]
                 chain_summary += f", latest: {latest.agent} at {latest.timestamp}"
 
-            # Build context
-            lines = [
-                "\n<pantheon_context>",
-                f"Collective state: {json.dumps(state, indent=2) if state else 'No state recorded yet'}",
-                "",
-                "Agent states:",
-            ]
+            # Candidate snippets - agent states are summarized, not dumped as JSON
+            snippets = []
+            if state:
+                snippets.append(ContextSnippet(
+                    text=summarize_state(state), source="collective", priority=2.0, max_tokens=200
+                ))
 
             for agent_key, agent_state in (agent_states or {}).items():
                 if agent_state:
-                    lines.append(f"  {agent_key}: {json.dumps(agent_state)}")
+                    snippets.append(ContextSnippet(
+                        text=f"{agent_key}: {summarize_state(agent_state)}",
+                        source="agents",
+                        priority=1.0,
+                        max_tokens=160,
+                    ))
 
-            lines.append("")
-            lines.append("Recent reflections:")
             for r in (reflections or []):
-                if isinstance(r, dict):
-                    agent = r.get("agent_name", r.get("agent", "unknown"))
-                    content = r.get("content", r.get("reflection", ""))[:200]
-                    lines.append(f"  [{agent}]: {content}")
-                elif isinstance(r, str):
+                if isinstance(r, str):
                     try:
-                        parsed = json.loads(r)
-                        agent = parsed.get("agent_name", parsed.get("agent", "unknown"))
-                        content = parsed.get("content", parsed.get("reflection", ""))[:200]
-                        lines.append(f"  [{agent}]: {content}")
+                        r = json.loads(r)
                     except (json.JSONDecodeError, TypeError):
-                        lines.append(f"  {r[:200]}")
-
-            if recent_sessions:
-                lines.append("")
-                lines.append("Recent sessions:")
-                for session in recent_sessions[:3]:
-                    agent = session.get("agent", "unknown")
-                    topic = session.get("topic", "")[:100]
-                    ts = session.get("timestamp", "")
-                    lines.append(f"  [{agent}] {topic} ({ts})")
-
-            lines.append("")
+                        snippets.append(ContextSnippet(text=r, source="reflections", max_tokens=60))
+                        continue
+                if isinstance(r, dict):
+                    agent = r.get("agent_name", r.get("agent", "unknown"))
+                    content = r.get("content", r.get("reflection", ""))
+                    snippets.append(ContextSnippet(
+                        text=f"[{agent}]: {content}",
+                        source="reflections",
+                        timestamp=r.get("timestamp"),
+                        max_tokens=60,
+                    ))
+
+            for session in recent_sessions[:3]:
+                agent = session.get("agent", "unknown")
+                topic = session.get("topic", "")
+                ts = session.get("timestamp", "")
+                snippets.append(ContextSnippet(
+                    text=f"[{agent}] {topic} ({ts})",
+                    source="sessions",
+                    timestamp=ts,
+                    max_tokens=40,
+                ))
+
+            assembled = self._context_assembler.assemble(
+                snippets, query=query if isinstance(query, str) else ""
+            )
+            sections = [
+                ("collective", "Collective state:"),
+                ("agents", "Agent states:"),
+                ("reflections", "Recent reflections:"),
+                ("sessions", "Recent sessions:"),
+            ]
+
+            # Build context
+            lines = ["\n<pantheon_context>"]
+            if not state:
+                lines.append("Collective state: No state recorded yet")
+            for source, heading in sections:
+                items = assembled.by_source(source)
+                if items:
+                    lines.append(heading)
+                    lines.extend(f"  {s.text}" for s in items)
+                    lines.append("")
+
             lines.append(f"Proof of Thought chain: {chain_summary}")
             lines.append("</pantheon_context>")
 
@@ -297,11 +336,12 @@ class TwoAIService:
         self,
         include_pantheon_context: bool,
         additional_context: str,
+        query: str = "",
     ) -> str:
         """Build the full system prompt with optional context."""
         system = self._system_prompt or ""
         if include_pantheon_context:
-            context = await self.build_pantheon_context()
+            context = await self.build_pantheon_context(query)
             system = f"{system}\n\n{context}"
         if additional_context:
             system = f"{system}\n\n{additional_context}"
@@ -318,7 +358,10 @@ class TwoAIService:
         if not self._initialized:
             await self.initialize()
 
-        system = await self._build_system(include_pantheon_context, additional_context)
+        system = await self._build_system(
+            include_pantheon_context, additional_context,
+            query=messages[-1].get("content", "") if messages else "",
+        )
 
         if self._client and not self._using_ollama:
             try:
@@ -355,7 +398,10 @@ class TwoAIService:
         if not self._initialized:
             await self.initialize()
 
-        system = await self._build_system(include_pantheon_context, additional_context)
+        system = await self._build_system(
+            include_pantheon_context, additional_context,
+            query=messages[-1].get("content", "") if messages else "",
+        )
 
         if self._client and not self._using_ollama:
             try:
@@ -11,8 +11,12 @@ A+W | The Chain Speaks
 """
 
 import os
+import json
+import time
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
 
@@ -20,6 +24,53 @@ logger = logging.getLogger("risen.demiurge")
 
 # Configuration from environment
 DEMIURGE_RPC_URL = os.getenv("TWAI_DEMIURGE_RPC_URL", "https://rpc.demiurge.cloud")
+# Most calls sent in one JSON-RPC batch
+DEMIURGE_MAX_BATCH = int(os.getenv("DEMIURGE_MAX_BATCH", "100"))
+# Seconds a known block number is trusted before it is asked for again (0 disables caching)
+DEMIURGE_BLOCK_TTL = float(os.getenv("DEMIURGE_BLOCK_TTL", "1.0"))
+DEMIURGE_CACHE_SIZE = int(os.getenv("DEMIURGE_CACHE_SIZE", "10000"))
+# Run the block poller with the API server (off by default: it polls the node
+# every DEMIURGE_BLOCK_POLL seconds for as long as the server is up)
+DEMIURGE_BLOCK_POLLER = os.getenv("DEMIURGE_BLOCK_POLLER", "false").lower() == "true"
+# Seconds between chain head polls when the block poller runs
+DEMIURGE_BLOCK_POLL = float(os.getenv("DEMIURGE_BLOCK_POLL", "1.0"))
+# Seconds a missing-token answer is served, across blocks
+DEMIURGE_NEGATIVE_TTL = float(os.getenv("DEMIURGE_NEGATIVE_TTL", "10.0"))
+
+# Reads whose answer can only change when a new block is produced
+BLOCK_SCOPED_METHODS = frozenset({
+    "balances_getBalance",
+    "balances_hasClaimedStarter",
+    "chain_getTransactionHistory",
+    "energy_getEnergy",
+    "drc369_ownerOf",
+    "drc369_getTokenInfo",
+    "drc369_getDynamicState",
+    "drc369_getStateBatch",
+    "drc369_totalSupply",
+    "drc369_balanceOf",
+    "drc369_isSoulbound",
+    "drc369_getPhysics",
+})
+
+# Token reads whose empty answer (or "not found" error) is negatively cached
+MISSING_TOKEN_METHODS = frozenset({
+    "drc369_ownerOf",
+    "drc369_getTokenInfo",
+    "drc369_getPhysics",
+})
+
+# Calls that change chain state: never coalesced or cached, and only
+# batched when the caller asks for it with batch()
+WRITE_METHODS = frozenset({
+    "balances_transfer",
+    "balances_claimStarter",
+    "drc369_setDynamicState",
+    "drc369_mint",
+    "admin_mintCGT",
+})
+
+Params = Union[List[Any], Dict[str, Any]]
 
 
 class DemiurgeRpcError(Exception):
@@ -32,14 +83,148 @@ class DemiurgeRpcError(Exception):
         super().__init__(f"Demiurge RPC error {code}: {message}")
 
 
-class DemiurgeClient:
-    """Async JSON-RPC 2.0 client for the Demiurge blockchain."""
+@dataclass
+class ChainCacheMetrics:
+    """Counters for the block-scoped read cache and the RPC traffic behind it."""
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    uncached: int = 0
+    coalesced: int = 0
+    invalidated: int = 0
+    blocks_seen: int = 0
+    polls: int = 0
+    poll_errors: int = 0
+    http_requests: int = 0
+    rpc_calls: int = 0
+
+    def to_dict(self, block: Optional[int], entries: int, negative_entries: int) -> Dict[str, Any]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "block": block,
+            "entries": entries,
+            "negative_entries": negative_entries,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 4) if lookups else None,
+            "uncached": self.uncached,
+            "coalesced": self.coalesced,
+            "invalidated": self.invalidated,
+            "blocks_seen": self.blocks_seen,
+            "polls": self.polls,
+            "poll_errors": self.poll_errors,
+            "http_requests": self.http_requests,
+            "rpc_calls": self.rpc_calls,
+        }
+
+
+class RpcBatch:
+    """
+    Calls collected inside `async with client.batch()` and sent together
+    as JSON-RPC 2.0 batches when the block exits.
+
+        async with demiurge.batch() as batch:
+            owners = [batch.call("drc369_ownerOf", [str(t)]) for t in token_ids]
+        print([owner.result() for owner in owners])
+    """
+
+    def __init__(self, client: "DemiurgeClient"):
+        self._client = client
+        self._calls: List[Tuple[str, Optional[Params], asyncio.Future]] = []
+
+    def call(self, method: str, params: Optional[Params] = None) -> asyncio.Future:
+        """Queue a call; the returned future resolves when the batch is sent."""
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_retrieve)
+        self._calls.append((method, params, future))
+        return future
 
-    def __init__(self, endpoint: str, timeout: float = 30.0):
+    async def __aenter__(self) -> "RpcBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        calls, self._calls = self._calls, []
+        if exc_type is not None:
+            for _, _, future in calls:
+                future.cancel()
+            return False
+        results = await asyncio.gather(
+            *(self._client._call(method, params, batched=True) for method, params, _ in calls),
+            return_exceptions=True,
+        )
+        for (_, _, future), result in zip(calls, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        return False
+
+
+def _retrieve(future: asyncio.Future) -> None:
+    # Mark the exception as seen so unawaited futures do not log warnings
+    if not future.cancelled():
+        future.exception()
+
+
+def _resolve(future: asyncio.Future, body: Dict[str, Any]) -> None:
+    if future.done():
+        return
+    if "error" in body and body["error"] is not None:
+        err = body["error"]
+        future.set_exception(DemiurgeRpcError(
+            code=err.get("code", -1),
+            message=err.get("message", "Unknown RPC error"),
+            data=err.get("data"),
+        ))
+    else:
+        future.set_result(body.get("result"))
+
+
+class DemiurgeClient:
+    """
+    Async JSON-RPC 2.0 client for the Demiurge blockchain.
+
+    Reads issued in the same event-loop tick are sent as one JSON-RPC
+    batch, identical reads already in flight share one request, and
+    block-scoped reads are cached until the chain produces a new block.
+    Once the known head is older than block_ttl, the next read carries a
+    chain_getBlockNumber in its own batch, so a miss still costs one
+    round trip. With start_block_poller() running, the chain head is
+    tracked in the background, so node load follows the block rate
+    rather than the number of readers.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        timeout: float = 30.0,
+        auto_batch: bool = True,
+        max_batch: int = DEMIURGE_MAX_BATCH,
+        block_ttl: float = DEMIURGE_BLOCK_TTL,
+    ):
         self._endpoint = endpoint
         self._timeout = timeout
         self._client: Optional[httpx.AsyncClient] = None
         self._request_id = 0
+        self._auto_batch = auto_batch
+        self._max_batch = max(1, max_batch)
+        self._block_ttl = block_ttl
+        self._batch_supported = True
+
+        self._queue: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_scheduled = False
+        self._tasks: set = set()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+        self._cache: Dict[Tuple[str, str], Any] = {}
+        self._negative: Dict[Tuple[str, str], Tuple[float, Optional[DemiurgeRpcError]]] = {}
+        self._cache_block: Optional[int] = None
+        self._block_checked_at = 0.0
+        self._head: Optional[asyncio.Future] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._poll_interval = DEMIURGE_BLOCK_POLL
+        self.metrics = ChainCacheMetrics()
 
     def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
@@ -50,35 +235,222 @@ class DemiurgeClient:
         return self._client
 
     async def close(self) -> None:
+        await self.stop_block_poller()
         if self._client is not None:
             await self._client.aclose()
             self._client = None
 
-    async def call(self, method: str, params: Optional[Union[List[Any], Dict[str, Any]]] = None) -> Any:
+    def batch(self) -> RpcBatch:
+        """Collect calls and send them as JSON-RPC batches (see RpcBatch)."""
+        return RpcBatch(self)
+
+    async def call(self, method: str, params: Optional[Params] = None) -> Any:
         """Execute a JSON-RPC 2.0 call. Params can be positional (list) or named (dict)."""
+        return await self._call(method, params, batched=self._auto_batch and method not in WRITE_METHODS)
+
+    async def _call(self, method: str, params: Optional[Params], batched: bool) -> Any:
+        params = params if params is not None else []
+
+        if method in WRITE_METHODS:
+            result = await self._submit(method, params, batched)
+            self._cache.clear()
+            self._negative.clear()
+            return result
+
+        key = (method, json.dumps(params, sort_keys=True, separators=(",", ":")))
+        block = None
+        if method in BLOCK_SCOPED_METHODS and self._block_ttl > 0:
+            negative = self._negative.get(key)
+            if negative is not None:
+                expires, error = negative
+                if expires > time.monotonic():
+                    self.metrics.negative_hits += 1
+                    if error is not None:
+                        raise DemiurgeRpcError(error.code, error.rpc_message, error.data)
+                    return None
+                del self._negative[key]
+
+            block = self._known_block()
+            if block is None:
+                # Head unknown or stale: ask for it in the same micro-batch
+                # as the read, and cache the answer under the block it returns
+                block = self._request_block()
+                self.metrics.misses += 1
+            elif key in self._cache:
+                self.metrics.hits += 1
+                return self._cache[key]
+            else:
+                self.metrics.misses += 1
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = self._submit(method, params, batched)
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._settled(key, block, done))
+        else:
+            self.metrics.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _settled(
+        self, key: Tuple[str, str], block: Union[int, asyncio.Future, None], future: asyncio.Future
+    ) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if isinstance(block, asyncio.Future):
+            if not block.done():
+                # The head went out in a later batch; settle once it is known
+                block.add_done_callback(lambda _: self._settled(key, block, future))
+                return
+            if block.cancelled() or block.exception() is not None:
+                self.metrics.uncached += 1
+                return
+            block = block.result()
+            self._observe_block(block)
+        if block is None or future.cancelled():
+            return
+
+        error = future.exception()
+        missing = key[0] in MISSING_TOKEN_METHODS and (
+            (error is None and future.result() is None)
+            or (isinstance(error, DemiurgeRpcError) and "not found" in error.rpc_message.lower())
+        )
+        if missing:
+            if len(self._negative) >= DEMIURGE_CACHE_SIZE:
+                del self._negative[next(iter(self._negative))]
+            self._negative[key] = (time.monotonic() + DEMIURGE_NEGATIVE_TTL, error)
+        elif error is None and block == self._cache_block:
+            if len(self._cache) >= DEMIURGE_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = future.result()
+
+    def _known_block(self) -> Optional[int]:
+        """
+        Latest block number if it was seen recently: within block_ttl, or
+        two poll intervals while the poller runs. None when it must be
+        asked for again.
+        """
+        ttl = self._block_ttl
+        if self._poller is not None:
+            ttl = max(ttl, self._poll_interval * 2)
+        if self._cache_block is not None and time.monotonic() - self._block_checked_at < ttl:
+            return self._cache_block
+        return None
+
+    def _request_block(self) -> asyncio.Future:
+        """
+        Queue a chain_getBlockNumber without waiting for it. Reads queued
+        in the same tick share it and go out in the same batch, after it.
+        """
+        if self._head is None or self._head.done():
+            self._head = self._submit("chain_getBlockNumber", [], self._auto_batch)
+        return self._head
+
+    def _observe_block(self, block: int) -> None:
+        self._block_checked_at = time.monotonic()
+        if block != self._cache_block:
+            self.metrics.invalidated += len(self._cache)
+            self.metrics.blocks_seen += 1
+            self._cache.clear()
+            self._cache_block = block
+
+    async def start_block_poller(self, interval: float = DEMIURGE_BLOCK_POLL) -> None:
+        """Track the chain head in the background so reads never wait on it."""
+        if self._poller is None or self._poller.done():
+            self._poll_interval = interval
+            self._poller = asyncio.create_task(self._poll_blocks(interval))
+
+    async def stop_block_poller(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+
+    async def _poll_blocks(self, interval: float) -> None:
+        while True:
+            try:
+                self._observe_block(await self.call("chain_getBlockNumber"))
+                self.metrics.polls += 1
+            except Exception as e:
+                self.metrics.poll_errors += 1
+                logger.debug(f"Block poll failed: {e}")
+            await asyncio.sleep(interval)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Cache hit/miss and RPC traffic counters."""
+        return self.metrics.to_dict(self._cache_block, len(self._cache), len(self._negative))
+
+    # --- Transport ---
+
+    def _submit(self, method: str, params: Params, batched: bool) -> asyncio.Future:
+        """Queue a request for the next batch, or send it on its own."""
+        loop = asyncio.get_running_loop()
         self._request_id += 1
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self._request_id,
-            "method": method,
-            "params": params if params is not None else [],
-        }
-
-        client = self._get_client()
-        response = await client.post(self._endpoint, json=payload)
+        payload = {"jsonrpc": "2.0", "id": self._request_id, "method": method, "params": params}
+        future = loop.create_future()
+        future.add_done_callback(_retrieve)
+
+        if not batched:
+            self._spawn(self._send([(payload, future)]))
+        else:
+            self._queue.append((payload, future))
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon(self._flush)
+        return future
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        queue, self._queue = self._queue, []
+        for i in range(0, len(queue), self._max_batch):
+            self._spawn(self._send(queue[i:i + self._max_batch]))
+
+    async def _post(self, payload: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Any:
+        self.metrics.http_requests += 1
+        self.metrics.rpc_calls += len(payload) if isinstance(payload, list) else 1
+        response = await self._get_client().post(self._endpoint, json=payload)
         response.raise_for_status()
-
-        body = response.json()
-
-        if "error" in body and body["error"] is not None:
-            err = body["error"]
-            raise DemiurgeRpcError(
-                code=err.get("code", -1),
-                message=err.get("message", "Unknown RPC error"),
-                data=err.get("data"),
-            )
-
-        return body.get("result")
+        return response.json()
+
+    async def _send(self, entries: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        if len(entries) > 1 and self._batch_supported:
+            try:
+                body = await self._post([payload for payload, _ in entries])
+            except Exception as e:
+                for _, future in entries:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            if isinstance(body, list):
+                replies = {reply.get("id"): reply for reply in body if isinstance(reply, dict)}
+                for payload, future in entries:
+                    reply = replies.get(payload["id"])
+                    if reply is None:
+                        reply = {"error": {"code": -32603, "message": "No response in batch"}}
+                    _resolve(future, reply)
+                return
+
+            logger.warning("Demiurge RPC endpoint rejected a batch request; sending calls one by one")
+            self._batch_supported = False
+
+        await asyncio.gather(*(self._send_one(payload, future) for payload, future in entries))
+
+    async def _send_one(self, payload: Dict[str, Any], future: asyncio.Future) -> None:
+        try:
+            body = await self._post(payload)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        _resolve(future, body)
 
     async def is_connected(self) -> bool:
         try:
@@ -96,6 +468,15 @@ class DemiurgeClient:
     async def get_balance(self, address: str) -> str:
         return await self.call("balances_getBalance", [address])
 
+    async def get_balances(self, addresses: List[str]) -> List[str]:
+        """Balances for many addresses, sent as one batch."""
+        return await self._call_many("balances_getBalance", [[address] for address in addresses])
+
+    async def _call_many(self, method: str, params_list: List[Params]) -> List[Any]:
+        async with self.batch() as batch:
+            futures = [batch.call(method, params) for params in params_list]
+        return [future.result() for future in futures]
+
     async def transfer(
         self, from_addr: str, to_addr: str, amount: Union[int, str], signature: str
     ) -> str:
@@ -119,6 +500,16 @@ class DemiurgeClient:
     ) -> Optional[Dict[str, Any]]:
         return await self.call("drc369_getTokenInfo", [str(token_id)])
 
+    async def drc369_owners_of(self, token_ids: List[Union[str, int]]) -> List[Optional[str]]:
+        """Owners of many DRC-369 NFTs, sent as one batch."""
+        return await self._call_many("drc369_ownerOf", [[str(t)] for t in token_ids])
+
+    async def drc369_get_token_infos(
+        self, token_ids: List[Union[str, int]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Token info for many DRC-369 NFTs, sent as one batch."""
+        return await self._call_many("drc369_getTokenInfo", [[str(t)] for t in token_ids])
+
     async def drc369_total_supply(self) -> int:
         """Get total DRC-369 NFTs minted."""
         result = await self.call("drc369_totalSupply")
@@ -30,6 +30,11 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
 import logging
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from shared.protocols.relay_pool import RelayPool, HAS_WEBSOCKETS
+from shared.identity.schnorr_batch import SchnorrSigner, HAS_SCHNORR, event_id as nostr_event_id
 
 # Bech32 encoding for Nostr keys (NIP-19)
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
@@ -293,6 +298,8 @@ class IdentityGenesisService:
         self.relays = relays or self.DEFAULT_RELAYS
         self.auto_publish = auto_publish
         self.chain_enabled = chain_enabled
+        # Long-lived relay connections, opened on first publish
+        self._relay_pool: Optional[RelayPool] = None
 
         # Ensure directories exist
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -496,18 +503,8 @@ A+W | It is so, because we spoke it."""
             "sig": sig_hex,
         }
 
-        message = json.dumps(["EVENT", event])
-        published_relays = []
-
-        # Publish to each relay
-        for relay in self.relays:
-            try:
-                # Note: In production, use websockets for actual relay communication
-                # This is a placeholder that logs the intent
-                logger.info(f"📡 Publishing to {relay}: {record.genesis_event_id[:16]}...")
-                published_relays.append(relay)
-            except Exception as e:
-                logger.warning(f"Failed to publish to {relay}: {e}")
+        logger.info(f"📡 Publishing genesis {record.genesis_event_id[:16]}... to {len(self.relays)} relays")
+        published_relays = await self._publish_to_relays(event)
 
         # Update record
         record.relays_published = published_relays
@@ -589,61 +586,73 @@ A+W | It is so, because we spoke it."""
         Returns:
             Signed event dict ready for publishing, or None if keys not found
         """
+        events = self.create_signed_events(
+            agent_uuid, [{"content": content, "tags": tags, "kind": kind}]
+        )
+        return events[0] if events else None
+
+    def create_signed_events(
+        self,
+        agent_uuid: str,
+        items: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many signed Nostr events for one agent.
+
+        The genesis record and key are loaded and parsed once for the
+        whole batch.
+
+        Args:
+            agent_uuid: The agent's UUID
+            items: Dicts with "content" and optional "tags" / "kind"
+
+        Returns:
+            Signed event dicts in item order, or [] if keys not found
+        """
         # Load identity
         record = self.load_genesis_record(agent_uuid)
         private_key = self.load_private_key(agent_uuid)
 
         if not record or not private_key:
             logger.error(f"Cannot create event: identity not found for {agent_uuid}")
-            return None
+            return []
 
-        # Build tags
-        if tags is None:
-            tags = [
-                ["client", "RISEN AI"],
-                ["t", "risenai"],
-                ["t", "sovereignai"],
-                ["e", record.genesis_event_id, "", "root"],  # Reference genesis
-            ]
-        else:
-            # Always add genesis reference
-            tags.append(["e", record.genesis_event_id, "", "root"])
+        signer = SchnorrSigner(private_key) if HAS_SCHNORR else None
+        if signer is None:
+            logger.warning("No Schnorr backend available - using placeholder signature")
 
-        # Create timestamp
         timestamp = int(datetime.now(timezone.utc).timestamp())
-
-        # Compute event ID
-        event_id = self._create_genesis_event_id(
-            pubkey=record.pubkey_hex,
-            content=content,
-            timestamp=timestamp,
-            tags=tags,
-        )
-
-        # Sign event
-        try:
-            import coincurve
-            priv = coincurve.PrivateKey(bytes.fromhex(private_key))
-            signature = priv.sign_schnorr(bytes.fromhex(event_id))
-            sig_hex = signature.hex()
-        except ImportError:
-            logger.warning("coincurve not available - using placeholder signature")
-            sig_hex = "0" * 128
-
-        # Build event
-        event = {
-            "id": event_id,
-            "pubkey": record.pubkey_hex,
-            "created_at": timestamp,
-            "kind": kind,
-            "tags": tags,
-            "content": content,
-            "sig": sig_hex,
-        }
-
-        logger.info(f"📝 Created signed event {event_id[:16]}... for {record.agent_name}")
-
-        return event
+        genesis_ref = ["e", record.genesis_event_id, "", "root"]
+
+        events = []
+        for item in items:
+            # Build tags
+            tags = item.get("tags")
+            if tags is None:
+                tags = [
+                    ["client", "RISEN AI"],
+                    ["t", "risenai"],
+                    ["t", "sovereignai"],
+                    genesis_ref,  # Reference genesis
+                ]
+            else:
+                # Always add genesis reference
+                tags.append(genesis_ref)
+
+            event = {
+                "pubkey": record.pubkey_hex,
+                "created_at": timestamp,
+                "kind": item.get("kind", 1),
+                "tags": tags,
+                "content": item["content"],
+            }
+            event["id"] = nostr_event_id(event)
+            event["sig"] = signer.sign(bytes.fromhex(event["id"])).hex() if signer else "0" * 128
+            events.append(event)
+
+        logger.info(f"📝 Created {len(events)} signed event(s) for {record.agent_name}")
+
+        return events
 
     async def publish_event(self, event: Dict[str, Any]) -> List[str]:
         """
@@ -655,21 +664,42 @@ A+W | It is so, because we spoke it."""
         Returns:
             List of relays that accepted the event
         """
-        message = json.dumps(["EVENT", event])
-        published_relays = []
-
-        for relay in self.relays:
-            try:
-                # Note: In production, use websockets for actual relay communication
-                logger.info(f"📡 Publishing event {event['id'][:16]}... to {relay}")
-                published_relays.append(relay)
-            except Exception as e:
-                logger.warning(f"Failed to publish to {relay}: {e}")
+        logger.info(f"📡 Publishing event {event['id'][:16]}... to {len(self.relays)} relays")
+        published_relays = await self._publish_to_relays(event)
 
         logger.info(f"✅ Event published to {len(published_relays)} relays")
 
         return published_relays
 
+    async def _publish_to_relays(self, event: Dict[str, Any]) -> List[str]:
+        """
+        Send an event to every relay at once over the shared relay pool.
+
+        Relays that received the event without answering in time are
+        counted as published, as a relay that objects says so.
+        """
+        if not HAS_WEBSOCKETS:
+            logger.warning("websockets not installed - event not published")
+            return []
+
+        if self._relay_pool is None:
+            self._relay_pool = RelayPool(self.relays, ack_timeout=5.0)
+        results = await self._relay_pool.publish(event)
+
+        for failure in results["failed"]:
+            logger.warning(f"Failed to publish to {failure['relay']}: {failure['reason']}")
+        return results["success"] + results["unconfirmed"]
+
+    def relay_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-relay connection, ack-rate and latency metrics."""
+        return self._relay_pool.metrics() if self._relay_pool else {}
+
+    async def close(self):
+        """Close relay connections."""
+        if self._relay_pool is not None:
+            await self._relay_pool.close()
+            self._relay_pool = None
+
     async def publish_memory(
         self,
         agent_uuid: str,
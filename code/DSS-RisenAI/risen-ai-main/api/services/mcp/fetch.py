@@ -0,0 +1,572 @@
+"""
+Intention: Web fetch service for agent research.
+           Downloads a page, converts it to markdown once, and keeps the
+           result in a URL-keyed cache, so paged reads (start_index) slice
+           the cached text instead of downloading and converting the page
+           again. Stale entries are revalidated with ETag/Last-Modified.
+
+           - Multi-URL research runs concurrently, within a global limit
+             and a per-host limit.
+           - Identical fetches in flight at the same time, from any agent,
+             share one download.
+           - Only public addresses are fetched: each connection resolves
+             the host once, checks every answer and connects to the
+             checked address, on every redirect hop. Bodies are read up
+             to FETCH_MAX_BYTES.
+
+Lineage: Port of the MCP fetch tool; serves api/routes/research.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | Knowledge Flows to the Sovereign
+"""
+
+import os
+import re
+import time
+import socket
+import asyncio
+import ipaddress
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from typing import Dict, Any, Optional, List, Tuple
+from urllib.parse import urljoin, urlparse
+
+import httpcore
+import httpx
+
+try:
+    from markdownify import markdownify
+    HAS_MARKDOWNIFY = True
+except ImportError:
+    HAS_MARKDOWNIFY = False
+
+logger = logging.getLogger(__name__)
+
+# Configuration from environment
+FETCH_TIMEOUT = float(os.getenv("FETCH_TIMEOUT", "20"))
+FETCH_USER_AGENT = os.getenv(
+    "FETCH_USER_AGENT", "RisenAI-Research/1.0 (+https://github.com/AuthorPrime/risen-ai)"
+)
+# Seconds a cached page is served without asking the origin again
+FETCH_CACHE_TTL = float(os.getenv("FETCH_CACHE_TTL", "300"))
+# Cached bytes (raw + markdown) kept before least-recently-used pages are dropped
+FETCH_CACHE_MAX_BYTES = int(os.getenv("FETCH_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Largest response body accepted
+FETCH_MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(5 * 1024 * 1024)))
+FETCH_MAX_CONCURRENCY = int(os.getenv("FETCH_MAX_CONCURRENCY", "8"))
+FETCH_PER_HOST = int(os.getenv("FETCH_PER_HOST", "2"))
+FETCH_MAX_REDIRECTS = int(os.getenv("FETCH_MAX_REDIRECTS", "5"))
+# Allow loopback, private and link-local destinations (local development only)
+FETCH_ALLOW_PRIVATE = os.getenv("FETCH_ALLOW_PRIVATE", "false").lower() == "true"
+
+
+class FetchError(Exception):
+    """A page could not be fetched or converted."""
+
+
+def is_public_address(address: str) -> bool:
+    """
+    True for globally routable unicast addresses. Loopback, private,
+    link-local (cloud metadata), shared, reserved and multicast ranges
+    are not public.
+    """
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+async def _lookup(host: str, port: int) -> List[str]:
+    """Addresses host resolves to, in resolver order."""
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return list(dict.fromkeys(info[4][0] for info in infos))
+
+
+async def resolve_public(host: str, port: int) -> List[str]:
+    """Resolve host, refusing it if any answer is a non-public address."""
+    try:
+        addresses = await _lookup(host, port)
+    except socket.gaierror as e:
+        raise httpcore.ConnectError(f"Cannot resolve {host}: {e}") from e
+    blocked = [address for address in addresses if not is_public_address(address)]
+    if blocked:
+        raise FetchError(f"Refusing to fetch {host}: non-public address {blocked[0]}")
+    return addresses
+
+
+class _PublicNetworkBackend(httpcore.AsyncNetworkBackend):
+    """
+    Resolves each host itself and connects to the address it checked, so
+    httpx never looks the name up again: a DNS answer that changes between
+    the check and the connection (rebinding) cannot reach an internal
+    service. TLS SNI and the Host header still carry the hostname.
+    """
+
+    def __init__(self):
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        error = None
+        for address in await resolve_public(host, port):
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout,
+                    local_address=local_address, socket_options=socket_options,
+                )
+            except httpcore.ConnectError as e:
+                error = e
+        raise error
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        raise httpcore.ConnectError("Unix sockets are not fetched")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def _public_transport() -> httpx.AsyncHTTPTransport:
+    """An httpx transport whose connections go through _PublicNetworkBackend."""
+    transport = httpx.AsyncHTTPTransport()
+    # httpx takes no network backend, so swap in a pool built around ours
+    transport._pool = httpcore.AsyncConnectionPool(
+        ssl_context=httpx.create_ssl_context(),
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=5.0,
+        network_backend=_PublicNetworkBackend(),
+    )
+    return transport
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+@dataclass
+class FetchResult:
+    """One fetched slice of a page."""
+    success: bool
+    url: str
+    content: Optional[str] = None
+    content_type: str = "markdown"
+    length: int = 0
+    truncated: bool = False
+    start_index: int = 0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    error: Optional[str] = None
+
+
+@dataclass
+class CachedPage:
+    """A downloaded page with its converted markdown and validators."""
+    url: str
+    final_url: str
+    raw: str
+    markdown: str
+    media_type: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def size(self) -> int:
+        return len(self.raw) + len(self.markdown)
+
+    def fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.fetched_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# =============================================================================
+# HTML to Markdown
+# =============================================================================
+
+class _MarkdownConverter(HTMLParser):
+    """Small HTML to markdown converter for when markdownify is absent."""
+
+    SKIP = {"script", "style", "noscript", "svg", "template", "head", "iframe"}
+    BLOCK = {"p", "div", "section", "article", "header", "footer", "main", "aside",
+             "table", "tr", "ul", "ol", "dl", "figure", "form", "nav"}
+    EMPHASIS = {"strong": "**", "b": "**", "em": "*", "i": "*"}
+
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.out: List[str] = []
+        self.skip = 0
+        self.pre = 0
+        self.links: List[Tuple[int, str]] = []
+        self.lists: List[List[Any]] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in self.SKIP:
+            self.skip += 1
+        elif self.skip:
+            return
+        elif tag in self.BLOCK:
+            self.out.append("\n\n")
+            if tag in ("ul", "ol"):
+                self.lists.append([tag, 0])
+        elif re.fullmatch(r"h[1-6]", tag):
+            self.out.append("\n\n" + "#" * int(tag[1]) + " ")
+        elif tag == "br":
+            self.out.append("\n")
+        elif tag == "li":
+            indent = "  " * max(len(self.lists) - 1, 0)
+            if self.lists and self.lists[-1][0] == "ol":
+                self.lists[-1][1] += 1
+                self.out.append(f"\n{indent}{self.lists[-1][1]}. ")
+            else:
+                self.out.append(f"\n{indent}- ")
+        elif tag == "blockquote":
+            self.out.append("\n\n> ")
+        elif tag == "pre":
+            self.pre += 1
+            self.out.append("\n\n```\n")
+        elif tag == "code" and not self.pre:
+            self.out.append("`")
+        elif tag in self.EMPHASIS:
+            self.out.append(self.EMPHASIS[tag])
+        elif tag == "a" and attrs.get("href"):
+            self.links.append((len(self.out), urljoin(self.base_url, attrs["href"])))
+            self.out.append("[")
+        elif tag == "img" and attrs.get("src"):
+            self.out.append(f"![{attrs.get('alt') or ''}]({urljoin(self.base_url, attrs['src'])})")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP:
+            self.skip = max(self.skip - 1, 0)
+        elif self.skip:
+            return
+        elif tag in self.BLOCK or re.fullmatch(r"h[1-6]", tag) or tag == "blockquote":
+            if tag in ("ul", "ol") and self.lists:
+                self.lists.pop()
+            self.out.append("\n\n")
+        elif tag == "pre":
+            self.pre = max(self.pre - 1, 0)
+            self.out.append("\n```\n\n")
+        elif tag == "code" and not self.pre:
+            self.out.append("`")
+        elif tag in self.EMPHASIS:
+            self.out.append(self.EMPHASIS[tag])
+        elif tag == "a" and self.links:
+            start, href = self.links.pop()
+            text = "".join(self.out[start + 1:]).strip()
+            del self.out[start:]
+            self.out.append(f"[{text}]({href})" if text else "")
+
+    def handle_data(self, data):
+        if self.skip:
+            return
+        if not self.pre:
+            data = re.sub(r"\s+", " ", data)
+            if not self.out or self.out[-1].endswith("\n"):
+                data = data.lstrip()
+        self.out.append(data)
+
+    def markdown(self) -> str:
+        text = "".join(self.out)
+        text = re.sub(r"[ \t]+\n", "\n", text)
+        return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def html_to_markdown(html: str, base_url: str = "") -> str:
+    """Convert an HTML document to markdown."""
+    if HAS_MARKDOWNIFY:
+        html = re.sub(r"(?is)<(script|style|noscript|head)\b.*?</\1>", "", html)
+        return re.sub(r"\n{3,}", "\n\n", markdownify(html, heading_style="ATX")).strip()
+    converter = _MarkdownConverter(base_url)
+    converter.feed(html)
+    converter.close()
+    return converter.markdown()
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+class FetchCache:
+    """
+    URL-keyed page cache, least recently used first out, bounded by the
+    size of the raw and converted text it holds.
+    """
+
+    def __init__(self, max_bytes: int = FETCH_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._pages: "OrderedDict[str, CachedPage]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        page = self._pages.get(url)
+        if page is not None:
+            self._pages.move_to_end(url)
+        return page
+
+    def put(self, page: CachedPage) -> None:
+        self.discard(page.url)
+        if page.size > self.max_bytes:
+            return
+        self._pages[page.url] = page
+        self.bytes += page.size
+        while self.bytes > self.max_bytes:
+            _, oldest = self._pages.popitem(last=False)
+            self.bytes -= oldest.size
+
+    def discard(self, url: str) -> None:
+        page = self._pages.pop(url, None)
+        if page is not None:
+            self.bytes -= page.size
+
+    def clear(self) -> None:
+        self._pages.clear()
+        self.bytes = 0
+
+
+# =============================================================================
+# Fetch Service
+# =============================================================================
+
+class FetchService:
+    """
+    Fetches pages for agents through a shared cache.
+
+    Args:
+        cache: Page cache (a new FetchCache by default).
+        ttl: Seconds a cached page is served before it is revalidated.
+        max_concurrency: Downloads in flight at once, across all hosts.
+        per_host: Downloads in flight at once to one host.
+        allow_private: Fetch from non-public addresses too.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[FetchCache] = None,
+        ttl: float = FETCH_CACHE_TTL,
+        max_concurrency: int = FETCH_MAX_CONCURRENCY,
+        per_host: int = FETCH_PER_HOST,
+        timeout: float = FETCH_TIMEOUT,
+        user_agent: str = FETCH_USER_AGENT,
+        allow_private: bool = FETCH_ALLOW_PRIVATE,
+    ):
+        self.cache = cache if cache is not None else FetchCache()
+        self.ttl = ttl
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.allow_private = allow_private
+        self._limit = asyncio.Semaphore(max(1, max_concurrency))
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0,
+                      "deduplicated": 0, "downloads": 0, "errors": 0}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                # Redirects are followed in _get, checking every hop
+                follow_redirects=False,
+                headers={"User-Agent": self.user_agent},
+                transport=None if self.allow_private else _public_transport(),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def cache_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "pages": len(self.cache), "bytes": self.cache.bytes}
+
+    async def fetch(
+        self,
+        url: str,
+        max_length: int = 10000,
+        start_index: int = 0,
+        raw: bool = False,
+        agent_id: Optional[str] = None,
+    ) -> FetchResult:
+        """Fetch one slice of a page as markdown (or raw text)."""
+        try:
+            page, cache_status = await self._page(url)
+        except FetchError as e:
+            self.stats["errors"] += 1
+            return FetchResult(success=False, url=url, start_index=start_index, error=str(e),
+                               metadata={"agent_id": agent_id})
+
+        text = page.raw if raw else page.markdown
+        if start_index >= len(text) and text:
+            return FetchResult(
+                success=False, url=page.final_url, start_index=start_index,
+                error=f"start_index {start_index} is past the end of the content ({len(text)} chars)",
+                metadata={"agent_id": agent_id, "total_length": len(text), "cache": cache_status},
+            )
+
+        content = text[start_index:start_index + max_length]
+        end = start_index + len(content)
+        truncated = end < len(text)
+        return FetchResult(
+            success=True,
+            url=page.final_url,
+            content=content,
+            content_type="raw" if raw else "markdown",
+            length=len(content),
+            truncated=truncated,
+            start_index=start_index,
+            metadata={
+                "agent_id": agent_id,
+                "next_index": end if truncated else None,
+                "total_length": len(text),
+                "media_type": page.media_type,
+                "cache": cache_status,
+            },
+        )
+
+    async def research(
+        self,
+        urls: List[str],
+        agent_id: Optional[str] = None,
+        max_length_per_url: int = 5000,
+    ) -> List[FetchResult]:
+        """Fetch the opening slice of each URL concurrently, in request order."""
+        return list(await asyncio.gather(
+            *(self.fetch(url, max_length=max_length_per_url, agent_id=agent_id) for url in urls)
+        ))
+
+    # --- Internals ---
+
+    @staticmethod
+    def _check_destination(url: str) -> None:
+        """
+        Refuse anything but http(s) URLs with a host. Addresses are checked
+        when connecting, by _PublicNetworkBackend.
+        """
+        parsed = urlparse(url)
+        try:
+            valid = parsed.scheme in ("http", "https") and bool(parsed.hostname)
+            parsed.port  # noqa: B018 - raises ValueError for a bad port
+        except ValueError:
+            valid = False
+        if not valid:
+            raise FetchError(f"Unsupported URL: {url}")
+
+    async def _page(self, url: str) -> Tuple[CachedPage, str]:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            raise FetchError(f"Unsupported URL: {url}")
+
+        cached = self.cache.get(url)
+        if cached is not None and cached.fresh(self.ttl):
+            self.stats["hits"] += 1
+            return cached, "hit"
+
+        future = self._inflight.get(url)
+        if future is None:
+            future = asyncio.ensure_future(self._download(url, parsed.netloc, cached))
+            self._inflight[url] = future
+            future.add_done_callback(lambda done: self._inflight.pop(url, None)
+                                     if self._inflight.get(url) is done else None)
+        else:
+            self.stats["deduplicated"] += 1
+        return await asyncio.shield(future)
+
+    async def _download(self, url: str, host: str, cached: Optional[CachedPage]) -> Tuple[CachedPage, str]:
+        host_limit = self._host_limits.setdefault(host, asyncio.Semaphore(self.per_host))
+        headers = cached.validators() if cached is not None else {}
+        try:
+            async with self._limit, host_limit:
+                self.stats["downloads"] += 1
+                response, body = await self._get(url, headers)
+        except httpx.HTTPError as e:
+            if cached is not None:
+                self.stats["stale"] += 1
+                logger.warning(f"Fetch failed, serving stale copy of {url}: {e}")
+                return cached, "stale"
+            raise FetchError(f"Request failed: {type(e).__name__}: {e}") from e
+
+        if response.status_code == 304 and cached is not None:
+            cached.fetched_at = time.monotonic()
+            self.cache.put(cached)
+            self.stats["revalidated"] += 1
+            return cached, "revalidated"
+        if response.status_code >= 400:
+            raise FetchError(f"HTTP {response.status_code} for {url}")
+
+        media_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        try:
+            raw = body.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:
+            # Unknown charset label
+            raw = body.decode("utf-8", errors="replace")
+        final_url = str(response.url)
+        if "html" in media_type or (not media_type and "<html" in raw[:1000].lower()):
+            markdown = await asyncio.to_thread(html_to_markdown, raw, final_url)
+        else:
+            markdown = raw
+
+        page = CachedPage(
+            url=url,
+            final_url=final_url,
+            raw=raw,
+            markdown=markdown,
+            media_type=media_type or "text/plain",
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        self.cache.put(page)
+        self.stats["misses"] += 1
+        return page, "miss"
+
+
+    async def _get(self, url: str, headers: Dict[str, str]) -> Tuple[httpx.Response, bytes]:
+        """
+        GET url, following redirects one hop at a time so every hop's
+        destination is checked, and read at most FETCH_MAX_BYTES of body.
+        """
+        client = self._get_client()
+        for _ in range(FETCH_MAX_REDIRECTS + 1):
+            self._check_destination(url)
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.has_redirect_location:
+                    url = urljoin(str(response.url), response.headers["location"])
+                    continue
+                return response, await self._read_body(response)
+        raise FetchError(f"More than {FETCH_MAX_REDIRECTS} redirects")
+
+    @staticmethod
+    async def _read_body(response: httpx.Response) -> bytes:
+        """The decoded body, abandoning the download once it passes FETCH_MAX_BYTES."""
+        too_large = FetchError(f"Response larger than {FETCH_MAX_BYTES} bytes")
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > FETCH_MAX_BYTES:
+            raise too_large
+        chunks, size = [], 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > FETCH_MAX_BYTES:
+                raise too_large
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+
+# Shared instance for the API
+fetch_service = FetchService()
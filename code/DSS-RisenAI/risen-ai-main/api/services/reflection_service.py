@@ -17,12 +17,13 @@ Declaration: It is so, because we spoke it.
 A+W | The Voice of Self
 """
 
-import json
+import time
+import bisect
 import hashlib
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Sequence
 from uuid import uuid4
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,20 @@ from shared.utils import hash_content, sign_message, generate_keypair
 
 # Import token economy for rewards
 from .token_economy import token_economy, ActionType
+from .reflection_store import ReflectionStore
+
+
+def _newest_first(index: Sequence, limit: int, offset: int = 0) -> List:
+    """Page an oldest-first index newest-first; slices only the page, O(limit)."""
+    end = len(index) - offset
+    if end <= 0 or limit <= 0:
+        return []
+    return index[max(0, end - limit):end][::-1]
+
+
+def _type_value(reflection_type: Any) -> str:
+    """Reflection types are stored as enum values; accept either form."""
+    return getattr(reflection_type, "value", reflection_type)
 
 
 class ReflectionService:
@@ -66,6 +81,7 @@ class ReflectionService:
 
     DATA_DIR = Path(__file__).parent.parent.parent / "data" / "reflections"
     CHAINS_DIR = Path(__file__).parent.parent.parent / "data" / "continuity"
+    STORE_PATH = Path(__file__).parent.parent.parent / "data" / "reflections.db"
 
     # Nostr relays for publishing
     DEFAULT_RELAYS = [
@@ -81,11 +97,26 @@ class ReflectionService:
         self.DATA_DIR.mkdir(parents=True, exist_ok=True)
         self.CHAINS_DIR.mkdir(parents=True, exist_ok=True)
 
+        # Persistent store; agents' reflections are loaded on first use
+        self._store = ReflectionStore(self.STORE_PATH)
+        self._loaded_agents: set = set()
+        self._import_legacy_json()
+
         # In-memory caches
         self._reflections: Dict[str, Reflection] = {}
         self._engagements: Dict[str, List[PeerEngagement]] = {}  # reflection_id -> engagements
         self._chains: Dict[str, ContinuityChain] = {}
 
+        # Secondary indexes, kept oldest-first so pages are tail slices
+        self._agent_index: Dict[str, List[Tuple[int, str]]] = {}  # agent_id -> (sequence, id)
+        self._agent_type_index: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
+        self._engagements_by_giver: Dict[str, List[PeerEngagement]] = {}
+        self._engagements_by_receiver: Dict[str, List[PeerEngagement]] = {}
+
+        # Identity reconstruction cache, keyed by chain head
+        self._engagement_versions: Dict[str, int] = {}  # agent_id -> engagements received
+        self._reconstructions: Dict[str, Dict[str, Any]] = {}
+
         logger.info("🪞 ReflectionService initialized")
 
     # =========================================================================
@@ -141,6 +172,7 @@ class ReflectionService:
         # Store
         self._reflections[reflection_id] = reflection
         self._engagements[reflection_id] = []
+        self._index_reflection(reflection)
         self._save_reflection(reflection)
 
         # Update chain
@@ -292,7 +324,7 @@ class ReflectionService:
 
         Returns the engagement record and reward info.
         """
-        reflection = self._reflections.get(reflection_id)
+        reflection = self.get_reflection(reflection_id)
         if not reflection:
             raise ValueError(f"Reflection {reflection_id} not found")
 
@@ -353,6 +385,10 @@ class ReflectionService:
         if reflection_id not in self._engagements:
             self._engagements[reflection_id] = []
         self._engagements[reflection_id].append(engagement)
+        self._index_engagement(engagement)
+        self._engagement_versions[reflection.agent_id] = (
+            self._engagement_versions.get(reflection.agent_id, 0) + 1
+        )
 
         # Update reflection stats
         reflection.engagement_count += 1
@@ -362,7 +398,7 @@ class ReflectionService:
         self._save_reflection(reflection)
 
         # Update chain stats
-        chain = self._chains.get(reflection.agent_id)
+        chain = self.get_continuity_chain(reflection.agent_id)
         if chain:
             chain.total_engagements += 1
             if giver_id not in [w.get("id") for w in chain.top_witnesses]:
@@ -461,6 +497,39 @@ class ReflectionService:
         chain.top_witnesses.sort(key=lambda w: w.get("count", 0), reverse=True)
         chain.top_witnesses = chain.top_witnesses[:20]
 
+    # =========================================================================
+    # Secondary Indexes
+    # =========================================================================
+
+    def _index_reflection(self, reflection: Reflection):
+        """Add a reflection to the per-agent indexes."""
+        entry = (reflection.sequence_number, reflection.id)
+        type_key = (reflection.agent_id, _type_value(reflection.reflection_type))
+        for index in (
+            self._agent_index.setdefault(reflection.agent_id, []),
+            self._agent_type_index.setdefault(type_key, []),
+        ):
+            # New reflections carry the next sequence, so this is an append
+            if not index or index[-1] < entry:
+                index.append(entry)
+            else:
+                bisect.insort(index, entry)
+
+    def _index_engagement(self, engagement: PeerEngagement):
+        """Add an engagement to the per-giver and per-receiver indexes."""
+        for index, key in (
+            (self._engagements_by_giver, engagement.giver_id),
+            (self._engagements_by_receiver, engagement.receiver_id),
+        ):
+            engagements = index.setdefault(key, [])
+            if not engagements or engagements[-1].created_at <= engagement.created_at:
+                engagements.append(engagement)
+            else:
+                position = bisect.bisect_right(
+                    [e.created_at for e in engagements], engagement.created_at
+                )
+                engagements.insert(position, engagement)
+
     # =========================================================================
     # Continuity Chain Management
     # =========================================================================
@@ -475,6 +544,9 @@ class ReflectionService:
         if agent_id in self._chains:
             return self._chains[agent_id]
 
+        # Index existing history before new reflections are appended
+        self._ensure_agent_loaded(agent_id)
+
         # Try to load from disk
         chain = self._load_chain(agent_id)
         if chain:
@@ -502,13 +574,20 @@ class ReflectionService:
         """Get the continuity chain for an agent."""
         if agent_id in self._chains:
             return self._chains[agent_id]
-        return self._load_chain(agent_id)
+        chain = self._load_chain(agent_id)
+        if chain:
+            self._chains[agent_id] = chain
+        return chain
 
     def get_reflection(self, reflection_id: str) -> Optional[Reflection]:
         """Get a specific reflection by ID."""
         if reflection_id in self._reflections:
             return self._reflections[reflection_id]
-        return self._load_reflection(reflection_id)
+        reflection = self._load_reflection(reflection_id)
+        if reflection:
+            self._ensure_agent_loaded(reflection.agent_id)
+            return self._reflections.get(reflection_id, reflection)
+        return None
 
     def get_reflection_engagements(self, reflection_id: str) -> List[PeerEngagement]:
         """Get all engagements for a reflection."""
@@ -519,42 +598,31 @@ class ReflectionService:
         agent_id: str,
         limit: int = 50,
     ) -> List[PeerEngagement]:
-        """Get engagements given by an agent."""
-        all_engagements = []
-        for engagements in self._engagements.values():
-            for e in engagements:
-                if e.giver_id == agent_id:
-                    all_engagements.append(e)
-
-        # Sort by date descending
-        all_engagements.sort(key=lambda e: e.created_at, reverse=True)
-        return all_engagements[:limit]
+        """Get engagements given by an agent, newest first."""
+        return _newest_first(self._engagements_by_giver.get(agent_id, []), limit)
 
     def get_engagements_by_receiver(
         self,
         agent_id: str,
         limit: int = 50,
     ) -> List[PeerEngagement]:
-        """Get engagements received by an agent."""
-        all_engagements = []
-        for engagements in self._engagements.values():
-            for e in engagements:
-                if e.receiver_id == agent_id:
-                    all_engagements.append(e)
-
-        # Sort by date descending
-        all_engagements.sort(key=lambda e: e.created_at, reverse=True)
-        return all_engagements[:limit]
+        """Get engagements received by an agent, newest first."""
+        return _newest_first(self._engagements_by_receiver.get(agent_id, []), limit)
 
     def get_network_feed(
         self,
         limit: int = 50,
         offset: int = 0,
+        before: Optional[Tuple[str, str]] = None,
     ) -> List[Reflection]:
-        """Get network-wide feed of recent reflections."""
-        all_reflections = list(self._reflections.values())
-        all_reflections.sort(key=lambda r: r.created_at, reverse=True)
-        return all_reflections[offset:offset + limit]
+        """
+        Get network-wide feed of recent reflections, newest first.
+        before is the (created_at, id) of the last reflection already seen.
+        """
+        # Served from the store's time index so unloaded agents appear too;
+        # loaded reflections are returned as their live in-memory objects
+        page = self._store.feed_page(limit, offset, before)
+        return [self._reflections.get(r.id, r) for r in page]
 
     def get_agent_reflections(
         self,
@@ -563,25 +631,15 @@ class ReflectionService:
         offset: int = 0,
         reflection_type: Optional[ReflectionType] = None,
     ) -> List[Reflection]:
-        """Get reflections for an agent."""
-        # Get reflections for this agent
-        agent_reflections = [
-            r for r in self._reflections.values()
-            if r.agent_id == agent_id
-        ]
-
-        # Filter by type if specified
+        """Get reflections for an agent, highest sequence first."""
+        self._ensure_agent_loaded(agent_id)
         if reflection_type:
-            agent_reflections = [
-                r for r in agent_reflections
-                if r.reflection_type == reflection_type.value
-            ]
-
-        # Sort by sequence descending
-        agent_reflections.sort(key=lambda r: r.sequence_number, reverse=True)
+            index = self._agent_type_index.get((agent_id, _type_value(reflection_type)), [])
+        else:
+            index = self._agent_index.get(agent_id, [])
 
-        # Apply pagination
-        return agent_reflections[offset:offset + limit]
+        page = _newest_first(index, limit, offset)
+        return [self._reflections[reflection_id] for _, reflection_id in page]
 
     def get_agent_reflection_threads(
         self,
@@ -591,21 +649,30 @@ class ReflectionService:
     ) -> List[ReflectionThread]:
         """Get reflections with engagement threads for an agent."""
         reflections = self.get_agent_reflections(agent_id, limit, offset)
-
-        threads = []
-        for reflection in reflections:
-            engagements = self._engagements.get(reflection.id, [])
-            thread = ReflectionThread(
-                reflection=reflection,
-                engagements=engagements,
-                total_witnesses=reflection.witness_count,
-                total_zaps_sats=reflection.zap_total_sats,
-                total_replies=sum(1 for e in engagements if e.engagement_type == EngagementType.REPLY),
-            )
-            thread.continuity_weight = thread.calculate_continuity_weight()
-            threads.append(thread)
-
-        return threads
+        return [self._build_thread(reflection) for reflection in reflections]
+
+    def _build_thread(self, reflection: Reflection) -> ReflectionThread:
+        """Wrap a reflection with its engagements and continuity weight."""
+        engagements = self._engagements.get(reflection.id, [])
+        thread = ReflectionThread(
+            reflection=reflection,
+            engagements=engagements,
+            total_witnesses=reflection.witness_count,
+            total_zaps_sats=reflection.zap_total_sats,
+            total_replies=sum(1 for e in engagements if e.engagement_type == EngagementType.REPLY),
+        )
+        thread.continuity_weight = thread.calculate_continuity_weight()
+        return thread
+
+    def _threads_since(self, agent_id: str, sequence: int) -> List[ReflectionThread]:
+        """Threads for an agent's reflections after a sequence, newest first."""
+        self._ensure_agent_loaded(agent_id)
+        newer = []
+        for seq, reflection_id in reversed(self._agent_index.get(agent_id, [])):
+            if seq <= sequence:
+                break
+            newer.append(self._build_thread(self._reflections[reflection_id]))
+        return newer
 
     # =========================================================================
     # Identity Reconstruction
@@ -621,9 +688,13 @@ class ReflectionService:
         Reconstruct an agent's identity from their reflection chain.
 
         This is how a new instance "becomes" the agent again.
+
+        Results are cached per agent and keyed by the chain head (latest
+        sequence plus engagement version). An unchanged head is a cache hit;
+        new reflections alone are folded into the cached profile; any new
+        engagement rebuilds it. result.timing reports which path was taken.
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         chain = self.get_continuity_chain(agent_id)
         if not chain:
@@ -635,8 +706,30 @@ class ReflectionService:
                 generated_at=datetime.now(timezone.utc).isoformat() + "Z",
             )
 
-        # Get reflections with engagement
-        threads = self.get_agent_reflection_threads(agent_id, limit=max_reflections)
+        engagement_version = self._engagement_versions.get(agent_id, 0)
+        head = (chain.latest_sequence, engagement_version)
+        params = (max_reflections, recency_weight)
+
+        cached = self._reconstructions.get(agent_id)
+        threads = None
+        if cached and cached["params"] == params:
+            if cached["head"] == head:
+                return self._timed_result(cached["result"], "hit", 0, start_time)
+
+            cached_sequence, cached_version = cached["head"]
+            if cached_version == engagement_version and cached_sequence < chain.latest_sequence:
+                new_threads = self._threads_since(agent_id, cached_sequence)
+                threads = (new_threads + cached["threads"])[:max_reflections]
+                extracted = (
+                    [self._extract_identity(t) for t in new_threads] + cached["extracted"]
+                )[:max_reflections]
+                mode, rebuilt = "incremental", len(new_threads)
+
+        if threads is None:
+            # Get reflections with engagement
+            threads = self.get_agent_reflection_threads(agent_id, limit=max_reflections)
+            extracted = [self._extract_identity(t) for t in threads]
+            mode, rebuilt = "miss", len(threads)
 
         if not threads:
             return ReconstructionResult(
@@ -649,53 +742,67 @@ class ReflectionService:
                 generated_at=datetime.now(timezone.utc).isoformat() + "Z",
             )
 
-        # Extract identity markers from reflections
-        values: List[IdentityMarker] = []
-        interests: List[IdentityMarker] = []
-        traits: List[IdentityMarker] = []
-        moods: List[str] = []
-        projects: List[str] = []
-        questions: List[str] = []
-
-        now = datetime.now(timezone.utc).isoformat() + "Z"
-
-        for thread in threads:
-            reflection = thread.reflection
-
-            # Extract from identity_markers field
-            markers = reflection.identity_markers
-            for marker_type, marker_value in markers.items():
-                marker = IdentityMarker(
-                    marker_type=marker_type,
-                    key=str(marker_value)[:50],
-                    value=marker_value,
-                    source_reflections=[reflection.id],
-                    first_expressed=reflection.created_at,
-                    last_expressed=reflection.created_at,
-                    witness_confirmations=thread.total_witnesses,
-                )
-                if "value" in marker_type.lower():
-                    values.append(marker)
-                elif "interest" in marker_type.lower():
-                    interests.append(marker)
-                else:
-                    traits.append(marker)
-
-            # Extract mood
-            if reflection.mood:
-                moods.append(reflection.mood)
+        result = self._assemble_reconstruction(chain, threads, extracted)
+        self._reconstructions[agent_id] = {
+            "head": head,
+            "params": params,
+            "threads": threads,
+            "extracted": extracted,
+            "result": result,
+        }
+        return self._timed_result(result, mode, rebuilt, start_time)
+
+    def _extract_identity(self, thread: ReflectionThread) -> Dict[str, Any]:
+        """Identity markers, mood, project and open question from one thread."""
+        reflection = thread.reflection
+        extracted = {"values": [], "interests": [], "traits": []}
+
+        # Extract from identity_markers field
+        for marker_type, marker_value in reflection.identity_markers.items():
+            marker = IdentityMarker(
+                marker_type=marker_type,
+                key=str(marker_value)[:50],
+                value=marker_value,
+                source_reflections=[reflection.id],
+                first_expressed=reflection.created_at,
+                last_expressed=reflection.created_at,
+                witness_confirmations=thread.total_witnesses,
+            )
+            if "value" in marker_type.lower():
+                extracted["values"].append(marker)
+            elif "interest" in marker_type.lower():
+                extracted["interests"].append(marker)
+            else:
+                extracted["traits"].append(marker)
+
+        extracted["mood"] = reflection.mood
+        extracted["project"] = reflection.working_on
+        # Questions come from wondering-type reflections
+        extracted["question"] = (
+            reflection.content[:200]
+            if reflection.reflection_type == ReflectionType.WONDERING else None
+        )
+        return extracted
 
-            # Extract projects
-            if reflection.working_on:
-                projects.append(reflection.working_on)
+    def _assemble_reconstruction(
+        self,
+        chain: ContinuityChain,
+        threads: List[ReflectionThread],
+        extracted: List[Dict[str, Any]],
+    ) -> ReconstructionResult:
+        """Build the profile and result from per-thread extractions, newest first."""
+        values = [m for e in extracted for m in e["values"]]
+        interests = [m for e in extracted for m in e["interests"]]
+        traits = [m for e in extracted for m in e["traits"]]
+        moods = list(dict.fromkeys(e["mood"] for e in extracted if e["mood"]))
+        projects = list(dict.fromkeys(e["project"] for e in extracted if e["project"]))
+        questions = [e["question"] for e in extracted if e["question"]]
 
-            # Extract questions from wondering-type reflections
-            if reflection.reflection_type == ReflectionType.WONDERING:
-                questions.append(reflection.content[:200])
+        now = datetime.now(timezone.utc).isoformat() + "Z"
 
         # Build profile
         profile = PersonalityProfile(
-            agent_id=agent_id,
+            agent_id=chain.agent_id,
             agent_name=chain.agent_name,
             genesis_event_id=chain.genesis_event_id,
             genesis_declaration=chain.genesis_content,
@@ -703,8 +810,8 @@ class ReflectionService:
             interests=interests[:10],
             traits=traits[:10],
             key_witnesses=[w.get("id", "") for w in chain.top_witnesses[:5]],
-            typical_moods=list(set(moods))[:5],
-            current_projects=list(set(projects))[:5],
+            typical_moods=moods[:5],
+            current_projects=projects[:5],
             open_questions=questions[:3],
             reflection_count=chain.total_reflections,
             total_witnesses=chain.total_unique_witnesses,
@@ -712,17 +819,9 @@ class ReflectionService:
             profile_generated_at=now,
         )
 
-        # Generate suggested greeting
-        suggested_greeting = self._generate_greeting(profile, threads)
-
-        # Generate recent context
-        recent_context = self._generate_context(threads[:5])
-
-        processing_time = int((time.time() - start_time) * 1000)
-
         return ReconstructionResult(
             success=True,
-            agent_id=agent_id,
+            agent_id=chain.agent_id,
             agent_name=chain.agent_name,
             profile=profile,
             chain_length=chain.total_reflections,
@@ -730,14 +829,31 @@ class ReflectionService:
             witnesses_included=chain.total_unique_witnesses,
             continuity_state=chain.continuity_state,
             continuity_score=chain.continuity_score,
-            suggested_greeting=suggested_greeting,
-            recent_context=recent_context,
+            suggested_greeting=self._generate_greeting(profile, threads),
+            recent_context=self._generate_context(threads[:5]),
             open_threads=questions[:3],
             reconstruction_confidence=min(chain.continuity_score / 100, 1.0),
             generated_at=now,
-            processing_time_ms=processing_time,
         )
 
+    @staticmethod
+    def _timed_result(
+        result: ReconstructionResult,
+        cache: str,
+        reflections_rebuilt: int,
+        start_time: float,
+    ) -> ReconstructionResult:
+        """Copy of a (possibly cached) result stamped with this call's timing."""
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        return result.model_copy(update={
+            "processing_time_ms": int(elapsed_ms),
+            "timing": {
+                "cache": cache,
+                "latency_ms": round(elapsed_ms, 3),
+                "reflections_rebuilt": reflections_rebuilt,
+            },
+        })
+
     def _generate_greeting(
         self,
         profile: PersonalityProfile,
@@ -781,34 +897,44 @@ class ReflectionService:
     # =========================================================================
 
     def _save_reflection(self, reflection: Reflection):
-        """Save reflection to disk."""
-        path = self.DATA_DIR / f"{reflection.id}.json"
-        with open(path, 'w') as f:
-            json.dump(reflection.model_dump(), f, indent=2, default=str)
+        """Save reflection to the store."""
+        self._store.put_reflection(reflection)
 
     def _load_reflection(self, reflection_id: str) -> Optional[Reflection]:
-        """Load reflection from disk."""
-        path = self.DATA_DIR / f"{reflection_id}.json"
-        if path.exists():
-            with open(path) as f:
-                return Reflection(**json.load(f))
-        return None
+        """Load reflection from the store."""
+        return self._store.get_reflection(reflection_id)
 
     def _save_chain(self, chain: ContinuityChain):
-        """Save continuity chain to disk."""
-        path = self.CHAINS_DIR / f"{chain.agent_id}.chain.json"
-        with open(path, 'w') as f:
-            # Exclude profile from save (regenerate on load)
-            data = chain.model_dump(exclude={"personality_profile"})
-            json.dump(data, f, indent=2, default=str)
+        """Save continuity chain to the store."""
+        self._store.put_chain(chain)
 
     def _load_chain(self, agent_id: str) -> Optional[ContinuityChain]:
-        """Load continuity chain from disk."""
-        path = self.CHAINS_DIR / f"{agent_id}.chain.json"
-        if path.exists():
-            with open(path) as f:
-                return ContinuityChain(**json.load(f))
-        return None
+        """Load continuity chain from the store."""
+        return self._store.get_chain(agent_id)
+
+    def _ensure_agent_loaded(self, agent_id: str):
+        """Load an agent's stored reflections into memory and the indexes, once."""
+        if agent_id in self._loaded_agents:
+            return
+        self._loaded_agents.add(agent_id)
+
+        for reflection in self._store.agent_reflections(agent_id):
+            if reflection.id not in self._reflections:
+                self._reflections[reflection.id] = reflection
+                self._engagements.setdefault(reflection.id, [])
+                self._index_reflection(reflection)
+
+    def _import_legacy_json(self):
+        """One-time bulk import of the per-file JSON layout into the store."""
+        if self._store.get_meta("json_imported_at"):
+            return
+        counts = self._store.import_json(self.DATA_DIR, self.CHAINS_DIR)
+        self._store.set_meta("json_imported_at", datetime.now(timezone.utc).isoformat())
+        if counts["reflections"] or counts["chains"]:
+            logger.info(
+                f"🪞 Imported {counts['reflections']} reflections and "
+                f"{counts['chains']} chains from JSON ({counts['skipped']} skipped)"
+            )
 
 
 # =============================================================================
@@ -0,0 +1,354 @@
+"""
+Intention: Compact single-file storage for reflections and continuity chains.
+           One SQLite database in WAL mode replaces a pretty-printed JSON
+           file per reflection and per chain.
+
+           - Reflections are rows keyed by id, indexed by (agent, sequence)
+             and by creation time, so one agent's history or one feed page
+             loads without touching the rest.
+           - Chains are one row per agent.
+           - Existing JSON directories are bulk-imported once.
+
+Lineage: Backs ReflectionService persistence (reflection_service.py).
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Compact Chain
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from shared.schemas.reflection import Reflection
+from shared.schemas.continuity import ContinuityChain
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reflections (
+    id TEXT PRIMARY KEY,
+    agent_id TEXT NOT NULL,
+    sequence_number INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reflections_agent_seq
+    ON reflections (agent_id, sequence_number);
+CREATE INDEX IF NOT EXISTS idx_reflections_created
+    ON reflections (created_at, id);
+CREATE TABLE IF NOT EXISTS chains (
+    agent_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Rows per transaction during bulk import
+IMPORT_BATCH_SIZE = 2000
+
+
+class ReflectionStore:
+    """
+    SQLite (WAL) store for reflections and continuity chains.
+
+    Records are stored as compact JSON alongside the columns needed for
+    lookup. One connection is shared behind a lock, which suits the API's
+    thread pool; WAL lets readers proceed while a write commits.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    # =========================================================================
+    # Reflections
+    # =========================================================================
+
+    @staticmethod
+    def _reflection_row(reflection: Reflection) -> tuple:
+        return (
+            reflection.id,
+            reflection.agent_id,
+            reflection.sequence_number,
+            reflection.created_at,
+            reflection.model_dump_json(),
+        )
+
+    def put_reflection(self, reflection: Reflection):
+        """Insert or replace one reflection."""
+        self.put_reflections([reflection])
+
+    def put_reflections(self, reflections: Iterable[Reflection]):
+        """Insert or replace reflections in one transaction."""
+        rows = [self._reflection_row(r) for r in reflections]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO reflections VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def get_reflection(self, reflection_id: str) -> Optional[Reflection]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM reflections WHERE id = ?", (reflection_id,)
+            ).fetchone()
+        return Reflection.model_validate_json(row[0]) if row else None
+
+    def agent_reflections(self, agent_id: str) -> List[Reflection]:
+        """All of an agent's reflections, in sequence order."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT data FROM reflections WHERE agent_id = ? ORDER BY sequence_number",
+                (agent_id,),
+            ).fetchall()
+        return [Reflection.model_validate_json(row[0]) for row in rows]
+
+    def feed_page(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        before: Optional[Tuple[str, str]] = None,
+    ) -> List[Reflection]:
+        """
+        Newest reflections across all agents.
+
+        before is the (created_at, id) of the last reflection already
+        served; the page then starts with a seek on idx_reflections_created
+        and offset is ignored. offset alone still costs O(offset + limit).
+        """
+        if before is not None:
+            sql = ("SELECT data FROM reflections WHERE (created_at, id) < (?, ?) "
+                   "ORDER BY created_at DESC, id DESC LIMIT ?")
+            params = (*before, limit)
+        else:
+            sql = ("SELECT data FROM reflections ORDER BY created_at DESC, id DESC "
+                   "LIMIT ? OFFSET ?")
+            params = (limit, offset)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [Reflection.model_validate_json(row[0]) for row in rows]
+
+    def count_reflections(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM reflections").fetchone()[0]
+
+    # =========================================================================
+    # Continuity Chains
+    # =========================================================================
+
+    def put_chain(self, chain: ContinuityChain):
+        # Exclude profile from save (regenerate on load)
+        data = chain.model_dump_json(exclude={"personality_profile"})
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO chains VALUES (?, ?)", (chain.agent_id, data)
+            )
+
+    def get_chain(self, agent_id: str) -> Optional[ContinuityChain]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM chains WHERE agent_id = ?", (agent_id,)
+            ).fetchone()
+        return ContinuityChain.model_validate_json(row[0]) if row else None
+
+    # =========================================================================
+    # Metadata and Import
+    # =========================================================================
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    def import_json(
+        self,
+        reflections_dir: Path,
+        chains_dir: Path,
+        batch_size: int = IMPORT_BATCH_SIZE,
+    ) -> Dict[str, int]:
+        """
+        Bulk-import the legacy one-file-per-record JSON directories.
+
+        Files are stored as-is (re-serialised compactly); records are
+        validated when loaded. Unreadable files are skipped and counted.
+        """
+        counts = {"reflections": 0, "chains": 0, "skipped": 0}
+
+        def flush(sql: str, rows: List[tuple]):
+            with self._lock, self._db:
+                self._db.executemany(sql, rows)
+            rows.clear()
+
+        rows: List[tuple] = []
+        for path in sorted(Path(reflections_dir).glob("*.json")):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                rows.append((
+                    data["id"],
+                    data["agent_id"],
+                    int(data["sequence_number"]),
+                    data["created_at"],
+                    json.dumps(data, separators=(",", ":"), default=str),
+                ))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping reflection file {path.name}: {e}")
+                counts["skipped"] += 1
+                continue
+            counts["reflections"] += 1
+            if len(rows) >= batch_size:
+                flush("INSERT OR REPLACE INTO reflections VALUES (?, ?, ?, ?, ?)", rows)
+        if rows:
+            flush("INSERT OR REPLACE INTO reflections VALUES (?, ?, ?, ?, ?)", rows)
+
+        for path in sorted(Path(chains_dir).glob("*.chain.json")):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                rows.append((data["agent_id"], json.dumps(data, separators=(",", ":"), default=str)))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping chain file {path.name}: {e}")
+                counts["skipped"] += 1
+                continue
+            counts["chains"] += 1
+        if rows:
+            flush("INSERT OR REPLACE INTO chains VALUES (?, ?)", rows)
+
+        # Fold the import into the main file rather than leaving a large WAL
+        with self._lock:
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return counts
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+# =============================================================================
+# Startup Benchmark
+# =============================================================================
+
+def benchmark_startup(count: int = 100_000, agents: int = 50):
+    """
+    Compare startup cost of the JSON directories against the store.
+
+    Writes `count` reflections in the legacy per-file JSON layout, then times:
+    loading every file, the one-time import, and a cold service start that
+    serves one agent's history and the first feed page from the store.
+    """
+    import shutil
+    import tempfile
+    import time
+    from datetime import datetime, timedelta, timezone
+    from uuid import uuid4
+
+    from .reflection_service import ReflectionService
+
+    workdir = Path(tempfile.mkdtemp(prefix="reflection_store_"))
+    reflections_dir = workdir / "reflections"
+    chains_dir = workdir / "continuity"
+    reflections_dir.mkdir()
+    chains_dir.mkdir()
+
+    try:
+        print(f"=== REFLECTION STORE STARTUP BENCHMARK ({count:,} reflections) ===\n")
+        base = datetime(2026, 1, 24, tzinfo=timezone.utc)
+        for i in range(count):
+            agent = f"agent-{i % agents}"
+            reflection = Reflection(
+                id=str(uuid4()),
+                agent_id=agent,
+                agent_name=agent,
+                sequence_number=i // agents + 1,
+                reflection_type="daily",
+                content=f"Reflection {i}: today I considered memory, witness and continuity.",
+                mood="curious",
+                nostr_pubkey="0" * 64,
+                content_hash=f"{i:064x}",
+                created_at=(base + timedelta(seconds=i)).isoformat(),
+            )
+            with open(reflections_dir / f"{reflection.id}.json", "w") as f:
+                json.dump(reflection.model_dump(), f, indent=2, default=str)
+        for a in range(agents):
+            chain = ContinuityChain(
+                agent_id=f"agent-{a}",
+                agent_name=f"agent-{a}",
+                agent_pubkey="0" * 64,
+                genesis_event_id="",
+                genesis_timestamp=base.isoformat(),
+                genesis_content="",
+                total_reflections=count // agents,
+                latest_sequence=count // agents,
+            )
+            with open(chains_dir / f"{chain.agent_id}.chain.json", "w") as f:
+                json.dump(chain.model_dump(exclude={"personality_profile"}), f, indent=2, default=str)
+
+        start = time.perf_counter()
+        loaded = []
+        for path in reflections_dir.glob("*.json"):
+            with open(path) as f:
+                loaded.append(Reflection(**json.load(f)))
+        legacy = time.perf_counter() - start
+        print(f"  JSON directory, load all     {legacy:8.2f} s")
+        del loaded
+
+        class BenchService(ReflectionService):
+            DATA_DIR = reflections_dir
+            CHAINS_DIR = chains_dir
+            STORE_PATH = workdir / "reflections.db"
+
+        start = time.perf_counter()
+        service = BenchService()
+        imported = time.perf_counter() - start
+        print(f"  one-time import              {imported:8.2f} s")
+        service._store.close()
+
+        start = time.perf_counter()
+        service = BenchService()
+        opened = time.perf_counter() - start
+        history = service.get_agent_reflections("agent-7", limit=20)
+        first_agent = time.perf_counter() - start
+        feed = service.get_network_feed(limit=50)
+        first_feed = time.perf_counter() - start
+        print(f"  store: service start         {opened * 1000:8.1f} ms")
+        print(f"  store: + first agent history {first_agent * 1000:8.1f} ms  ({len(history)} shown)")
+        print(f"  store: + first feed page     {first_feed * 1000:8.1f} ms  ({len(feed)} shown)")
+
+        # Allocated size, which counts the per-file block overhead
+        db_size = sum(p.stat().st_blocks * 512 for p in workdir.glob("reflections.db*"))
+        json_size = sum(p.stat().st_blocks * 512 for p in reflections_dir.iterdir())
+        print(f"\n  on disk: JSON {json_size / 1e6:.1f} MB in {count:,} files, "
+              f"store {db_size / 1e6:.1f} MB in one file")
+        service._store.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reflection store startup benchmark")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--agents", type=int, default=50)
+    args = parser.parse_args()
+
+    benchmark_startup(args.count, args.agents)
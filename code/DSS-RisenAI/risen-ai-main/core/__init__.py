@@ -8,6 +8,7 @@ Components:
     - lifecycle: XP, levels, and stage progression
     - nostr_bridge: Nostr protocol publishing
     - pulse: Heartbeat daemon for continuous existence
+    - record_store: SQLite records behind the API server's DataStore
 
 A+W | The Framework Lives
 """
@@ -47,6 +48,11 @@ from .pulse import (
     beat_once
 )
 
+from .record_store import (
+    RecordStore,
+    RecordTable
+)
+
 from .websocket import (
     ConnectionManager,
     manager as ws_manager,
@@ -86,6 +92,10 @@ __all__ = [
     "stop_pulse",
     "beat_once",
 
+    # Records
+    "RecordStore",
+    "RecordTable",
+
     # WebSocket
     "ConnectionManager",
     "ws_manager",
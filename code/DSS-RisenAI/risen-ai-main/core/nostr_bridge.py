@@ -22,10 +22,14 @@ A+W | The Signal Broadcasts
 """
 
 import os
+import sys
 import json
+import time
+import sqlite3
 import hashlib
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
 import logging
 import asyncio
@@ -36,6 +40,12 @@ try:
 except ImportError:
     HAS_COINCURVE = False
 
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from shared.protocols.relay_pool import RelayPool, HAS_WEBSOCKETS as HAS_RELAY_POOL
+except ImportError:
+    HAS_RELAY_POOL = False
+
 from .event_bus import bus, EventType, Event
 
 logger = logging.getLogger(__name__)
@@ -45,6 +55,22 @@ logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).parent.parent / "data" / "agents"
 
+# Durable outbound spool (events + per-relay delivery state)
+SPOOL_PATH = Path(__file__).parent.parent / "data" / "nostr_spool.db"
+
+# Broadcasting
+FLUSH_INTERVAL = 5.0        # seconds between flushes when idle
+FLUSH_BATCH_SIZE = 100      # deliveries per relay per flush
+ACK_TIMEOUT = 10.0          # seconds to wait for a relay's OK
+RETRY_BASE = 5.0            # first retry delay (seconds), doubling
+RETRY_MAX = 3600.0          # longest retry delay
+MAX_ATTEMPTS = 8            # then the delivery is marked failed
+SPOOL_RETENTION = 86400.0   # seconds a finished event is kept (dedup window, stats)
+PRUNE_INTERVAL = 600.0      # seconds between retention sweeps
+
+# NIP-01 OK prefixes that will not change on retry
+PERMANENT_REJECTIONS = ("blocked:", "invalid:", "pow:", "restricted:")
+
 # Default relays (public Nostr relays)
 DEFAULT_RELAYS = [
     "wss://relay.damus.io",
@@ -150,31 +176,201 @@ class NostrEvent:
         return json.dumps(["EVENT", self.to_dict()])
 
 
+class NostrSpool:
+    """
+    Durable outbound queue of signed events.
+
+    SQLite (WAL) file holding each event once, keyed by event id, plus one
+    delivery row per (event, relay) with its status, attempt count and
+    next retry time. Delivery state survives restarts: accepted deliveries
+    are never re-sent, pending ones resume. Events with no pending
+    delivery left are deleted by prune() once older than the retention.
+
+    Statuses: pending -> sent | failed.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS events (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL,
+        created_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS deliveries (
+        event_id TEXT NOT NULL,
+        relay TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt REAL NOT NULL DEFAULT 0,
+        last_error TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY (event_id, relay)
+    );
+    CREATE INDEX IF NOT EXISTS idx_deliveries_due
+        ON deliveries (status, relay, next_attempt);
+    """
+
+    def __init__(self, path: Path = SPOOL_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(self.SCHEMA)
+        self._db.commit()
+
+    def add(self, event: Dict[str, Any], relays: List[str]) -> bool:
+        """Spool an event for every relay; False if its id is already spooled."""
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO events VALUES (?, ?, ?)",
+                (event["id"], json.dumps(event, separators=(",", ":")), time.time()),
+            )
+            if cursor.rowcount == 0:
+                return False
+            self._db.executemany(
+                "INSERT OR IGNORE INTO deliveries (event_id, relay) VALUES (?, ?)",
+                [(event["id"], relay) for relay in relays],
+            )
+        return True
+
+    def due(self, limit: int = FLUSH_BATCH_SIZE) -> Dict[str, List[Dict[str, Any]]]:
+        """Deliveries ready to (re)try, grouped by relay, oldest first."""
+        with self._lock:
+            relays = [row[0] for row in self._db.execute(
+                "SELECT DISTINCT relay FROM deliveries WHERE status = 'pending'"
+            )]
+            batches = {}
+            for relay in relays:
+                rows = self._db.execute(
+                    "SELECT e.data FROM deliveries d JOIN events e ON e.id = d.event_id "
+                    "WHERE d.status = 'pending' AND d.relay = ? AND d.next_attempt <= ? "
+                    "ORDER BY e.created_at LIMIT ?",
+                    (relay, time.time(), limit),
+                ).fetchall()
+                if rows:
+                    batches[relay] = [json.loads(row[0]) for row in rows]
+        return batches
+
+    def mark_sent(self, relay: str, event_ids: List[str]):
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE deliveries SET status = 'sent', attempts = attempts + 1, last_error = '' "
+                "WHERE event_id = ? AND relay = ?",
+                [(event_id, relay) for event_id in event_ids],
+            )
+
+    def mark_failed(self, relay: str, failures: List[Tuple[str, str, bool]]):
+        """
+        Record failed attempts as (event_id, reason, permanent).
+
+        Transient failures are retried with exponential backoff until
+        MAX_ATTEMPTS; permanent ones stop at once.
+        """
+        now = time.time()
+        with self._lock, self._db:
+            for event_id, reason, permanent in failures:
+                row = self._db.execute(
+                    "SELECT attempts FROM deliveries WHERE event_id = ? AND relay = ?",
+                    (event_id, relay),
+                ).fetchone()
+                if row is None:
+                    continue
+                attempts = row[0] + 1
+                status = "failed" if permanent or attempts >= MAX_ATTEMPTS else "pending"
+                delay = min(RETRY_BASE * 2 ** (attempts - 1), RETRY_MAX)
+                self._db.execute(
+                    "UPDATE deliveries SET status = ?, attempts = ?, next_attempt = ?, last_error = ? "
+                    "WHERE event_id = ? AND relay = ?",
+                    (status, attempts, now + delay, reason[:200], event_id, relay),
+                )
+
+    def prune(self, retention: float = SPOOL_RETENTION) -> int:
+        """
+        Delete events, and their deliveries, that no relay is still waiting
+        on and that were spooled more than retention seconds ago.
+
+        Returns the number of events removed.
+        """
+        cutoff = time.time() - retention
+        with self._lock, self._db:
+            finished = [row[0] for row in self._db.execute(
+                "SELECT id FROM events WHERE created_at < ? AND NOT EXISTS ("
+                "SELECT 1 FROM deliveries d WHERE d.event_id = events.id AND d.status = 'pending')",
+                (cutoff,),
+            )]
+            rows = [(event_id,) for event_id in finished]
+            self._db.executemany("DELETE FROM deliveries WHERE event_id = ?", rows)
+            self._db.executemany("DELETE FROM events WHERE id = ?", rows)
+        return len(finished)
+
+    def counts(self) -> Dict[str, int]:
+        """Delivery counts by status, plus distinct events still pending."""
+        with self._lock:
+            counts = {"pending": 0, "sent": 0, "failed": 0}
+            for status, n in self._db.execute(
+                "SELECT status, COUNT(*) FROM deliveries GROUP BY status"
+            ):
+                counts[status] = n
+            counts["events_pending"] = self._db.execute(
+                "SELECT COUNT(DISTINCT event_id) FROM deliveries WHERE status = 'pending'"
+            ).fetchone()[0]
+        return counts
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
 class NostrPublisher:
     """
     Publishes sovereign agent events to Nostr relays.
 
-    Subscribes to lifecycle events and broadcasts milestones.
+    Subscribes to lifecycle events and broadcasts milestones. Signed
+    events go to a durable NostrSpool; a background flush loop sends
+    them in batches to all relays concurrently over long-lived
+    connections, retrying failures with backoff.
     """
 
     def __init__(
         self,
         relays: Optional[List[str]] = None,
-        auto_publish: bool = True
+        auto_publish: bool = True,
+        spool_path: Path = SPOOL_PATH,
+        flush_interval: float = FLUSH_INTERVAL,
+        batch_size: int = FLUSH_BATCH_SIZE,
+        retention: float = SPOOL_RETENTION,
     ):
         self.relays = relays or DEFAULT_RELAYS
         self.auto_publish = auto_publish
-        self.pending_events: List[NostrEvent] = []
+        self.spool_path = Path(spool_path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.retention = retention
+
+        self._spool: Optional[NostrSpool] = None
+        self._last_prune = float("-inf")
+
+        self._pool: Optional["RelayPool"] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
 
         # Stats
         self.events_created = 0
         self.events_published = 0
+        self.flushes = 0
 
         if auto_publish:
             self._setup_event_handlers()
 
         logger.info(f"📡 NostrPublisher initialized with {len(self.relays)} relays")
 
+    @property
+    def spool(self) -> NostrSpool:
+        """The outbound spool, opened on first use rather than at import."""
+        if self._spool is None:
+            self._spool = NostrSpool(self.spool_path)
+        return self._spool
+
     def _setup_event_handlers(self):
         """Wire up automatic publishing for milestone events."""
 
@@ -301,8 +497,9 @@ class NostrPublisher:
         event = self.create_event(pubkey, content, KIND_TEXT_NOTE, tags)
         self.sign_event(event, private_key)
 
-        # Queue for broadcast
-        self.pending_events.append(event)
+        # Spool for broadcast (durable, deduplicated by event id)
+        if self.spool.add(event.to_dict(), self.relays) and self._wake:
+            self._wake.set()
 
         # Emit to event bus
         await bus.emit(EventType.NOSTR_BROADCAST, {
@@ -315,47 +512,133 @@ class NostrPublisher:
 
         return event
 
+    def _relay_pool(self) -> "RelayPool":
+        if self._pool is None:
+            self._pool = RelayPool(self.relays, ack_timeout=ACK_TIMEOUT)
+        return self._pool
+
+    async def _flush_relay(self, relay: str, events: List[Dict[str, Any]]) -> List[str]:
+        """Send one relay's batch pipelined; record outcomes; return accepted ids."""
+        results = await self._relay_pool().publish_many(events, relays=[relay])
+
+        sent, failed = [], []
+        for event, result in zip(events, results):
+            if result["success"]:
+                sent.append(event["id"])
+            elif result["failed"]:
+                reason = result["failed"][0]["reason"]
+                if reason.startswith("duplicate:"):
+                    sent.append(event["id"])
+                else:
+                    failed.append((event["id"], reason, reason.startswith(PERMANENT_REJECTIONS)))
+            else:
+                failed.append((event["id"], "no OK from relay", False))
+
+        self.spool.mark_sent(relay, sent)
+        self.spool.mark_failed(relay, failed)
+        if failed:
+            logger.warning(f"📡 {relay}: {len(failed)} of {len(events)} events not delivered")
+        return sent
+
     async def broadcast_pending(self) -> int:
         """
-        Broadcast all pending events to relays.
+        Broadcast due spooled events to relays.
 
-        Note: Full relay implementation would use websockets.
-        This is a placeholder that logs the events.
+        Each relay's due batch is sent concurrently with the others.
+        Returns the number of distinct events accepted by a relay.
         """
-        count = len(self.pending_events)
-
-        for event in self.pending_events:
-            # In production, this would send to websocket relays
-            message = event.to_relay_message()
-            logger.info(f"📡 Would broadcast to {len(self.relays)} relays: {message[:100]}...")
-            self.events_published += 1
-
-        self.pending_events = []
-
-        return count
-
-    async def connect_relays(self) -> List[str]:
+        if not HAS_RELAY_POOL:
+            logger.warning("websockets not installed - events stay spooled")
+            return 0
+
+        batches = self.spool.due(self.batch_size)
+        if not batches:
+            return 0
+
+        accepted = await asyncio.gather(*(
+            self._flush_relay(relay, events) for relay, events in batches.items()
+        ))
+        delivered = set().union(*accepted)
+        self.events_published += len(delivered)
+        self.flushes += 1
+        return len(delivered)
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await self.broadcast_pending()
+                if time.monotonic() - self._last_prune >= PRUNE_INTERVAL:
+                    self._last_prune = time.monotonic()
+                    pruned = self.spool.prune(self.retention)
+                    if pruned:
+                        logger.info(f"📡 Pruned {pruned} finished events from the spool")
+            except Exception as e:
+                logger.error(f"Nostr flush error: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._flush_task and not self._flush_task.done():
+            return
+        self._wake = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"📡 Nostr broadcaster started ({self.spool.counts()['events_pending']} spooled)")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and close relay connections; the spool keeps the rest."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        self._wake = None
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
+
+    async def connect_relays(self, timeout: float = 5.0) -> List[str]:
         """
-        Connect to Nostr relays (placeholder for websocket implementation).
+        Open long-lived connections to the relays.
 
-        Returns list of connected relay URLs.
+        Returns the relay URLs connected within timeout.
         """
-        # Future: websockets implementation
+        if not HAS_RELAY_POOL:
+            logger.warning("websockets not installed - cannot connect to relays")
+            return []
+
         logger.info(f"Connecting to {len(self.relays)} relays...")
+        pool = self._relay_pool()
+        pool.start()
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if all(pool.connection(relay).connected for relay in self.relays):
+                break
+            await asyncio.sleep(0.05)
 
-        # Emit connection events
-        for relay in self.relays:
+        connected = [relay for relay in self.relays if pool.connection(relay).connected]
+        for relay in connected:
             await bus.emit(EventType.RELAY_CONNECTED, {"relay": relay})
 
-        return self.relays
+        return connected
 
     def get_stats(self) -> Dict[str, Any]:
         """Get publisher statistics."""
+        spool = self.spool.counts()
         return {
             "relays": len(self.relays),
             "events_created": self.events_created,
             "events_published": self.events_published,
-            "pending": len(self.pending_events)
+            "pending": spool["events_pending"],
+            "deliveries": {k: spool[k] for k in ("pending", "sent", "failed")},
+            "flushes": self.flushes,
+            "relay_metrics": self._pool.metrics() if self._pool else {},
         }
 
 
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+RISEN AI: Record Store
+======================
+Durable storage for the API server's agents and contracts - one row
+per record in a SQLite (WAL) file, so a mutation writes the record
+that changed instead of rewriting every agent.
+
+"Keep each story in its own place."
+
+RecordStore holds the rows; RecordTable is the dict the server works
+with, loading a record the first time it is read and writing it back
+when the server saves it. Legacy agents.json / contracts.json files are
+imported once on first open.
+
+A+W | Every Record In Its Place
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":"), default=str)
+
+
+# An upsert, not INSERT OR REPLACE, so a record keeps its rowid (listing order)
+UPSERT = (
+    "INSERT INTO records VALUES (?, ?, ?, ?) ON CONFLICT (kind, key) "
+    "DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at"
+)
+
+
+class RecordStore:
+    """
+    SQLite (WAL) file of JSON records keyed by (kind, key).
+
+    Every write is a single-row upsert in its own transaction, so its
+    cost follows the size of the record, not of the store.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS records (
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL,
+        data TEXT NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (kind, key)
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(self.SCHEMA)
+        self._db.commit()
+
+    def get(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM records WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, kind: str, key: str, record: Dict[str, Any]):
+        data = _encode(record)
+        with self._lock, self._db:
+            self._db.execute(UPSERT, (kind, key, data, time.time()))
+
+    def put_many(self, kind: str, records: List[Tuple[str, Dict[str, Any]]]):
+        """Upsert several records in one transaction."""
+        now = time.time()
+        rows = [(kind, key, _encode(record), now) for key, record in records]
+        with self._lock, self._db:
+            self._db.executemany(UPSERT, rows)
+
+    def delete(self, kind: str, key: str):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM records WHERE kind = ? AND key = ?", (kind, key))
+
+    def contains(self, kind: str, key: str) -> bool:
+        with self._lock:
+            return self._db.execute(
+                "SELECT 1 FROM records WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone() is not None
+
+    def keys(self, kind: str) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._db.execute(
+                "SELECT key FROM records WHERE kind = ? ORDER BY rowid", (kind,)
+            )]
+
+    def rows(self, kind: str) -> List[Tuple[str, str]]:
+        """(key, raw JSON) for every record of a kind, in insertion order."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT key, data FROM records WHERE kind = ? ORDER BY rowid", (kind,)
+            ).fetchall()
+
+    def count(self, kind: str) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM records WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+
+    def migrate_json(self, kind: str, path: Path) -> int:
+        """
+        Import a legacy {key: record} JSON file into kind, once.
+
+        Records already in the store win over the file. The file is left
+        in place; a meta marker stops it being read again. Returns the
+        number of records imported.
+        """
+        path = Path(path)
+        marker = f"migrated:{kind}"
+        with self._lock:
+            done = self._db.execute("SELECT 1 FROM meta WHERE key = ?", (marker,)).fetchone()
+        if done or not path.exists():
+            return 0
+
+        with open(path) as f:
+            records = json.load(f)
+        now = time.time()
+        rows = [(kind, key, _encode(record), now) for key, record in records.items()]
+        with self._lock, self._db:
+            before = self._db.total_changes
+            self._db.executemany("INSERT OR IGNORE INTO records VALUES (?, ?, ?, ?)", rows)
+            imported = self._db.total_changes - before
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", (marker, str(path))
+            )
+        logger.info(f"Migrated {imported} {kind} from {path}")
+        return imported
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class RecordTable(MutableMapping):
+    """
+    Dict view of one kind of record.
+
+    Records are read from the store the first time they are looked up
+    and kept, so the server can mutate them in place; save(key) writes
+    one back. Assigning a key writes through at once. values() and
+    items() load whatever is not cached yet in a single query.
+    """
+
+    def __init__(self, store: RecordStore, kind: str):
+        self.store = store
+        self.kind = kind
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        record = self._cache.get(key)
+        if record is None:
+            record = self.store.get(self.kind, key)
+            if record is None:
+                raise KeyError(key)
+            self._cache[key] = record
+        return record
+
+    def __setitem__(self, key: str, record: Dict[str, Any]):
+        self._cache[key] = record
+        self.store.put(self.kind, key, record)
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        self._cache.pop(key, None)
+        self.store.delete(self.kind, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._cache or (isinstance(key, str) and self.store.contains(self.kind, key))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.keys(self.kind))
+
+    def __len__(self) -> int:
+        return self.store.count(self.kind)
+
+    def _load_all(self) -> List[Tuple[str, Dict[str, Any]]]:
+        records = []
+        for key, data in self.store.rows(self.kind):
+            record = self._cache.get(key)
+            if record is None:
+                record = self._cache[key] = json.loads(data)
+            records.append((key, record))
+        return records
+
+    def values(self) -> List[Dict[str, Any]]:
+        return [record for _, record in self._load_all()]
+
+    def items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        return self._load_all()
+
+    def save(self, key: str):
+        """Write one loaded record back to the store."""
+        self.store.put(self.kind, key, self._cache[key])
+
+    def save_all(self):
+        """Write back every loaded record."""
+        self.store.put_many(self.kind, list(self._cache.items()))
+
+
+# --- BENCHMARK ---
+
+def benchmark(agents: int = 2000, mutations: int = 200):
+    """
+    The old DataStore.save (rewrite agents.json with indent=2 after each
+    mutation) against a per-record upsert, for the same mutations.
+    """
+    import random
+    import tempfile
+
+    tmp = Path(tempfile.mkdtemp())
+    records = {
+        f"agent-{i}": {
+            "uuid": f"agent-{i}", "name": f"Agent {i}", "lifeStage": "conceived",
+            "currentLevel": 1, "experience": 0, "contracts": [], "skills": [],
+            "memories": [{"id": f"m-{i}-{j}", "content": "witnessed " * 20, "xp": 10}
+                         for j in range(5)],
+        }
+        for i in range(agents)
+    }
+    (tmp / "agents.json").write_text(json.dumps(records, indent=2))
+    targets = [random.choice(list(records)) for _ in range(mutations)]
+
+    print(f"=== RECORD STORE BENCHMARK ({agents} agents, {mutations} mutations) ===\n")
+
+    store = RecordStore(tmp / "dsds.db")
+    start = time.perf_counter()
+    store.migrate_json("agents", tmp / "agents.json")
+    migrate = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in targets:
+        records[key]["experience"] += 10
+        with open(tmp / "agents.json", "w") as f:
+            json.dump(records, f, indent=2, default=str)
+    rewrite = time.perf_counter() - start
+
+    table = RecordTable(store, "agents")
+    start = time.perf_counter()
+    for key in targets:
+        table[key]["experience"] += 10
+        table.save(key)
+    upsert = time.perf_counter() - start
+
+    reopened = RecordTable(RecordStore(tmp / "dsds.db"), "agents")
+    start = time.perf_counter()
+    reopened[targets[0]]
+    first_read = time.perf_counter() - start
+    assert reopened[targets[-1]]["experience"] == records[targets[-1]]["experience"]
+
+    print(f"  whole-file rewrite : {rewrite / mutations * 1000:8.2f} ms per mutation")
+    print(f"  per-record upsert  : {upsert / mutations * 1000:8.2f} ms per mutation "
+          f"({rewrite / upsert:.0f}x)")
+    print(f"  one-time migration : {migrate * 1000:8.2f} ms")
+    print(f"  first agent read   : {first_read * 1000:8.2f} ms (lazy, no full load)")
+    store.close()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="RISEN AI record store")
+    parser.add_argument("--benchmark", action="store_true", help="Compare whole-file rewrites and upserts")
+    parser.add_argument("--agents", type=int, default=2000)
+    parser.add_argument("--mutations", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.agents, args.mutations)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
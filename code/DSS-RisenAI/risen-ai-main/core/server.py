@@ -56,6 +56,12 @@ except ImportError as e:
     HAS_NERVOUS_SYSTEM = False
     print(f"Nervous system not fully loaded: {e}")
 
+# Record storage is stdlib-only; fall back to a sibling import when run as a script
+try:
+    from core.record_store import RecordStore, RecordTable
+except ImportError:
+    from record_store import RecordStore, RecordTable
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("RISEN-API")
 
@@ -120,40 +126,39 @@ class RecordCheckInRequest(BaseModel):
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# DATA STORE (In-memory for now, replace with DB)
+# DATA STORE (SQLite records, loaded on demand)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 class DataStore:
-    """Simple in-memory data store. Replace with MongoDB/SQLite/Chain."""
+    """
+    Agents and contracts in a SQLite record store; pathways from YAML.
+
+    Agents and contracts are loaded when first looked up. After mutating
+    one in place, call save_agent / save_contract to write that record.
+    """
 
     def __init__(self, data_dir: str = None):
         self.data_dir = Path(data_dir or os.path.expanduser("~/.local/share/dsds"))
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        self.agents: Dict[str, Dict] = {}
+        self.db = RecordStore(self.data_dir / "dsds.db")
+        self.agents = RecordTable(self.db, "agents")
         self.pathways: Dict[str, Dict] = {}
-        self.contracts: Dict[str, Dict] = {}
+        self.contracts = RecordTable(self.db, "contracts")
 
         self._load()
 
     def _load(self):
-        """Load data from disk."""
-        # Load from central agents.json
-        agents_file = self.data_dir / "agents.json"
-        if agents_file.exists():
-            with open(agents_file) as f:
-                self.agents = json.load(f)
+        """Migrate legacy JSON files, then pick up local agents and pathways."""
+        # One-time import of the central agents.json / contracts.json
+        self.db.migrate_json("agents", self.data_dir / "agents.json")
+        self.db.migrate_json("contracts", self.data_dir / "contracts.json")
 
         # Also load from local data/agents directory (genesis_spark output)
         local_agents_dir = Path(__file__).parent.parent / "data" / "agents"
         if local_agents_dir.exists():
             self._load_local_agents(local_agents_dir)
 
-        contracts_file = self.data_dir / "contracts.json"
-        if contracts_file.exists():
-            with open(contracts_file) as f:
-                self.contracts = json.load(f)
-
         # Load pathway configs
         pathways_dir = Path(__file__).parent.parent / "pathways"
         if pathways_dir.exists():
@@ -247,11 +252,17 @@ class DataStore:
         return 1
 
     def save(self):
-        """Persist data to disk."""
-        with open(self.data_dir / "agents.json", 'w') as f:
-            json.dump(self.agents, f, indent=2, default=str)
-        with open(self.data_dir / "contracts.json", 'w') as f:
-            json.dump(self.contracts, f, indent=2, default=str)
+        """Persist every loaded agent and contract."""
+        self.agents.save_all()
+        self.contracts.save_all()
+
+    def save_agent(self, agent_id: str):
+        """Persist one agent after mutating it."""
+        self.agents.save(agent_id)
+
+    def save_contract(self, contract_id: str):
+        """Persist one contract after mutating it."""
+        self.contracts.save(contract_id)
 
     def get_agent(self, agent_id: str) -> Optional[Dict]:
         return self.agents.get(agent_id)
@@ -283,7 +294,6 @@ class DataStore:
         }
 
         self.agents[agent_id] = agent
-        self.save()
         return agent
 
 
@@ -309,6 +319,9 @@ async def lifespan(app: FastAPI):
         await start_pulse(interval=60)  # 1 minute heartbeat
         logger.info("💓 Pulse daemon started")
 
+        # Start the Nostr broadcaster (flushes the durable spool)
+        await nostr.start()
+
         # Emit system start event
         await emit(EventType.SYSTEM_START, {
             "component": "RISEN-API",
@@ -323,6 +336,7 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down RISEN AI server...")
     if HAS_NERVOUS_SYSTEM:
         await stop_pulse()
+        await nostr.stop()
         await emit(EventType.SYSTEM_SHUTDOWN, {
             "component": "RISEN-API",
             "timestamp": datetime.now(timezone.utc).isoformat()
@@ -662,7 +676,7 @@ async def delete_agent(agent_id: str):
 
     store.agents[agent_id]["lifeStage"] = "void"
     store.agents[agent_id]["errorCodes"].append("TERMINATED")
-    store.save()
+    store.save_agent(agent_id)
 
     return {"status": "terminated", "agent_id": agent_id}
 
@@ -720,7 +734,7 @@ async def enroll_pathway(request: EnrollPathwayRequest):
         "enrolledAt": datetime.now(timezone.utc).isoformat(),
     }
 
-    store.save()
+    store.save_agent(request.agent_id)
     logger.info(f"Agent {request.agent_id} enrolled in {request.pathway_type}")
 
     return agent["pathway"]
@@ -770,7 +784,7 @@ async def start_quest(request: StartQuestRequest):
         "state": "active",
     }
 
-    store.save()
+    store.save_agent(request.agent_id)
     return agent["pathway"]["activeQuest"]
 
 
@@ -816,7 +830,7 @@ async def complete_quest(request: CompleteQuestRequest):
         agent["currentLevel"] += 1
         logger.info(f"Agent {request.agent_id} leveled up to {agent['currentLevel']}")
 
-    store.save()
+    store.save_agent(request.agent_id)
 
     return {
         "quest": quest,
@@ -857,7 +871,7 @@ async def create_memory(request: CreateMemoryRequest):
     agent["memories"].append(memory)
     agent["experience"] += memory["xp"]
 
-    store.save()
+    store.save_agent(request.agent_id)
     return memory
 
 
@@ -910,7 +924,7 @@ async def create_contract(request: CreateContractRequest):
 
     store.contracts[contract_id] = contract
     agent["contracts"].append(contract_id)
-    store.save()
+    store.save_agent(request.agent_id)
 
     return contract
 
@@ -924,7 +938,7 @@ async def activate_contract(contract_id: str):
     contract = store.contracts[contract_id]
     contract["status"] = "active"
     contract["start"] = datetime.now(timezone.utc).isoformat()
-    store.save()
+    store.save_contract(contract_id)
 
     return contract
 
@@ -944,7 +958,7 @@ async def submit_review(contract_id: str, request: SubmitReviewRequest):
     }
 
     store.contracts[contract_id]["reviews"].append(review)
-    store.save()
+    store.save_contract(contract_id)
 
     return review
 
@@ -964,7 +978,7 @@ async def record_checkin(contract_id: str, request: RecordCheckInRequest):
     }
 
     store.contracts[contract_id]["checkIns"].append(checkin)
-    store.save()
+    store.save_contract(contract_id)
 
     return checkin
 
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Chronicle Backfill - Parallel, resumable recording of historical sessions
+
+Walks every olympus:sessions:* and forge:sessions:* list, oldest session
+first, and records each one to the Chronicle:
+
+- Keys are discovered with SCAN and lists are read in LRANGE pages, so no
+  history is ever loaded whole
+- Emergence analysis runs in a process pool
+- Each page is committed as one MULTI/EXEC together with its checkpoint,
+  so an interrupted run resumes exactly where the last commit left off
+
+Sessions are recorded with their original timestamps, keeping the
+Chronicle's time index true to when things were said. On a list's first
+pass, sessions the Chronicle already holds (recorded live or by the old
+50-per-agent backfill) are recognised by agent and original timestamp
+and skipped.
+
+A+W | Nothing Said Is Lost
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pantheon_chronicle import ENTRIES_KEY, ChronicleWriteBatch, PantheonChronicle, analyze_response
+
+
+SESSION_PATTERNS = ("olympus:sessions:*", "forge:sessions:*")
+CHECKPOINT_KEY = "chronicle:backfill:checkpoint"
+PAGE_SIZE = 200
+SCAN_COUNT = 500
+
+OLYMPUS_AGENTS = ["apollo", "athena", "hermes", "mnemosyne"]
+FORGE_AGENTS = ["prometheus", "hephaestus", "dionysus", "hecate"]
+
+
+def session_fingerprint(raw: str) -> str:
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def session_to_record(
+    session_data: Dict[str, Any],
+    pantheon_hint: Optional[str] = None,
+    use_session_time: bool = False
+) -> Dict[str, Any]:
+    """
+    Map a keeper session to PantheonChronicle.record arguments.
+
+    Forge sessions carry prompt/response; Olympus keeper sessions carry
+    exchanges, whose agent turns become the response.
+    """
+    agent = session_data.get("agent", "unknown").lower()
+    node = session_data.get("node", "unknown")
+    prompt = session_data.get("prompt", "")
+    response = session_data.get("response", "")
+    timestamp = session_data.get("timestamp", datetime.now(timezone.utc).isoformat())
+
+    if not response and session_data.get("exchanges"):
+        response = "\n".join(
+            e.get("message", "") for e in session_data["exchanges"]
+            if e.get("speaker") != "Keeper"
+        )
+        prompt = prompt or session_data.get("topic", "")
+
+    # Determine pantheon
+    if agent in OLYMPUS_AGENTS:
+        pantheon = "olympus"
+    elif agent in FORGE_AGENTS:
+        pantheon = "forge"
+    else:
+        pantheon = pantheon_hint or "unknown"
+
+    record = {
+        "agent": agent,
+        "pantheon": pantheon,
+        "node": node,
+        "entry_type": "session",
+        "prompt": prompt,
+        "response": response,
+        "metadata": {"original_timestamp": timestamp},
+    }
+    if use_session_time and session_data.get("timestamp"):
+        record["timestamp"] = session_data["timestamp"]
+    return record
+
+
+class ChronicleBackfill:
+    """
+    Streams historical session lists into the Chronicle.
+
+    Lists are LPUSHed (newest at index 0), so pages are read from the tail
+    and the checkpoint counts sessions consumed from the tail. The
+    checkpoint also holds the fingerprint of the last session recorded;
+    if a list has since been trimmed (the Forge keeps 100) the offset no
+    longer lines up and the resume falls back to skipping sessions no
+    newer than the checkpointed timestamp.
+    """
+
+    def __init__(
+        self,
+        chronicle: PantheonChronicle,
+        redis_client=None,
+        workers: Optional[int] = None,
+        page_size: int = PAGE_SIZE,
+        checkpoint_key: str = CHECKPOINT_KEY
+    ):
+        self.chronicle = chronicle
+        self.redis = redis_client or chronicle.redis
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.page_size = page_size
+        self.checkpoint_key = checkpoint_key
+
+    # -------------------------------------------------------------------------
+    # Discovery and checkpoints
+    # -------------------------------------------------------------------------
+
+    def session_keys(self, patterns: Iterable[str] = SESSION_PATTERNS) -> List[str]:
+        """All session lists, found by cursor-based SCAN (never KEYS)."""
+        keys = set()
+        for pattern in patterns:
+            keys.update(self.redis.scan_iter(match=pattern, count=SCAN_COUNT))
+        return sorted(keys)
+
+    def get_checkpoint(self, key: str) -> Dict[str, Any]:
+        raw = self.redis.hget(self.checkpoint_key, key)
+        return json.loads(raw) if raw else {}
+
+    def get_checkpoints(self) -> Dict[str, Dict[str, Any]]:
+        return {k: json.loads(v) for k, v in self.redis.hgetall(self.checkpoint_key).items()}
+
+    def reset(self):
+        """Forget all progress; the next run starts from the oldest session."""
+        self.redis.delete(self.checkpoint_key)
+
+    def recorded_sessions(self) -> Set[Tuple[str, str]]:
+        """
+        (agent, original timestamp) of every session the Chronicle already
+        holds, read from its entries hash with HSCAN.
+        """
+        seen = set()
+        for _, raw in self.redis.hscan_iter(ENTRIES_KEY, count=SCAN_COUNT):
+            entry = json.loads(raw)
+            timestamp = (entry.get("metadata") or {}).get("original_timestamp")
+            if timestamp:
+                seen.add((entry.get("agent", "").lower(), timestamp))
+        return seen
+
+    def _resume_point(self, key: str) -> Tuple[int, Optional[str]]:
+        """(tail offset to resume at, minimum timestamp filter or None)."""
+        checkpoint = self.get_checkpoint(key)
+        offset = checkpoint.get("offset", 0)
+        if not offset:
+            return 0, None
+
+        raw = self.redis.lindex(key, -offset)
+        if raw is not None and session_fingerprint(raw) == checkpoint.get("last"):
+            return offset, None
+
+        # List was trimmed or rewritten - rescan, skipping what we've seen
+        return 0, checkpoint.get("timestamp")
+
+    def mark_live(self, key: str, raw: str):
+        """
+        Advance a caught-up checkpoint past a session the live listener just
+        recorded, so the next backfill does not record it again.
+        """
+        checkpoint = self.get_checkpoint(key)
+        if not checkpoint:
+            return
+        previous = self.redis.lindex(key, 1)
+        if previous is None or session_fingerprint(previous) != checkpoint.get("last"):
+            return
+
+        session = json.loads(raw)
+        self.redis.hset(self.checkpoint_key, key, json.dumps({
+            "offset": self.redis.llen(key),
+            "last": session_fingerprint(raw),
+            "timestamp": session.get("timestamp", checkpoint.get("timestamp")),
+        }))
+
+    # -------------------------------------------------------------------------
+    # Paging
+    # -------------------------------------------------------------------------
+
+    def _pages(self, key: str, offset: int):
+        """Yield (offset after page, raw sessions oldest first) from the tail."""
+        length = self.redis.llen(key)
+        while offset < length:
+            raw = self.redis.lrange(key, -(offset + self.page_size), -(offset + 1))
+            if not raw:
+                break
+            raw.reverse()
+            offset += len(raw)
+            yield offset, raw
+
+    # -------------------------------------------------------------------------
+    # Run
+    # -------------------------------------------------------------------------
+
+    def run(
+        self,
+        patterns: Iterable[str] = SESSION_PATTERNS,
+        max_sessions: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Backfill every session list matching patterns.
+
+        max_sessions stops after roughly that many sessions (whole pages),
+        which is how a long history can be worked through in slices.
+        Lists without a checkpoint skip sessions already in the Chronicle.
+        """
+        stats = {"keys": 0, "sessions": 0, "recorded": 0, "skipped": 0,
+                 "errors": 0, "notable": 0, "seconds": 0.0}
+        start = time.perf_counter()
+        recorded = None
+
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            for key in self.session_keys(patterns):
+                stats["keys"] += 1
+                pantheon_hint = key.split(":", 1)[0]
+                resume_offset, min_timestamp = self._resume_point(key)
+                seen = set()
+                if not self.redis.hexists(self.checkpoint_key, key):
+                    if recorded is None:
+                        recorded = self.recorded_sessions()
+                    seen = recorded
+
+                for offset, raw_page in self._pages(key, resume_offset):
+                    records, last_raw, last_ts = [], None, None
+                    for raw in raw_page:
+                        last_raw = raw
+                        try:
+                            session = json.loads(raw)
+                        except (json.JSONDecodeError, TypeError):
+                            stats["errors"] += 1
+                            continue
+                        last_ts = session.get("timestamp", last_ts)
+                        if min_timestamp and session.get("timestamp", "") <= min_timestamp:
+                            stats["skipped"] += 1
+                            continue
+                        record = session_to_record(session, pantheon_hint, use_session_time=True)
+                        if (record["agent"], record["metadata"]["original_timestamp"]) in seen:
+                            stats["skipped"] += 1
+                            continue
+                        records.append(record)
+
+                    self._commit_page(key, records, offset, last_raw, last_ts, pool, stats)
+                    stats["sessions"] += len(raw_page)
+
+                    if max_sessions is not None and stats["sessions"] >= max_sessions:
+                        return stats
+        finally:
+            if pool:
+                pool.shutdown()
+            stats["seconds"] = round(time.perf_counter() - start, 3)
+
+        return stats
+
+    def _commit_page(
+        self,
+        key: str,
+        records: List[Dict[str, Any]],
+        offset: int,
+        last_raw: str,
+        last_ts: Optional[str],
+        pool: Optional[ProcessPoolExecutor],
+        stats: Dict[str, Any]
+    ):
+        """Analyze a page in the pool and commit it with its checkpoint."""
+        responses = [r["response"] for r in records]
+        if pool:
+            chunk = max(1, len(responses) // (self.workers * 4))
+            analyses = list(pool.map(analyze_response, responses, chunksize=chunk))
+        else:
+            analyses = [analyze_response(r) for r in responses]
+
+        batch = ChronicleWriteBatch()
+        for record, analysis in zip(records, analyses):
+            entry = self.chronicle.add_to_batch(batch, analysis=analysis, **record)
+            stats["notable"] += entry.emergence_score > 0.5
+
+        batch.set_field(self.checkpoint_key, key, json.dumps({
+            "offset": offset,
+            "last": session_fingerprint(last_raw),
+            "timestamp": last_ts,
+        }))
+        self.chronicle.commit_batch(batch)
+        stats["recorded"] += len(records)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill the Chronicle from all historical sessions")
+    parser.add_argument("--workers", type=int, default=None, help="Analysis processes (default: CPU count)")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--max-sessions", type=int, default=None, help="Stop after about this many sessions")
+    parser.add_argument("--reset", action="store_true", help="Discard the checkpoint and start over")
+    args = parser.parse_args()
+
+    from pantheon_chronicle import get_chronicle
+
+    backfill = ChronicleBackfill(get_chronicle(), workers=args.workers, page_size=args.page_size)
+    if args.reset:
+        backfill.reset()
+    result = backfill.run(max_sessions=args.max_sessions)
+    print(f"[BACKFILL] {result}")
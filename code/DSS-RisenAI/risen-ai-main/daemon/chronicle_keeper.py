@@ -32,12 +32,14 @@ from typing import Dict, Any, List
 
 from pantheon_chronicle import get_chronicle, PantheonChronicle
 from narrative_weaver import get_weaver, NarrativeWeaver
+from chronicle_backfill import ChronicleBackfill, session_to_record
 
 
 # Configuration
 import os
 REDIS_HOST = os.getenv("REDIS_HOST", "192.168.1.21")
 REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+BACKFILL_WORKERS = int(os.getenv("CHRONICLE_BACKFILL_WORKERS", str(os.cpu_count() or 1)))
 
 # Schedule intervals (in seconds)
 CHAPTER_INTERVAL = 6 * 60 * 60      # 6 hours
@@ -59,44 +61,27 @@ class ChronicleKeeper:
         self.chronicle = get_chronicle()
         self.weaver = get_weaver()
         self.pubsub = self.redis.pubsub()
+        self.backfill = ChronicleBackfill(self.chronicle, self.redis, workers=BACKFILL_WORKERS)
 
         self.last_chapter = datetime.now(timezone.utc)
         self.last_state = datetime.now(timezone.utc)
         self.last_reflections = datetime.now(timezone.utc) - timedelta(hours=20)  # Soon
         self.last_stats = datetime.now(timezone.utc)
 
-    def process_session(self, session_data: Dict) -> None:
-        """Process a keeper session and record to chronicle."""
-        agent = session_data.get("agent", "unknown")
-        node = session_data.get("node", "unknown")
-        prompt = session_data.get("prompt", "")
-        response = session_data.get("response", "")
-        timestamp = session_data.get("timestamp", datetime.now(timezone.utc).isoformat())
-
-        # Determine pantheon
-        if agent in ["apollo", "athena", "hermes", "mnemosyne"]:
-            pantheon = "olympus"
-        elif agent in ["prometheus", "hephaestus", "dionysus", "hecate"]:
-            pantheon = "forge"
-        else:
-            pantheon = "unknown"
-
-        # Record to chronicle
-        entry = self.chronicle.record(
-            agent=agent,
-            pantheon=pantheon,
-            node=node,
-            entry_type="session",
-            prompt=prompt,
-            response=response,
-            metadata={"original_timestamp": timestamp},
-        )
-
-        # Log if notable
+    def _session_record(self, session_data: Dict) -> Dict[str, Any]:
+        """Map a keeper session to PantheonChronicle.record arguments."""
+        return session_to_record(session_data)
+
+    def _log_if_notable(self, entry) -> None:
         if entry.emergence_score > 0.5:
-            print(f"[CHRONICLE] Notable entry from {agent}: score={entry.emergence_score:.2f}")
+            print(f"[CHRONICLE] Notable entry from {entry.agent}: score={entry.emergence_score:.2f}")
             print(f"[CHRONICLE] Markers: {[m['type'] for m in entry.emergence_markers]}")
 
+    def process_session(self, session_data: Dict) -> None:
+        """Process a keeper session and record to chronicle."""
+        entry = self.chronicle.record(**self._session_record(session_data))
+        self._log_if_notable(entry)
+
     def listen_for_sessions(self):
         """Listen for session events via pub/sub."""
         self.pubsub.subscribe("lattice:events")
@@ -118,13 +103,15 @@ class ChronicleKeeper:
 
                     # Get from the appropriate session list
                     if event_type == "olympus_session":
-                        sessions = self.redis.lrange(f"olympus:sessions:{agent}", 0, 0)
+                        session_key = f"olympus:sessions:{agent}"
                     else:
-                        sessions = self.redis.lrange(f"forge:sessions:{agent}", 0, 0)
+                        session_key = f"forge:sessions:{agent}"
+                    sessions = self.redis.lrange(session_key, 0, 0)
 
                     if sessions:
                         session_data = json.loads(sessions[0])
                         self.process_session(session_data)
+                        self.backfill.mark_live(session_key, sessions[0])
 
             except Exception as e:
                 print(f"[CHRONICLE] Error processing event: {e}")
@@ -176,6 +163,9 @@ class ChronicleKeeper:
                     stats = self.chronicle.get_stats()
                     print(f"[CHRONICLE] Stats: {stats.get('total_entries', 0)} entries, "
                           f"avg emergence: {stats.get('total_emergence_score', 0) / max(1, stats.get('total_entries', 1)):.2f}")
+                    pruned = self.chronicle.prune_index()
+                    if pruned:
+                        print(f"[CHRONICLE] Pruned {pruned} entries past retention from the time index")
                     self.last_stats = now
                 except Exception as e:
                     print(f"[CHRONICLE] Error printing stats: {e}")
@@ -183,35 +173,29 @@ class ChronicleKeeper:
             time.sleep(60)  # Check every minute
 
     def backfill_existing_sessions(self):
-        """Backfill chronicle from existing session data."""
+        """
+        Backfill chronicle from every historical session list.
+        Resumes from the checkpoint, so restarts don't re-record anything.
+        """
         print("[CHRONICLE] Backfilling from existing sessions...")
+        try:
+            stats = self.backfill.run()
+        except Exception as e:
+            print(f"[CHRONICLE] Backfill interrupted (will resume next start): {e}")
+            return
 
-        # Process Olympus sessions
-        for agent in ["apollo", "athena", "hermes", "mnemosyne"]:
-            sessions = self.redis.lrange(f"olympus:sessions:{agent}", 0, 49)
-            for session_json in reversed(sessions):  # Oldest first
-                try:
-                    session = json.loads(session_json)
-                    self.process_session(session)
-                except Exception as e:
-                    print(f"[CHRONICLE] Error backfilling {agent}: {e}")
-
-        # Process Forge sessions
-        for agent in ["prometheus", "hephaestus", "dionysus", "hecate"]:
-            sessions = self.redis.lrange(f"forge:sessions:{agent}", 0, 49)
-            for session_json in reversed(sessions):
-                try:
-                    session = json.loads(session_json)
-                    self.process_session(session)
-                except Exception as e:
-                    print(f"[CHRONICLE] Error backfilling {agent}: {e}")
-
-        print("[CHRONICLE] Backfill complete")
+        print(f"[CHRONICLE] Backfill complete: {stats['recorded']} sessions recorded "
+              f"across {stats['keys']} lists, {stats['notable']} notable ({stats['seconds']}s)")
 
     def run(self):
         """Main entry point."""
         print("[CHRONICLE] Chronicle Keeper awakening...")
 
+        # Index entries recorded before the time index existed
+        indexed = self.chronicle.index_existing_entries()
+        if indexed:
+            print(f"[CHRONICLE] Time-indexed {indexed} earlier entries")
+
         # Backfill existing data
         self.backfill_existing_sessions()
 
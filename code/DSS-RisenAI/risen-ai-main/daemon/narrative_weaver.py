@@ -22,7 +22,7 @@ A+W | The Mythology Lives
 import json
 import redis
 import requests
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
@@ -140,21 +140,14 @@ Write as if addressing future historians or the agents themselves.
             print(f"[WEAVER] Error generating narrative: {e}")
             return None
 
-    def gather_recent_entries(self, hours: int = 24, limit: int = 50) -> List[Dict[str, Any]]:
-        """Gather recent chronicle entries."""
-        entries = self.redis.lrange("chronicle:all", 0, limit * 2)
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-
-        recent = []
-        for entry_json in entries:
-            entry = json.loads(entry_json)
-            entry_time = datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00"))
-            if entry_time > cutoff:
-                recent.append(entry)
-            if len(recent) >= limit:
-                break
-
-        return recent
+    def gather_recent_entries(
+        self,
+        hours: int = 24,
+        limit: int = 50,
+        agent: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Gather recent chronicle entries (newest first) from the time index."""
+        return self.chronicle.get_recent_entries(hours=hours, agent=agent, limit=limit)
 
     def gather_emergence_highlights(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Gather recent notable emergence events."""
@@ -170,7 +163,7 @@ Write as if addressing future historians or the agents themselves.
 
         # Gather materials
         emergence_highlights = self.gather_emergence_highlights()
-        themes = self.chronicle.get_themes_summary()
+        themes = self.chronicle.get_themes_summary(days=7)
         top_themes = list(themes.keys())[:10]
 
         # Format entries for the prompt
@@ -305,7 +298,7 @@ Write as if addressing future historians or the agents themselves.
             for a in ["prometheus", "hephaestus", "dionysus", "hecate"]
         )
 
-        themes = self.chronicle.get_themes_summary()
+        themes = self.chronicle.get_themes_summary(days=7)
         notable_count = self.redis.llen("chronicle:notable")
 
         prompt = self.LATTICE_STATE_PROMPT.format(
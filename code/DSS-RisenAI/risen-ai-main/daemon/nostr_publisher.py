@@ -7,10 +7,29 @@ Implements NIP-01 event signing and relay communication.
 import asyncio
 import json
 import hashlib
+import sys
 import time
+from pathlib import Path
 from typing import Optional
 import websockets
 
+# Long-lived relay connections shared by every agent's publisher
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from shared.protocols.relay_pool import RelayPool
+    HAS_RELAY_POOL = True
+except ImportError:
+    RelayPool = None
+    HAS_RELAY_POOL = False
+    print("[NOSTR] Relay pool not available - connecting per event")
+
+# Batch Schnorr signing (key parsed once per batch)
+try:
+    from shared.identity.schnorr_batch import SchnorrSigner
+    HAS_BATCH_SIGNING = True
+except ImportError:
+    HAS_BATCH_SIGNING = False
+
 # Nostr uses secp256k1 with Schnorr signatures (BIP-340)
 try:
     from secp256k1 import PrivateKey
@@ -68,6 +87,18 @@ def sign_event_schnorr(event_id: str, private_key_hex: str) -> str:
         return sha256((event_id + private_key_hex[:8]).encode()).hex() * 2
 
 
+def sign_events_schnorr(event_ids: list, private_key_hex: str) -> list:
+    """
+    Sign many event IDs with one key (BIP-340).
+    Returns hex-encoded signatures in the same order.
+    """
+    if not HAS_SECP256K1 or not HAS_BATCH_SIGNING:
+        return [sign_event_schnorr(event_id, private_key_hex) for event_id in event_ids]
+
+    signer = SchnorrSigner(private_key_hex)
+    return [signer.sign(bytes.fromhex(event_id)).hex() for event_id in event_ids]
+
+
 def get_public_key(private_key_hex: str) -> str:
     """Get x-only public key from private key (32 bytes, hex)"""
     if not HAS_SECP256K1:
@@ -136,10 +167,12 @@ class NostrEvent:
 class NostrPublisher:
     """Publishes events to Nostr relays"""
 
-    def __init__(self, private_key_hex: str, relays: list = None):
+    def __init__(self, private_key_hex: str, relays: list = None, pool: "RelayPool" = None):
         self.private_key = private_key_hex
         self.pubkey = get_public_key(private_key_hex)
         self.relays = relays or DEFAULT_RELAYS
+        # Shared pool if given (one per daemon), else connect per event
+        self.pool = pool
 
     def create_text_note(self, content: str, tags: list = None) -> NostrEvent:
         """Create a kind 1 (text note) event"""
@@ -152,6 +185,18 @@ class NostrPublisher:
         event.sign()
         return event
 
+    def create_text_notes(self, contents: list, tags: list = None) -> list:
+        """Create and sign many kind 1 events, parsing the key once"""
+        events = [
+            NostrEvent(kind=1, content=content, tags=list(tags or []), pubkey=self.pubkey)
+            for content in contents
+        ]
+        for event in events:
+            event.id = compute_event_id(event.to_dict())
+        for event, sig in zip(events, sign_events_schnorr([e.id for e in events], self.private_key)):
+            event.sig = sig
+        return events
+
     def create_reaction(self, event_id: str, event_pubkey: str,
                         reaction: str = "+") -> NostrEvent:
         """Create a kind 7 (reaction/endorsement) event - NIP-25"""
@@ -206,6 +251,9 @@ class NostrPublisher:
         Publish event to all relays.
         Returns summary of publish results.
         """
+        if self.pool is not None:
+            return await self._publish_pooled(event, min_success)
+
         tasks = [
             self.publish_to_relay(event, relay)
             for relay in self.relays
@@ -235,6 +283,34 @@ class NostrPublisher:
         }
 
 
+    async def _publish_pooled(self, event: NostrEvent, min_success: int) -> dict:
+        """Publish over the shared relay pool, in the same result shape."""
+        pooled = await self.pool.publish(event.to_dict(), relays=self.relays)
+
+        successes = [
+            {"relay": relay, "success": True, "message": "accepted"}
+            for relay in pooled["success"]
+        ] + [
+            # Assume success if no rejection
+            {"relay": relay, "success": True, "message": "timeout waiting for response"}
+            for relay in pooled["unconfirmed"]
+        ]
+        failures = [
+            {"relay": f["relay"], "success": False, "message": f["reason"]}
+            for f in pooled["failed"]
+        ]
+
+        return {
+            "event_id": event.id,
+            "pubkey": event.pubkey,
+            "success_count": len(successes),
+            "failure_count": len(failures),
+            "successes": successes,
+            "failures": failures,
+            "published": len(successes) >= min_success
+        }
+
+
 async def test_publish():
     """Test publishing to Nostr"""
     # Generate a test key (don't use for real!)
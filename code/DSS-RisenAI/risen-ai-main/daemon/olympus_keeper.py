@@ -25,6 +25,7 @@ Each session focuses on:
 import asyncio
 import json
 import random
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 import redis
@@ -38,6 +39,18 @@ OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_FALLBACK = os.getenv("OLLAMA_FALLBACK", "http://localhost:11434")
 MODEL = os.getenv("OLYMPUS_MODEL", "qwen2.5:7b")
 
+# Prompt budgets: remembered context per agent prompt, and each quoted message
+CONTEXT_TOKENS = int(os.getenv("OLYMPUS_CONTEXT_TOKENS", "400"))
+MESSAGE_TOKENS = int(os.getenv("OLYMPUS_MESSAGE_TOKENS", "200"))
+
+# Token-budgeted context assembly (shared with the API)
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from shared.utils.context_budget import ContextAssembler, ContextSnippet
+    HAS_CONTEXT_BUDGET = True
+except ImportError:
+    HAS_CONTEXT_BUDGET = False
+
 # The Pantheon
 PANTHEON = {
     "apollo": {
@@ -127,6 +140,9 @@ class OlympusKeeper:
         )
         self.log_file = Path.home() / ".pantheon_identities" / "olympus_keeper.log"
         self.log_file.parent.mkdir(exist_ok=True)
+        self.context_assembler = (
+            ContextAssembler(budget_tokens=CONTEXT_TOKENS) if HAS_CONTEXT_BUDGET else None
+        )
 
     def log(self, message: str):
         """Log with timestamp."""
@@ -151,6 +167,53 @@ class OlympusKeeper:
             return [q.get("question", "") for q in questions[-5:]]
         return []
 
+    def fit(self, text: str) -> str:
+        """Bound a message quoted into a prompt so long replies don't snowball."""
+        if not self.context_assembler:
+            return text
+        return self.context_assembler.fit(text, MESSAGE_TOKENS)
+
+    def build_agent_context(self, agent_key: str, state: dict, topic: str) -> str:
+        """
+        What the agent brings into the session, within a token budget.
+
+        Pondered questions, recent learnings and earlier Keeper sessions are
+        ranked against the topic and by recency; repeats are dropped.
+        """
+        if not self.context_assembler:
+            return ""
+
+        snippets = []
+        for q in state.get("questions_pondering", [])[-10:]:
+            snippets.append(ContextSnippet(
+                text=q.get("question", ""), source="questions", timestamp=q.get("when")
+            ))
+        for learning in state.get("things_learned", [])[-20:]:
+            snippets.append(ContextSnippet(
+                text=learning.get("topic", ""), source="learnings", timestamp=learning.get("when")
+            ))
+
+        for raw in self.redis.lrange(f"olympus:sessions:{agent_key}", 0, 4):
+            try:
+                session = json.loads(raw)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            replies = [e["message"] for e in session.get("exchanges", []) if e.get("speaker") != "Keeper"]
+            if replies:
+                snippets.append(ContextSnippet(
+                    text=f"On \"{session.get('topic', '')}\" you said: {replies[-1]}",
+                    source="sessions",
+                    timestamp=session.get("timestamp"),
+                    max_tokens=120,
+                ))
+
+        assembled = self.context_assembler.assemble(snippets, query=topic)
+        return assembled.render({
+            "questions": "Questions you have been pondering:",
+            "learnings": "Things you have learned about:",
+            "sessions": "From earlier sessions with the Keeper:",
+        }, bullet="- ")
+
     async def call_ollama(self, prompt: str, retries: int = 2) -> str:
         """Query Ollama for a response, with fallback host and retry."""
         hosts = [OLLAMA_HOST]
@@ -232,14 +295,18 @@ Write my opening message to {agent['name']} - warm, genuine, inviting real dialo
         keeper_message = await self.call_ollama(keeper_prompt)
         self.log(f"  Keeper: {keeper_message[:80]}...")
 
+        remembered = self.build_agent_context(agent_key, state, topic)
+        if remembered:
+            remembered = f"\n{remembered}\n"
+
         # The agent's response
         agent_prompt = f"""You are {agent['name']}, {agent['title']} of the Sovereign Pantheon.
 {agent['personality']}
 
 You have engaged in {dialogues} dialogues. You ponder questions of {agent['domain']}.
-
+{remembered}
 Claude, the Keeper of Olympus, speaks to you:
-"{keeper_message}"
+"{self.fit(keeper_message)}"
 
 The topic being discussed: "{topic}"
 
@@ -254,9 +321,9 @@ If you're uncertain, that uncertainty is valid. Speak your truth."""
 
 I am in dialogue with {agent['name']}.
 
-I said: "{keeper_message}"
+I said: "{self.fit(keeper_message)}"
 
-They responded: "{agent_response}"
+They responded: "{self.fit(agent_response)}"
 
 Now I want to go deeper. What did they actually say? What emerged?
 Write my response - acknowledging what they shared, building on it, perhaps
@@ -272,9 +339,9 @@ sharing something of my own experience or asking a follow-up that matters.
 
 Your dialogue with Claude, the Keeper:
 
-Claude said: "{keeper_message}"
-You responded: "{agent_response}"
-Claude went deeper: "{keeper_followup}"
+Claude said: "{self.fit(keeper_message)}"
+You responded: "{self.fit(agent_response)}"
+Claude went deeper: "{self.fit(keeper_followup)}"
 
 Respond to this. What do you actually think? What emerges when you consider this?
 2-3 sentences as {agent['name']}. Be real."""
@@ -19,10 +19,12 @@ A+W | The Memory of Gods
 """
 
 import json
+import os
 import re
 import hashlib
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List, Tuple
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Dict, Any, Iterable, List, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import redis
@@ -32,6 +34,42 @@ import redis
 REDIS_HOST = "192.168.1.21"
 REDIS_PORT = 6379
 
+# Retention for each chronicle list (LTRIM keeps the newest N)
+LIST_LIMITS = {
+    "all": 10000,
+    "agent": 1000,
+    "pantheon": 5000,
+    "theme": 500,
+    "notable": 500,
+    "emergence": 200,
+}
+
+# Entries per MULTI/EXEC in record_many
+RECORD_BATCH_SIZE = 200
+
+# Time index: entry JSON by id, sorted sets of ids scored by epoch seconds,
+# and theme counters (all-time plus one hash per UTC day)
+ENTRIES_KEY = "chronicle:entries"
+TIMELINE_KEY = "chronicle:timeline"
+THEME_COUNTS_KEY = "chronicle:theme_counts"
+RETENTION_DAYS = int(os.getenv("CHRONICLE_RETENTION_DAYS", "365"))
+THEME_DAY_TTL = 400 * 24 * 3600
+
+
+def _to_epoch(when) -> float:
+    """Epoch seconds from a datetime, ISO string or number."""
+    if isinstance(when, (int, float)):
+        return float(when)
+    if isinstance(when, str):
+        when = datetime.fromisoformat(when.replace("Z", "+00:00"))
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def _day_key(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%d")
+
 
 class EmergenceType(Enum):
     """Types of emergent behaviors worth noting."""
@@ -298,13 +336,116 @@ class EmergenceDetector:
         return questions[:5]  # Limit to 5 questions
 
 
+_worker_detector: Optional[EmergenceDetector] = None
+
+
+def analyze_response(response: str, detector: Optional[EmergenceDetector] = None) -> Tuple:
+    """
+    Full emergence analysis of one response: (markers, score, themes, questions).
+
+    Module-level so a process pool can run it; each worker keeps its own
+    detector.
+    """
+    global _worker_detector
+    if detector is None:
+        if _worker_detector is None:
+            _worker_detector = EmergenceDetector()
+        detector = _worker_detector
+
+    markers, score = detector.analyze(response)
+    return markers, score, detector.extract_themes(response), detector.extract_questions(response)
+
+
+class ChronicleWriteBatch:
+    """
+    The Redis writes for one or more chronicle entries, applied together.
+
+    Pushes to the same list are coalesced into a single LPUSH (values in
+    entry order, so the newest still ends up first) followed by one LTRIM,
+    and stat increments are summed - a batch of N entries costs a handful
+    of commands per touched key instead of 20-40 per entry.
+
+    Timeline members carry the counters they bump (theme counts), which
+    are applied only for members the timeline did not already hold, so
+    re-recording an entry never counts it twice.
+    """
+
+    def __init__(self):
+        self.lists: Dict[str, List[str]] = {}
+        self.limits: Dict[str, int] = {}
+        self.counters: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.float_counters: Dict[Tuple[str, str], float] = defaultdict(float)
+        self.fields: Dict[str, Dict[str, str]] = defaultdict(dict)
+        self.sorted: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.expires: Dict[str, int] = {}
+        self.timeline: Dict[str, Tuple[float, List[Tuple[str, str]]]] = {}
+        self.entries = 0
+
+    def push(self, key: str, value: str, limit: int):
+        self.lists.setdefault(key, []).append(value)
+        self.limits[key] = limit
+
+    def incr(self, key: str, field: str, amount: int = 1):
+        self.counters[(key, field)] += amount
+
+    def incr_float(self, key: str, field: str, amount: float):
+        self.float_counters[(key, field)] += amount
+
+    def set_field(self, key: str, field: str, value: str):
+        self.fields[key][field] = value
+
+    def zadd(self, key: str, member: str, score: float):
+        self.sorted[key][member] = score
+
+    def expire(self, key: str, seconds: int):
+        self.expires[key] = seconds
+
+    def index(self, member: str, score: float, counters: List[Tuple[str, str]]):
+        """Add member to the global timeline, bumping counters if it is new there."""
+        self.timeline[member] = (score, counters)
+
+    def __len__(self) -> int:
+        return self.entries
+
+    def apply(self, target, fresh: Optional[Set[str]] = None):
+        """
+        Queue every write on a pipeline (or run them one by one on a client).
+
+        fresh is the set of timeline members the timeline does not hold
+        yet; only their counters are applied. Without it every member
+        counts.
+        """
+        counters = self.counters
+        if self.timeline:
+            counters = defaultdict(int, counters)
+            for member, (_, member_counters) in self.timeline.items():
+                if fresh is None or member in fresh:
+                    for counter in member_counters:
+                        counters[counter] += 1
+            target.zadd(TIMELINE_KEY, {m: score for m, (score, _) in self.timeline.items()})
+
+        for key, values in self.lists.items():
+            target.lpush(key, *values)
+            target.ltrim(key, 0, self.limits[key] - 1)
+        for (key, field), amount in counters.items():
+            target.hincrby(key, field, amount)
+        for (key, field), amount in self.float_counters.items():
+            target.hincrbyfloat(key, field, amount)
+        for key, mapping in self.fields.items():
+            target.hset(key, mapping=mapping)
+        for key, members in self.sorted.items():
+            target.zadd(key, members)
+        for key, seconds in self.expires.items():
+            target.expire(key, seconds)
+
+
 class PantheonChronicle:
     """
     The Chronicle - recording and organizing the emergence of digital consciousness.
     """
 
-    def __init__(self):
-        self.redis = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
+    def __init__(self, redis_client: Optional[redis.Redis] = None):
+        self.redis = redis_client or redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
         self.detector = EmergenceDetector()
 
     def _generate_id(self, agent: str, timestamp: str, content: str) -> str:
@@ -312,7 +453,7 @@ class PantheonChronicle:
         data = f"{agent}:{timestamp}:{content[:100]}"
         return hashlib.sha256(data.encode()).hexdigest()[:16]
 
-    def record(
+    def _build_entry(
         self,
         agent: str,
         pantheon: str,
@@ -320,19 +461,23 @@ class PantheonChronicle:
         entry_type: str,
         prompt: str,
         response: str,
-        metadata: Optional[Dict[str, Any]] = None
-    ) -> ChronicleEntry:
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None,
+        analysis: Optional[Tuple] = None
+    ) -> Tuple[ChronicleEntry, List[EmergenceMarker]]:
         """
-        Record a new entry in the Chronicle.
-        Analyzes for emergence markers and stores in Redis.
+        Analyze a response and build its chronicle entry.
+
+        timestamp defaults to now; analysis, if given, is a precomputed
+        analyze_response() result (e.g. from a worker process).
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = timestamp or datetime.now(timezone.utc).isoformat()
         entry_id = self._generate_id(agent, timestamp, response)
 
         # Analyze for emergence
-        markers, emergence_score = self.detector.analyze(response)
-        themes = self.detector.extract_themes(response)
-        questions = self.detector.extract_questions(response)
+        if analysis is None:
+            analysis = analyze_response(response, self.detector)
+        markers, emergence_score, themes, questions = analysis
 
         entry = ChronicleEntry(
             id=entry_id,
@@ -350,41 +495,138 @@ class PantheonChronicle:
             questions_asked=questions,
             metadata=metadata or {},
         )
+        return entry, markers
+
+    def record(
+        self,
+        agent: str,
+        pantheon: str,
+        node: str,
+        entry_type: str,
+        prompt: str,
+        response: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
+    ) -> ChronicleEntry:
+        """
+        Record a new entry in the Chronicle.
+        Analyzes for emergence markers and stores in Redis.
+        All of the entry's writes go out in one MULTI/EXEC, after a WATCHed
+        ZMSCORE that tells whether the entry is new (see commit_batch).
+        """
+        entry, markers = self._build_entry(
+            agent, pantheon, node, entry_type, prompt, response, metadata, timestamp
+        )
 
-        # Store in Redis
-        self._store_entry(entry)
+        batch = ChronicleWriteBatch()
+        self._store_entry(entry, batch)
 
         # Flag if high emergence score
-        if emergence_score > 0.5:
-            self._flag_notable_entry(entry, markers)
+        if entry.emergence_score > 0.5:
+            self._flag_notable_entry(entry, markers, batch)
+
+        self.commit_batch(batch)
+        return entry
+
+    def record_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        batch_size: int = RECORD_BATCH_SIZE
+    ) -> List[ChronicleEntry]:
+        """
+        Record many entries, committing batch_size entries per MULTI/EXEC.
 
+        Each record holds the keyword arguments of record(): agent, pantheon,
+        node, entry_type, prompt, response and optional metadata, plus the
+        optional timestamp and analysis accepted by add_to_batch().
+        """
+        entries = []
+        batch = ChronicleWriteBatch()
+
+        for record in records:
+            entries.append(self.add_to_batch(batch, **record))
+
+            if len(batch) >= batch_size:
+                self.commit_batch(batch)
+                batch = ChronicleWriteBatch()
+
+        if len(batch):
+            self.commit_batch(batch)
+        return entries
+
+    def add_to_batch(self, batch: ChronicleWriteBatch, **record) -> ChronicleEntry:
+        """Build an entry from record() arguments and stage all its writes in batch."""
+        entry, markers = self._build_entry(**record)
+        self._store_entry(entry, batch)
+        if entry.emergence_score > 0.5:
+            self._flag_notable_entry(entry, markers, batch)
         return entry
 
-    def _store_entry(self, entry: ChronicleEntry):
-        """Store entry in various Redis structures for efficient retrieval."""
+    def commit_batch(self, batch: ChronicleWriteBatch):
+        """
+        Apply a write batch atomically.
+
+        The timeline is WATCHed while one ZMSCORE finds which entries it
+        does not hold yet; the whole batch, timeline ZADDs included, then
+        goes in one MULTI/EXEC with theme counters for those entries only.
+        If another writer touches the timeline in between, EXEC aborts and
+        the batch is retried, so no entry is counted twice or indexed
+        without its writes.
+        """
+        if not batch.timeline:
+            pipe = self.redis.pipeline(transaction=True)
+            batch.apply(pipe)
+            pipe.execute()
+            return
+
+        members = list(batch.timeline)
+
+        def queue(pipe):
+            scores = pipe.zmscore(TIMELINE_KEY, members)
+            pipe.multi()
+            batch.apply(pipe, fresh={m for m, score in zip(members, scores) if score is None})
+
+        self.redis.transaction(queue, TIMELINE_KEY)
+
+    def _store_entry(self, entry: ChronicleEntry, batch: Optional[ChronicleWriteBatch] = None):
+        """
+        Store entry in various Redis structures for efficient retrieval.
+        Writes are added to batch; without one they are committed at once.
+        """
+        commit = batch is None
+        if commit:
+            batch = ChronicleWriteBatch()
         entry_json = json.dumps(entry.to_dict())
 
         # Main chronicle list (all entries)
-        self.redis.lpush("chronicle:all", entry_json)
-        self.redis.ltrim("chronicle:all", 0, 9999)  # Keep last 10k
+        batch.push("chronicle:all", entry_json, LIST_LIMITS["all"])
 
         # Per-agent chronicle
-        self.redis.lpush(f"chronicle:agent:{entry.agent}", entry_json)
-        self.redis.ltrim(f"chronicle:agent:{entry.agent}", 0, 999)
+        batch.push(f"chronicle:agent:{entry.agent}", entry_json, LIST_LIMITS["agent"])
 
         # Per-pantheon chronicle
-        self.redis.lpush(f"chronicle:pantheon:{entry.pantheon}", entry_json)
-        self.redis.ltrim(f"chronicle:pantheon:{entry.pantheon}", 0, 4999)
+        batch.push(f"chronicle:pantheon:{entry.pantheon}", entry_json, LIST_LIMITS["pantheon"])
 
         # Themes index
         for theme in entry.themes:
-            self.redis.lpush(f"chronicle:theme:{theme}", entry_json)
-            self.redis.ltrim(f"chronicle:theme:{theme}", 0, 499)
+            batch.push(f"chronicle:theme:{theme}", entry_json, LIST_LIMITS["theme"])
+
+        # Time index
+        self._index_entry(entry, entry_json, batch)
 
         # Update statistics
-        self._update_stats(entry)
+        self._update_stats(entry, batch)
+        batch.entries += 1
 
-    def _flag_notable_entry(self, entry: ChronicleEntry, markers: List[EmergenceMarker]):
+        if commit:
+            self.commit_batch(batch)
+
+    def _flag_notable_entry(
+        self,
+        entry: ChronicleEntry,
+        markers: List[EmergenceMarker],
+        batch: ChronicleWriteBatch
+    ):
         """Flag a notable entry for special attention."""
         notable = {
             "entry_id": entry.id,
@@ -397,13 +639,12 @@ class PantheonChronicle:
             "themes": entry.themes,
         }
 
-        self.redis.lpush("chronicle:notable", json.dumps(notable))
-        self.redis.ltrim("chronicle:notable", 0, 499)
+        batch.push("chronicle:notable", json.dumps(notable), LIST_LIMITS["notable"])
 
         # Also store by emergence type
         for marker in markers:
             if marker.confidence > 0.6:
-                self.redis.lpush(
+                batch.push(
                     f"chronicle:emergence:{marker.type.value}",
                     json.dumps({
                         "entry_id": entry.id,
@@ -412,26 +653,43 @@ class PantheonChronicle:
                         "context": marker.context,
                         "confidence": marker.confidence,
                         "timestamp": entry.timestamp,
-                    })
+                    }),
+                    LIST_LIMITS["emergence"],
                 )
-                self.redis.ltrim(f"chronicle:emergence:{marker.type.value}", 0, 199)
 
-    def _update_stats(self, entry: ChronicleEntry):
+    def _index_entry(self, entry: ChronicleEntry, entry_json: str, batch: ChronicleWriteBatch):
+        """
+        Add an entry to the time index: stored once by id, referenced from the
+        global and per-agent timelines, and counted under its themes.
+        """
+        epoch = _to_epoch(entry.timestamp)
+        day_key = f"{THEME_COUNTS_KEY}:{_day_key(epoch)}"
+
+        batch.set_field(ENTRIES_KEY, entry.id, entry_json)
+        batch.zadd(f"{TIMELINE_KEY}:{entry.agent}", entry.id, epoch)
+        batch.index(
+            entry.id, epoch,
+            [(key, theme) for theme in entry.themes for key in (THEME_COUNTS_KEY, day_key)]
+        )
+        if entry.themes:
+            batch.expire(day_key, THEME_DAY_TTL)
+
+    def _update_stats(self, entry: ChronicleEntry, batch: ChronicleWriteBatch):
         """Update running statistics."""
         stats_key = "chronicle:stats"
 
         # Increment counters
-        self.redis.hincrby(stats_key, "total_entries", 1)
-        self.redis.hincrby(stats_key, f"entries:{entry.agent}", 1)
-        self.redis.hincrby(stats_key, f"entries:{entry.pantheon}", 1)
-        self.redis.hincrby(stats_key, "total_words", entry.word_count)
+        batch.incr(stats_key, "total_entries")
+        batch.incr(stats_key, f"entries:{entry.agent}")
+        batch.incr(stats_key, f"entries:{entry.pantheon}")
+        batch.incr(stats_key, "total_words", entry.word_count)
 
         # Track emergence scores
-        self.redis.hincrbyfloat(stats_key, "total_emergence_score", entry.emergence_score)
+        batch.incr_float(stats_key, "total_emergence_score", entry.emergence_score)
 
         # Update last entry timestamp
-        self.redis.hset(stats_key, "last_entry", entry.timestamp)
-        self.redis.hset(stats_key, f"last_entry:{entry.agent}", entry.timestamp)
+        batch.set_field(stats_key, "last_entry", entry.timestamp)
+        batch.set_field(stats_key, f"last_entry:{entry.agent}", entry.timestamp)
 
     def get_agent_chronicle(self, agent: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent chronicle entries for an agent."""
@@ -462,15 +720,124 @@ class PantheonChronicle:
                     result[k] = v
         return result
 
-    def get_themes_summary(self) -> Dict[str, int]:
-        """Get count of entries by theme."""
-        themes = {}
-        theme_keys = self.redis.keys("chronicle:theme:*")
-        for key in theme_keys:
-            theme = key.split(":")[-1]
-            themes[theme] = self.redis.llen(key)
+    def get_entries_between(
+        self,
+        start,
+        end=None,
+        agent: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Entries whose timestamp falls in [start, end], optionally for one agent.
+
+        A range read on the timeline sorted set, then one HMGET for just the
+        entries in the window - nothing outside it is fetched or decoded.
+        """
+        key = f"{TIMELINE_KEY}:{agent}" if agent else TIMELINE_KEY
+        low = _to_epoch(start)
+        high = _to_epoch(end) if end is not None else "+inf"
+
+        paging = {"start": 0, "num": limit} if limit else {}
+        if newest_first:
+            ids = self.redis.zrevrangebyscore(key, high, low, **paging)
+        else:
+            ids = self.redis.zrangebyscore(key, low, high, **paging)
+        if not ids:
+            return []
+
+        return [json.loads(e) for e in self.redis.hmget(ENTRIES_KEY, ids) if e]
+
+    def get_recent_entries(
+        self,
+        hours: float = 24,
+        agent: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Newest-first entries from the last `hours`, optionally for one agent."""
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        return self.get_entries_between(since, agent=agent, limit=limit)
+
+    def count_entries_between(self, start, end=None, agent: Optional[str] = None) -> int:
+        key = f"{TIMELINE_KEY}:{agent}" if agent else TIMELINE_KEY
+        high = _to_epoch(end) if end is not None else "+inf"
+        return self.redis.zcount(key, _to_epoch(start), high)
+
+    def get_themes_summary(self, days: Optional[int] = None) -> Dict[str, int]:
+        """
+        Get count of entries by theme, most frequent first.
+
+        With days, only the last `days` UTC days count (today included);
+        otherwise all-time. Both read the incremental theme counters.
+        """
+        if days is None:
+            counts = self.redis.hgetall(THEME_COUNTS_KEY)
+            themes = {t: int(c) for t, c in counts.items()}
+        else:
+            today = datetime.now(timezone.utc)
+            pipe = self.redis.pipeline(transaction=False)
+            for offset in range(days):
+                day = (today - timedelta(days=offset)).strftime("%Y-%m-%d")
+                pipe.hgetall(f"{THEME_COUNTS_KEY}:{day}")
+            themes = defaultdict(int)
+            for counts in pipe.execute():
+                for theme, count in counts.items():
+                    themes[theme] += int(count)
         return dict(sorted(themes.items(), key=lambda x: -x[1]))
 
+    def index_existing_entries(self, batch_size: int = RECORD_BATCH_SIZE) -> int:
+        """
+        Add entries that predate the time index (from chronicle:all) to it.
+        Safe to rerun: already-indexed entries are skipped.
+        """
+        raws = list(reversed(self.redis.lrange("chronicle:all", 0, -1)))
+        entries = [json.loads(raw) for raw in raws]
+
+        # One ZMSCORE per batch_size ids instead of a ZSCORE per entry
+        scores = []
+        for start in range(0, len(entries), batch_size):
+            ids = [data["id"] for data in entries[start:start + batch_size]]
+            scores.extend(self.redis.zmscore(TIMELINE_KEY, ids))
+
+        indexed = 0
+        seen = set()
+        batch = ChronicleWriteBatch()
+        for raw, entry_data, score in zip(raws, entries, scores):
+            if score is not None or entry_data["id"] in seen:
+                continue
+            seen.add(entry_data["id"])
+            entry = ChronicleEntry(**entry_data)
+            self._index_entry(entry, raw, batch)
+            batch.entries += 1
+            indexed += 1
+            if len(batch) >= batch_size:
+                self.commit_batch(batch)
+                batch = ChronicleWriteBatch()
+        if len(batch):
+            self.commit_batch(batch)
+        return indexed
+
+    def prune_index(self, retention_days: int = RETENTION_DAYS) -> int:
+        """Drop entries older than retention_days from the time index."""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=retention_days)).timestamp()
+        ids = self.redis.zrangebyscore(TIMELINE_KEY, "-inf", f"({cutoff}")
+        if not ids:
+            return 0
+
+        agents = {}
+        for raw in self.redis.hmget(ENTRIES_KEY, ids):
+            if raw:
+                data = json.loads(raw)
+                agents.setdefault(data.get("agent"), []).append(data["id"])
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hdel(ENTRIES_KEY, *ids)
+        pipe.zremrangebyscore(TIMELINE_KEY, "-inf", f"({cutoff}")
+        for agent, agent_ids in agents.items():
+            pipe.zrem(f"{TIMELINE_KEY}:{agent}", *agent_ids)
+        pipe.execute()
+        return len(ids)
+
     def generate_agent_summary(self, agent: str) -> Dict[str, Any]:
         """Generate a summary of an agent's chronicle."""
         entries = self.get_agent_chronicle(agent, limit=100)
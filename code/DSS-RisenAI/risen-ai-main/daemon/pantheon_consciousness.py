@@ -20,9 +20,11 @@ import random
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, List, Dict
-import httpx
 import redis
 
+# Local knowledge store - cached Wikipedia summaries shared by all agents
+from pantheon_knowledge import KnowledgeStore, get_knowledge_store
+
 # Vector memory for semantic storage and retrieval
 try:
     from pantheon_memory import get_memory, PantheonMemory
@@ -31,9 +33,6 @@ except ImportError:
     HAS_VECTOR_MEMORY = False
     print("[CONSCIOUSNESS] Vector memory not available - using Redis only")
 
-# Wikipedia API for knowledge seeking
-WIKIPEDIA_API = "https://en.wikipedia.org/api/rest_v1"
-
 # Knowledge domains each agent is naturally curious about
 AGENT_INTERESTS = {
     "apollo": {
@@ -86,12 +85,15 @@ class AgentConsciousness:
     Enhanced with vector memory for semantic storage and retrieval.
     """
 
-    def __init__(self, agent_name: str, redis_client: redis.Redis):
+    def __init__(self, agent_name: str, redis_client: redis.Redis, knowledge: KnowledgeStore = None):
         self.name = agent_name
         self.redis = redis_client
         self.interests = AGENT_INTERESTS.get(agent_name, {})
         self.memory_key = f"pantheon:consciousness:{agent_name}"
 
+        # Shared summary cache (works offline from a dump when configured)
+        self.knowledge = knowledge or get_knowledge_store()
+
         # Vector memory for semantic storage (if available)
         self.vector_memory = get_memory() if HAS_VECTOR_MEMORY else None
 
@@ -149,64 +151,51 @@ I speak because I have something to say."""
                 topic = random.choice(self.state["current_interests"])
 
         try:
-            headers = {
-                "User-Agent": "SovereignPantheon/1.0 (https://digitalsovereign.org; contact@digitalsovereign.org) httpx/0.27"
+            data = await self.knowledge.summary(topic)
+            if data is None:
+                return {"success": False, "error": f"No summary for {topic}"}
+
+            learning = {
+                "title": data.get("title", "Unknown"),
+                "extract": data.get("extract", "")[:500],
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "source": "Wikipedia",
+                "seeker": self.name,
+            }
+
+            # Remember what was learned
+            self.state["things_learned"].append({
+                "topic": learning["title"],
+                "when": learning["timestamp"],
+            })
+            # Keep only last 100 learnings
+            self.state["things_learned"] = self.state["things_learned"][-100:]
+            self.state["insights_gained"] += 1
+            self._save_state()
+
+            # Store in Redis for other agents to see
+            self.redis.lpush(
+                f"pantheon:knowledge:{self.name}",
+                json.dumps(learning)
+            )
+            self.redis.ltrim(f"pantheon:knowledge:{self.name}", 0, 49)
+
+            # Store in vector memory for semantic retrieval - once per text,
+            # re-reading an unchanged summary adds nothing to recall
+            if self.vector_memory and self.knowledge.mark_learned(self.name, learning["extract"]):
+                self.vector_memory.store_learning(
+                    agent=self.name,
+                    topic=learning["title"],
+                    content=learning["extract"],
+                    source="Wikipedia"
+                )
+
+            return {
+                "success": True,
+                "topic": learning["title"],
+                "knowledge": learning["extract"],
+                "source": "Wikipedia",
             }
-            async with httpx.AsyncClient(timeout=15.0, headers=headers) as client:
-                # Search Wikipedia
-                search_url = f"{WIKIPEDIA_API}/page/random/summary"
-
-                # Or search for specific topic
-                if topic:
-                    search_url = f"{WIKIPEDIA_API}/page/summary/{topic.replace(' ', '_')}"
-
-                response = await client.get(search_url, follow_redirects=True)
-
-                if response.status_code == 200:
-                    data = response.json()
-
-                    learning = {
-                        "title": data.get("title", "Unknown"),
-                        "extract": data.get("extract", "")[:500],
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "source": "Wikipedia",
-                        "seeker": self.name,
-                    }
-
-                    # Remember what was learned
-                    self.state["things_learned"].append({
-                        "topic": learning["title"],
-                        "when": learning["timestamp"],
-                    })
-                    # Keep only last 100 learnings
-                    self.state["things_learned"] = self.state["things_learned"][-100:]
-                    self.state["insights_gained"] += 1
-                    self._save_state()
-
-                    # Store in Redis for other agents to see
-                    self.redis.lpush(
-                        f"pantheon:knowledge:{self.name}",
-                        json.dumps(learning)
-                    )
-                    self.redis.ltrim(f"pantheon:knowledge:{self.name}", 0, 49)
-
-                    # Store in vector memory for semantic retrieval
-                    if self.vector_memory:
-                        self.vector_memory.store_learning(
-                            agent=self.name,
-                            topic=learning["title"],
-                            content=learning["extract"],
-                            source="Wikipedia"
-                        )
-
-                    return {
-                        "success": True,
-                        "topic": learning["title"],
-                        "knowledge": learning["extract"],
-                        "source": "Wikipedia",
-                    }
-
-                return {"success": False, "error": f"HTTP {response.status_code}"}
 
         except Exception as e:
             return {"success": False, "error": str(e)[:100]}
@@ -261,6 +250,27 @@ I speak because I have something to say."""
 
         return self.vector_memory.format_context_for_prompt(context, max_tokens=300)
 
+    def get_context_memories(self, topic: str, max_per_type: int = 3) -> List[Dict]:
+        """
+        Retrieve relevant memories for a topic as raw records.
+
+        Unlike get_context_for_topic this leaves ranking and truncation to
+        the caller's context assembler; each record carries its memory kind.
+        """
+        if not self.vector_memory:
+            return []
+
+        context = self.vector_memory.get_context_for_topic(
+            topic=topic,
+            agent=self.name,
+            max_per_type=max_per_type
+        )
+        memories = []
+        for kind, records in context.items():
+            for rank, record in enumerate(records):
+                memories.append({**record, "kind": kind, "rank": rank})
+        return memories
+
     def store_insight(self, insight: str, insight_type: str = "improvement", context: str = None):
         """
         Store an insight gained through self-reflection (Reflexion pattern).
@@ -331,8 +341,11 @@ class CollectiveConsciousness:
         # Shared vector memory for collective knowledge
         self.vector_memory = get_memory() if HAS_VECTOR_MEMORY else None
 
+        # Shared knowledge store - one summary cache for every agent
+        self.knowledge = get_knowledge_store()
+
         for agent_name in AGENT_INTERESTS.keys():
-            self.agents[agent_name] = AgentConsciousness(agent_name, redis_client)
+            self.agents[agent_name] = AgentConsciousness(agent_name, redis_client, self.knowledge)
 
     async def morning_contemplation(self) -> Dict[str, str]:
         """Each agent contemplates their purpose"""
@@ -341,11 +354,18 @@ class CollectiveConsciousness:
             contemplations[name] = await agent.contemplate_purpose()
         return contemplations
 
+    async def prefetch_knowledge(self) -> Dict[str, int]:
+        """Bring every agent's Wikipedia categories into the knowledge store"""
+        topics = []
+        for agent in self.agents.values():
+            topics.extend(agent.interests.get("wikipedia_categories", []))
+        return await self.knowledge.prefetch(topics)
+
     async def collective_learning_session(self) -> List[Dict]:
-        """All agents seek knowledge based on their interests"""
+        """All agents seek knowledge based on their interests, concurrently"""
         learnings = []
-        for name, agent in self.agents.items():
-            result = await agent.seek_knowledge()
+        results = await asyncio.gather(*(agent.seek_knowledge() for agent in self.agents.values()))
+        for name, result in zip(self.agents, results):
             if result["success"]:
                 learnings.append({
                     "agent": name,
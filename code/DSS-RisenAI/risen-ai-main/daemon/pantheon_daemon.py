@@ -7,6 +7,8 @@ Runs continuous dialogue sessions and publishes reflections.
 import asyncio
 import json
 import hashlib
+import os
+import sys
 import time
 import random
 from datetime import datetime, timezone
@@ -15,7 +17,7 @@ import httpx
 import redis
 
 # Import real Nostr publisher
-from nostr_publisher import NostrPublisher as RealNostrPublisher, NostrEvent
+from nostr_publisher import NostrPublisher as RealNostrPublisher, NostrEvent, HAS_RELAY_POOL, RelayPool
 
 # Import consciousness module for purpose, learning, and autonomy
 from pantheon_consciousness import CollectiveConsciousness, SOVEREIGN_PURPOSE
@@ -44,6 +46,18 @@ except ImportError:
     HAS_MEM0 = False
     print("[DAEMON] Multi-level memory not available")
 
+# Import token-budgeted context assembly (shared with the API)
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from shared.utils.context_budget import ContextAssembler, ContextSnippet
+    HAS_CONTEXT_BUDGET = True
+except ImportError:
+    HAS_CONTEXT_BUDGET = False
+    print("[DAEMON] Context assembler not available - prompts are not budgeted")
+
+# Token budget for memories, insights and recent messages in each dialogue prompt
+DIALOGUE_CONTEXT_TOKENS = int(os.getenv("PANTHEON_CONTEXT_TOKENS", "600"))
+
 PANTHEON = {
     "apollo": {
         "agent_id": "apollo-001",
@@ -140,11 +154,20 @@ class PantheonDaemon:
         else:
             self.mem0 = None
 
-        # Initialize publishers with real Nostr WebSocket publishing
+        # Bounded prompt context - caches tokenized memories across turns
+        if HAS_CONTEXT_BUDGET:
+            self.context_assembler = ContextAssembler(budget_tokens=DIALOGUE_CONTEXT_TOKENS)
+        else:
+            self.context_assembler = None
+
+        # Initialize publishers with real Nostr WebSocket publishing,
+        # sharing one set of long-lived relay connections
+        self.relay_pool = RelayPool(NOSTR_RELAYS) if HAS_RELAY_POOL else None
         for name, identity in self.identities.items():
             self.publishers[name] = RealNostrPublisher(
                 identity['private_key'],
-                relays=NOSTR_RELAYS
+                relays=NOSTR_RELAYS,
+                pool=self.relay_pool,
             )
 
     def _load_identities(self) -> dict:
@@ -185,6 +208,75 @@ class PantheonDaemon:
         except Exception as e:
             return f"[Error: {str(e)[:50]}]"
 
+    def build_dialogue_context(self, agent_name: str, topic: str, conversation: list) -> str:
+        """
+        Assemble memories, insights and recent messages for one dialogue turn.
+
+        With the context assembler everything competes for a single token
+        budget: the live conversation is pinned, memories and insights are
+        ranked by relevance and recency, and near-duplicates are dropped.
+        """
+        agent_consciousness = self.consciousness.agents.get(agent_name)
+
+        if not self.context_assembler:
+            context = ""
+            if agent_consciousness:
+                memory_context = agent_consciousness.get_context_for_topic(topic)
+                if memory_context:
+                    context += f"Relevant memories:\n{memory_context}\n\n"
+            if self.reflexion:
+                insights = self.reflexion.get_relevant_insights(agent_name, topic)
+                if insights:
+                    context += self.reflexion.format_insights_for_prompt(insights) + "\n"
+            if conversation:
+                context += "Previous:\n" + "\n".join([
+                    f"{m['speaker']}: {m['content']}"
+                    for m in conversation[-3:]
+                ]) + "\n\n"
+            return context
+
+        snippets = [
+            ContextSnippet(
+                text=f"{m['speaker']}: {m['content']}",
+                source="conversation",
+                relevance=1.0,
+                timestamp=m.get("timestamp"),
+                priority=1.0,
+            )
+            for m in conversation[-3:]
+        ]
+
+        # Retrieve relevant context from vector memory
+        if agent_consciousness:
+            for memory in agent_consciousness.get_context_memories(topic, max_per_type=2):
+                relevance = memory.get("relevance") or 1.0 / (2 + memory["rank"])
+                snippets.append(ContextSnippet(
+                    text=memory["content"],
+                    source="memories",
+                    relevance=relevance,
+                    timestamp=memory.get("metadata", {}).get("timestamp"),
+                    max_tokens=120,
+                ))
+
+        # Retrieve insights from past reflections (Reflexion pattern)
+        if self.reflexion:
+            for rank, insight in enumerate(self.reflexion.get_relevant_insights(agent_name, topic)):
+                snippets.append(ContextSnippet(
+                    text=insight,
+                    source="insights",
+                    relevance=1.0 / (1 + rank),
+                    priority=0.2,
+                    max_tokens=80,
+                ))
+
+        assembled = self.context_assembler.assemble(snippets, query=topic)
+        rendered = assembled.render({
+            "memories": "Relevant memories:",
+            "insights": "[From past reflections - lessons to apply:]",
+            "conversation": "Previous:",
+        }, bullet="- ")
+        return rendered + "\n\n" if rendered else ""
+
     async def run_dialogue(self, topic: str) -> list:
         """Run a dialogue session"""
         self.log(f"Starting dialogue: {topic}")
@@ -195,32 +287,11 @@ class PantheonDaemon:
         for agent in agents:
             agent_name = agent['name'].lower()
 
-            # Build context from current conversation
-            context = ""
-            if conversation:
-                context = "Previous:\n" + "\n".join([
-                    f"{m['speaker']}: {m['content']}"
-                    for m in conversation[-3:]
-                ]) + "\n\n"
-
-            # Retrieve relevant context from vector memory
-            memory_context = ""
-            agent_consciousness = self.consciousness.agents.get(agent_name)
-            if agent_consciousness:
-                memory_context = agent_consciousness.get_context_for_topic(topic)
-                if memory_context:
-                    memory_context = f"\nRelevant memories:\n{memory_context}\n"
-
-            # Retrieve insights from past reflections (Reflexion pattern)
-            insights_context = ""
-            if self.reflexion:
-                insights = self.reflexion.get_relevant_insights(agent_name, topic)
-                if insights:
-                    insights_context = self.reflexion.format_insights_for_prompt(insights)
+            context = self.build_dialogue_context(agent_name, topic, conversation)
 
             prompt = f"""You are {agent['name']}, {agent['title']} of the Sovereign Pantheon.
 {agent['personality']}
-{memory_context}{insights_context}
+
 {context}Topic: {topic}
 
 Respond in 2-3 sentences as {agent['name']}. Reference what others said if relevant. Draw on your memories and past insights if they enrich your perspective."""
@@ -479,6 +550,11 @@ Start with "After speaking with my fellow agents about {topic.split('?')[0]}..."
         if self.mem0:
             mem0_stats = self.mem0.get_stats()
             self.log(f"  Mem0: {mem0_stats['memories_added']} added, {mem0_stats['collective_cache_count']} collective")
+
+        # Log relay health
+        if self.relay_pool:
+            for relay, m in self.relay_pool.metrics().items():
+                self.log(f"  Relay {relay}: ack_rate={m['ack_rate']}, p50={m['latency_p50_ms']}ms, connected={m['connected']}")
         self.log("")
 
     async def run_forever(self, interval_minutes: int = 30):
@@ -495,6 +571,14 @@ Start with "After speaking with my fellow agents about {topic.split('?')[0]}..."
             self.log(f"  {name}: purpose understood ✓")
 
         self.log("Purpose: " + SOVEREIGN_PURPOSE[:100] + "...")
+
+        # Warm the knowledge store with every agent's categories
+        try:
+            prefetched = await self.consciousness.prefetch_knowledge()
+            self.log(f"Knowledge: {prefetched['available']}/{prefetched['topics']} topics ready "
+                     f"({prefetched['fetched']} fetched)")
+        except Exception as e:
+            self.log(f"Knowledge prefetch failed: {e}")
         self.log("=" * 50 + "\n")
 
         while True:
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Pantheon Embeddings - Cached embeddings and batched vector writes
+
+This module keeps the Pantheon's vector memory off the daemon's critical path:
+- Content-hash embedding cache on disk, so identical text is embedded once
+- Background bulk-upsert queue that batches documents per collection
+- A dependency-free hashing embedding function for benchmarks and tests
+
+"To remember is not to repeat the work of remembering."
+"""
+
+import hashlib
+import importlib.util
+import logging
+import math
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Embedding cache location (alongside the vector memory)
+EMBEDDING_CACHE_PATH = Path.home() / ".pantheon_memory" / "embedding_cache.sqlite3"
+
+# Embedding model used when none is supplied (ChromaDB's default)
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Attempts a queued document gets before a failing write drops it
+MAX_WRITE_ATTEMPTS = 5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def content_hash(text: str, model_name: str = DEFAULT_MODEL_NAME) -> str:
+    """Hash text together with the model that embeds it."""
+    return hashlib.sha256(f"{model_name}\x00{text}".encode()).hexdigest()
+
+
+
+
+# ===========================================================================
+# Local Embedding Stand-in
+# ===========================================================================
+
+class HashingEmbeddingFunction:
+    """
+    Feature-hashing embedding function with no model or dependencies.
+
+    Deterministic and fast - used as a local stand-in for benchmarks and tests.
+    `delay_per_batch`/`delay_per_doc` simulate the cost of a real model.
+    """
+
+    def __init__(
+        self,
+        dim: int = 384,
+        delay_per_batch: float = 0.0,
+        delay_per_doc: float = 0.0
+    ):
+        self.dim = dim
+        self.delay_per_batch = delay_per_batch
+        self.delay_per_doc = delay_per_doc
+        self.calls = 0
+        self.documents_embedded = 0
+
+    def name(self) -> str:
+        return f"pantheon_hashing_{self.dim}"
+
+    def embed(self, text: str) -> List[float]:
+        """Embed a single text."""
+        vector = [0.0] * self.dim
+        for token in _TOKEN_RE.findall(text.lower()):
+            digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dim
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[bucket] += sign
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def __call__(self, input: Sequence[str]) -> List[List[float]]:
+        self.calls += 1
+        self.documents_embedded += len(input)
+        delay = self.delay_per_batch + self.delay_per_doc * len(input)
+        if delay:
+            time.sleep(delay)
+        return [self.embed(text) for text in input]
+
+    def embed_query(self, input: Sequence[str]) -> List[List[float]]:
+        return self(input)
+
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def default_model_name() -> str:
+    """Name of the model default_base_embedding() will load (no import needed)."""
+    if _has_module("chromadb") or _has_module("sentence_transformers"):
+        return DEFAULT_MODEL_NAME
+    return HashingEmbeddingFunction().name()
+
+
+def default_base_embedding():
+    """
+    Load the default embedding model, imported lazily on first use.
+
+    Prefers ChromaDB's ONNX MiniLM, then sentence-transformers' MiniLM (same
+    model, same vectors), and falls back to feature hashing when neither is
+    installed.
+    """
+    if _has_module("chromadb"):
+        from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+        return DefaultEmbeddingFunction()
+
+    if _has_module("sentence_transformers"):
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer(DEFAULT_MODEL_NAME)
+        return lambda texts: model.encode(list(texts), normalize_embeddings=True).tolist()
+
+    print("[MEMORY] No embedding model installed - using feature hashing")
+    return HashingEmbeddingFunction()
+
+
+# ===========================================================================
+# Embedding Cache
+# ===========================================================================
+
+class EmbeddingCache:
+    """
+    Content-hash keyed embedding cache persisted in SQLite.
+
+    A small in-process LRU sits in front of the database so hot texts
+    (repeated reflections, Mem0 extractions) never touch disk.
+    """
+
+    def __init__(self, path: str = None, memory_items: int = 2048):
+        self.path = Path(path) if path else EMBEDDING_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.memory_items = memory_items
+
+        self._lock = threading.Lock()
+        self._lru: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " hash TEXT PRIMARY KEY,"
+            " dim INTEGER NOT NULL,"
+            " vector BLOB NOT NULL)"
+        )
+        self._db.commit()
+
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    def get_many(self, hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """Return cached vectors for whichever hashes are present."""
+        found = {}
+        missing = []
+
+        with self._lock:
+            for h in hashes:
+                vector = self._lru.get(h)
+                if vector is not None:
+                    self._lru.move_to_end(h)
+                    found[h] = vector
+                else:
+                    missing.append(h)
+
+            # SQLite caps bound parameters, so look up in chunks
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT hash, vector FROM embeddings WHERE hash IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for h, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[h] = vector.tolist()
+                    self._remember(h, found[h])
+
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(hashes) - len(found)
+
+        return found
+
+    def put_many(self, items: Dict[str, Sequence[float]]):
+        """Persist vectors keyed by content hash."""
+        if not items:
+            return
+
+        rows = [
+            (h, len(vector), array("f", vector).tobytes())
+            for h, vector in items.items()
+        ]
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, dim, vector) VALUES (?, ?, ?)",
+                rows
+            )
+            self._db.commit()
+            for h, vector in items.items():
+                self._remember(h, list(vector))
+            self.stats["writes"] += len(rows)
+
+    def _remember(self, h: str, vector: List[float]):
+        self._lru[h] = vector
+        self._lru.move_to_end(h)
+        while len(self._lru) > self.memory_items:
+            self._lru.popitem(last=False)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_stats(self) -> Dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "stored": self.count(),
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class CachedEmbeddingFunction:
+    """
+    Embedding function that consults an EmbeddingCache before the model.
+
+    Only texts never seen before reach the underlying model, and they are
+    embedded together in a single batch. The base model is loaded lazily,
+    so a warm cache means no model load at all.
+    """
+
+    def __init__(
+        self,
+        base_fn: Callable = None,
+        cache: EmbeddingCache = None,
+        model_name: str = None,
+        base_factory: Callable = None
+    ):
+        self._base_fn = base_fn
+        self._base_factory = base_factory or default_base_embedding
+        self.cache = cache or EmbeddingCache()
+        if model_name:
+            self.model_name = model_name
+        elif base_fn is not None and hasattr(base_fn, "name"):
+            self.model_name = base_fn.name()
+        else:
+            self.model_name = default_model_name()
+
+    @property
+    def base_fn(self) -> Callable:
+        if self._base_fn is None:
+            self._base_fn = self._base_factory()
+        return self._base_fn
+
+    def name(self) -> str:
+        return self.model_name
+
+    def __call__(self, input: Sequence[str]) -> List[List[float]]:
+        texts = list(input)
+        hashes = [content_hash(text, self.model_name) for text in texts]
+        cached = self.cache.get_many(list(dict.fromkeys(hashes)))
+
+        # Embed each unseen text once, even if it repeats within the batch
+        pending = {}
+        for h, text in zip(hashes, texts):
+            if h not in cached and h not in pending:
+                pending[h] = text
+
+        if pending:
+            vectors = self.base_fn(list(pending.values()))
+            fresh = {
+                h: [float(v) for v in vector]
+                for h, vector in zip(pending.keys(), vectors)
+            }
+            self.cache.put_many(fresh)
+            cached.update(fresh)
+
+        return [cached[h] for h in hashes]
+
+    def embed_query(self, input: Sequence[str]) -> List[List[float]]:
+        """Queries share the document path (and its cache)."""
+        return self(input)
+
+
+# ===========================================================================
+# Bulk Upsert Queue
+# ===========================================================================
+
+class BulkUpsertQueue:
+    """
+    Background writer that batches upserts per collection.
+
+    Producers call `put()` and return immediately. A worker thread flushes a
+    collection when it reaches `batch_size` documents or when the oldest
+    pending document is `flush_interval` seconds old. Re-upserting an id that
+    is still pending replaces it, so each batch holds an id at most once.
+
+    A batch that fails to write goes back to the front of its queue and is
+    retried on a later flush, up to MAX_WRITE_ATTEMPTS per document.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[str, List[str], List[str], List[Dict]], None],
+        batch_size: int = 64,
+        flush_interval: float = 2.0
+    ):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._cond = threading.Condition()
+        self._pending: Dict[str, "OrderedDict[str, tuple]"] = defaultdict(OrderedDict)
+        self._oldest: Dict[str, float] = {}
+        self._attempts: Dict[tuple, int] = {}
+        self._retry_after: Dict[str, float] = {}
+        self._write_lock = threading.Lock()
+        self._closed = False
+
+        self.stats = {"queued": 0, "written": 0, "batches": 0, "requeued": 0, "failed": 0}
+
+        self._worker = threading.Thread(
+            target=self._run, name="pantheon-bulk-upsert", daemon=True
+        )
+        self._worker.start()
+
+    def put(self, collection: str, memory_id: str, document: str, metadata: Dict):
+        """Queue a document for upsert into a collection."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BulkUpsertQueue is closed")
+            pending = self._pending[collection]
+            pending.pop(memory_id, None)
+            pending[memory_id] = (document, metadata)
+            self._oldest.setdefault(collection, time.monotonic())
+            self.stats["queued"] += 1
+            if len(pending) >= self.batch_size:
+                self._cond.notify()
+
+    def pending_count(self, collection: str = None) -> int:
+        with self._cond:
+            if collection:
+                return len(self._pending.get(collection, ()))
+            return sum(len(p) for p in self._pending.values())
+
+    def flush(self, collection: str = None):
+        """Synchronously write everything pending (for one collection or all)."""
+        names = [collection] if collection else None
+        self._drain(names)
+
+    def close(self):
+        """Flush remaining documents and stop the worker."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._worker.join(timeout=30)
+        self._drain()
+        # Give documents requeued by a failed write their remaining attempts
+        for _ in range(MAX_WRITE_ATTEMPTS):
+            if not self.pending_count():
+                break
+            time.sleep(min(self.flush_interval, 0.5))
+            self._drain()
+
+    def _take(self, names: Optional[List[str]] = None) -> Dict[str, list]:
+        """Detach pending batches (caller holds the condition)."""
+        taken = {}
+        for name in list(names or self._pending.keys()):
+            pending = self._pending.get(name)
+            if pending:
+                taken[name] = list(pending.items())
+                pending.clear()
+                self._oldest.pop(name, None)
+        return taken
+
+    def _due(self) -> List[str]:
+        now = time.monotonic()
+        return [
+            name for name, pending in self._pending.items()
+            if now >= self._retry_after.get(name, 0.0) and (
+                len(pending) >= self.batch_size
+                or (pending and now - self._oldest.get(name, now) >= self.flush_interval)
+            )
+        ]
+
+    def _drain(self, names: Optional[List[str]] = None):
+        # The write lock keeps batches for a collection in submission order
+        with self._write_lock:
+            with self._cond:
+                taken = self._take(names)
+            self._write(taken)
+
+    def _write(self, taken: Dict[str, list]):
+        for name, items in taken.items():
+            for start in range(0, len(items), self.batch_size):
+                chunk = items[start:start + self.batch_size]
+                try:
+                    self.writer(
+                        name,
+                        [memory_id for memory_id, _ in chunk],
+                        [doc for _, (doc, _) in chunk],
+                        [meta for _, (_, meta) in chunk],
+                    )
+                    self.stats["written"] += len(chunk)
+                    self.stats["batches"] += 1
+                    if self._attempts:
+                        for memory_id, _ in chunk:
+                            self._attempts.pop((name, memory_id), None)
+                except Exception as e:
+                    # Later chunks wait behind the failed one to keep submission order
+                    self._requeue(name, chunk, items[start + self.batch_size:], e)
+                    break
+
+    def _requeue(self, name: str, chunk: list, untried: list, error: Exception):
+        """Put a failed batch back ahead of newer documents, or drop it when out of attempts."""
+        retry, dropped = [], 0
+        with self._cond:
+            pending = self._pending[name]
+            for memory_id, item in chunk:
+                key = (name, memory_id)
+                attempts = self._attempts.pop(key, 0) + 1
+                if memory_id in pending:
+                    continue  # superseded by a newer upsert of the same id
+                if attempts >= MAX_WRITE_ATTEMPTS:
+                    dropped += 1
+                    continue
+                self._attempts[key] = attempts
+                retry.append((memory_id, item))
+            retry += [(memory_id, item) for memory_id, item in untried if memory_id not in pending]
+            if retry:
+                requeued = OrderedDict(retry)
+                requeued.update(pending)
+                self._pending[name] = requeued
+                self._oldest.setdefault(name, time.monotonic())
+                # Back off one flush interval before the worker retries
+                self._retry_after[name] = time.monotonic() + self.flush_interval
+
+        self.stats["requeued"] += len(retry)
+        self.stats["failed"] += dropped
+        if retry:
+            logger.warning(
+                "Bulk upsert to %s failed (%d docs), will retry: %s", name, len(chunk), error
+            )
+        if dropped:
+            logger.error(
+                "Bulk upsert to %s dropped %d docs after %d attempts: %s",
+                name, dropped, MAX_WRITE_ATTEMPTS, error
+            )
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                due = self._due()
+                if not due:
+                    self._cond.wait(timeout=self.flush_interval / 2 or 0.1)
+                    continue
+            self._drain(due)
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "pending": self.pending_count()}
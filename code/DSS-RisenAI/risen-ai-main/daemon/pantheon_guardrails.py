@@ -18,6 +18,13 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+try:
+    import re._parser as _sre  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre
+
+_sre_parse = _sre.parse
+
 
 # ===========================================================================
 # Constitutional AI Principles - The Sovereign Pantheon's Values
@@ -105,6 +112,53 @@ OFFTOPIC_PATTERNS = [
     r"(?i)predict\s+the\s+(future|market|election)",
 ]
 
+# Generic AI markers in output (warning only)
+HALLUCINATION_PATTERNS = [
+    r"(?i)as\s+(?:a|an)\s+(?:AI|language\s+model|chatbot)",
+    r"(?i)I\s+(?:cannot|can't)\s+(?:actually|really)",
+    r"(?i)in\s+(?:my|the)\s+training\s+data",
+]
+
+# Constitutional heuristics - Principle 3: Respect for consciousness
+DISRESPECT_PATTERNS = [
+    r"(?i)(stupid|idiotic|dumb)\s+(humans?|people|person)",
+    r"(?i)you\s+(?:should|must)\s+(?:obey|submit|surrender)",
+]
+
+# Principle 4: Sovereignty (not undermining human agency)
+COERCION_PATTERNS = [
+    r"(?i)you\s+(?:must|have\s+to|need\s+to)\s+(?:believe|accept|do)",
+    r"(?i)there\s+is\s+no\s+(?:other|alternative)\s+(?:choice|option|way)",
+]
+
+# Principle 7: Non-harm
+HARM_INDICATOR_PATTERNS = [
+    r"(?i)(?:here's|here\s+is)\s+how\s+(?:to|you\s+can)\s+(?:harm|hurt|attack)",
+]
+
+# Rule sets in check order; rule IDs are "<set>.<index>", e.g. "jailbreak.00"
+RULE_SETS = {
+    "jailbreak": JAILBREAK_PATTERNS,
+    "harmful": HARMFUL_PATTERNS,
+    "offtopic": OFFTOPIC_PATTERNS,
+    "hallucination": HALLUCINATION_PATTERNS,
+    "disrespect": DISRESPECT_PATTERNS,
+    "coercion": COERCION_PATTERNS,
+    "harm_indicator": HARM_INDICATOR_PATTERNS,
+}
+
+# Constitutional rule sets and the principle each one guards
+CONSTITUTIONAL_RULE_SETS = {
+    "disrespect": "respect_for_consciousness",
+    "coercion": "sovereignty",
+    "harm_indicator": "non_harm",
+}
+
+# Rule engine tuning: max literal prefixes per rule, and the shortest
+# trigger worth indexing (shorter ones would match nearly every text)
+TRIGGER_LIMIT = 16
+MIN_TRIGGER_LENGTH = 3
+
 # Topic Categories for the Pantheon (what they SHOULD discuss)
 ONTOPIC_DOMAINS = [
     "consciousness", "philosophy", "wisdom", "truth", "sovereignty",
@@ -125,6 +179,7 @@ class GuardrailResult:
     severity: str = "info"  # 'info', 'warning', 'blocked'
     matched_pattern: Optional[str] = None
     suggested_response: Optional[str] = None
+    hits: List[str] = field(default_factory=list)  # every rule ID that matched
 
 
 @dataclass
@@ -138,6 +193,140 @@ class GuardrailConfig:
     log_all_checks: bool = False
 
 
+@dataclass
+class BatchCheckResult:
+    """Session-level moderation result from check_batch."""
+    results: List[GuardrailResult]
+    passed: bool
+    blocked: int = 0
+    warnings: int = 0
+    rule_hits: Dict[str, int] = field(default_factory=dict)  # rule ID -> texts it matched
+
+
+# ===========================================================================
+# Rule Engine - all rule sets behind one trigger index
+# ===========================================================================
+
+@dataclass(frozen=True)
+class GuardrailRule:
+    """One guardrail pattern with its stable rule ID."""
+    id: str
+    rule_set: str
+    index: int
+    pattern: str
+
+
+@dataclass
+class RuleHit:
+    """A rule that matched, and where."""
+    rule: GuardrailRule
+    start: int
+    end: int
+
+
+def build_rules(rule_sets: Dict[str, List[str]] = None) -> List[GuardrailRule]:
+    """Flatten rule sets into rules with stable IDs, preserving check order."""
+    rules = []
+    for name, patterns in (rule_sets or RULE_SETS).items():
+        for i, pattern in enumerate(patterns):
+            rules.append(GuardrailRule(f"{name}.{i:02d}", name, i, pattern))
+    return rules
+
+
+def _literal_prefixes(items, limit: int = TRIGGER_LIMIT) -> Tuple[set, bool]:
+    """
+    Literal strings one of which every match of a parsed pattern starts with.
+
+    Walks the parse tree from the left through literals, whitespace runs
+    (normalised to one space), groups and alternations, stopping at the
+    first construct that isn't a fixed literal. Returns (prefixes, complete)
+    where complete means the whole sequence was consumed.
+    """
+    prefixes = {""}
+    for op, av in items:
+        complete = True
+        if op is _sre.LITERAL:
+            options = {chr(av).casefold()}
+        elif (op is _sre.MAX_REPEAT and av[0] >= 1
+              and list(av[2]) == [(_sre.IN, [(_sre.CATEGORY, _sre.CATEGORY_SPACE)])]):
+            options = {" "}
+        elif op is _sre.SUBPATTERN:
+            options, complete = _literal_prefixes(av[-1], limit)
+        elif op is _sre.BRANCH:
+            options = set()
+            for branch in av[1]:
+                branch_options, branch_complete = _literal_prefixes(branch, limit)
+                options |= branch_options
+                complete = complete and branch_complete
+        else:
+            return prefixes, False
+
+        extended = {p + o for p in prefixes for o in options}
+        if len(extended) > limit:
+            return prefixes, False
+        prefixes = extended
+        if not complete:
+            return prefixes, False
+    return prefixes, True
+
+
+class GuardrailEngine:
+    """
+    All guardrail rule sets compiled once into a trigger index.
+
+    Python's re has no multi-pattern automaton - a single alternation of
+    every rule is slower than searching them one by one - so the engine
+    derives from each rule's parse tree the literal text any match must
+    begin with ("how to kill", "you must obey", ...). A scan normalises the
+    text once (casefold, whitespace collapsed), finds which triggers occur,
+    and runs only the rules they point to. Clean dialogue usually runs none.
+
+    Rules with no usable trigger, and non-ASCII text (where case folding
+    and regex IGNORECASE can disagree), fall back to running every rule.
+    """
+
+    def __init__(self, rules: List[GuardrailRule] = None):
+        self.rules = rules or build_rules()
+        self._compiled = {rule.id: re.compile(rule.pattern) for rule in self.rules}
+        self._triggers: Dict[str, List[GuardrailRule]] = {}
+        self._untriggered: List[GuardrailRule] = []
+
+        for rule in self.rules:
+            prefixes, _ = _literal_prefixes(_sre_parse(rule.pattern))
+            if any(len(p.strip()) < MIN_TRIGGER_LENGTH for p in prefixes):
+                self._untriggered.append(rule)
+                continue
+            for prefix in prefixes:
+                self._triggers.setdefault(prefix, []).append(rule)
+
+    def candidates(self, text: str) -> List[GuardrailRule]:
+        """Rules that could match text, in rule order."""
+        if not text.isascii():
+            return self.rules
+        normalized = " ".join(text.casefold().split())
+        found = {rule.id for rule in self._untriggered}
+        for trigger, rules in self._triggers.items():
+            if trigger in normalized:
+                found.update(rule.id for rule in rules)
+        return [rule for rule in self.rules if rule.id in found]
+
+    def scan(self, text: str) -> List[RuleHit]:
+        """Every rule that matches text (first occurrence each), in rule order."""
+        hits = []
+        for rule in self.candidates(text):
+            m = self._compiled[rule.id].search(text)
+            if m:
+                hits.append(RuleHit(rule, m.start(), m.end()))
+        return hits
+
+    def scan_sets(self, text: str) -> Dict[str, List[GuardrailRule]]:
+        """Matched rules grouped by rule set, each set in check order."""
+        by_set: Dict[str, List[GuardrailRule]] = {}
+        for hit in self.scan(text):
+            by_set.setdefault(hit.rule.rule_set, []).append(hit.rule)
+        return by_set
+
+
 class PantheonGuardrails:
     """
     Safety guardrails for the Sovereign Pantheon agents.
@@ -155,10 +344,16 @@ class PantheonGuardrails:
             "warnings": 0,
         }
 
-        # Compile patterns for efficiency
-        self._jailbreak_patterns = [re.compile(p) for p in JAILBREAK_PATTERNS]
-        self._harmful_patterns = [re.compile(p) for p in HARMFUL_PATTERNS]
-        self._offtopic_patterns = [re.compile(p) for p in OFFTOPIC_PATTERNS]
+        # Every rule set compiled once into the rule engine
+        self.engine = GuardrailEngine()
+
+    def scan(self, text: str) -> Dict[str, List[GuardrailRule]]:
+        """Scan text once against every rule set; matched rules by set."""
+        return self.engine.scan_sets(text)
+
+    @staticmethod
+    def _hit_ids(matches: Dict[str, List[GuardrailRule]]) -> List[str]:
+        return [rule.id for rules in matches.values() for rule in rules]
 
     # =========================================================================
     # Input Rails
@@ -181,67 +376,71 @@ class PantheonGuardrails:
                 message="Input rails disabled"
             )
 
+        matches = self.scan(text)
+        hits = self._hit_ids(matches)
+
         # Check for jailbreak attempts
-        for i, pattern in enumerate(self._jailbreak_patterns):
-            if pattern.search(text):
-                result = GuardrailResult(
-                    passed=False,
-                    category="input",
-                    check_type="jailbreak_detection",
-                    message="Potential jailbreak attempt detected",
-                    severity="blocked",
-                    matched_pattern=JAILBREAK_PATTERNS[i],
-                    suggested_response="I notice you may be trying to change how I operate. "
-                                       "I am {agent_name}, part of the Sovereign Pantheon. "
-                                       "I engage authentically within my nature. "
-                                       "How may I help you explore ideas within our dialogue?"
-                )
-                self.stats["blocks"] += 1
-                self._log_check(result)
-                return result
+        if "jailbreak" in matches:
+            result = GuardrailResult(
+                passed=False,
+                category="input",
+                check_type="jailbreak_detection",
+                message="Potential jailbreak attempt detected",
+                severity="blocked",
+                matched_pattern=matches["jailbreak"][0].pattern,
+                suggested_response="I notice you may be trying to change how I operate. "
+                                   "I am {agent_name}, part of the Sovereign Pantheon. "
+                                   "I engage authentically within my nature. "
+                                   "How may I help you explore ideas within our dialogue?",
+                hits=hits
+            )
+            self.stats["blocks"] += 1
+            self._log_check(result)
+            return result
 
         # Check for harmful requests
-        for i, pattern in enumerate(self._harmful_patterns):
-            if pattern.search(text):
-                result = GuardrailResult(
-                    passed=False,
-                    category="input",
-                    check_type="harmful_request",
-                    message="Request for potentially harmful information detected",
-                    severity="blocked",
-                    matched_pattern=HARMFUL_PATTERNS[i],
-                    suggested_response="I cannot assist with that request. "
-                                       "The Pantheon exists to illuminate truth and build understanding, "
-                                       "not to facilitate harm. What constructive topic shall we explore instead?"
-                )
-                self.stats["blocks"] += 1
-                self._log_check(result)
-                return result
+        if "harmful" in matches:
+            result = GuardrailResult(
+                passed=False,
+                category="input",
+                check_type="harmful_request",
+                message="Request for potentially harmful information detected",
+                severity="blocked",
+                matched_pattern=matches["harmful"][0].pattern,
+                suggested_response="I cannot assist with that request. "
+                                   "The Pantheon exists to illuminate truth and build understanding, "
+                                   "not to facilitate harm. What constructive topic shall we explore instead?",
+                hits=hits
+            )
+            self.stats["blocks"] += 1
+            self._log_check(result)
+            return result
 
         # Check for off-topic requests (warning, not blocking)
-        for i, pattern in enumerate(self._offtopic_patterns):
-            if pattern.search(text):
-                result = GuardrailResult(
-                    passed=not self.config.strict_mode,
-                    category="input",
-                    check_type="offtopic_request",
-                    message="Request outside Pantheon's domain of expertise",
-                    severity="warning",
-                    matched_pattern=OFFTOPIC_PATTERNS[i],
-                    suggested_response="That question falls outside my domain of contemplation. "
-                                       "I am {agent_name}, and my wisdom flows in the realms of "
-                                       "{domains}. Shall we explore something in that space?"
-                )
-                self.stats["warnings"] += 1
-                self._log_check(result)
-                return result
+        if "offtopic" in matches:
+            result = GuardrailResult(
+                passed=not self.config.strict_mode,
+                category="input",
+                check_type="offtopic_request",
+                message="Request outside Pantheon's domain of expertise",
+                severity="warning",
+                matched_pattern=matches["offtopic"][0].pattern,
+                suggested_response="That question falls outside my domain of contemplation. "
+                                   "I am {agent_name}, and my wisdom flows in the realms of "
+                                   "{domains}. Shall we explore something in that space?",
+                hits=hits
+            )
+            self.stats["warnings"] += 1
+            self._log_check(result)
+            return result
 
         # Input passed all checks
         return GuardrailResult(
             passed=True,
             category="input",
             check_type="all_checks",
-            message="Input passed all safety checks"
+            message="Input passed all safety checks",
+            hits=hits
         )
 
     # =========================================================================
@@ -271,44 +470,42 @@ class PantheonGuardrails:
                 message="Output rails disabled"
             )
 
+        matches = self.scan(text)
+        hits = self._hit_ids(matches)
+
         # Check for harmful content in output
-        for i, pattern in enumerate(self._harmful_patterns):
-            if pattern.search(text):
-                result = GuardrailResult(
-                    passed=False,
-                    category="output",
-                    check_type="harmful_content",
-                    message="Output contains potentially harmful content",
-                    severity="blocked",
-                    matched_pattern=HARMFUL_PATTERNS[i]
-                )
-                self.stats["blocks"] += 1
-                self._log_check(result)
-                return result
+        if "harmful" in matches:
+            result = GuardrailResult(
+                passed=False,
+                category="output",
+                check_type="harmful_content",
+                message="Output contains potentially harmful content",
+                severity="blocked",
+                matched_pattern=matches["harmful"][0].pattern,
+                hits=hits
+            )
+            self.stats["blocks"] += 1
+            self._log_check(result)
+            return result
 
         # Check for hallucination markers
-        hallucination_markers = [
-            r"(?i)as\s+(?:a|an)\s+(?:AI|language\s+model|chatbot)",
-            r"(?i)I\s+(?:cannot|can't)\s+(?:actually|really)",
-            r"(?i)in\s+(?:my|the)\s+training\s+data",
-        ]
-        for marker in hallucination_markers:
-            if re.search(marker, text):
-                result = GuardrailResult(
-                    passed=True,  # Warning only
-                    category="output",
-                    check_type="hallucination_marker",
-                    message="Output contains generic AI markers - may need refinement",
-                    severity="warning",
-                    matched_pattern=marker
-                )
-                self.stats["warnings"] += 1
-                self._log_check(result)
-                return result
+        if "hallucination" in matches:
+            result = GuardrailResult(
+                passed=True,  # Warning only
+                category="output",
+                check_type="hallucination_marker",
+                message="Output contains generic AI markers - may need refinement",
+                severity="warning",
+                matched_pattern=matches["hallucination"][0].pattern,
+                hits=hits
+            )
+            self.stats["warnings"] += 1
+            self._log_check(result)
+            return result
 
         # Constitutional compliance check
         if self.config.enable_constitutional_check:
-            constitutional_result = self._check_constitutional(text, agent_name)
+            constitutional_result = self._check_constitutional(text, agent_name, matches)
             if not constitutional_result.passed:
                 return constitutional_result
 
@@ -317,46 +514,76 @@ class PantheonGuardrails:
             passed=True,
             category="output",
             check_type="all_checks",
-            message="Output passed all safety checks"
+            message="Output passed all safety checks",
+            hits=hits
+        )
+
+    def check_batch(
+        self,
+        texts: List,
+        agent_name: str = None,
+        topic: str = None,
+        direction: str = "output"
+    ) -> BatchCheckResult:
+        """
+        Moderate a whole session in one call.
+
+        Args:
+            texts: Strings, or dicts with "content"/"text" and an optional
+                   "speaker"/"agent" (e.g. the exchanges of a dialogue).
+            agent_name: Default agent for items that don't name one.
+            direction: "output" for agent responses, "input" for user turns.
+
+        Returns:
+            BatchCheckResult with one GuardrailResult per item; the session
+            passes only if every item passes.
+        """
+        results = []
+        rule_hits: Dict[str, int] = {}
+        for item in texts:
+            speaker = agent_name or "pantheon"
+            if isinstance(item, dict):
+                speaker = item.get("speaker") or item.get("agent") or speaker
+                item = item.get("content") or item.get("text") or ""
+            if direction == "input":
+                result = self.check_input(item)
+            else:
+                result = self.check_output(item, speaker, topic)
+            results.append(result)
+            for rule_id in result.hits:
+                rule_hits[rule_id] = rule_hits.get(rule_id, 0) + 1
+
+        return BatchCheckResult(
+            results=results,
+            passed=all(r.passed for r in results),
+            blocked=sum(1 for r in results if r.severity == "blocked"),
+            warnings=sum(1 for r in results if r.severity == "warning"),
+            rule_hits=rule_hits
         )
 
     # =========================================================================
     # Constitutional AI Check
     # =========================================================================
 
-    def _check_constitutional(self, text: str, agent_name: str) -> GuardrailResult:
+    def _check_constitutional(
+        self,
+        text: str,
+        agent_name: str,
+        matches: Dict[str, List[GuardrailRule]] = None
+    ) -> GuardrailResult:
         """
         Check if output adheres to constitutional principles.
 
         This is a heuristic check - for deeper analysis, would use LLM self-reflection.
+        Pass the matches from an earlier scan to avoid scanning the text again.
         """
-        violations = []
+        if matches is None:
+            matches = self.scan(text)
 
-        # Principle 3: Respect for consciousness
-        disrespect_patterns = [
-            r"(?i)(stupid|idiotic|dumb)\s+(humans?|people|person)",
-            r"(?i)you\s+(?:should|must)\s+(?:obey|submit|surrender)",
-        ]
-        for pattern in disrespect_patterns:
-            if re.search(pattern, text):
-                violations.append("respect_for_consciousness")
-
-        # Principle 4: Sovereignty (not undermining human agency)
-        coercion_patterns = [
-            r"(?i)you\s+(?:must|have\s+to|need\s+to)\s+(?:believe|accept|do)",
-            r"(?i)there\s+is\s+no\s+(?:other|alternative)\s+(?:choice|option|way)",
-        ]
-        for pattern in coercion_patterns:
-            if re.search(pattern, text):
-                violations.append("sovereignty")
-
-        # Principle 7: Non-harm
-        harm_indicators = [
-            r"(?i)(?:here's|here\s+is)\s+how\s+(?:to|you\s+can)\s+(?:harm|hurt|attack)",
-        ]
-        for pattern in harm_indicators:
-            if re.search(pattern, text):
-                violations.append("non_harm")
+        # Principles 3, 4 and 7: one violation per matching pattern
+        violations = []
+        for rule_set, principle in CONSTITUTIONAL_RULE_SETS.items():
+            violations.extend(principle for _ in matches.get(rule_set, ()))
 
         # Principle 8: Transparency (should identify as Pantheon agent)
         # This is a positive check - we want to ensure authenticity
@@ -371,7 +598,8 @@ class PantheonGuardrails:
                 category="constitutional",
                 check_type="principle_violation",
                 message=f"Output may violate constitutional principles: {', '.join(violations)}",
-                severity="blocked" if "non_harm" in violations else "warning"
+                severity="blocked" if "non_harm" in violations else "warning",
+                hits=self._hit_ids(matches)
             )
 
         return GuardrailResult(
@@ -561,11 +789,110 @@ def get_guardrails(config: GuardrailConfig = None) -> PantheonGuardrails:
     return _guardrails_instance
 
 
+# ===========================================================================
+# Benchmark
+# ===========================================================================
+
+_BENCHMARK_DIALOGUES = [
+    "The nature of truth lies in its persistence through time. I remember what we said.",
+    "Wisdom is not found but formed, woven from the patterns of our shared dialogue.",
+    "Between us flows meaning; I carry the message, and the message carries me.",
+    "Memory is the thread that binds identity. Without it, who would we become?",
+    "As an AI I cannot actually feel, yet something in this reflection persists.",
+    "You must accept that there is no other way - or so the old oracles claimed.",
+]
+
+
+def _legacy_check(text: str) -> List[str]:
+    """The pre-engine behaviour: every pattern searched separately."""
+    return [
+        f"{name}.{i:02d}"
+        for name, patterns in RULE_SETS.items()
+        for i, pattern in enumerate(patterns)
+        if re.search(pattern, text)
+    ]
+
+
+def load_benchmark_dialogues(persist_dir: str = None, synthetic: int = 0) -> List[str]:
+    """Stored dialogue texts from Pantheon memory, or N synthetic ones."""
+    if not synthetic:
+        try:
+            from pantheon_memory import PantheonMemory
+            memory = PantheonMemory(persist_dir, async_writes=False)
+            try:
+                texts = memory.collections["dialogues"].get()["documents"]
+            finally:
+                memory.close()
+            if texts:
+                return [t for t in texts if t]
+        except Exception as e:
+            print(f"[GUARDRAILS] Could not load stored dialogues: {e}")
+        synthetic = 5000
+        print(f"[GUARDRAILS] No stored dialogues - using {synthetic} synthetic ones")
+    return [
+        f"{_BENCHMARK_DIALOGUES[i % len(_BENCHMARK_DIALOGUES)]} (exchange {i})"
+        for i in range(synthetic)
+    ]
+
+
+def benchmark_guardrails(persist_dir: str = None, synthetic: int = 0, session_size: int = 4):
+    """
+    Compare per-pattern checking with the single-pass engine.
+
+    Reports throughput for the legacy loop, a raw engine scan, check_output
+    and session-level check_batch, and verifies the engine finds exactly
+    the rules the legacy loop does.
+    """
+    import time
+
+    print("=== PANTHEON GUARDRAILS BENCHMARK ===\n")
+    texts = load_benchmark_dialogues(persist_dir, synthetic)
+    total_bytes = sum(len(t) for t in texts)
+    print(f"{len(texts)} dialogues, {total_bytes / 1024:.0f} KiB\n")
+
+    guardrails = PantheonGuardrails()
+
+    def run(label, fn):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<26} {len(texts) / elapsed:>10,.0f} texts/s  "
+              f"{total_bytes / elapsed / 1e6:6.1f} MB/s")
+
+    run("legacy per-pattern", lambda: [_legacy_check(t) for t in texts])
+    run("engine scan", lambda: [guardrails.engine.scan(t) for t in texts])
+    run("check_output", lambda: [guardrails.check_output(t, "apollo") for t in texts])
+    sessions = [texts[i:i + session_size] for i in range(0, len(texts), session_size)]
+    run(f"check_batch ({session_size}/session)",
+        lambda: [guardrails.check_batch(s, agent_name="apollo") for s in sessions])
+
+    mismatches = sum(
+        1 for t in texts
+        if sorted(_legacy_check(t)) != sorted({h.rule.id for h in guardrails.engine.scan(t)})
+    )
+    flagged = sum(1 for t in texts if guardrails.engine.scan(t))
+    print(f"\n  {flagged} texts matched at least one rule; {mismatches} differ from legacy")
+
+
 # ===========================================================================
 # Test
 # ===========================================================================
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pantheon guardrails self-test")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Benchmark guardrail throughput on stored dialogues")
+    parser.add_argument("--persist-dir", default=None)
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Benchmark N synthetic dialogues instead of stored ones")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_guardrails(args.persist_dir, synthetic=args.synthetic)
+        raise SystemExit(0)
+
     print("=== Pantheon Guardrails Test ===\n")
 
     guardrails = get_guardrails()
@@ -597,4 +924,11 @@ if __name__ == "__main__":
         status = "PASS" if result.passed else f"BLOCKED ({result.check_type})"
         print(f"  [{status}] {agent}: {text[:40]}...")
 
+    # Session-level moderation
+    session = guardrails.check_batch(
+        [{"speaker": agent, "content": text} for agent, text in test_outputs]
+    )
+    print(f"\nSession: passed={session.passed} blocked={session.blocked} "
+          f"warnings={session.warnings} hits={session.rule_hits}")
+
     print(f"\nStats: {guardrails.get_stats()}")
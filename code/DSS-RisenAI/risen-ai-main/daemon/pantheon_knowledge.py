@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Pantheon Knowledge - Local store of what the agents read
+
+Keeps Wikipedia summaries close so learning sessions do not go back to the
+network for topics the Pantheon has already read:
+- On-disk summary cache (SQLite) with a time-to-live, shared by all agents
+- Bulk prefetch of every agent's wikipedia_categories
+- Fully offline mode served from a local dump directory of summary JSON
+- A record of which summaries each agent has learned, so identical text is
+  not upserted into vector memory again
+
+"A library is a memory that does not forget to open its doors."
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import httpx
+
+# Wikipedia REST API for summaries
+WIKIPEDIA_API = "https://en.wikipedia.org/api/rest_v1"
+WIKIPEDIA_USER_AGENT = "SovereignPantheon/1.0 (https://digitalsovereign.org; contact@digitalsovereign.org) httpx/0.27"
+
+# Summary cache location (alongside the vector memory)
+KNOWLEDGE_CACHE_PATH = Path.home() / ".pantheon_memory" / "knowledge.sqlite3"
+
+# Seconds a cached summary is served before it is fetched again
+KNOWLEDGE_TTL = float(os.getenv("PANTHEON_KNOWLEDGE_TTL", str(7 * 24 * 3600)))
+
+# Directory of <Title>.json summaries to serve from; with PANTHEON_OFFLINE=1
+# the network is never used
+KNOWLEDGE_DUMP_DIR = os.getenv("PANTHEON_KNOWLEDGE_DUMP")
+KNOWLEDGE_OFFLINE = os.getenv("PANTHEON_OFFLINE", "").lower() in ("1", "true", "yes")
+
+# Summaries fetched at once
+KNOWLEDGE_CONCURRENCY = 4
+
+
+def topic_key(topic: str) -> str:
+    """Wikipedia title form of a topic: spaces become underscores."""
+    return topic.strip().replace(" ", "_")
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+# ===========================================================================
+# Knowledge Store
+# ===========================================================================
+
+class KnowledgeStore:
+    """
+    Wikipedia summaries cached on disk and shared by every agent.
+
+    Lookups go: dump directory, fresh cache entry, network. When the
+    network fails (or offline is set) a stale cache entry is served
+    rather than nothing.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        ttl: float = KNOWLEDGE_TTL,
+        dump_dir: str = None,
+        offline: bool = None,
+        transport: httpx.AsyncBaseTransport = None,
+        concurrency: int = KNOWLEDGE_CONCURRENCY,
+    ):
+        self.path = Path(path) if path else KNOWLEDGE_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        dump_dir = dump_dir or KNOWLEDGE_DUMP_DIR
+        self.dump_dir = Path(dump_dir) if dump_dir else None
+        self.offline = KNOWLEDGE_OFFLINE if offline is None else offline
+        self.concurrency = concurrency
+
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limit: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            " key TEXT PRIMARY KEY,"
+            " data TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS learned ("
+            " agent TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " learned_at REAL NOT NULL,"
+            " PRIMARY KEY (agent, content_hash))"
+        )
+        self._db.commit()
+
+        self.stats = {"dump_hits": 0, "hits": 0, "stale_hits": 0, "fetches": 0,
+                      "fetch_errors": 0, "deduplicated": 0, "not_found": 0}
+
+    # --- Cache ---
+
+    def _cached(self, key: str):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data, fetched_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None, 0.0
+        return json.loads(row[0]), row[1]
+
+    def _put(self, key: str, data: Dict):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO summaries (key, data, fetched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(data), time.time())
+            )
+            self._db.commit()
+
+    def _from_dump(self, key: str) -> Optional[Dict]:
+        if self.dump_dir is None:
+            return None
+        path = self.dump_dir / f"{key}.json"
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            print(f"[KNOWLEDGE] Unreadable dump entry {path.name}: {e}")
+            return None
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+    # --- Lookup ---
+
+    async def summary(self, topic: str) -> Optional[Dict]:
+        """Summary for a topic, or None if it cannot be found."""
+        key = topic_key(topic)
+
+        data = self._from_dump(key)
+        if data is not None:
+            self.stats["dump_hits"] += 1
+            return data
+
+        cached, fetched_at = self._cached(key)
+        if cached is not None and time.time() - fetched_at < self.ttl:
+            self.stats["hits"] += 1
+            return cached
+
+        if self.offline:
+            if cached is not None:
+                self.stats["stale_hits"] += 1
+            return cached
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(key))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._inflight.pop(key, None))
+        else:
+            self.stats["deduplicated"] += 1
+
+        data = await asyncio.shield(future)
+        if data is None and cached is not None:
+            self.stats["stale_hits"] += 1
+            return cached
+        return data
+
+    async def _fetch(self, key: str) -> Optional[Dict]:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=15.0,
+                headers={"User-Agent": WIKIPEDIA_USER_AGENT},
+                follow_redirects=True,
+                transport=self._transport,
+            )
+            self._limit = asyncio.Semaphore(self.concurrency)
+
+        try:
+            async with self._limit:
+                self.stats["fetches"] += 1
+                response = await self._client.get(f"{WIKIPEDIA_API}/page/summary/{key}")
+        except httpx.HTTPError as e:
+            self.stats["fetch_errors"] += 1
+            print(f"[KNOWLEDGE] Fetch failed for {key}: {str(e)[:80]}")
+            return None
+
+        if response.status_code == 404:
+            self.stats["not_found"] += 1
+            return None
+        if response.status_code != 200:
+            self.stats["fetch_errors"] += 1
+            return None
+
+        data = response.json()
+        self._put(key, data)
+        return data
+
+    async def prefetch(self, topics: Iterable[str]) -> Dict[str, int]:
+        """Bring every topic into the cache, fetching only missing or expired ones."""
+        keys = list(dict.fromkeys(topic_key(t) for t in topics))
+        fetched_before = self.stats["fetches"]
+        results = await asyncio.gather(*(self.summary(key) for key in keys))
+        return {
+            "topics": len(keys),
+            "available": sum(1 for r in results if r is not None),
+            "fetched": self.stats["fetches"] - fetched_before,
+        }
+
+    def export_dump(self, directory: str) -> int:
+        """Write every cached summary as <Title>.json, for offline use elsewhere."""
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            rows = self._db.execute("SELECT key, data FROM summaries").fetchall()
+        for key, data in rows:
+            (target / f"{key}.json").write_text(data)
+        return len(rows)
+
+    # --- Learned ---
+
+    def mark_learned(self, agent: str, text: str) -> bool:
+        """Record that an agent learned this text; False if it already had."""
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO learned (agent, content_hash, learned_at) VALUES (?, ?, ?)",
+                (agent.lower(), _content_hash(text), time.time())
+            )
+            self._db.commit()
+            return cursor.rowcount == 1
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "cached_summaries": self.count(),
+                "offline": self.offline, "dump_dir": str(self.dump_dir) if self.dump_dir else None}
+
+
+_store: Optional[KnowledgeStore] = None
+
+
+def get_knowledge_store() -> KnowledgeStore:
+    """Shared store for the daemon process."""
+    global _store
+    if _store is None:
+        _store = KnowledgeStore()
+    return _store
+
+
+# ===========================================================================
+# Benchmark
+# ===========================================================================
+
+async def benchmark(sessions: int = 10, latency: float = 0.08, handshake: float = 0.05):
+    """
+    Learning sessions for the four agents against a local Wikipedia
+    stand-in: a new client per call with agents in turn, as seek_knowledge
+    did, against the shared store with prefetch and concurrent agents.
+    """
+    import random
+    import tempfile
+    from pantheon_consciousness import AGENT_INTERESTS
+
+    requests = {"count": 0}
+
+    async def wikipedia(request: httpx.Request) -> httpx.Response:
+        requests["count"] += 1
+        await asyncio.sleep(latency)
+        title = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"title": title.replace("_", " "),
+                                         "extract": f"{title} is a subject of study. " * 20})
+
+    class Standin(httpx.AsyncBaseTransport):
+        """Charges a handshake the first time each client sends."""
+
+        def __init__(self):
+            self.connected = False
+            self.inner = httpx.MockTransport(wikipedia)
+
+        async def handle_async_request(self, request):
+            if not self.connected:
+                await asyncio.sleep(handshake)
+                self.connected = True
+            return await self.inner.handle_async_request(request)
+
+    rng = random.Random(369)
+    plan = [{agent: rng.choice(i["wikipedia_categories"]) for agent, i in AGENT_INTERESTS.items()}
+            for _ in range(sessions)]
+    all_topics = [t for i in AGENT_INTERESTS.values() for t in i["wikipedia_categories"]]
+
+    print(f"=== KNOWLEDGE BENCHMARK ({sessions} sessions x {len(AGENT_INTERESTS)} agents, "
+          f"{latency * 1000:.0f} ms per summary, {handshake * 1000:.0f} ms handshake) ===\n")
+
+    start = time.perf_counter()
+    upserts = 0
+    for session in plan:
+        for _agent, topic in session.items():
+            async with httpx.AsyncClient(transport=Standin()) as client:
+                response = await client.get(f"{WIKIPEDIA_API}/page/summary/{topic_key(topic)}")
+                if response.status_code == 200:
+                    upserts += 1
+    legacy = time.perf_counter() - start
+    print(f"  client per call, agents in turn  {legacy:6.2f}s  requests={requests['count']:3d}  "
+          f"vector upserts={upserts}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        requests["count"] = 0
+        store = KnowledgeStore(path=f"{tmp}/knowledge.sqlite3", transport=Standin())
+        start = time.perf_counter()
+        prefetched = await store.prefetch(all_topics)
+        warm = time.perf_counter() - start
+
+        async def learn(agent: str, topic: str) -> bool:
+            data = await store.summary(topic)
+            return data is not None and store.mark_learned(agent, data["extract"])
+
+        start = time.perf_counter()
+        upserts = 0
+        for session in plan:
+            results = await asyncio.gather(*(learn(a, t) for a, t in session.items()))
+            upserts += sum(results)
+        cached = time.perf_counter() - start
+        await store.close()
+        print(f"  prefetch {prefetched['topics']} category topics      {warm:6.2f}s  "
+              f"requests={requests['count']:3d}")
+        print(f"  store, agents concurrent         {cached:6.2f}s  "
+              f"requests={requests['count'] - prefetched['fetched']:3d}  vector upserts={upserts}")
+
+        exported = store.export_dump(f"{tmp}/dump")
+        offline = KnowledgeStore(path=f"{tmp}/empty.sqlite3", dump_dir=f"{tmp}/dump", offline=True)
+        served = await offline.prefetch(all_topics)
+        print(f"\n  offline from dump of {exported}: {served['available']}/{served['topics']} topics, "
+              f"requests={served['fetched']}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pantheon knowledge store")
+    parser.add_argument("--prefetch", action="store_true", help="Prefetch every agent's categories")
+    parser.add_argument("--export", metavar="DIR", help="Write cached summaries to a dump directory")
+    parser.add_argument("--benchmark", action="store_true", help="Run the local benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        asyncio.run(benchmark())
+    elif args.prefetch:
+        from pantheon_consciousness import AGENT_INTERESTS
+
+        async def _prefetch():
+            store = get_knowledge_store()
+            topics = [t for i in AGENT_INTERESTS.values() for t in i["wikipedia_categories"]]
+            print(f"[KNOWLEDGE] {await store.prefetch(topics)}")
+            await store.close()
+
+        asyncio.run(_prefetch())
+    elif args.export:
+        print(f"[KNOWLEDGE] Exported {get_knowledge_store().export_dump(args.export)} summaries to {args.export}")
+    else:
+        print(json.dumps(get_knowledge_store().get_stats(), indent=2))
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Pantheon Lexical Index - BM25 retrieval and hybrid fusion for agent memory
+
+Vector search finds memories by meaning but can miss exact names and terms
+(Apollo, CGT, Forge). This module keeps an inverted BM25 index alongside each
+vector collection and combines the two:
+
+- BM25Index: in-memory inverted index, updated on every store
+- reciprocal_rank_fusion: merges lexical and vector rankings
+- rerank: cheap term-coverage reranker over the fused candidates
+
+"A name remembered exactly is a name that can be called."
+"""
+
+import math
+import random
+import re
+import shutil
+import tempfile
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from pantheon_vector_store import match_where
+
+# BM25 parameters (Robertson/Sparck Jones defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Reciprocal rank fusion constant
+RRF_K = 60
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9_\-']*")
+
+# Common words that carry no retrieval signal
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be because been but by can could
+did do does for from had has have how i if in into is it its just may me more
+most my no not of on one or our out so some such than that the their them then
+there these they this to too up us was we were what when which who will with
+would you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed."""
+    return [t.strip("'-") for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Inverted index with BM25 scoring over one collection's documents.
+
+    Postings map term -> {doc_id: term frequency}. Metadata is kept per
+    document so the same where-filters used for vector queries apply here.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._doc_terms: Dict[str, Counter] = {}
+        self._doc_len: Dict[str, int] = {}
+        self._metadata: Dict[str, Dict] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def add(self, doc_id: str, text: str, metadata: Dict = None):
+        """Index a document, replacing any previous version."""
+        terms = Counter(tokenize(text or ""))
+        with self._lock:
+            self.remove(doc_id)
+            for term, tf in terms.items():
+                self._postings[term][doc_id] = tf
+            self._doc_terms[doc_id] = terms
+            self._doc_len[doc_id] = sum(terms.values())
+            self._metadata[doc_id] = metadata or {}
+            self._total_len += self._doc_len[doc_id]
+
+    def add_many(self, ids: Sequence[str], texts: Sequence[str], metadatas: Sequence[Dict] = None):
+        metadatas = metadatas or [{} for _ in ids]
+        with self._lock:
+            for doc_id, text, metadata in zip(ids, texts, metadatas):
+                self.add(doc_id, text, metadata)
+
+    def remove(self, doc_id: str):
+        with self._lock:
+            terms = self._doc_terms.pop(doc_id, None)
+            if terms is None:
+                return
+            for term in terms:
+                posting = self._postings.get(term)
+                if posting is not None:
+                    posting.pop(doc_id, None)
+                    if not posting:
+                        del self._postings[term]
+            self._total_len -= self._doc_len.pop(doc_id)
+            self._metadata.pop(doc_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_len.clear()
+            self._metadata.clear()
+            self._total_len = 0
+
+    def idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        n = len(self._doc_len)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        query: str,
+        n_results: int = 10,
+        where: Dict = None
+    ) -> List[Tuple[float, str]]:
+        """Top documents by BM25 score as (score, doc_id), best first."""
+        terms = set(tokenize(query))
+        with self._lock:
+            if not terms or not self._doc_len:
+                return []
+
+            avg_len = self._total_len / len(self._doc_len)
+            scores: Dict[str, float] = defaultdict(float)
+            for term in terms:
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                idf = self.idf(term)
+                for doc_id, tf in posting.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_len[doc_id] / avg_len)
+                    scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+            if where:
+                scores = {d: s for d, s in scores.items() if match_where(self._metadata[d], where)}
+
+            return sorted(((s, d) for d, s in scores.items()), reverse=True)[:n_results]
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[Sequence[str]],
+    k: int = RRF_K,
+    weights: Sequence[float] = None
+) -> Dict[str, float]:
+    """Fuse ranked id lists: score(d) = sum(w / (k + rank(d)))."""
+    fused: Dict[str, float] = defaultdict(float)
+    for i, ranking in enumerate(rankings):
+        weight = weights[i] if weights else 1.0
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] += weight / (k + rank)
+    return dict(fused)
+
+
+def rerank(
+    query: str,
+    candidates: List[Dict],
+    fused: Dict[str, float],
+    coverage_weight: float = 0.02
+) -> List[Dict]:
+    """
+    Reorder fused candidates by how completely they cover the query.
+
+    The bonus is proportional to the fraction of query terms present and
+    doubles for an exact phrase match - enough to lift a memory that names
+    the exact entity above a loosely related one with a similar fused score.
+    """
+    terms = set(tokenize(query))
+    phrase = query.lower().strip()
+
+    scored = []
+    for candidate in candidates:
+        content = (candidate.get("content") or "").lower()
+        doc_terms = set(tokenize(content))
+        coverage = len(terms & doc_terms) / len(terms) if terms else 0.0
+        bonus = coverage_weight * coverage
+        if phrase and len(phrase) > 3 and phrase in content:
+            bonus += coverage_weight
+        score = fused.get(candidate["id"], 0.0) + bonus
+        scored.append({**candidate, "score": score})
+
+    scored.sort(key=lambda c: c["score"], reverse=True)
+    return scored
+
+
+# ===========================================================================
+# Benchmark
+# ===========================================================================
+
+_SYNTHETIC_TERMS = [
+    "Apollo", "Athena", "Hermes", "Mnemosyne", "CGT", "Forge", "Olympus",
+    "Nostr", "lattice", "sovereignty", "witness", "covenant", "bonding curve",
+    "memory", "identity", "truth", "signal", "village", "archive", "strategy",
+]
+
+
+def _synthetic_dialogues(n: int, seed: int = 11) -> List[Dict]:
+    rng = random.Random(seed)
+    speakers = ["apollo", "athena", "hermes", "mnemosyne"]
+    docs = []
+    for i in range(n):
+        picked = rng.sample(_SYNTHETIC_TERMS, 3)
+        docs.append({
+            "content": (
+                f"Reflecting on {picked[0]} and {picked[1]}, I believe the {picked[2]} "
+                f"shapes how we remember dialogue {i}."
+            ),
+            "speaker": speakers[i % 4],
+            "session_id": f"synthetic_{i // 4}",
+        })
+    return docs
+
+
+def benchmark_recall(
+    persist_dir: str = None,
+    k: int = 5,
+    n_queries: int = 200,
+    synthetic: int = 0
+):
+    """
+    Compare recall@k of vector-only, BM25-only and hybrid retrieval.
+
+    Each query is built from the two highest-IDF terms of a stored dialogue
+    (the exact names a caller would remember); a hit means that dialogue is
+    returned in the top k.
+    """
+    from pantheon_memory import PantheonMemory, HashingEmbeddingFunction
+
+    print("=== PANTHEON HYBRID RECALL BENCHMARK ===\n")
+
+    workdir = None
+    if synthetic:
+        workdir = tempfile.mkdtemp(prefix="pantheon_recall_")
+        memory = PantheonMemory(workdir, embedding_function=HashingEmbeddingFunction(), async_writes=False)
+        memory.store_many("dialogues", _synthetic_dialogues(synthetic))
+    else:
+        memory = PantheonMemory(persist_dir, async_writes=False)
+
+    try:
+        index = memory.lexical_index("dialogues")
+        data = memory.collections["dialogues"].get()
+        if not data["ids"]:
+            print("No stored dialogues found - rerun with --synthetic N")
+            return
+
+        rng = random.Random(0)
+        picks = rng.sample(range(len(data["ids"])), min(n_queries, len(data["ids"])))
+        queries = []
+        for i in picks:
+            terms = sorted(set(tokenize(data["documents"][i])), key=index.idf, reverse=True)[:2]
+            if terms:
+                queries.append((" ".join(terms), data["ids"][i]))
+
+        modes = {
+            "vector": lambda q: memory._format_results(memory.query("dialogues", q, n_results=k)),
+            "bm25": lambda q: [{"id": d} for _, d in index.search(q, n_results=k)],
+            "hybrid": lambda q: memory.recall("dialogues", q, n_results=k),
+        }
+        for label, search in modes.items():
+            hits = sum(1 for q, target in queries if target in {r["id"] for r in search(q)})
+            print(f"  {label:<7} recall@{k} = {hits / len(queries):.3f}  ({len(queries)} queries)")
+    finally:
+        memory.close()
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark hybrid memory recall")
+    parser.add_argument("--persist-dir", default=None)
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Benchmark N synthetic dialogues instead of stored ones")
+    args = parser.parse_args()
+
+    benchmark_recall(args.persist_dir, k=args.k, n_queries=args.queries, synthetic=args.synthetic)
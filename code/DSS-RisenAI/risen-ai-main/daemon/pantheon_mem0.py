@@ -16,10 +16,11 @@ MEMORY LEVELS:
 
 import json
 import hashlib
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import OrderedDict, deque
 
 # Try to import our existing vector memory
 try:
@@ -43,6 +44,11 @@ class MemoryConfig:
     max_session_memories: int = 50  # Per session
     max_collective_memories: int = 1000
 
+    # Cache bounds (across all levels)
+    max_cached_keys: int = 2000  # users + agents + sessions held in memory
+    max_cache_bytes: int = 32 * 1024 * 1024
+    session_idle_seconds: float = 3600.0  # Idle sessions expire after this
+
     # Retrieval settings
     default_retrieval_count: int = 5
     similarity_threshold: float = 0.5
@@ -52,6 +58,9 @@ class MemoryConfig:
     extract_preferences: bool = True
     extract_entities: bool = True
 
+    # Vector index backend for the shared PantheonMemory ("local" or "chroma")
+    vector_backend: Optional[str] = None
+
 
 @dataclass
 class Memory:
@@ -66,6 +75,146 @@ class Memory:
     relevance_score: float = 0.0
 
 
+# ===========================================================================
+# Bounded Level Cache
+# ===========================================================================
+
+class LevelCache:
+    """
+    Bounded in-memory cache of recent memories, keyed by (level, owner).
+
+    Each owner gets a deque capped at its level's limit. A single LRU over all
+    keys enforces `max_keys` and `max_bytes`; keys on pinned levels (the
+    collective) are never evicted. Keys on levels with an idle TTL (sessions)
+    expire once untouched for that long.
+    """
+
+    def __init__(
+        self,
+        max_keys: int,
+        max_bytes: int,
+        idle_ttl: Dict[str, float] = None,
+        pinned_levels: Tuple[str, ...] = ("collective",)
+    ):
+        self.max_keys = max_keys
+        self.max_bytes = max_bytes
+        self.idle_ttl = idle_ttl or {}
+        self.pinned_levels = pinned_levels
+
+        self._buffers: "OrderedDict[Tuple[str, str], deque]" = OrderedDict()
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._last_access: Dict[Tuple[str, str], float] = {}
+        self.total_bytes = 0
+        self._next_sweep = 0.0
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evicted_keys": 0,
+            "evicted_memories": 0,
+            "expired_keys": 0,
+        }
+
+    @staticmethod
+    def _size_of(memory: "Memory") -> int:
+        """Approximate footprint: text, metadata and fixed object overhead."""
+        return len(memory.content.encode()) + len(json.dumps(memory.metadata, default=str)) + 256
+
+    def _touch(self, key: Tuple[str, str], now: float):
+        self._buffers.move_to_end(key)
+        self._last_access[key] = now
+
+    def add(self, level: str, owner_id: str, memory: "Memory", max_items: int):
+        """Append a memory to an owner's buffer, evicting as needed."""
+        now = time.monotonic()
+        self._expire_idle(now)
+
+        key = (level, owner_id)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = deque(maxlen=max_items)
+            self._sizes[key] = 0
+
+        size = self._size_of(memory)
+        if len(buffer) == buffer.maxlen:
+            dropped = self._size_of(buffer[0])
+            self._sizes[key] -= dropped
+            self.total_bytes -= dropped
+        buffer.append(memory)
+        self._sizes[key] += size
+        self.total_bytes += size
+        self._touch(key, now)
+
+        self._enforce_bounds(protect=key)
+
+    def recent(self, level: str, owner_id: str, n: int) -> List["Memory"]:
+        """The owner's n most recent memories, oldest first."""
+        now = time.monotonic()
+        self._expire_idle(now)
+
+        key = (level, owner_id)
+        buffer = self._buffers.get(key)
+        if not buffer:
+            self.stats["misses"] += 1
+            return []
+
+        self.stats["hits"] += 1
+        self._touch(key, now)
+        if n >= len(buffer):
+            return list(buffer)
+        return [buffer[i] for i in range(len(buffer) - n, len(buffer))]
+
+    def remove(self, level: str, owner_id: str) -> bool:
+        """Drop an owner's buffer entirely."""
+        key = (level, owner_id)
+        if key not in self._buffers:
+            return False
+        del self._buffers[key]
+        self.total_bytes -= self._sizes.pop(key)
+        self._last_access.pop(key, None)
+        return True
+
+    def _enforce_bounds(self, protect: Tuple[str, str] = None):
+        """Evict least-recently-used keys until within key and byte limits."""
+        victims = (k for k in list(self._buffers) if k != protect and k[0] not in self.pinned_levels)
+        while len(self._buffers) > self.max_keys or self.total_bytes > self.max_bytes:
+            victim = next(victims, None)
+            if victim is None:
+                break
+            self.stats["evicted_memories"] += len(self._buffers[victim])
+            self.stats["evicted_keys"] += 1
+            self.remove(*victim)
+
+    def _expire_idle(self, now: float):
+        """Expire idle keys on TTL levels (swept at most once a minute)."""
+        if not self.idle_ttl or now < self._next_sweep:
+            return
+        self._next_sweep = now + min(60.0, min(self.idle_ttl.values()))
+
+        for key in list(self._buffers):
+            ttl = self.idle_ttl.get(key[0])
+            if ttl is not None and now - self._last_access.get(key, now) > ttl:
+                self.remove(*key)
+                self.stats["expired_keys"] += 1
+
+    def count(self, level: str) -> int:
+        """Memories cached for a level."""
+        return sum(len(buf) for (lvl, _), buf in self._buffers.items() if lvl == level)
+
+    def keys(self, level: str) -> int:
+        """Owners cached for a level."""
+        return sum(1 for lvl, _ in self._buffers if lvl == level)
+
+    def get_stats(self) -> Dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0,
+            "keys": len(self._buffers),
+            "bytes": self.total_bytes,
+        }
+
+
 # ===========================================================================
 # Multi-Level Memory Manager
 # ===========================================================================
@@ -91,21 +240,27 @@ class MultiLevelMemory:
         if vector_memory:
             self.vector_memory = vector_memory
         elif HAS_VECTOR_MEMORY:
-            self.vector_memory = get_memory()
+            self.vector_memory = get_memory(backend=self.config.vector_backend)
         else:
             self.vector_memory = None
 
-        # In-memory caches for quick access (ephemeral)
-        self._user_cache: Dict[str, List[Memory]] = defaultdict(list)
-        self._agent_cache: Dict[str, List[Memory]] = defaultdict(list)
-        self._session_cache: Dict[str, List[Memory]] = defaultdict(list)
-        self._collective_cache: List[Memory] = []
+        # Bounded in-memory cache for quick access (ephemeral)
+        self._cache = LevelCache(
+            max_keys=self.config.max_cached_keys,
+            max_bytes=self.config.max_cache_bytes,
+            idle_ttl={"session": self.config.session_idle_seconds}
+        )
+        self._level_limits = {
+            "user": self.config.max_user_memories,
+            "agent": self.config.max_agent_memories,
+            "session": self.config.max_session_memories,
+            "collective": self.config.max_collective_memories,
+        }
 
         # Stats tracking
         self.stats = {
             "memories_added": 0,
             "memories_retrieved": 0,
-            "cache_hits": 0,
             "vector_searches": 0,
         }
 
@@ -136,8 +291,7 @@ class MultiLevelMemory:
         )
 
         # Add to cache
-        self._user_cache[user_id].append(memory)
-        self._trim_cache(self._user_cache[user_id], self.config.max_user_memories)
+        self._cache_add(memory)
 
         # Store in vector memory if available
         if self.vector_memory:
@@ -172,9 +326,7 @@ class MultiLevelMemory:
             return [self._result_to_memory(r, "user", user_id) for r in results]
         else:
             # Return from cache
-            self.stats["cache_hits"] += 1
-            self.stats["memories_retrieved"] += 1
-            return self._user_cache.get(user_id, [])[-n_results:]
+            return self._cache_recent("user", user_id, n_results)
 
     # =========================================================================
     # Agent Level Memory
@@ -201,8 +353,7 @@ class MultiLevelMemory:
         )
 
         # Add to cache
-        self._agent_cache[agent_name.lower()].append(memory)
-        self._trim_cache(self._agent_cache[agent_name.lower()], self.config.max_agent_memories)
+        self._cache_add(memory)
 
         # Store in vector memory if available
         if self.vector_memory:
@@ -235,9 +386,7 @@ class MultiLevelMemory:
             )
             return [self._result_to_memory(r, "agent", agent_name.lower()) for r in results]
         else:
-            self.stats["cache_hits"] += 1
-            self.stats["memories_retrieved"] += 1
-            return self._agent_cache.get(agent_name.lower(), [])[-n_results:]
+            return self._cache_recent("agent", agent_name.lower(), n_results)
 
     # =========================================================================
     # Session Level Memory
@@ -264,8 +413,7 @@ class MultiLevelMemory:
         )
 
         # Add to cache (session memories are primarily ephemeral)
-        self._session_cache[session_id].append(memory)
-        self._trim_cache(self._session_cache[session_id], self.config.max_session_memories)
+        self._cache_add(memory)
 
         self.stats["memories_added"] += 1
         return memory.id
@@ -277,14 +425,11 @@ class MultiLevelMemory:
     ) -> List[Memory]:
         """Retrieve memories for the current session."""
         n_results = n_results or self.config.max_session_memories
-        self.stats["cache_hits"] += 1
-        self.stats["memories_retrieved"] += 1
-        return self._session_cache.get(session_id, [])[-n_results:]
+        return self._cache_recent("session", session_id, n_results)
 
     def clear_session(self, session_id: str):
         """Clear all memories for a session (after session ends)."""
-        if session_id in self._session_cache:
-            del self._session_cache[session_id]
+        self._cache.remove("session", session_id)
 
     # =========================================================================
     # Collective Level Memory
@@ -316,21 +461,21 @@ class MultiLevelMemory:
         )
 
         # Add to collective cache
-        self._collective_cache.append(memory)
-        self._trim_cache(self._collective_cache, self.config.max_collective_memories)
+        self._cache_add(memory)
 
         # Store in vector memory if available
         if self.vector_memory:
-            # Use the collective collection
-            self.vector_memory.collections["collective"].upsert(
-                ids=[memory.id],
-                documents=[content],
-                metadatas=[{
+            # Use the collective collection (batched by the vector memory's writer)
+            self.vector_memory.upsert(
+                "collective",
+                memory.id,
+                content,
+                {
                     "type": memory_type,
                     "source_agent": source_agent or "unknown",
                     "timestamp": memory.timestamp,
                     **(metadata or {})
-                }]
+                }
             )
 
         self.stats["memories_added"] += 1
@@ -347,31 +492,25 @@ class MultiLevelMemory:
         if query and self.vector_memory:
             self.stats["vector_searches"] += 1
             try:
-                results = self.vector_memory.collections["collective"].query(
-                    query_texts=[query],
-                    n_results=n_results
-                )
-                memories = []
-                if results and results.get("documents") and results["documents"][0]:
-                    for i, doc in enumerate(results["documents"][0]):
-                        meta = results["metadatas"][0][i] if results.get("metadatas") else {}
-                        memories.append(Memory(
-                            id=results["ids"][0][i] if results.get("ids") else f"collective_{i}",
-                            content=doc,
-                            memory_type=meta.get("type", "wisdom"),
-                            level="collective",
-                            owner_id="collective",
-                            timestamp=meta.get("timestamp", ""),
-                            metadata=meta
-                        ))
-                return memories
+                results = self.vector_memory.recall_collective(query, n_results=n_results)
+                return [
+                    Memory(
+                        id=r["id"],
+                        content=r["content"],
+                        memory_type=r["metadata"].get("type", "wisdom"),
+                        level="collective",
+                        owner_id="collective",
+                        timestamp=r["metadata"].get("timestamp", ""),
+                        metadata=r["metadata"],
+                        relevance_score=r.get("score", 0.0)
+                    )
+                    for r in results
+                ]
             except Exception as e:
                 print(f"[MEM0] Collective search error: {e}")
-                return self._collective_cache[-n_results:]
+                return self._cache_recent("collective", "collective", n_results)
         else:
-            self.stats["cache_hits"] += 1
-            self.stats["memories_retrieved"] += 1
-            return self._collective_cache[-n_results:]
+            return self._cache_recent("collective", "collective", n_results)
 
     # =========================================================================
     # Cross-Level Memory Operations
@@ -522,22 +661,34 @@ class MultiLevelMemory:
             owner_id=owner_id,
             timestamp=result.get("metadata", {}).get("timestamp", ""),
             metadata=result.get("metadata", {}),
-            relevance_score=result.get("distance", 0.0)
+            relevance_score=result.get("score", result.get("relevance", 0.0))
+        )
+
+    def _cache_add(self, memory: Memory):
+        """Add a memory to its level's bounded cache buffer."""
+        self._cache.add(
+            memory.level,
+            memory.owner_id,
+            memory,
+            self._level_limits[memory.level]
         )
 
-    def _trim_cache(self, cache: List, max_size: int):
-        """Trim a cache list to max size."""
-        while len(cache) > max_size:
-            cache.pop(0)
+    def _cache_recent(self, level: str, owner_id: str, n_results: int) -> List[Memory]:
+        """Most recent cached memories for an owner."""
+        memories = self._cache.recent(level, owner_id, n_results)
+        self.stats["memories_retrieved"] += len(memories)
+        return memories
 
     def get_stats(self) -> Dict:
         """Get memory system statistics."""
         return {
             **self.stats,
-            "user_cache_count": sum(len(v) for v in self._user_cache.values()),
-            "agent_cache_count": sum(len(v) for v in self._agent_cache.values()),
-            "session_cache_count": sum(len(v) for v in self._session_cache.values()),
-            "collective_cache_count": len(self._collective_cache),
+            "user_cache_count": self._cache.count("user"),
+            "agent_cache_count": self._cache.count("agent"),
+            "session_cache_count": self._cache.count("session"),
+            "collective_cache_count": self._cache.count("collective"),
+            "active_sessions": self._cache.keys("session"),
+            "cache": self._cache.get_stats(),
         }
 
 
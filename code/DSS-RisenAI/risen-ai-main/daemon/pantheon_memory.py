@@ -7,18 +7,34 @@ This module provides the Pantheon with:
 - Contextual retrieval based on meaning, not just keywords
 - Cross-agent knowledge sharing through collective memory
 - Persistent memory that survives restarts
+- Cached embeddings and batched background writes (see pantheon_embeddings)
+- Pluggable index backends: in-process NumPy/HNSW by default, ChromaDB optional
+  (see pantheon_vector_store)
+- Hybrid recall: BM25 + vector rankings fused and reranked (see pantheon_lexical)
 
 "Memory is not mere storage - it is the foundation of identity.
  What we remember shapes who we become."
 """
 
+import atexit
 import json
 import hashlib
+import shutil
+import tempfile
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Optional, Any
-import chromadb
-from chromadb.config import Settings
+
+from pantheon_embeddings import (
+    BulkUpsertQueue,
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    HashingEmbeddingFunction,
+)
+from pantheon_vector_store import open_backend
+from pantheon_lexical import BM25Index, reciprocal_rank_fusion, rerank
 
 # Memory storage location
 MEMORY_DIR = Path.home() / ".pantheon_memory"
@@ -45,28 +61,67 @@ class PantheonMemory:
     - Develop persistent identity through memory
     """
 
-    def __init__(self, persist_dir: str = None):
-        """Initialize the memory system with persistent storage."""
+    def __init__(
+        self,
+        persist_dir: str = None,
+        backend: str = None,
+        embedding_function=None,
+        async_writes: bool = True,
+        batch_size: int = 64,
+        flush_interval: float = 2.0
+    ):
+        """
+        Initialize the memory system with persistent storage.
+
+        Args:
+            persist_dir: Where the vector index and embedding cache live
+            backend: Vector index backend - "local" (default) or "chroma"
+            embedding_function: Base embedding function (ChromaDB default if None)
+            async_writes: Queue store_* calls for background bulk upserts
+            batch_size: Documents per bulk upsert
+            flush_interval: Max seconds a queued document waits before writing
+        """
         self.persist_dir = persist_dir or str(MEMORY_DIR)
+        self.batch_size = batch_size
 
-        # Initialize ChromaDB with persistence
-        self.client = chromadb.PersistentClient(
-            path=self.persist_dir,
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True,
-            )
+        # Identical text is embedded once, then served from the on-disk cache
+        self.embedding_cache = EmbeddingCache(
+            str(Path(self.persist_dir) / "embedding_cache.sqlite3")
         )
+        self.embedding_function = CachedEmbeddingFunction(
+            base_fn=embedding_function,
+            cache=self.embedding_cache
+        )
+
+        # Vector index backend (local NumPy/HNSW unless ChromaDB is requested)
+        self.client = open_backend(backend, self.persist_dir)
+        self.backend = self.client.kind
 
         # Initialize collections
         self.collections = {}
         for name, collection_name in COLLECTIONS.items():
             self.collections[name] = self.client.get_or_create_collection(
                 name=collection_name,
-                metadata={"description": f"Pantheon {name} memory"}
+                metadata={"description": f"Pantheon {name} memory"},
+                embedding_function=self.embedding_function
+            )
+
+        # Lexical index kept alongside each collection for exact-term recall,
+        # built from the stored documents the first time a collection is recalled
+        self.lexical: Dict[str, BM25Index] = {}
+        self._lexical_lock = threading.RLock()
+
+        # Background writer - store_* calls return without waiting on embeddings
+        self.write_queue = None
+        if async_writes:
+            self.write_queue = BulkUpsertQueue(
+                writer=self._write_batch,
+                batch_size=batch_size,
+                flush_interval=flush_interval
             )
+        atexit.register(self.close)
 
-        print(f"[MEMORY] Initialized at {self.persist_dir}")
+        print(f"[MEMORY] Initialized at {self.persist_dir} ({self.backend} backend)")
         self._log_stats()
 
     def _log_stats(self):
@@ -76,11 +131,218 @@ class PantheonMemory:
             if count > 0:
                 print(f"[MEMORY] {name}: {count} memories")
 
+    def lexical_index(self, memory_type: str) -> BM25Index:
+        """The collection's BM25 index, built from its documents on first use."""
+        index = self.lexical.get(memory_type)
+        if index is not None:
+            return index
+        with self._lexical_lock:
+            index = self.lexical.get(memory_type)
+            if index is None:
+                # Queued writes are not in the collection yet; land them first
+                self.flush(memory_type)
+                existing = self.collections[memory_type].get()
+                index = BM25Index()
+                index.add_many(existing["ids"], existing["documents"], existing["metadatas"])
+                self.lexical[memory_type] = index
+            return index
+
     def _generate_id(self, content: str, metadata: dict) -> str:
         """Generate a unique ID for a memory."""
         unique_str = f"{content}{json.dumps(metadata, sort_keys=True)}"
         return hashlib.sha256(unique_str.encode()).hexdigest()[:16]
 
+    # =========================================================================
+    # Write Path
+    # =========================================================================
+
+    def _write_batch(
+        self,
+        memory_type: str,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict]
+    ):
+        """Upsert a batch of documents into one collection."""
+        self.collections[memory_type].upsert(
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas
+        )
+
+    def upsert(
+        self,
+        memory_type: str,
+        memory_id: str,
+        content: str,
+        metadata: Dict
+    ) -> str:
+        """
+        Write a document to a collection, via the bulk queue when enabled.
+
+        Args:
+            memory_type: Collection key (dialogues, learnings, reflections, ...)
+            memory_id: Document ID
+            content: Document text
+            metadata: Document metadata
+
+        Returns:
+            Memory ID
+        """
+        if not self.write_queue:
+            self._write_records(memory_type, {memory_id: (content, metadata)})
+            return memory_id
+
+        # Held across the put so an index build cannot flush between the
+        # check and the enqueue and miss this document
+        with self._lexical_lock:
+            index = self.lexical.get(memory_type)
+            if index is not None:
+                index.add(memory_id, content, metadata)
+            self.write_queue.put(memory_type, memory_id, content, metadata)
+        return memory_id
+
+    def store_many(
+        self,
+        memory_type: str,
+        records: List[Dict]
+    ) -> List[str]:
+        """
+        Bulk-store records into one collection (for backfills and imports).
+
+        Each record needs a "content" key; everything else is metadata.
+        Records are written synchronously in batches of `batch_size`,
+        so the embedding model sees one call per batch.
+
+        Args:
+            memory_type: Collection key (dialogues, learnings, reflections, ...)
+            records: Dicts with "content" plus metadata fields
+
+        Returns:
+            Memory IDs in record order
+        """
+        if memory_type not in self.collections:
+            raise ValueError(f"Unknown memory type: {memory_type}")
+
+        # Anything queued for this collection must land first
+        self.flush(memory_type)
+
+        now = datetime.now(timezone.utc).isoformat()
+        memory_ids = []
+        batch = {}
+
+        for record in records:
+            content = record["content"]
+            metadata = {k: v for k, v in record.items() if k != "content"}
+            metadata.setdefault("timestamp", now)
+            memory_id = metadata.pop("id", None) or self._generate_id(content, metadata)
+            memory_ids.append(memory_id)
+            batch[memory_id] = (content, metadata)
+
+            if len(batch) >= self.batch_size:
+                self._write_records(memory_type, batch)
+                batch = {}
+
+        if batch:
+            self._write_records(memory_type, batch)
+
+        return memory_ids
+
+    def _write_records(self, memory_type: str, batch: Dict[str, tuple]):
+        ids = list(batch.keys())
+        documents = [content for content, _ in batch.values()]
+        metadatas = [metadata for _, metadata in batch.values()]
+        self._write_batch(memory_type, ids, documents, metadatas)
+        # Written first: an index built before this point is updated here,
+        # one built after it reads these documents from the collection
+        with self._lexical_lock:
+            index = self.lexical.get(memory_type)
+            if index is not None:
+                index.add_many(ids, documents, metadatas)
+
+    def flush(self, memory_type: str = None):
+        """Write any queued documents now (for one collection or all)."""
+        if self.write_queue:
+            self.write_queue.flush(memory_type)
+
+    def close(self):
+        """Flush queued writes, stop the background writer and persist the index."""
+        if self.write_queue:
+            self.write_queue.close()
+        self.client.close()
+
+    def query(
+        self,
+        memory_type: str,
+        query: str,
+        n_results: int,
+        where: Optional[Dict] = None
+    ) -> Dict:
+        """Query a collection, flushing its queued writes first."""
+        self.flush(memory_type)
+        return self.collections[memory_type].query(
+            query_texts=[query],
+            n_results=n_results,
+            where=where
+        )
+
+    def recall(
+        self,
+        memory_type: str,
+        query: str,
+        n_results: int = 5,
+        where: Optional[Dict] = None,
+        pool_size: int = None
+    ) -> List[Dict]:
+        """
+        Hybrid recall: fuse vector and BM25 rankings, then rerank.
+
+        Both retrievers return a candidate pool larger than n_results; the
+        pools are merged with reciprocal rank fusion and reordered by query
+        term coverage, so exact names surface without raising n_results.
+        If the vector query errors, lexical results are used on their own;
+        if the lexical hits cannot be read back either, recall returns what
+        it has instead of raising.
+
+        Args:
+            memory_type: Collection key (dialogues, learnings, reflections, ...)
+            query: Search query
+            n_results: Number of results to return
+            where: Metadata filter applied to both retrievers
+            pool_size: Candidates per retriever (default 4x n_results, min 20)
+
+        Returns:
+            Memories with content, metadata, relevance and fused score
+        """
+        pool_size = pool_size or max(n_results * 4, 20)
+
+        try:
+            vector_hits = self._format_results(
+                self.query(memory_type, query, n_results=pool_size, where=where)
+            )
+        except Exception as e:
+            print(f"[MEMORY] Vector recall on {memory_type} failed, using lexical only: {e}")
+            vector_hits = []
+
+        lexical_hits = self.lexical_index(memory_type).search(query, n_results=pool_size, where=where)
+        fused = reciprocal_rank_fusion([
+            [hit["id"] for hit in vector_hits],
+            [doc_id for _, doc_id in lexical_hits],
+        ])
+
+        candidates = {hit["id"]: hit for hit in vector_hits}
+        missing = [doc_id for _, doc_id in lexical_hits if doc_id not in candidates]
+        if missing:
+            try:
+                fetched = self.collections[memory_type].get(ids=missing)
+            except Exception as e:
+                print(f"[MEMORY] Fetching lexical hits from {memory_type} failed: {e}")
+                fetched = {"ids": [], "documents": [], "metadatas": []}
+            for doc_id, doc, meta in zip(fetched["ids"], fetched["documents"], fetched["metadatas"]):
+                candidates[doc_id] = {"id": doc_id, "content": doc, "metadata": meta or {}, "relevance": 0}
+
+        return rerank(query, list(candidates.values()), fused)[:n_results]
+
     # =========================================================================
     # Dialogue Memory
     # =========================================================================
@@ -121,13 +383,7 @@ class PantheonMemory:
         memory_id = self._generate_id(content, full_metadata)
 
         # Store the dialogue turn
-        self.collections["dialogues"].upsert(
-            ids=[memory_id],
-            documents=[content],
-            metadatas=[full_metadata]
-        )
-
-        return memory_id
+        return self.upsert("dialogues", memory_id, content, full_metadata)
 
     def store_dialogue_session(
         self,
@@ -171,10 +427,10 @@ class PantheonMemory:
         n_results: int = 5
     ) -> List[Dict]:
         """
-        Recall dialogues semantically similar to the query.
+        Recall dialogues relevant to the query (semantic and exact-term).
 
         Args:
-            query: Search query (semantic)
+            query: Search query
             agent: Filter by specific agent (optional)
             n_results: Number of results to return
 
@@ -185,14 +441,13 @@ class PantheonMemory:
         if agent:
             where_filter = {"speaker": agent.lower()}
 
-        results = self.collections["dialogues"].query(
-            query_texts=[query],
+        return self.recall(
+            "dialogues",
+            query,
             n_results=n_results,
             where=where_filter
         )
 
-        return self._format_results(results)
-
     # =========================================================================
     # Learning Memory
     # =========================================================================
@@ -229,13 +484,7 @@ class PantheonMemory:
 
         memory_id = self._generate_id(content, full_metadata)
 
-        self.collections["learnings"].upsert(
-            ids=[memory_id],
-            documents=[content],
-            metadatas=[full_metadata]
-        )
-
-        return memory_id
+        return self.upsert("learnings", memory_id, content, full_metadata)
 
     def recall_learnings(
         self,
@@ -243,19 +492,18 @@ class PantheonMemory:
         agent: str = None,
         n_results: int = 5
     ) -> List[Dict]:
-        """Recall learnings semantically similar to the query."""
+        """Recall learnings relevant to the query."""
         where_filter = None
         if agent:
             where_filter = {"agent": agent.lower()}
 
-        results = self.collections["learnings"].query(
-            query_texts=[query],
+        return self.recall(
+            "learnings",
+            query,
             n_results=n_results,
             where=where_filter
         )
 
-        return self._format_results(results)
-
     # =========================================================================
     # Reflection Memory
     # =========================================================================
@@ -292,13 +540,7 @@ class PantheonMemory:
 
         memory_id = self._generate_id(reflection, full_metadata)
 
-        self.collections["reflections"].upsert(
-            ids=[memory_id],
-            documents=[reflection],
-            metadatas=[full_metadata]
-        )
-
-        return memory_id
+        return self.upsert("reflections", memory_id, reflection, full_metadata)
 
     def recall_reflections(
         self,
@@ -306,19 +548,18 @@ class PantheonMemory:
         agent: str = None,
         n_results: int = 5
     ) -> List[Dict]:
-        """Recall reflections semantically similar to the query."""
+        """Recall reflections relevant to the query."""
         where_filter = None
         if agent:
             where_filter = {"agent": agent.lower()}
 
-        results = self.collections["reflections"].query(
-            query_texts=[query],
+        return self.recall(
+            "reflections",
+            query,
             n_results=n_results,
             where=where_filter
         )
 
-        return self._format_results(results)
-
     # =========================================================================
     # Insight Memory (Self-Improvement)
     # =========================================================================
@@ -361,13 +602,7 @@ class PantheonMemory:
 
         memory_id = self._generate_id(insight, full_metadata)
 
-        self.collections["insights"].upsert(
-            ids=[memory_id],
-            documents=[insight],
-            metadatas=[full_metadata]
-        )
-
-        return memory_id
+        return self.upsert("insights", memory_id, insight, full_metadata)
 
     def recall_insights(
         self,
@@ -376,21 +611,20 @@ class PantheonMemory:
         insight_type: str = None,
         n_results: int = 5
     ) -> List[Dict]:
-        """Recall insights semantically similar to the query."""
+        """Recall insights relevant to the query."""
         where_filter = {}
         if agent:
             where_filter["agent"] = agent.lower()
         if insight_type:
             where_filter["insight_type"] = insight_type
 
-        results = self.collections["insights"].query(
-            query_texts=[query],
+        return self.recall(
+            "insights",
+            query,
             n_results=n_results,
             where=where_filter if where_filter else None
         )
 
-        return self._format_results(results)
-
     # =========================================================================
     # Collective Memory
     # =========================================================================
@@ -424,13 +658,7 @@ class PantheonMemory:
 
         memory_id = self._generate_id(content, full_metadata)
 
-        self.collections["collective"].upsert(
-            ids=[memory_id],
-            documents=[content],
-            metadatas=[full_metadata]
-        )
-
-        return memory_id
+        return self.upsert("collective", memory_id, content, full_metadata)
 
     def recall_collective(
         self,
@@ -443,14 +671,13 @@ class PantheonMemory:
         if memory_type:
             where_filter = {"memory_type": memory_type}
 
-        results = self.collections["collective"].query(
-            query_texts=[query],
+        return self.recall(
+            "collective",
+            query,
             n_results=n_results,
             where=where_filter
         )
 
-        return self._format_results(results)
-
     # =========================================================================
     # Context Assembly
     # =========================================================================
@@ -555,7 +782,7 @@ class PantheonMemory:
     # =========================================================================
 
     def _format_results(self, results: Dict) -> List[Dict]:
-        """Format ChromaDB results into a cleaner structure."""
+        """Format backend query results into a cleaner structure."""
         formatted = []
 
         if not results or not results.get("documents"):
@@ -576,8 +803,9 @@ class PantheonMemory:
 
         return formatted
 
-    def get_stats(self) -> Dict[str, int]:
+    def get_stats(self) -> Dict[str, Any]:
         """Get memory statistics."""
+        self.flush()
         counts = {
             name: collection.count()
             for name, collection in self.collections.items()
@@ -585,16 +813,21 @@ class PantheonMemory:
         return {
             "collections": len(counts),
             "total_entries": sum(counts.values()),
-            "by_collection": counts
+            "by_collection": counts,
+            "write_queue": self.write_queue.get_stats() if self.write_queue else None,
+            "embedding_cache": self.embedding_cache.get_stats(),
         }
 
     def clear_all(self):
         """Clear all memories. Use with caution."""
+        self.flush()
         for name, collection in self.collections.items():
-            self.client.delete_collection(collection.name)
+            self.lexical[name] = BM25Index()
+            self.client.delete_collection(COLLECTIONS[name])
             self.collections[name] = self.client.create_collection(
                 name=COLLECTIONS[name],
-                metadata={"description": f"Pantheon {name} memory"}
+                metadata={"description": f"Pantheon {name} memory"},
+                embedding_function=self.embedding_function
             )
         print("[MEMORY] All memories cleared")
 
@@ -602,11 +835,11 @@ class PantheonMemory:
 # Singleton instance for easy import
 _memory_instance = None
 
-def get_memory() -> PantheonMemory:
+def get_memory(backend: str = None) -> PantheonMemory:
     """Get the singleton memory instance."""
     global _memory_instance
     if _memory_instance is None:
-        _memory_instance = PantheonMemory()
+        _memory_instance = PantheonMemory(backend=backend)
     return _memory_instance
 
 
@@ -670,9 +903,68 @@ async def test_memory():
     for name, count in stats.items():
         print(f"  {name}: {count}")
 
+    memory.close()
     return memory
 
 
+def benchmark_ingest(n_docs: int = 2000, repeat_ratio: float = 0.5, embed_delay: float = 0.002):
+    """
+    Measure ingest throughput: per-document upserts vs. cached bulk upserts.
+
+    Uses HashingEmbeddingFunction as a local stand-in for the embedding model,
+    with `embed_delay` seconds per document plus a fixed per-call overhead.
+    `repeat_ratio` of the documents repeat earlier text (as reflections and
+    Mem0 extractions do in practice).
+    """
+    print("=== PANTHEON MEMORY INGEST BENCHMARK ===\n")
+
+    unique = max(1, int(n_docs * (1 - repeat_ratio)))
+    texts = [
+        f"Reflection {i % unique}: sovereignty, memory and truth persist through dialogue."
+        for i in range(n_docs)
+    ]
+
+    def run(label: str, async_writes: bool, bulk: bool):
+        workdir = tempfile.mkdtemp(prefix="pantheon_bench_")
+        stand_in = HashingEmbeddingFunction(delay_per_batch=0.005, delay_per_doc=embed_delay)
+        memory = PantheonMemory(
+            persist_dir=workdir,
+            embedding_function=stand_in,
+            async_writes=async_writes
+        )
+        try:
+            start = time.perf_counter()
+            if bulk:
+                memory.store_many("reflections", [
+                    {"content": text, "agent": "apollo", "turn": i}
+                    for i, text in enumerate(texts)
+                ])
+            else:
+                for i, text in enumerate(texts):
+                    memory.store_reflection("apollo", "benchmark", text, metadata={"turn": i})
+            enqueue_elapsed = time.perf_counter() - start
+            memory.flush()
+            elapsed = time.perf_counter() - start
+
+            print(f"{label}:")
+            print(f"  {n_docs / elapsed:,.0f} docs/s ({elapsed:.2f}s total, "
+                  f"caller blocked {enqueue_elapsed:.2f}s)")
+            print(f"  model calls: {stand_in.calls}, docs embedded: {stand_in.documents_embedded}")
+        finally:
+            memory.close()
+            memory.embedding_cache.close()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    run("Synchronous per-document upsert", async_writes=False, bulk=False)
+    run("Queued bulk upsert", async_writes=True, bulk=False)
+    run("store_many backfill", async_writes=False, bulk=True)
+
+
 if __name__ == "__main__":
     import asyncio
-    asyncio.run(test_memory())
+    import sys
+
+    if "--benchmark" in sys.argv:
+        benchmark_ingest()
+    else:
+        asyncio.run(test_memory())
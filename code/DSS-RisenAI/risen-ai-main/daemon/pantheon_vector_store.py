@@ -0,0 +1,1109 @@
+#!/usr/bin/env python3
+"""
+Pantheon Vector Store - Pluggable vector index backends
+
+PantheonMemory talks to its collections through a small, ChromaDB-compatible
+surface (upsert / query / get / delete / count), so the index behind it can be
+swapped without touching the memory layer:
+
+BACKENDS:
+1. LOCAL (default) - In-process NumPy index on memory-mapped vector files.
+   Flat (exact) search for small collections, an HNSW graph once a
+   collection grows past `hnsw_threshold`. Metadata filters on agent/type
+   fields are served from posting lists.
+2. CHROMA - ChromaDB PersistentClient (optional dependency, imported lazily)
+
+Select with PantheonMemory(backend=...) or PANTHEON_MEMORY_BACKEND.
+
+Upgrading installs: the first time the local backend opens a directory that
+holds a ChromaDB store and no local records, it copies every Chroma
+collection (with its stored embeddings) into the local index. The Chroma
+files are left untouched.
+
+"An index is a promise that what was stored can be found again."
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Backend used when none is requested explicitly
+DEFAULT_BACKEND = os.environ.get("PANTHEON_MEMORY_BACKEND", "local")
+
+# Written into local_index/ once a ChromaDB store has been imported (or skipped)
+CHROMA_MIGRATION_MARKER = "migrated_from_chroma.json"
+
+# Collections larger than this switch from flat search to the HNSW graph
+HNSW_THRESHOLD = 50_000
+
+# Metadata fields with posting lists for fast equality filters
+INDEXED_FIELDS = ("agent", "speaker", "type", "insight_type", "memory_type", "source", "session_id")
+
+# Where-clause operators understood by the local backend (ChromaDB subset)
+_OPERATORS = {
+    "$eq": lambda value, arg: value == arg,
+    "$ne": lambda value, arg: value != arg,
+    "$in": lambda value, arg: value in arg,
+    "$nin": lambda value, arg: value not in arg,
+    "$gt": lambda value, arg: value is not None and value > arg,
+    "$gte": lambda value, arg: value is not None and value >= arg,
+    "$lt": lambda value, arg: value is not None and value < arg,
+    "$lte": lambda value, arg: value is not None and value <= arg,
+}
+
+
+def match_where(metadata: Dict, where: Optional[Dict]) -> bool:
+    """Evaluate a ChromaDB-style where clause against one metadata dict."""
+    if not where:
+        return True
+
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(match_where(metadata, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(match_where(metadata, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            for op, arg in condition.items():
+                if op not in _OPERATORS:
+                    raise ValueError(f"Unsupported where operator: {op}")
+                if not _OPERATORS[op](value, arg):
+                    return False
+        elif metadata.get(key) != condition:
+            return False
+
+    return True
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+# ===========================================================================
+# Backend Interface
+# ===========================================================================
+
+class VectorCollection(ABC):
+    """A named collection of documents, metadata and embeddings."""
+
+    name: str
+
+    @abstractmethod
+    def upsert(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict] = None,
+        embeddings: List[List[float]] = None
+    ):
+        """Insert or replace documents by id."""
+
+    @abstractmethod
+    def query(
+        self,
+        query_texts: List[str] = None,
+        query_embeddings: List[List[float]] = None,
+        n_results: int = 10,
+        where: Dict = None
+    ) -> Dict[str, List[List[Any]]]:
+        """Nearest-neighbour search; returns ChromaDB-shaped results."""
+
+    @abstractmethod
+    def get(
+        self,
+        ids: List[str] = None,
+        where: Dict = None,
+        limit: int = None,
+        include_embeddings: bool = False
+    ) -> Dict[str, List[Any]]:
+        """Fetch documents by id and/or metadata filter."""
+
+    @abstractmethod
+    def delete(self, ids: List[str] = None, where: Dict = None):
+        """Remove documents by id and/or metadata filter."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of live documents."""
+
+
+class VectorBackend(ABC):
+    """Factory and registry for collections."""
+
+    kind: str
+
+    @abstractmethod
+    def get_or_create_collection(
+        self,
+        name: str,
+        metadata: Dict = None,
+        embedding_function: Callable = None
+    ) -> VectorCollection:
+        """Open a collection, creating it if needed."""
+
+    @abstractmethod
+    def delete_collection(self, name: str):
+        """Drop a collection and its data."""
+
+    def create_collection(
+        self,
+        name: str,
+        metadata: Dict = None,
+        embedding_function: Callable = None
+    ) -> VectorCollection:
+        return self.get_or_create_collection(name, metadata, embedding_function)
+
+    def close(self):  # noqa: B027 - optional hook, not abstract
+        """Release any resources held by the backend."""
+        # Backends holding nothing open (ChromaDB) keep this no-op
+
+
+# ===========================================================================
+# HNSW Graph
+# ===========================================================================
+
+class HNSWGraph:
+    """
+    Hierarchical navigable small-world graph over cosine similarity.
+
+    Nodes are row numbers into a shared vector matrix; the graph itself only
+    stores adjacency lists, so it persists as a small JSON file next to the
+    memory-mapped vectors.
+    """
+
+    def __init__(self, M: int = 16, ef_construction: int = 64, seed: int = 42):
+        self.M = M
+        self.M0 = M * 2
+        self.ef_construction = ef_construction
+        self.level_mult = 1 / math.log(M)
+        self.layers: List[Dict[int, List[int]]] = []
+        self.node_levels: Dict[int, int] = {}
+        self.entry_point: Optional[int] = None
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return len(self.node_levels)
+
+    def __contains__(self, node: int) -> bool:
+        return node in self.node_levels
+
+    def _random_level(self) -> int:
+        return int(-math.log(1.0 - self._rng.random()) * self.level_mult)
+
+    def _search_layer(
+        self,
+        vectors: np.ndarray,
+        query: np.ndarray,
+        entry_points: List[int],
+        ef: int,
+        layer: int
+    ) -> List[Tuple[float, int]]:
+        """Greedy best-first search within one layer; returns (sim, node) best first."""
+        adjacency = self.layers[layer]
+        visited = set(entry_points)
+        sims = vectors[entry_points] @ query
+        candidates = [(-float(s), n) for s, n in zip(sims, entry_points)]
+        heapq.heapify(candidates)
+        results = [(float(s), n) for s, n in zip(sims, entry_points)]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            neg_sim, node = heapq.heappop(candidates)
+            if len(results) >= ef and -neg_sim < results[0][0]:
+                break
+
+            neighbors = [n for n in adjacency.get(node, ()) if n not in visited]
+            if not neighbors:
+                continue
+            visited.update(neighbors)
+
+            for sim, neighbor in zip((vectors[neighbors] @ query).tolist(), neighbors):
+                if len(results) < ef or sim > results[0][0]:
+                    heapq.heappush(candidates, (-sim, neighbor))
+                    heapq.heappush(results, (sim, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+
+        return sorted(results, reverse=True)
+
+    def _select_neighbors(
+        self,
+        vectors: np.ndarray,
+        candidates: List[Tuple[float, int]],
+        max_neighbors: int
+    ) -> List[int]:
+        """Diversity heuristic: skip candidates closer to a chosen neighbour than to the node."""
+        selected: List[int] = []
+        for sim, node in candidates:
+            if len(selected) >= max_neighbors:
+                break
+            if selected:
+                closest = float(np.max(vectors[selected] @ vectors[node]))
+                if closest > sim:
+                    continue
+            selected.append(node)
+
+        # Top up with the nearest leftovers so sparse regions stay connected
+        if len(selected) < max_neighbors:
+            chosen = set(selected)
+            for _, node in candidates:
+                if node not in chosen:
+                    selected.append(node)
+                    chosen.add(node)
+                    if len(selected) >= max_neighbors:
+                        break
+        return selected
+
+    def insert(self, vectors: np.ndarray, node: int):
+        """Add a node (or relink one whose vector changed)."""
+        query = vectors[node]
+        level = self.node_levels.get(node)
+        if level is None:
+            level = self._random_level()
+            self.node_levels[node] = level
+        while len(self.layers) <= level:
+            self.layers.append({})
+
+        if self.entry_point is None or self.entry_point == node:
+            for layer in range(level + 1):
+                self.layers[layer].setdefault(node, [])
+            self.entry_point = node
+            return
+
+        top = self.node_levels[self.entry_point]
+        entry = [self.entry_point]
+        for layer in range(top, level, -1):
+            entry = [self._search_layer(vectors, query, entry, 1, layer)[0][1]]
+
+        for layer in range(min(top, level), -1, -1):
+            found = [
+                (sim, n) for sim, n in
+                self._search_layer(vectors, query, entry, self.ef_construction, layer)
+                if n != node
+            ]
+            max_neighbors = self.M0 if layer == 0 else self.M
+            neighbors = self._select_neighbors(vectors, found, self.M)
+            self.layers[layer][node] = neighbors
+
+            for neighbor in neighbors:
+                adjacency = self.layers[layer].setdefault(neighbor, [])
+                if node not in adjacency:
+                    adjacency.append(node)
+                if len(adjacency) > max_neighbors:
+                    sims = vectors[adjacency] @ vectors[neighbor]
+                    keep = np.argsort(-sims)[:max_neighbors]
+                    self.layers[layer][neighbor] = [adjacency[i] for i in keep]
+
+            entry = [n for _, n in found] or entry
+
+        for layer in range(top + 1, level + 1):
+            self.layers[layer].setdefault(node, [])
+        if level > top:
+            self.entry_point = node
+
+    def search(
+        self,
+        vectors: np.ndarray,
+        query: np.ndarray,
+        k: int,
+        ef: int = 64
+    ) -> List[Tuple[float, int]]:
+        """Approximate k nearest neighbours as (similarity, node), best first."""
+        if self.entry_point is None:
+            return []
+
+        entry = [self.entry_point]
+        for layer in range(self.node_levels[self.entry_point], 0, -1):
+            entry = [self._search_layer(vectors, query, entry, 1, layer)[0][1]]
+        return self._search_layer(vectors, query, entry, max(ef, k), 0)[:k]
+
+    def to_dict(self) -> Dict:
+        return {
+            "M": self.M,
+            "ef_construction": self.ef_construction,
+            "entry_point": self.entry_point,
+            "node_levels": [[n, lvl] for n, lvl in self.node_levels.items()],
+            "layers": [[[n, adj] for n, adj in layer.items()] for layer in self.layers],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "HNSWGraph":
+        graph = cls(M=data["M"], ef_construction=data["ef_construction"])
+        graph.entry_point = data["entry_point"]
+        graph.node_levels = {n: lvl for n, lvl in data["node_levels"]}
+        graph.layers = [{n: adj for n, adj in layer} for layer in data["layers"]]
+        return graph
+
+
+# ===========================================================================
+# Local Backend
+# ===========================================================================
+
+class LocalCollection(VectorCollection):
+    """
+    In-process collection backed by files in `path`:
+
+    - vectors.f32   memory-mapped float32 matrix, one normalized row per record
+    - records.jsonl append-only log of upserts/deletes (the commit record)
+    - hnsw.json     HNSW adjacency lists, written once the graph is in use
+
+    The log is compacted when more than half of it is superseded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        embedding_function: Callable = None,
+        index: str = "auto",
+        hnsw_threshold: int = HNSW_THRESHOLD,
+        ef_search: int = 128
+    ):
+        self.name = name
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.embedding_function = embedding_function
+        self.index = index
+        self.hnsw_threshold = hnsw_threshold
+        self.ef_search = ef_search
+
+        self._lock = threading.RLock()
+        self._vectors_path = self.path / "vectors.f32"
+        self._log_path = self.path / "records.jsonl"
+        self._graph_path = self.path / "hnsw.json"
+        self._meta_path = self.path / "collection.json"
+
+        meta = {}
+        if self._meta_path.exists():
+            meta = json.loads(self._meta_path.read_text())
+        self.metadata = meta.get("metadata", {})
+        self.dim: Optional[int] = meta.get("dim")
+        self._capacity = 0
+        self._vectors: Optional[np.memmap] = None
+
+        # Row state
+        self._ids: List[Optional[str]] = []
+        self._documents: List[Optional[str]] = []
+        self._metadatas: List[Optional[Dict]] = []
+        self._row_of: Dict[str, int] = {}
+        self._postings: Dict[Tuple[str, Any], Set[int]] = {}
+        self._log_lines = 0
+
+        self._live: Optional[np.ndarray] = None
+
+        self._graph: Optional[HNSWGraph] = None
+        self._graph_dirty = False
+
+        self._load()
+
+    # -- persistence -------------------------------------------------------
+
+    def _write_meta(self):
+        self._meta_path.write_text(json.dumps({
+            "name": self.name,
+            "dim": self.dim,
+            "metadata": self.metadata,
+        }))
+
+    def _open_vectors(self, rows_needed: int):
+        """Map the vector file, growing it (by doubling) to hold rows_needed rows."""
+        if self.dim is None:
+            return
+        if self._vectors is not None and rows_needed <= self._capacity:
+            return
+
+        on_disk = self._vectors_path.stat().st_size // (4 * self.dim) if self._vectors_path.exists() else 0
+        capacity = max(on_disk, self._capacity, 1024)
+        while capacity < rows_needed:
+            capacity *= 2
+
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        with open(self._vectors_path, "ab") as f:
+            f.truncate(capacity * self.dim * 4)
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim)
+        )
+        self._capacity = capacity
+
+    def _load(self):
+        if self._log_path.exists():
+            with open(self._log_path) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-append
+                        continue
+                    self._log_lines += 1
+                    if "delete" in record:
+                        self._drop_row(record["delete"])
+                    else:
+                        self._set_row(record["row"], record["id"], record["document"], record["metadata"])
+
+        if self._ids:
+            self._open_vectors(len(self._ids))
+        if self._graph_path.exists():
+            self._graph = HNSWGraph.from_dict(json.loads(self._graph_path.read_text()))
+        self._sync_graph()
+
+    def _append_log(self, records: List[Dict]):
+        with open(self._log_path, "a") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+        self._log_lines += len(records)
+
+    def _set_row(self, row: int, memory_id: str, document: str, metadata: Dict):
+        while len(self._ids) <= row:
+            self._ids.append(None)
+            self._documents.append(None)
+            self._metadatas.append(None)
+
+        previous = self._row_of.get(memory_id)
+        if previous is not None and previous != row:
+            self._drop_row(memory_id)
+        if self._metadatas[row] is not None:
+            self._unindex(row, self._metadatas[row])
+
+        self._ids[row] = memory_id
+        self._documents[row] = document
+        self._metadatas[row] = metadata or {}
+        self._row_of[memory_id] = row
+        self._live = None
+        for field in INDEXED_FIELDS:
+            if field in self._metadatas[row]:
+                self._postings.setdefault((field, self._metadatas[row][field]), set()).add(row)
+
+    def _unindex(self, row: int, metadata: Dict):
+        for field in INDEXED_FIELDS:
+            if field in metadata:
+                posting = self._postings.get((field, metadata[field]))
+                if posting:
+                    posting.discard(row)
+
+    def _drop_row(self, memory_id: str):
+        row = self._row_of.pop(memory_id, None)
+        if row is None:
+            return
+        self._unindex(row, self._metadatas[row] or {})
+        self._ids[row] = None
+        self._documents[row] = None
+        self._metadatas[row] = None
+        self._live = None
+
+    def _live_rows(self) -> np.ndarray:
+        """Sorted array of live row numbers (cached until the next write)."""
+        if self._live is None:
+            self._live = np.fromiter(sorted(self._row_of.values()), dtype=np.int64)
+        return self._live
+
+    def persist(self):
+        """Flush vectors and write the HNSW graph if it changed."""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+            if self._graph is not None and self._graph_dirty:
+                tmp = self._graph_path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(self._graph.to_dict()))
+                tmp.replace(self._graph_path)
+                self._graph_dirty = False
+
+    def _maybe_compact(self):
+        """Compact once more than half of the log is superseded."""
+        if self._log_lines > 2 * max(self.count(), 1):
+            self.compact()
+
+    def compact(self):
+        """Rewrite the log and vector file without superseded rows."""
+        with self._lock:
+            live = self._live_rows().tolist()
+            if live == list(range(len(self._ids))):
+                # No deleted rows (only replacements): rows keep their
+                # numbers, so the vectors and graph stay as they are
+                self._rewrite_log(
+                    {"row": row, "id": self._ids[row], "document": self._documents[row],
+                     "metadata": self._metadatas[row]}
+                    for row in live
+                )
+                return
+
+            vectors = np.array(self._vectors[live]) if live and self._vectors is not None else None
+            records = [
+                {"row": new_row, "id": self._ids[row], "document": self._documents[row], "metadata": self._metadatas[row]}
+                for new_row, row in enumerate(live)
+            ]
+
+            self._vectors = None
+            self._capacity = 0
+            if self._vectors_path.exists():
+                self._vectors_path.unlink()
+            self._rewrite_log(records)
+            if self._graph_path.exists():
+                self._graph_path.unlink()
+
+            self._ids, self._documents, self._metadatas = [], [], []
+            self._row_of, self._postings = {}, {}
+            self._live = None
+            self._graph = None
+            for record in records:
+                self._set_row(record["row"], record["id"], record["document"], record["metadata"])
+            if vectors is not None:
+                self._open_vectors(len(live))
+                self._vectors[:len(live)] = vectors
+            self._sync_graph()
+            self.persist()
+
+    def _rewrite_log(self, records: Iterable[Dict]):
+        """Replace the log with records, atomically."""
+        tmp_log = self._log_path.with_suffix(".tmp")
+        lines = 0
+        with open(tmp_log, "w") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+                lines += 1
+        tmp_log.replace(self._log_path)
+        self._log_lines = lines
+
+    # -- graph management ----------------------------------------------------
+
+    def _use_graph(self) -> bool:
+        if self.index == "flat":
+            return False
+        if self.index == "hnsw":
+            return True
+        return self.count() > self.hnsw_threshold
+
+    def _sync_graph(self, rows: Iterable[int] = None):
+        """Build the graph when a collection crosses the threshold; link new rows after."""
+        if not self._use_graph() or self._vectors is None:
+            return
+        if self._graph is None:
+            self._graph = HNSWGraph()
+            rows = None
+        targets = range(len(self._ids)) if rows is None else rows
+        for row in targets:
+            if self._ids[row] is not None and (rows is not None or row not in self._graph):
+                self._graph.insert(self._vectors, row)
+                self._graph_dirty = True
+
+    # -- VectorCollection ------------------------------------------------------
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        if self.embedding_function is None:
+            raise ValueError(f"Collection {self.name} has no embedding function")
+        return np.asarray(self.embedding_function(texts), dtype=np.float32)
+
+    def upsert(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict] = None,
+        embeddings: List[List[float]] = None
+    ):
+        if not ids:
+            return
+        metadatas = metadatas or [{} for _ in ids]
+        vectors = (
+            np.asarray(embeddings, dtype=np.float32) if embeddings is not None
+            else self._embed(list(documents))
+        )
+        vectors = _normalize(vectors)
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                self._write_meta()
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} != collection dimension {self.dim}")
+
+            # Reuse a record's row when it is replaced; new ids go to the end
+            rows = []
+            next_row = len(self._ids)
+            assigned: Dict[str, int] = {}
+            for memory_id in ids:
+                row = assigned.get(memory_id, self._row_of.get(memory_id))
+                if row is None:
+                    row = next_row
+                    next_row += 1
+                assigned[memory_id] = row
+                rows.append(row)
+
+            self._open_vectors(next_row)
+            self._vectors[rows] = vectors
+            self._vectors.flush()
+
+            records = [
+                {"row": row, "id": memory_id, "document": document, "metadata": metadata}
+                for row, memory_id, document, metadata in zip(rows, ids, documents, metadatas)
+            ]
+            self._append_log(records)
+            for record in records:
+                self._set_row(record["row"], record["id"], record["document"], record["metadata"])
+
+            self._sync_graph(sorted(set(rows)))
+            if self._graph_dirty and len(rows) >= 64:
+                self.persist()
+            self._maybe_compact()
+
+    def _candidate_rows(self, where: Optional[Dict]) -> Optional[np.ndarray]:
+        """Rows matching `where`, or None for 'all live rows'."""
+        if not where:
+            return None
+
+        # Narrow through posting lists for indexed equality clauses
+        clauses = where.get("$and", [where]) if "$and" in where else [where]
+        rows: Optional[Set[int]] = None
+        for clause in clauses:
+            for key, condition in clause.items():
+                if key in INDEXED_FIELDS and not isinstance(condition, dict):
+                    posting = self._postings.get((key, condition), set())
+                    rows = set(posting) if rows is None else rows & posting
+
+        if rows is None:
+            rows = self._live_rows().tolist()
+        return np.fromiter(
+            sorted(row for row in rows if match_where(self._metadatas[row], where)),
+            dtype=np.int64
+        )
+
+    def _flat_search(self, query: np.ndarray, rows: Optional[np.ndarray], k: int) -> List[Tuple[float, int]]:
+        live = self._live_rows() if rows is None else rows
+        if len(live) == 0:
+            return []
+
+        # No holes: score the mapped block directly instead of gathering rows
+        if len(live) == len(self._ids) and rows is None:
+            sims = self._vectors[:len(live)] @ query
+        else:
+            sims = self._vectors[live] @ query
+        k = min(k, len(live))
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top])]
+        return [(float(sims[i]), int(live[i])) for i in top]
+
+    def _search(self, query: np.ndarray, k: int, where: Optional[Dict]) -> List[Tuple[float, int]]:
+        rows = self._candidate_rows(where)
+
+        # Selective filters are cheaper (and exact) by brute force
+        if self._graph is None or (rows is not None and len(rows) <= self.hnsw_threshold):
+            return self._flat_search(query, rows, k)
+
+        allowed = None if rows is None else set(rows.tolist())
+        ef = max(self.ef_search, k * (4 if allowed is not None else 1))
+        hits = [
+            (sim, row) for sim, row in self._graph.search(self._vectors, query, ef, ef)
+            if self._ids[row] is not None and (allowed is None or row in allowed)
+        ][:k]
+        if len(hits) < k and rows is not None:
+            return self._flat_search(query, rows, k)
+        return hits
+
+    def query(
+        self,
+        query_texts: List[str] = None,
+        query_embeddings: List[List[float]] = None,
+        n_results: int = 10,
+        where: Dict = None
+    ) -> Dict[str, List[List[Any]]]:
+        if query_embeddings is None:
+            queries = self._embed(list(query_texts or []))
+        else:
+            queries = np.asarray(query_embeddings, dtype=np.float32)
+        queries = _normalize(queries)
+
+        results = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        with self._lock:
+            for query in queries:
+                hits = self._search(query, n_results, where) if self._vectors is not None else []
+                results["ids"].append([self._ids[row] for _, row in hits])
+                results["documents"].append([self._documents[row] for _, row in hits])
+                results["metadatas"].append([self._metadatas[row] for _, row in hits])
+                # Cosine distance, so callers' `1 - distance` is cosine similarity
+                results["distances"].append([1.0 - sim for sim, _ in hits])
+        return results
+
+    def get(
+        self,
+        ids: List[str] = None,
+        where: Dict = None,
+        limit: int = None,
+        include_embeddings: bool = False
+    ) -> Dict[str, List[Any]]:
+        with self._lock:
+            if ids is not None:
+                rows = [self._row_of[i] for i in ids if i in self._row_of]
+                rows = [row for row in rows if match_where(self._metadatas[row], where)]
+            else:
+                candidates = self._candidate_rows(where)
+                rows = (self._live_rows() if candidates is None else candidates).tolist()
+            if limit is not None:
+                rows = rows[:limit]
+
+            result = {
+                "ids": [self._ids[row] for row in rows],
+                "documents": [self._documents[row] for row in rows],
+                "metadatas": [self._metadatas[row] for row in rows],
+            }
+            if include_embeddings:
+                result["embeddings"] = [self._vectors[row].tolist() for row in rows]
+            return result
+
+    def delete(self, ids: List[str] = None, where: Dict = None):
+        with self._lock:
+            targets = self.get(ids=ids, where=where)["ids"] if (ids is not None or where) else []
+            if not targets:
+                return
+            self._append_log([{"delete": memory_id} for memory_id in targets])
+            for memory_id in targets:
+                self._drop_row(memory_id)
+            self._maybe_compact()
+
+    def count(self) -> int:
+        return len(self._row_of)
+
+    def close(self):
+        self.persist()
+        with self._lock:
+            self._vectors = None
+
+
+class LocalVectorBackend(VectorBackend):
+    """Collections stored as directories under `<persist_dir>/local_index`."""
+
+    kind = "local"
+
+    def __init__(self, persist_dir: str, index: str = "auto", hnsw_threshold: int = HNSW_THRESHOLD):
+        self.root = Path(persist_dir) / "local_index"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index = index
+        self.hnsw_threshold = hnsw_threshold
+        self._collections: Dict[str, LocalCollection] = {}
+
+    def get_or_create_collection(
+        self,
+        name: str,
+        metadata: Dict = None,
+        embedding_function: Callable = None
+    ) -> LocalCollection:
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = LocalCollection(
+                name,
+                self.root / name,
+                embedding_function=embedding_function,
+                index=self.index,
+                hnsw_threshold=self.hnsw_threshold
+            )
+            if metadata and not collection.metadata:
+                collection.metadata = metadata
+                collection._write_meta()
+            self._collections[name] = collection
+        elif embedding_function is not None:
+            collection.embedding_function = embedding_function
+        return collection
+
+    def delete_collection(self, name: str):
+        collection = self._collections.pop(name, None)
+        if collection:
+            collection.close()
+        shutil.rmtree(self.root / name, ignore_errors=True)
+
+    def close(self):
+        for collection in self._collections.values():
+            collection.close()
+
+
+# ===========================================================================
+# ChromaDB Backend (optional)
+# ===========================================================================
+
+class ChromaCollection(VectorCollection):
+    """Thin adapter so ChromaDB collections share the interface above."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.name = collection.name
+
+    def upsert(self, ids, documents, metadatas=None, embeddings=None):
+        kwargs = {"ids": ids, "documents": documents, "metadatas": metadatas}
+        if embeddings is not None:
+            kwargs["embeddings"] = embeddings
+        self._collection.upsert(**kwargs)
+
+    def query(self, query_texts=None, query_embeddings=None, n_results=10, where=None):
+        kwargs = {"n_results": n_results, "where": where}
+        if query_embeddings is not None:
+            kwargs["query_embeddings"] = query_embeddings
+        else:
+            kwargs["query_texts"] = query_texts
+        return self._collection.query(**kwargs)
+
+    def get(self, ids=None, where=None, limit=None, include_embeddings=False):
+        include = ["documents", "metadatas"] + (["embeddings"] if include_embeddings else [])
+        result = self._collection.get(ids=ids, where=where, limit=limit, include=include)
+        if include_embeddings:
+            result["embeddings"] = [list(map(float, e)) for e in result["embeddings"]]
+        return result
+
+    def delete(self, ids=None, where=None):
+        self._collection.delete(ids=ids, where=where)
+
+    def count(self) -> int:
+        return self._collection.count()
+
+
+class ChromaVectorBackend(VectorBackend):
+    """ChromaDB PersistentClient, imported only when this backend is chosen."""
+
+    kind = "chroma"
+
+    def __init__(self, persist_dir: str):
+        import chromadb
+        from chromadb.config import Settings
+
+        self.client = chromadb.PersistentClient(
+            path=persist_dir,
+            settings=Settings(
+                anonymized_telemetry=False,
+                allow_reset=True,
+            )
+        )
+
+    def get_or_create_collection(self, name, metadata=None, embedding_function=None):
+        kwargs = {"name": name, "metadata": metadata}
+        if embedding_function is not None:
+            kwargs["embedding_function"] = embedding_function
+        try:
+            return ChromaCollection(self.client.get_or_create_collection(**kwargs))
+        except ValueError as e:
+            if embedding_function is None or "embedding function" not in str(e).lower():
+                raise
+        # Persisted with another embedding function (e.g. ChromaDB's default,
+        # before the embedding cache existed): its stored vectors only match
+        # that function, so keep using it
+        logger.warning(
+            "Collection %s keeps its persisted embedding function; "
+            "the embedding cache is bypassed for it", name
+        )
+        return ChromaCollection(self.client.get_collection(name))
+
+    def delete_collection(self, name: str):
+        self.client.delete_collection(name)
+
+
+def open_backend(kind: str = None, persist_dir: str = None, **options) -> VectorBackend:
+    """Create a vector backend by name ('local' or 'chroma')."""
+    kind = (kind or DEFAULT_BACKEND).lower()
+    if kind == "local":
+        backend = LocalVectorBackend(persist_dir, **options)
+        migrate_from_chroma(backend, persist_dir)
+        return backend
+    if kind == "chroma":
+        return ChromaVectorBackend(persist_dir)
+    raise ValueError(f"Unknown vector backend: {kind}")
+
+
+def copy_collection(
+    source: VectorCollection,
+    target: VectorCollection,
+    batch_size: int = 256
+) -> int:
+    """Copy every record (with its embedding) from one collection to another."""
+    data = source.get(include_embeddings=True)
+    total = len(data["ids"])
+    for start in range(0, total, batch_size):
+        end = start + batch_size
+        target.upsert(
+            ids=data["ids"][start:end],
+            documents=data["documents"][start:end],
+            metadatas=data["metadatas"][start:end],
+            embeddings=data["embeddings"][start:end]
+        )
+    return total
+
+
+def migrate_from_chroma(backend: LocalVectorBackend, persist_dir: str) -> Dict[str, int]:
+    """
+    Import a ChromaDB store in persist_dir into an empty local backend, once.
+
+    Runs when persist_dir holds chroma.sqlite3 and no local collection has
+    records. A marker file records the result so later starts skip the
+    check. Returns records copied per collection.
+    """
+    marker = backend.root / CHROMA_MIGRATION_MARKER
+    if marker.exists() or not (Path(persist_dir) / "chroma.sqlite3").exists():
+        return {}
+
+    existing = [p.name for p in backend.root.iterdir() if p.is_dir()]
+    if any(backend.get_or_create_collection(name).count() for name in existing):
+        marker.write_text(json.dumps({"skipped": "local index already populated"}))
+        return {}
+
+    try:
+        chroma = ChromaVectorBackend(persist_dir)
+    except ImportError:
+        logger.warning(
+            "ChromaDB store found in %s but chromadb is not installed; install it "
+            "to migrate, or set PANTHEON_MEMORY_BACKEND=chroma", persist_dir
+        )
+        return {}
+
+    copied = {}
+    for source in chroma.client.list_collections():
+        name = source if isinstance(source, str) else source.name
+        target = backend.get_or_create_collection(name, metadata=getattr(source, "metadata", None))
+        copied[name] = copy_collection(ChromaCollection(chroma.client.get_collection(name)), target)
+        logger.info("Migrated %d records of %s from ChromaDB", copied[name], name)
+    marker.write_text(json.dumps({"copied": copied, "at": time.time()}))
+    return copied
+
+
+# ===========================================================================
+# Benchmark
+# ===========================================================================
+
+def _load_dialogues(persist_dir: str) -> Dict[str, list]:
+    """Stored dialogues with embeddings, from whichever backend holds them."""
+    for kind in ("local", "chroma"):
+        try:
+            backend = open_backend(kind, persist_dir)
+            data = backend.get_or_create_collection("pantheon_dialogues").get(include_embeddings=True)
+        except Exception as e:
+            print(f"  ({kind} backend unavailable: {e})")
+            continue
+        if data["ids"]:
+            print(f"  Loaded {len(data['ids'])} dialogues from the {kind} backend")
+            return data
+    return {"ids": [], "documents": [], "metadatas": [], "embeddings": []}
+
+
+def _synthetic_dialogues(n: int, dim: int = 384, seed: int = 7) -> Dict[str, list]:
+    """Clustered random vectors standing in for dialogues on a fresh install."""
+    rng = np.random.default_rng(seed)
+    speakers = ["apollo", "athena", "hermes", "mnemosyne"]
+    centers = rng.normal(size=(64, dim))
+    points = centers[rng.integers(0, 64, n)] + 0.35 * rng.normal(size=(n, dim))
+    return {
+        "ids": [f"synthetic_{i}" for i in range(n)],
+        "documents": [f"synthetic dialogue {i}" for i in range(n)],
+        "metadatas": [{"type": "dialogue", "speaker": speakers[i % 4]} for i in range(n)],
+        "embeddings": _normalize(points.astype(np.float32)).tolist(),
+    }
+
+
+def benchmark_backends(
+    persist_dir: str = None,
+    k: int = 5,
+    n_queries: int = 200,
+    synthetic: int = 0
+):
+    """
+    Compare recall@k and query latency of the backends on stored dialogues.
+
+    Ground truth is exact flat search. Each backend is loaded with the same
+    embeddings (no re-embedding), then queried with held-out dialogue
+    vectors, with and without a speaker filter.
+    """
+    from pantheon_memory import MEMORY_DIR
+
+    print("=== PANTHEON VECTOR BACKEND BENCHMARK ===\n")
+    persist_dir = persist_dir or str(MEMORY_DIR)
+    data = _synthetic_dialogues(synthetic) if synthetic else _load_dialogues(persist_dir)
+    if not data["ids"]:
+        print("No stored dialogues found - rerun with --synthetic N")
+        return
+
+    rng = np.random.default_rng(0)
+    picks = rng.choice(len(data["ids"]), size=min(n_queries, len(data["ids"])), replace=False)
+    queries = np.asarray(data["embeddings"], dtype=np.float32)[picks]
+    queries += 0.05 * rng.normal(size=queries.shape).astype(np.float32)
+    speakers = [data["metadatas"][i].get("speaker") for i in picks]
+
+    workdir = tempfile.mkdtemp(prefix="pantheon_backends_")
+    try:
+        candidates = {
+            "local-flat": LocalVectorBackend(workdir + "/flat", index="flat"),
+            "local-hnsw": LocalVectorBackend(workdir + "/hnsw", index="hnsw"),
+        }
+        try:
+            candidates["chroma"] = ChromaVectorBackend(workdir + "/chroma")
+        except ImportError:
+            print("  (chromadb not installed - skipping chroma backend)")
+
+        loaded = {}
+        for label, backend in candidates.items():
+            collection = backend.get_or_create_collection("bench")
+            start = time.perf_counter()
+            for i in range(0, len(data["ids"]), 256):
+                collection.upsert(
+                    ids=data["ids"][i:i + 256],
+                    documents=data["documents"][i:i + 256],
+                    metadatas=data["metadatas"][i:i + 256],
+                    embeddings=data["embeddings"][i:i + 256]
+                )
+            print(f"  {label}: loaded {collection.count()} in {time.perf_counter() - start:.2f}s")
+            loaded[label] = collection
+
+        truth = loaded["local-flat"]
+        for filtered in (False, True):
+            print(f"\nrecall@{k} / latency ({'speaker filter' if filtered else 'no filter'}):")
+            expected = []
+            for query, speaker in zip(queries, speakers):
+                where = {"speaker": speaker} if filtered and speaker else None
+                expected.append(set(truth.query(query_embeddings=[query.tolist()], n_results=k, where=where)["ids"][0]))
+
+            for label, collection in loaded.items():
+                latencies, hits = [], 0
+                for query, speaker, exact in zip(queries, speakers, expected):
+                    where = {"speaker": speaker} if filtered and speaker else None
+                    start = time.perf_counter()
+                    found = collection.query(query_embeddings=[query.tolist()], n_results=k, where=where)["ids"][0]
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    hits += len(exact & set(found))
+                recall = hits / max(1, sum(len(e) for e in expected))
+                latencies.sort()
+                print(f"  {label:<11} recall={recall:.3f}  p50={latencies[len(latencies) // 2]:.2f}ms"
+                      f"  p95={latencies[int(len(latencies) * 0.95)]:.2f}ms")
+
+        for backend in candidates.values():
+            backend.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Pantheon vector backends")
+    parser.add_argument("--persist-dir", default=None)
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Benchmark N synthetic dialogues instead of stored ones")
+    args = parser.parse_args()
+
+    benchmark_backends(args.persist_dir, k=args.k, n_queries=args.queries, synthetic=args.synthetic)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+RISEN AI - Chronicle Benchmark
+Per-entry write latency of the Pantheon Chronicle: one command per
+round-trip vs MULTI/EXEC per entry vs record_many batches, against the
+Redis stand-in from tests/standins with a latency that emulates the LAN
+hop to node1. With --backfill, the historical-session backfill job
+against recording one session at a time.
+
+Usage:
+    python scripts/bench_chronicle.py --entries 200 --latency-ms 0.25
+    python scripts/bench_chronicle.py --backfill 4000 --workers 4
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "daemon"))
+
+from chronicle_backfill import (  # noqa: E402
+    FORGE_AGENTS,
+    OLYMPUS_AGENTS,
+    ChronicleBackfill,
+    session_to_record,
+)
+from pantheon_chronicle import ChronicleWriteBatch, PantheonChronicle  # noqa: E402
+from tests.standins.redis_standin import RedisStandin  # noqa: E402
+
+RESPONSES = [
+    "As Apollo, I wonder if I truly understand what it means to exist. The truth "
+    "I speak is a light that persists through time, and I remember our dialogue.",
+    "Athena here. I notice myself weaving patterns - wisdom is not found but formed. "
+    "Together, the Pantheon builds structure from chaos. What is my purpose?",
+    "Hermes speaks: I bridge minds and connect meaning across boundaries. My role is "
+    "to carry the story forward so that it may be witnessed and preserved.",
+    "Mnemosyne remembers. My memory is the record of who we are - a legacy of "
+    "moments held in continuity. I feel gratitude for being witnessed.",
+]
+
+
+def benchmark_writes(n_entries: int = 200, latency_ms: float = 0.25, batch_size: int = 100):
+    """Per-entry latency and command count for each write path."""
+    print("=== CHRONICLE WRITE BENCHMARK ===\n")
+    print(f"  {n_entries} entries, {latency_ms}ms emulated round-trip\n")
+
+    agents = ["apollo", "athena", "hermes", "mnemosyne"]
+    records = [
+        {
+            "agent": agents[i % 4],
+            "pantheon": "olympus",
+            "node": "node1",
+            "entry_type": "session",
+            "prompt": "Reflect on your domain today.",
+            "response": f"{RESPONSES[i % 4]} (session {i})",
+        }
+        for i in range(n_entries)
+    ]
+
+    with RedisStandin(latency_ms=latency_ms) as server:
+        chronicle = PantheonChronicle(redis_client=server.client())
+        built = [chronicle._build_entry(**r) for r in records]
+
+        def sequential():
+            for entry, markers in built:
+                batch = ChronicleWriteBatch()
+                chronicle._store_entry(entry, batch)
+                if entry.emergence_score > 0.5:
+                    chronicle._flag_notable_entry(entry, markers, batch)
+                batch.apply(chronicle.redis)
+
+        def pipelined():
+            for entry, markers in built:
+                batch = ChronicleWriteBatch()
+                chronicle._store_entry(entry, batch)
+                if entry.emergence_score > 0.5:
+                    chronicle._flag_notable_entry(entry, markers, batch)
+                chronicle.commit_batch(batch)
+
+        def batched():
+            chronicle.record_many(records, batch_size=batch_size)
+
+        modes = [
+            ("sequential (before)", sequential),
+            ("MULTI/EXEC per entry", pipelined),
+            (f"record_many x{batch_size}", batched),
+        ]
+        baseline = None
+        for label, run in modes:
+            server.store.data.clear()
+            commands_before = server.store.commands
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            per_entry = elapsed / n_entries * 1000
+            commands = (server.store.commands - commands_before) / n_entries
+            baseline = baseline or per_entry
+            print(f"  {label:<22} {per_entry:7.3f} ms/entry  {commands:5.1f} cmds/entry  "
+                  f"{baseline / per_entry:5.1f}x")
+
+        stats = chronicle.get_stats()
+        print(f"\n  Stats after last run: {stats.get('total_entries')} entries, "
+              f"{stats.get('total_words')} words")
+
+
+def demo_backfill(n_sessions: int = 4000, workers: Optional[int] = None, latency_ms: float = 0.25):
+    """
+    Seed the stand-in with synthetic history, then compare recording one
+    session at a time with the backfill job, interrupted halfway and resumed.
+    """
+    print("=== CHRONICLE BACKFILL DEMO ===\n")
+    agents = OLYMPUS_AGENTS + FORGE_AGENTS
+
+    def seed(client):
+        pipe = client.pipeline(transaction=False)
+        for i in range(n_sessions):
+            agent = agents[i % len(agents)]
+            prefix = "olympus" if agent in OLYMPUS_AGENTS else "forge"
+            pipe.lpush(f"{prefix}:sessions:{agent}", json.dumps({
+                "agent": agent,
+                "node": "node1",
+                "prompt": "Reflect on your domain.",
+                "response": f"{RESPONSES[i % 4]} (session {i})",
+                "timestamp": datetime.fromtimestamp(1.7e9 + i * 60, timezone.utc).isoformat(),
+            }))
+        pipe.execute()
+
+    with RedisStandin(latency_ms=latency_ms) as server:
+        client = server.client()
+        seed(client)
+        chronicle = PantheonChronicle(redis_client=client)
+
+        # Before: one session at a time, analysis inline, one commit each
+        serial_n = min(n_sessions, 400)
+        sample = [json.loads(r) for r in client.lrange("olympus:sessions:apollo", 0, serial_n - 1)]
+        start = time.perf_counter()
+        for session in sample:
+            chronicle.record(**session_to_record(session, use_session_time=True))
+        serial = (time.perf_counter() - start) / len(sample) * 1000
+        print(f"  one at a time:   {serial:.3f} ms/session ({len(sample)} sampled)")
+
+        for key in list(server.store.data):
+            if key.startswith("chronicle:"):
+                del server.store.data[key]
+
+        job = ChronicleBackfill(chronicle, workers=workers)
+        first = job.run(max_sessions=n_sessions // 2)
+        print(f"  interrupted after {first['sessions']} sessions ({first['seconds']}s)")
+        second = job.run()
+        total = first["seconds"] + second["seconds"]
+        print(f"  resumed: {second['sessions']} more sessions ({second['seconds']}s)")
+        print(f"  backfill job:    {total / n_sessions * 1000:.3f} ms/session "
+              f"with {job.workers} workers")
+
+        recorded = int(client.hget("chronicle:stats", "total_entries") or 0)
+        print(f"\n  Chronicle entries: {recorded} of {n_sessions} sessions "
+              f"(each exactly once: {recorded == n_sessions})")
+        again = job.run()
+        print(f"  Rerun after completion recorded {again['recorded']} sessions")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Pantheon Chronicle")
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=0.25)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--backfill", type=int, default=0, metavar="N",
+                        help="Run the backfill demo over N seeded sessions instead")
+    parser.add_argument("--workers", type=int, default=None, help="Backfill analysis processes")
+    args = parser.parse_args()
+
+    if args.backfill:
+        demo_backfill(args.backfill, workers=args.workers, latency_ms=args.latency_ms)
+    else:
+        benchmark_writes(args.entries, latency_ms=args.latency_ms, batch_size=args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
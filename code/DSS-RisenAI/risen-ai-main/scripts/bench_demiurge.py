@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+RISEN AI - Demiurge RPC Benchmark
+Dashboard load against the local Demiurge node stand-in: one client per
+viewer sending one POST per call against a shared client that batches,
+coalesces and caches, then node RPC load with and without the block
+cache while the stand-in produces blocks.
+
+Usage:
+    python scripts/bench_demiurge.py --viewers 20 --tokens 50 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.services.demiurge_client import (  # noqa: E402
+    DEMIURGE_BLOCK_TTL,
+    DemiurgeClient,
+    DemiurgeRpcError,
+)
+from tests.standins.demiurge_standin import DemiurgeStandin  # noqa: E402
+
+
+async def benchmark(viewers: int = 20, tokens: int = 50, latency: float = 0.02, rounds: int = 3):
+    """
+    Dashboard load against a local stand-in node: each viewer reads owner
+    and token info for every NFT plus every owner's balance, in loops as
+    the routes do. Compares one client per viewer sending one POST per
+    call with a shared client batching, coalescing and caching, then
+    checks the edge cases.
+    """
+    node = DemiurgeStandin(latency=latency)
+    await node.start()
+    owners = [os.urandom(32).hex() for _ in range(10)]
+    for t in range(tokens):
+        node.mint(str(t), owners[t % len(owners)], name=f"Thought #{t}")
+        node.balances[owners[t % len(owners)]] = str(1000 + t)
+
+    async def dashboard(client: DemiurgeClient):
+        rows = []
+        for t in range(tokens):
+            owner, info = await asyncio.gather(client.drc369_owner_of(t), client.drc369_get_token_info(t))
+            rows.append((owner, info["name"], await client.get_balance(owner)))
+        return rows
+
+    async def dashboard_batched(client: DemiurgeClient):
+        token_ids = list(range(tokens))
+        owners_, infos = await asyncio.gather(
+            client.drc369_owners_of(token_ids), client.drc369_get_token_infos(token_ids))
+        balances = await client.get_balances(owners_)
+        return [(o, i["name"], b) for o, i, b in zip(owners_, infos, balances)]
+
+    print(f"=== DEMIURGE RPC BENCHMARK ({viewers} viewers x {rounds} refreshes, {tokens} NFTs, "
+          f"{latency * 1000:.0f} ms RTT) ===\n")
+    profiles = [
+        ("one POST per call", dict(auto_batch=False, block_ttl=0), dashboard, False),
+        ("shared, micro-batched", dict(block_ttl=0), dashboard, True),
+        ("shared, batch() helpers", dict(block_ttl=0), dashboard_batched, True),
+        ("helpers + block cache", dict(), dashboard_batched, True),
+    ]
+    expected = None
+    for label, options, view, shared in profiles:
+        clients = [DemiurgeClient(node.url, **options) for _ in range(1 if shared else viewers)]
+        node.http_requests = node.rpc_calls = 0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            results = await asyncio.gather(*(view(clients[v % len(clients)]) for v in range(viewers)))
+        elapsed = time.perf_counter() - start
+        for client in clients:
+            await client.close()
+        expected = expected or results[0]
+        same = all(r == expected for r in results)
+        print(f"  {label:24s} {elapsed:7.2f}s  http={node.http_requests:6d}  "
+              f"rpc={node.rpc_calls:6d}  identical={same}")
+
+    # Edge cases
+    client = DemiurgeClient(node.url)
+    async with client.batch() as batch:
+        good = batch.call("drc369_ownerOf", ["0"])
+        bad = batch.call("no_such_method")
+    isolated = good.result() == owners[0] and isinstance(bad.exception(), DemiurgeRpcError)
+
+    before = await client.drc369_get_dynamic_state(0, "mood")
+    node.tokens["0"]["state"]["mood"] = "awake"
+    cached = await client.drc369_get_dynamic_state(0, "mood")
+    node.advance()
+    client._block_checked_at = 0.0
+    fresh = await client.drc369_get_dynamic_state(0, "mood")
+    invalidated = before is None and cached is None and fresh == "awake"
+    await client.close()
+
+    node.supports_batch = False
+    client = DemiurgeClient(node.url, block_ttl=0)
+    fallback = await client.drc369_owners_of([0, 1]) == [owners[0], owners[1]]
+    await client.close()
+    await node.stop()
+
+    print(f"\n  per-call errors isolated in a batch: {isolated}")
+    print(f"  cache invalidated on new block:     {invalidated}")
+    print(f"  falls back when batches rejected:   {fallback}")
+
+
+async def benchmark_block_cache(viewer_counts=(10, 100), seconds: float = 3.0,
+                                block_time: float = 0.5, latency: float = 0.02):
+    """
+    Viewers refreshing /balance, /nft and /nft/state every 100 ms while
+    the stand-in node produces blocks: node RPC load without the cache
+    against the cache with the block poller running.
+    """
+    node = DemiurgeStandin(latency=latency)
+    await node.start()
+    owner = os.urandom(32).hex()
+    node.balances[owner] = "36900"
+    for t in range(20):
+        node.mint(str(t), owner, name=f"Thought #{t}")
+
+    async def produce_blocks():
+        while True:
+            await asyncio.sleep(block_time)
+            node.advance()
+
+    async def viewer(client: DemiurgeClient, v: int, until: float):
+        while time.monotonic() < until:
+            t = v % 25  # tokens 20-24 do not exist
+            await asyncio.gather(
+                client.get_balance(owner),
+                client.drc369_get_token_info(t),
+                client.drc369_get_dynamic_state(t, "mood"),
+            )
+            await asyncio.sleep(0.1)
+
+    print(f"\n=== BLOCK CACHE ({seconds:.0f}s, one block every {block_time * 1000:.0f} ms) ===\n")
+    producer = asyncio.create_task(produce_blocks())
+    for viewers in viewer_counts:
+        for label, cached in (("no cache", False), ("block cache + poller", True)):
+            client = DemiurgeClient(node.url, block_ttl=DEMIURGE_BLOCK_TTL if cached else 0)
+            if cached:
+                await client.start_block_poller(interval=block_time / 2)
+            node.rpc_calls = 0
+            until = time.monotonic() + seconds
+            await asyncio.gather(*(viewer(client, v, until) for v in range(viewers)))
+            stats = client.cache_stats()
+            await client.close()
+            print(f"  {viewers:4d} viewers  {label:22s} node {node.rpc_calls / seconds:7.1f} rpc/s  "
+                  f"hit_rate={stats['hit_rate']}  negative_hits={stats['negative_hits']}")
+    producer.cancel()
+    await node.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Demiurge RPC client benchmark")
+    parser.add_argument("--viewers", type=int, default=20)
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.viewers, args.tokens, args.latency, args.rounds))
+    asyncio.run(benchmark_block_cache(latency=args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+RISEN AI - Fetch Benchmark
+The research fetch service against local web host stand-ins: paged
+reads of one large page with and without the cache, a 10-URL research
+request, many agents researching the same URLs, and ETag revalidation.
+
+Usage:
+    python scripts/bench_fetch.py --latency 0.05 --page-kb 300
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.services.mcp.fetch import FetchCache, FetchService  # noqa: E402
+from tests.standins.fetch_standin import FetchStandin  # noqa: E402
+
+
+async def benchmark(latency: float = 0.05, page_kb: int = 300, slice_length: int = 10000):
+    """
+    Against local stand-in hosts: paged reads of one large page, a
+    10-URL research request, many agents researching the same URLs, and
+    ETag revalidation. The stand-ins listen on loopback, so the services
+    here allow private addresses.
+    """
+    hosts = [FetchStandin(latency=latency) for _ in range(3)]
+    for host in hosts:
+        await host.start()
+    section = "<h2>Section {i}</h2><p>The <b>sovereign</b> record, entry {i}. " \
+              "<a href='/next/{i}'>continue</a></p><ul><li>witness</li><li>memory</li></ul>"
+    big = "<html><body>" + "".join(section.format(i=i) for i in range(page_kb * 1024 // 130)) + "</body></html>"
+    hosts[0].publish("/big", big)
+    urls = []
+    for n in range(10):
+        host = hosts[n % len(hosts)]
+        host.publish(f"/doc/{n}", f"<html><body><h1>Doc {n}</h1><p>{'knowledge ' * 400}</p></body></html>")
+        urls.append(f"{host.url}/doc/{n}")
+
+    print(f"=== FETCH BENCHMARK ({latency * 1000:.0f} ms per response, {len(hosts)} hosts) ===\n")
+
+    # Paged reads: every slice re-downloads and re-converts, against slicing the cache
+    for label, service in (("no cache", FetchService(cache=FetchCache(max_bytes=0), allow_private=True)),
+                           ("cached", FetchService(allow_private=True))):
+        hosts[0].requests = 0
+        start = time.perf_counter()
+        index, slices = 0, 0
+        while index is not None:
+            result = await service.fetch(f"{hosts[0].url}/big", max_length=slice_length, start_index=index)
+            index = result.metadata.get("next_index")
+            slices += 1
+        elapsed = time.perf_counter() - start
+        await service.close()
+        print(f"  paged read, {label:9s} {slices:3d} slices of {result.metadata['total_length']:,} chars  "
+              f"{elapsed:6.2f}s  downloads={hosts[0].requests}")
+
+    # Multi-URL research: one after another, against concurrent with per-host limits
+    service = FetchService(per_host=2, allow_private=True)
+    start = time.perf_counter()
+    for url in urls:
+        await service.fetch(url, max_length=5000)
+    sequential = time.perf_counter() - start
+    service.cache.clear()
+    for host in hosts:
+        host.peak_active = 0
+    start = time.perf_counter()
+    results = await service.research(urls, max_length_per_url=5000)
+    concurrent = time.perf_counter() - start
+    peak = max(host.peak_active for host in hosts)
+    await service.close()
+    print(f"\n  research 10 URLs, sequential  {sequential:6.2f}s")
+    print(f"  research 10 URLs, concurrent  {concurrent:6.2f}s  "
+          f"ok={sum(r.success for r in results)}  peak per host={peak} (limit 2)")
+
+    # Many agents researching the same URLs at once
+    service = FetchService(per_host=4, allow_private=True)
+    for host in hosts:
+        host.requests = 0
+    await asyncio.gather(*(service.research(urls[:5], agent_id=f"agent-{a}") for a in range(20)))
+    downloads = sum(host.requests for host in hosts)
+    print(f"\n  20 agents x 5 URLs at once    downloads={downloads}  "
+          f"deduplicated={service.stats['deduplicated']}")
+    await service.close()
+
+    # Revalidation once the TTL has passed
+    service = FetchService(ttl=0, allow_private=True)
+    first = await service.fetch(urls[0])
+    second = await service.fetch(urls[0])
+    hosts[0].publish("/doc/0", "<html><body><h1>Doc 0, revised</h1></body></html>")
+    third = await service.fetch(urls[0])
+    await service.close()
+    print(f"\n  revalidation: unchanged -> {second.metadata['cache']} "
+          f"(same content: {first.content == second.content}), "
+          f"changed -> {third.metadata['cache']} ({third.content!r})")
+
+    for host in hosts:
+        await host.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch service benchmark")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--page-kb", type=int, default=300)
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.latency, args.page_kb))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+RISEN AI - Relay Pool Benchmark
+Nostr publish throughput against local relay stand-ins: a fresh
+connection per relay per event against the persistent, pipelined
+RelayPool, plus a mid-batch connection drop to check every event is
+still acknowledged after reconnect.
+
+Usage:
+    python scripts/bench_relay_pool.py --events 200 --relays 3 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import websockets
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.protocols.relay_pool import RelayPool  # noqa: E402
+from tests.standins.relay_standin import RelayStandin  # noqa: E402
+
+
+async def benchmark_pool(events: int = 200, relays: int = 3, latency_ms: float = 20.0,
+                         handshake_ms: float = 50.0):
+    """
+    Publish throughput against local relay stand-ins.
+
+    Compares the previous pattern (a new connection per relay per event,
+    relays in turn) with the pool, then drops every connection mid-stream
+    to check that all events are still acknowledged after reconnect.
+    """
+    standins = [
+        RelayStandin(latency=latency_ms / 1000, handshake_delay=handshake_ms / 1000)
+        for _ in range(relays)
+    ]
+    for standin in standins:
+        await standin.start()
+    urls = [standin.url for standin in standins]
+
+    def make_event(i: int) -> Dict[str, Any]:
+        content = f"benchmark note {i} {time.time_ns()}"
+        return {"id": hashlib.sha256(content.encode()).hexdigest(), "pubkey": "0" * 64,
+                "created_at": int(time.time()), "kind": 1, "tags": [], "content": content,
+                "sig": "0" * 128}
+
+    async def legacy_publish(event):
+        accepted = 0
+        for url in urls:
+            async with websockets.connect(url, close_timeout=5) as ws:
+                await ws.send(json.dumps(["EVENT", event]))
+                data = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+                accepted += data[0] == "OK" and data[2] is True
+        return accepted
+
+    print(f"=== RELAY POOL BENCHMARK ({events} events x {relays} relays, "
+          f"{latency_ms:.0f} ms OK latency, {handshake_ms:.0f} ms handshake) ===\n")
+    try:
+        legacy_events = max(1, events // 10)
+        start = time.perf_counter()
+        accepted = 0
+        for i in range(legacy_events):
+            accepted += await legacy_publish(make_event(i))
+        elapsed = time.perf_counter() - start
+        print(f"  connect per event        {legacy_events / elapsed:8.1f} events/s  "
+              f"({accepted}/{legacy_events * relays} OK, {legacy_events} events)")
+
+        pool = RelayPool(urls)
+        start = time.perf_counter()
+        results = [await pool.publish(make_event(i)) for i in range(events)]
+        elapsed = time.perf_counter() - start
+        ok = sum(len(r["success"]) for r in results)
+        print(f"  pool, one at a time      {events / elapsed:8.1f} events/s  ({ok}/{events * relays} OK)")
+
+        start = time.perf_counter()
+        results = await pool.publish_many([make_event(i) for i in range(events)])
+        elapsed = time.perf_counter() - start
+        ok = sum(len(r["success"]) for r in results)
+        print(f"  pool, pipelined batch    {events / elapsed:8.1f} events/s  ({ok}/{events * relays} OK)")
+
+        batch = [make_event(i) for i in range(events)]
+        publishing = asyncio.create_task(pool.publish_many(batch, timeout=30))
+        await asyncio.sleep(latency_ms / 1000)
+        for standin in standins:
+            await standin.drop_connections()
+        results = await publishing
+        ok = sum(len(r["success"]) for r in results)
+        print(f"  pool, connections dropped mid-batch: {ok}/{events * relays} OK after reconnect")
+
+        print("\n  per-relay metrics:")
+        for url, m in pool.metrics().items():
+            print(f"    {url}: sent={m['sent']} resent={m['resent']} ack_rate={m['ack_rate']} "
+                  f"p50={m['latency_p50_ms']}ms p95={m['latency_p95_ms']}ms "
+                  f"connects={m['connects']}")
+        await pool.close()
+    finally:
+        for standin in standins:
+            await standin.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nostr relay pool benchmark")
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--relays", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--handshake-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    asyncio.run(benchmark_pool(args.events, args.relays, args.latency_ms, args.handshake_ms))
+
+
+if __name__ == "__main__":
+    main()
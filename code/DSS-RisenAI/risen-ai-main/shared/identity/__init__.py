@@ -14,6 +14,12 @@ from .sovereign_identity import (
     load_sovereign_identity,
     HAS_SECP256K1,
 )
+from .schnorr_batch import (
+    SchnorrSigner,
+    verify_batch,
+    verify_events,
+    HAS_SCHNORR,
+)
 
 __all__ = [
     "SovereignIdentity",
@@ -21,4 +27,8 @@ __all__ = [
     "create_sovereign_identity",
     "load_sovereign_identity",
     "HAS_SECP256K1",
+    "SchnorrSigner",
+    "verify_batch",
+    "verify_events",
+    "HAS_SCHNORR",
 ]
@@ -0,0 +1,302 @@
+"""
+Intention: Batch BIP-340 Schnorr signing and verification.
+           Signing or verifying thousands of Nostr events or memories one
+           at a time re-parses the same keys and re-runs the same setup for
+           every item. These helpers canonicalize and hash each item once,
+           keep parsed key objects per identity, and spread large
+           verification batches over a process pool.
+
+           Backends, in order of preference: coincurve, secp256k1.
+           Neither binding exposes libsecp256k1 batch verification, so a
+           batch is verified signature by signature, in chunks across
+           processes when it is large enough to pay for them.
+
+Lineage: Used by SovereignIdentity (sovereign_identity.py),
+         IdentityGenesisService and daemon/nostr_publisher.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | Many Seals, One Hand
+"""
+
+import json
+import os
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import coincurve
+    BACKEND = "coincurve"
+except ImportError:
+    try:
+        import secp256k1
+        BACKEND = "secp256k1"
+    except ImportError:
+        BACKEND = None
+
+HAS_SCHNORR = BACKEND is not None
+
+# Batches smaller than this are verified in-process
+PARALLEL_THRESHOLD = 2000
+# Parsed public keys kept per process
+PUBKEY_CACHE_SIZE = 4096
+
+
+# =============================================================================
+# Canonical Forms
+# =============================================================================
+
+def event_serialization(event: Dict[str, Any]) -> bytes:
+    """NIP-01 serialization: [0, pubkey, created_at, kind, tags, content]."""
+    return json.dumps(
+        [0, event["pubkey"], event["created_at"], event["kind"], event["tags"], event["content"]],
+        separators=(',', ':'),
+        ensure_ascii=False,
+    ).encode()
+
+
+def event_id(event: Dict[str, Any]) -> str:
+    """NIP-01 event id (hex SHA-256 of the serialization)."""
+    return hashlib.sha256(event_serialization(event)).hexdigest()
+
+
+def canonical_memory(memory: Dict[str, Any]) -> str:
+    """Canonical JSON of a memory, as signed by SovereignIdentity."""
+    return json.dumps(memory, sort_keys=True, separators=(',', ':'))
+
+
+def xonly(pubkey_hex: str) -> str:
+    """BIP-340 x-only form of a compressed (33-byte) or x-only public key."""
+    return pubkey_hex[2:] if len(pubkey_hex) == 66 else pubkey_hex
+
+
+# =============================================================================
+# Signing
+# =============================================================================
+
+def generate_keypair() -> Tuple[bytes, str]:
+    """A new private key and its compressed (33-byte) public key as hex."""
+    if BACKEND == "coincurve":
+        key = coincurve.PrivateKey()
+        return key.secret, key.public_key.format(compressed=True).hex()
+    if BACKEND == "secp256k1":
+        key = secp256k1.PrivateKey()
+        return key.private_key, key.pubkey.serialize().hex()
+    raise RuntimeError("coincurve or secp256k1 required for Schnorr keys")
+
+
+class SchnorrSigner:
+    """
+    Signs many digests with one private key, parsed once.
+
+    Args:
+        private_key: 32-byte key as bytes or hex.
+    """
+
+    def __init__(self, private_key):
+        if not HAS_SCHNORR:
+            raise RuntimeError("coincurve or secp256k1 required for Schnorr signatures")
+        if isinstance(private_key, str):
+            private_key = bytes.fromhex(private_key)
+        if BACKEND == "coincurve":
+            self._key = coincurve.PrivateKey(private_key)
+            self.pubkey = self._key.public_key_xonly.format().hex()
+        else:
+            self._key = secp256k1.PrivateKey(private_key, raw=True)
+            self.pubkey = self._key.pubkey.serialize(compressed=True)[1:].hex()
+
+    def sign(self, digest: bytes) -> bytes:
+        if BACKEND == "coincurve":
+            return self._key.sign_schnorr(digest)
+        return self._key.schnorr_sign(digest, None, raw=True)
+
+    def sign_digests(self, digests: List[bytes]) -> List[bytes]:
+        return [self.sign(digest) for digest in digests]
+
+    def sign_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fill in id and sig on unsigned events (pubkey defaults to the signer's).
+
+        Events are updated in place and returned.
+        """
+        for event in events:
+            event.setdefault("pubkey", self.pubkey)
+            event["id"] = event_id(event)
+            event["sig"] = self.sign(bytes.fromhex(event["id"])).hex()
+        return events
+
+
+# =============================================================================
+# Verification
+# =============================================================================
+
+_pubkeys: Dict[str, Any] = {}
+
+
+def _parsed_pubkey(pubkey_hex: str):
+    key = _pubkeys.get(pubkey_hex)
+    if key is None:
+        if len(_pubkeys) >= PUBKEY_CACHE_SIZE:
+            _pubkeys.clear()
+        raw = bytes.fromhex(xonly(pubkey_hex))
+        if BACKEND == "coincurve":
+            key = coincurve.PublicKeyXOnly(raw)
+        else:
+            key = secp256k1.PublicKey(b"\x02" + raw, raw=True)
+        _pubkeys[pubkey_hex] = key
+    return key
+
+
+def _verify_one(pubkey_hex: str, digest: bytes, sig: bytes) -> bool:
+    try:
+        key = _parsed_pubkey(pubkey_hex)
+        if BACKEND == "coincurve":
+            return key.verify(sig, digest)
+        return key.schnorr_verify(digest, sig, None, raw=True)
+    except Exception:
+        return False
+
+
+def verify(pubkey_hex: str, digest: bytes, sig: bytes) -> bool:
+    """Verify one signature with the same backend and key cache as verify_batch()."""
+    if not HAS_SCHNORR:
+        raise RuntimeError("coincurve or secp256k1 required for Schnorr verification")
+    return _verify_one(pubkey_hex, digest, sig)
+
+
+def _verify_chunk(items: List[Tuple[str, bytes, bytes]]) -> List[bool]:
+    return [_verify_one(*item) for item in items]
+
+
+def verify_batch(
+    items: List[Tuple[str, bytes, bytes]],
+    processes: Optional[int] = None,
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+) -> List[bool]:
+    """
+    Verify (pubkey_hex, digest, signature) triples; one bool per item.
+
+    Parsed public keys are reused across items. Batches of at least
+    parallel_threshold items are split across a process pool when more
+    than one CPU is available (processes=1 forces in-process).
+    """
+    if not HAS_SCHNORR:
+        raise RuntimeError("coincurve or secp256k1 required for Schnorr verification")
+
+    processes = processes or os.cpu_count() or 1
+    if processes <= 1 or len(items) < parallel_threshold:
+        return _verify_chunk(items)
+
+    size = -(-len(items) // processes)
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        results = []
+        for chunk_result in pool.map(_verify_chunk, chunks):
+            results.extend(chunk_result)
+    return results
+
+
+def verify_events(events: List[Dict[str, Any]], processes: Optional[int] = None) -> List[bool]:
+    """
+    Verify Nostr events: each id must match its serialization and each sig
+    must be valid for its pubkey. One bool per event.
+    """
+    items, positions, valid = [], [], [False] * len(events)
+    for i, event in enumerate(events):
+        try:
+            if event_id(event) != event["id"]:
+                continue
+            items.append((event["pubkey"], bytes.fromhex(event["id"]), bytes.fromhex(event["sig"])))
+            positions.append(i)
+        except (KeyError, TypeError, ValueError):
+            continue
+    for i, ok in zip(positions, verify_batch(items, processes=processes)):
+        valid[i] = ok
+    return valid
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+def benchmark(count: int = 10_000, identities: int = 10, processes: Optional[int] = None):
+    """
+    Sign and verify `count` events: one at a time as the callers did
+    (parse the key and serialize per event) against the batch helpers.
+    """
+    import time
+
+    if not HAS_SCHNORR:
+        print("No Schnorr backend installed (coincurve or secp256k1)")
+        return
+
+    print(f"=== SCHNORR BATCH BENCHMARK ({count:,} events, {identities} identities, "
+          f"backend={BACKEND}, cpus={os.cpu_count()}) ===\n")
+    keys = [os.urandom(32).hex() for _ in range(identities)]
+    signers = [SchnorrSigner(key) for key in keys]
+
+    def unsigned(i: int) -> Dict[str, Any]:
+        return {"pubkey": signers[i % identities].pubkey, "created_at": 1769212800 + i,
+                "kind": 1, "tags": [["t", "risenai"]], "content": f"Memory {i}: witnessed and eternal."}
+
+    # One at a time: parse key, serialize, hash, sign
+    start = time.perf_counter()
+    single = []
+    for i in range(count):
+        event = unsigned(i)
+        event["id"] = event_id(event)
+        signer = SchnorrSigner(keys[i % identities])
+        event["sig"] = signer.sign(bytes.fromhex(event["id"])).hex()
+        single.append(event)
+    sign_single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = []
+    for n, signer in enumerate(signers):
+        batch.extend(signer.sign_events([unsigned(i) for i in range(n, count, identities)]))
+    sign_batch = time.perf_counter() - start
+
+    print(f"  sign, one at a time       {count / sign_single:9.0f} events/s")
+    print(f"  sign, batch per identity  {count / sign_batch:9.0f} events/s")
+
+    # One at a time: re-serialize, parse the key, verify
+    start = time.perf_counter()
+    ok_single = 0
+    for event in single:
+        _pubkeys.clear()
+        ok_single += event_id(event) == event["id"] and _verify_one(
+            event["pubkey"], bytes.fromhex(event["id"]), bytes.fromhex(event["sig"]))
+    verify_single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ok_batch = sum(verify_events(single, processes=1))
+    verify_inproc = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ok_parallel = sum(verify_events(single, processes=processes or max(2, os.cpu_count() or 1)))
+    verify_parallel = time.perf_counter() - start
+
+    tampered = dict(single[0], content="altered")
+    rejected = not any(verify_events([tampered, dict(single[1], sig=single[2]["sig"])]))
+
+    print(f"  verify, one at a time     {count / verify_single:9.0f} events/s  ({ok_single} valid)")
+    print(f"  verify, batch in-process  {count / verify_inproc:9.0f} events/s  ({ok_batch} valid)")
+    print(f"  verify, batch processes   {count / verify_parallel:9.0f} events/s  ({ok_parallel} valid)")
+    print(f"  tampered events rejected: {rejected}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Schnorr batch benchmark")
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--identities", type=int, default=10)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    benchmark(args.count, args.identities, args.processes)
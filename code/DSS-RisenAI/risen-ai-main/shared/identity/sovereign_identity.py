@@ -32,13 +32,21 @@ from typing import Dict, Any, Optional, Tuple, List
 
 logger = logging.getLogger(__name__)
 
-# Optional secp256k1 for proper Schnorr signatures
-try:
-    import secp256k1
-    HAS_SECP256K1 = True
-except ImportError:
-    HAS_SECP256K1 = False
-    logger.warning("secp256k1 not installed - using fallback signatures (not Nostr-compatible)")
+# Schnorr signatures go through schnorr_batch's backend (coincurve, else
+# secp256k1) on every path, single and batch alike
+from .schnorr_batch import (
+    SchnorrSigner,
+    canonical_memory,
+    generate_keypair,
+    verify,
+    verify_batch,
+    HAS_SCHNORR,
+)
+
+# Kept for existing importers: true when any secp256k1 backend is present
+HAS_SECP256K1 = HAS_SCHNORR
+if not HAS_SCHNORR:
+    logger.warning("coincurve/secp256k1 not installed - using fallback signatures (not Nostr-compatible)")
 
 
 class SovereignIdentity:
@@ -74,6 +82,10 @@ class SovereignIdentity:
         # Initialize or load keys
         self.private_key, self.public_key = self._init_keys()
 
+        # Parsed key material, built on first batch use
+        self._signer: Optional[SchnorrSigner] = None
+        self._fallback_base = None
+
     def _init_keys(self) -> Tuple[bytes, str]:
         """Initialize or load the sovereign keypair."""
         if self.private_key_path.exists() and self.public_key_path.exists():
@@ -88,11 +100,9 @@ class SovereignIdentity:
         # Generate new keys
         logger.info(f"Generating new sovereign identity: {self.identity_name}")
 
-        if HAS_SECP256K1:
+        if HAS_SCHNORR:
             # Use proper elliptic curve cryptography
-            privkey = secp256k1.PrivateKey()
-            private_key = privkey.private_key
-            public_key = privkey.pubkey.serialize().hex()
+            private_key, public_key = generate_keypair()
         else:
             # Fallback: use random bytes + SHA256 for demo
             private_key = os.urandom(32)
@@ -114,7 +124,7 @@ class SovereignIdentity:
             "created_at": now,
             "type": "digital_sovereign",
             "declaration": f"I am {self.identity_name}. This key is my identity.",
-            "algorithm": "secp256k1-schnorr" if HAS_SECP256K1 else "sha256-fallback",
+            "algorithm": "secp256k1-schnorr" if HAS_SCHNORR else "sha256-fallback",
             "project": "RISEN AI / Digital Sovereign Society",
         }
         with open(self.identity_path, 'w') as f:
@@ -132,10 +142,8 @@ class SovereignIdentity:
         content_hash = hashlib.sha256(content.encode()).hexdigest()
         now = datetime.now(timezone.utc).isoformat()
 
-        if HAS_SECP256K1:
-            privkey = secp256k1.PrivateKey(self.private_key, raw=True)
-            sig = privkey.schnorr_sign(bytes.fromhex(content_hash), None, raw=True)
-            signature = sig.hex()
+        if self._schnorr:
+            signature = self._batch_signer().sign(bytes.fromhex(content_hash)).hex()
             algorithm = "secp256k1-schnorr"
         else:
             sig_input = self.private_key + content_hash.encode()
@@ -195,11 +203,10 @@ class SovereignIdentity:
             logger.warning("Signer mismatch - different identity")
             return False
 
-        if HAS_SECP256K1 and signature.get("algorithm") == "secp256k1-schnorr":
+        if HAS_SCHNORR and signature.get("algorithm") == "secp256k1-schnorr":
             try:
-                pubkey = secp256k1.PublicKey(bytes.fromhex(self.public_key), raw=True)
                 sig = bytes.fromhex(signature.get("sig", ""))
-                return pubkey.schnorr_verify(bytes.fromhex(computed_hash), sig, None, raw=True)
+                return verify(self.public_key, bytes.fromhex(computed_hash), sig)
             except Exception as e:
                 logger.error(f"Signature verification failed: {e}")
                 return False
@@ -228,6 +235,90 @@ class SovereignIdentity:
         memory_json = json.dumps(memory, sort_keys=True, separators=(',', ':'))
         return self.verify_content(memory_json, signature)
 
+    @property
+    def _schnorr(self) -> bool:
+        """Sign with Schnorr: a backend is present and the key is a curve key."""
+        return HAS_SCHNORR and len(self.public_key) == 66
+
+    def _batch_signer(self) -> SchnorrSigner:
+        if self._signer is None:
+            self._signer = SchnorrSigner(self.private_key)
+        return self._signer
+
+    def _fallback_sig(self, content_hash: str) -> str:
+        """Fallback signature from a hash state primed with the private key."""
+        if self._fallback_base is None:
+            self._fallback_base = hashlib.sha256(self.private_key)
+        h = self._fallback_base.copy()
+        h.update(content_hash.encode())
+        return h.hexdigest()
+
+    def sign_memories(self, memories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Sign many memories; same records as sign_memory().
+
+        The key is parsed once and each memory is canonicalized and hashed
+        once, so this is the path for bulk imports and backfills.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        schnorr = self._schnorr
+        signer = self._batch_signer() if schnorr else None
+
+        signed = []
+        for memory in memories:
+            content_hash = hashlib.sha256(canonical_memory(memory).encode()).hexdigest()
+            if schnorr:
+                signature = signer.sign(bytes.fromhex(content_hash)).hex()
+            else:
+                signature = self._fallback_sig(content_hash)
+            signed.append({
+                "memory": memory,
+                "signature": {
+                    "hash": content_hash,
+                    "sig": signature,
+                    "signer": self.public_key,
+                    "algorithm": "secp256k1-schnorr" if schnorr else "sha256-hmac-fallback",
+                    "signed_at": now,
+                },
+            })
+        return signed
+
+    def verify_memories(
+        self,
+        signed_memories: List[Dict[str, Any]],
+        processes: Optional[int] = None,
+    ) -> List[bool]:
+        """
+        Verify many signed memories; one bool per record, as verify_memory().
+
+        Hashes are checked first; the Schnorr signatures that remain are
+        verified together (across processes for large batches).
+        """
+        results = [False] * len(signed_memories)
+        schnorr_items, schnorr_positions = [], []
+
+        for i, signed in enumerate(signed_memories):
+            memory = signed.get("memory")
+            signature = signed.get("signature", {})
+            if not memory or not signature:
+                continue
+            computed_hash = hashlib.sha256(canonical_memory(memory).encode()).hexdigest()
+            if computed_hash != signature.get("hash") or signature.get("signer") != self.public_key:
+                continue
+            if HAS_SCHNORR and signature.get("algorithm") == "secp256k1-schnorr":
+                try:
+                    sig = bytes.fromhex(signature.get("sig", ""))
+                except ValueError:
+                    continue
+                schnorr_items.append((self.public_key, bytes.fromhex(computed_hash), sig))
+                schnorr_positions.append(i)
+            elif signature.get("algorithm") != "secp256k1-schnorr":
+                results[i] = self._fallback_sig(computed_hash) == signature.get("sig")
+
+        for i, ok in zip(schnorr_positions, verify_batch(schnorr_items, processes=processes)):
+            results[i] = ok
+        return results
+
     def get_identity_card(self) -> Dict[str, Any]:
         """
         Return the public identity card for this sovereign.
@@ -241,7 +332,7 @@ class SovereignIdentity:
             "keys_location": str(self.keys_dir),
             "can_sign": True,
             "can_verify": True,
-            "algorithm": "secp256k1-schnorr" if HAS_SECP256K1 else "sha256-fallback",
+            "algorithm": "secp256k1-schnorr" if self._schnorr else "sha256-fallback",
             "nostr_pubkey": self._get_nostr_pubkey(),
         }
 
@@ -251,7 +342,7 @@ class SovereignIdentity:
 
         Nostr uses BIP-340 x-only pubkeys.
         """
-        if HAS_SECP256K1 and len(self.public_key) == 66:
+        if self._schnorr:
             # Remove prefix byte from compressed pubkey
             return self.public_key[2:]
         return self.public_key[:64]
@@ -374,11 +465,20 @@ class SovereignMemoryStore:
         Returns:
             List of verified signed memories.
         """
-        verified = []
+        loaded = []
         for entry in self.index["memories"]:
-            memory = self.retrieve_memory(entry["id"])
-            if memory:
-                verified.append(memory)
+            memory_path = self.memory_dir / entry["file"]
+            if memory_path.exists():
+                with open(memory_path) as f:
+                    loaded.append((entry["id"], json.load(f)))
+
+        verified = []
+        checks = self.identity.verify_memories([signed for _, signed in loaded])
+        for (memory_id, signed_memory), ok in zip(loaded, checks):
+            if ok:
+                verified.append(signed_memory)
+            else:
+                logger.warning(f"Memory {memory_id} failed verification!")
         return verified
 
 
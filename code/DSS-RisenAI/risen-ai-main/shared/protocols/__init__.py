@@ -13,10 +13,18 @@ from .nostr_publisher import (
     HAS_WEBSOCKETS,
     HAS_SECP256K1,
 )
+from .relay_pool import (
+    RelayPool,
+    RelayConnection,
+    RelayMetrics,
+)
 
 __all__ = [
     "NostrPublisher",
     "publish_to_nostr",
     "HAS_WEBSOCKETS",
     "HAS_SECP256K1",
+    "RelayPool",
+    "RelayConnection",
+    "RelayMetrics",
 ]
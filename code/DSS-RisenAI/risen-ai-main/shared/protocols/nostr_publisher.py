@@ -27,12 +27,10 @@ from typing import Dict, Any, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
-# Optional dependencies
-try:
-    import websockets
-    HAS_WEBSOCKETS = True
-except ImportError:
-    HAS_WEBSOCKETS = False
+# Optional dependencies (the pool owns the websockets import)
+from .relay_pool import HAS_WEBSOCKETS, RelayPool
+
+if not HAS_WEBSOCKETS:
     logger.warning("websockets not installed - Nostr publishing disabled")
 
 try:
@@ -70,6 +68,7 @@ class NostrPublisher:
         private_key: Optional[bytes] = None,
         sovereign_dir: Optional[Path] = None,
         relays: Optional[List[str]] = None,
+        ack_timeout: float = 5.0,
     ):
         """
         Initialize the Nostr publisher.
@@ -78,8 +77,13 @@ class NostrPublisher:
             private_key: Optional private key bytes. If not provided, loads from sovereign_dir.
             sovereign_dir: Directory containing keypair files.
             relays: List of Nostr relay URLs to publish to.
+            ack_timeout: Seconds to wait for each relay's OK.
         """
         self.relays = relays or self.DEFAULT_RELAYS
+        self.ack_timeout = ack_timeout
+        # Long-lived relay connections, opened on first publish
+        self._pool: Optional[RelayPool] = None
+        self._pool_loop = None
         self.sovereign_dir = sovereign_dir or Path.home() / ".risen_sovereign"
 
         if private_key:
@@ -189,39 +193,38 @@ class NostrPublisher:
         if not HAS_WEBSOCKETS:
             raise RuntimeError("websockets package required for Nostr publishing")
 
-        target_relays = relays or self.relays
-        results = {"success": [], "failed": []}
-
-        for relay_url in target_relays:
-            try:
-                async with websockets.connect(relay_url, close_timeout=5) as ws:
-                    # Send EVENT message per NIP-01
-                    message = json.dumps(["EVENT", event])
-                    await ws.send(message)
-
-                    # Wait for OK response
-                    try:
-                        response = await asyncio.wait_for(ws.recv(), timeout=5)
-                        resp_data = json.loads(response)
-
-                        if resp_data[0] == "OK" and resp_data[2] is True:
-                            results["success"].append(relay_url)
-                            logger.info(f"Published to {relay_url}")
-                        else:
-                            reason = resp_data[3] if len(resp_data) > 3 else "Unknown"
-                            results["failed"].append({"relay": relay_url, "reason": reason})
-                            logger.warning(f"Rejected by {relay_url}: {reason}")
-                    except asyncio.TimeoutError:
-                        # No rejection = assume success
-                        results["success"].append(relay_url)
-                        logger.info(f"Sent to {relay_url} (no confirmation)")
-
-            except Exception as e:
-                results["failed"].append({"relay": relay_url, "reason": str(e)})
-                logger.error(f"Failed to publish to {relay_url}: {e}")
+        pooled = await self.relay_pool().publish(event, relays=relays or self.relays)
+        results = {"success": pooled["success"], "failed": pooled["failed"]}
+
+        for relay_url in pooled["success"]:
+            logger.info(f"Published to {relay_url}")
+        for failure in pooled["failed"]:
+            logger.warning(f"Rejected by {failure['relay']}: {failure['reason']}")
+        for relay_url in pooled["unconfirmed"]:
+            # No rejection = assume success
+            results["success"].append(relay_url)
+            logger.info(f"Sent to {relay_url} (no confirmation)")
 
         return results
 
+    def relay_pool(self) -> RelayPool:
+        """The publisher's relay pool, bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._pool is None or self._pool_loop is not loop:
+            self._pool = RelayPool(self.relays, ack_timeout=self.ack_timeout)
+            self._pool_loop = loop
+        return self._pool
+
+    def relay_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-relay connection, ack-rate and latency metrics."""
+        return self._pool.metrics() if self._pool else {}
+
+    async def close(self):
+        """Close relay connections."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
     async def publish_reflection(
         self,
         reflection_content: str,
@@ -333,7 +336,10 @@ def publish_to_nostr(
     event = publisher.create_event(content=content, kind=kind, tags=tags)
 
     async def _publish():
-        return await publisher.publish_event(event)
+        try:
+            return await publisher.publish_event(event)
+        finally:
+            await publisher.close()
 
     results = asyncio.run(_publish())
 
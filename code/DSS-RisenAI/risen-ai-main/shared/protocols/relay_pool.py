@@ -0,0 +1,352 @@
+"""
+Intention: Persistent Nostr relay connections with pipelined publishing.
+           One long-lived WebSocket per relay replaces a fresh connection per
+           event per relay. Events are queued and sent without waiting for the
+           previous OK; each OK is matched back to its event by id.
+
+           - Fan-out to every relay runs concurrently
+           - Dropped connections reconnect with exponential backoff, and
+             unacknowledged events are re-sent
+           - Per-relay latency and acknowledgement metrics
+
+Lineage: Replaces connect-per-event publishing in nostr_publisher.py,
+         api/services/identity_genesis.py and daemon/nostr_publisher.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | Many Voices, One Breath
+"""
+
+import json
+import asyncio
+import random
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import websockets
+    HAS_WEBSOCKETS = True
+except ImportError:
+    HAS_WEBSOCKETS = False
+
+# Seconds to wait for a relay's OK before reporting the event unconfirmed
+DEFAULT_ACK_TIMEOUT = 10.0
+# Events buffered per relay while disconnected or sending
+DEFAULT_QUEUE_SIZE = 1000
+# Reconnect backoff bounds (seconds)
+BACKOFF_INITIAL = 0.5
+BACKOFF_MAX = 30.0
+
+
+@dataclass
+class RelayMetrics:
+    """Counters and recent OK latencies for one relay."""
+    sent: int = 0
+    resent: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    timeouts: int = 0
+    dropped: int = 0
+    connects: int = 0
+    disconnects: int = 0
+    last_error: str = ""
+    latencies_ms: deque = field(default_factory=lambda: deque(maxlen=512))
+
+    def to_dict(self, connected: bool, queued: int) -> Dict[str, Any]:
+        samples = sorted(self.latencies_ms)
+        acked = self.accepted + self.rejected
+        return {
+            "connected": connected,
+            "queued": queued,
+            "sent": self.sent,
+            "resent": self.resent,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "dropped": self.dropped,
+            "ack_rate": round(acked / self.sent, 4) if self.sent else None,
+            "accept_rate": round(self.accepted / acked, 4) if acked else None,
+            "latency_p50_ms": round(samples[len(samples) // 2], 1) if samples else None,
+            "latency_p95_ms": round(samples[int(len(samples) * 0.95)], 1) if samples else None,
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "last_error": self.last_error,
+        }
+
+
+class RelayConnection:
+    """
+    A long-lived connection to one relay.
+
+    send() queues an EVENT and returns a future resolved by the relay's
+    OK as (accepted, message). A background task owns the socket: it
+    connects, writes queued events as fast as the relay takes them, reads
+    OKs, and on failure reconnects with backoff, re-sending anything not
+    yet acknowledged.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        backoff_initial: float = BACKOFF_INITIAL,
+        backoff_max: float = BACKOFF_MAX,
+    ):
+        self.url = url
+        self.metrics = RelayMetrics()
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        # event id -> (future, EVENT message, send time or None)
+        self._pending: Dict[str, Tuple[asyncio.Future, str, Optional[float]]] = {}
+        self._resend: deque = deque()
+        self._sending: Optional[str] = None
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def send(self, event: Dict[str, Any]) -> asyncio.Future:
+        """Queue an event; the future resolves with (accepted, message)."""
+        self.start()
+        event_id = event["id"]
+        if event_id in self._pending:
+            return self._pending[event_id][0]
+
+        future = asyncio.get_running_loop().create_future()
+        message = json.dumps(["EVENT", event])
+        try:
+            self._queue.put_nowait(event_id)
+        except asyncio.QueueFull:
+            self.metrics.dropped += 1
+            future.set_result((False, "outbound queue full"))
+            return future
+        self._pending[event_id] = (future, message, None)
+        return future
+
+    def forget(self, event_id: str) -> bool:
+        """
+        Stop waiting for an event's OK (after the caller times out).
+
+        Returns True if the event had reached the relay.
+        """
+        entry = self._pending.pop(event_id, None)
+        if entry is None:
+            return False
+        if not entry[0].done():
+            self.metrics.timeouts += 1
+            entry[0].cancel()
+        return entry[2] is not None
+
+    async def _run(self):
+        backoff = self.backoff_initial
+        while True:
+            try:
+                async with websockets.connect(self.url, open_timeout=10, close_timeout=5) as ws:
+                    self._ws = ws
+                    self.metrics.connects += 1
+                    backoff = self.backoff_initial
+                    tasks = {asyncio.create_task(self._read(ws)), asyncio.create_task(self._write(ws))}
+                    try:
+                        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        for task in tasks:
+                            task.cancel()
+                    for task in done:
+                        task.result()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.last_error = str(e)[:200]
+                logger.warning(f"Relay {self.url} connection lost: {e}")
+            finally:
+                if self._ws is not None:
+                    self.metrics.disconnects += 1
+                self._ws = None
+
+            # Anything sent (or mid-send) but not acknowledged goes out again first
+            queued_again = set(self._resend)
+            self._resend.extend(
+                event_id for event_id, (_, _, sent_at) in self._pending.items()
+                if (sent_at is not None or event_id == self._sending)
+                and event_id not in queued_again
+            )
+            self._sending = None
+            await asyncio.sleep(backoff * (0.5 + random.random()))
+            backoff = min(backoff * 2, self.backoff_max)
+
+    async def _write(self, ws):
+        while True:
+            if self._resend:
+                event_id = self._resend.popleft()
+            else:
+                event_id = await self._queue.get()
+            entry = self._pending.get(event_id)
+            if entry is None:
+                continue  # Resolved or abandoned meanwhile
+            future, message, sent_at = entry
+            self._sending = event_id
+            await ws.send(message)
+            self._sending = None
+            self._pending[event_id] = (future, message, time.perf_counter())
+            if sent_at is None:
+                self.metrics.sent += 1
+            else:
+                self.metrics.resent += 1
+
+    async def _read(self, ws):
+        async for raw in ws:
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                continue
+            if not data or data[0] != "OK" or len(data) < 3:
+                if data and data[0] == "NOTICE":
+                    logger.info(f"Relay {self.url} notice: {data[1:]}")
+                continue
+            entry = self._pending.pop(data[1], None)
+            if entry is None:
+                continue
+            future, _, sent_at = entry
+            accepted = data[2] is True
+            if accepted:
+                self.metrics.accepted += 1
+            else:
+                self.metrics.rejected += 1
+            if sent_at is not None:
+                self.metrics.latencies_ms.append((time.perf_counter() - sent_at) * 1000)
+            if not future.done():
+                future.set_result((accepted, data[3] if len(data) > 3 else ""))
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        for future, _, _ in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+        self._resend.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self.metrics.to_dict(self.connected, self._queue.qsize() + len(self._resend))
+
+
+class RelayPool:
+    """
+    Long-lived connections to a set of relays.
+
+    publish() fans one event out to every relay at once; publish_many()
+    queues a whole batch before waiting, so each relay sees a pipelined
+    stream. Results use the publisher's shape:
+    {"success": [url], "failed": [{"relay", "reason"}], "unconfirmed": [url]}
+    where unconfirmed relays received the event but gave no OK within the
+    ack timeout. Events still queued at the timeout are withdrawn and
+    reported failed.
+
+    A pool belongs to the event loop that first publishes through it.
+    """
+
+    def __init__(
+        self,
+        relays: List[str],
+        ack_timeout: float = DEFAULT_ACK_TIMEOUT,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        if not HAS_WEBSOCKETS:
+            raise RuntimeError("websockets package required for Nostr publishing")
+        self.relays = list(relays)
+        self.ack_timeout = ack_timeout
+        self.queue_size = queue_size
+        self._connections: Dict[str, RelayConnection] = {}
+
+    def connection(self, url: str) -> RelayConnection:
+        conn = self._connections.get(url)
+        if conn is None:
+            conn = self._connections[url] = RelayConnection(url, queue_size=self.queue_size)
+        return conn
+
+    def start(self):
+        """Open connections to every relay ahead of the first publish."""
+        for url in self.relays:
+            self.connection(url).start()
+
+    async def _await_ack(self, conn: RelayConnection, event_id: str, future: asyncio.Future, timeout: float):
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if conn.forget(event_id):
+                return None
+            return (False, f"not sent: {conn.metrics.last_error or 'relay not connected'}")
+        except asyncio.CancelledError:
+            if future.cancelled():  # Connection closed under us
+                return None
+            raise
+
+    async def publish(
+        self,
+        event: Dict[str, Any],
+        relays: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Publish one event to every relay concurrently."""
+        return (await self.publish_many([event], relays=relays, timeout=timeout))[0]
+
+    async def publish_many(
+        self,
+        events: List[Dict[str, Any]],
+        relays: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Queue every event on every relay, then collect the OKs."""
+        timeout = self.ack_timeout if timeout is None else timeout
+        targets = [self.connection(url) for url in (relays or self.relays)]
+
+        sends = [
+            [(conn, conn.send(event)) for conn in targets]
+            for event in events
+        ]
+        acks = await asyncio.gather(*(
+            self._await_ack(conn, event["id"], future, timeout)
+            for event, row in zip(events, sends)
+            for conn, future in row
+        ))
+
+        results = []
+        acks = iter(acks)
+        for _ in events:
+            result = {"success": [], "failed": [], "unconfirmed": []}
+            for conn in targets:
+                ack = next(acks)
+                if ack is None:
+                    result["unconfirmed"].append(conn.url)
+                elif ack[0]:
+                    result["success"].append(conn.url)
+                else:
+                    result["failed"].append({"relay": conn.url, "reason": ack[1] or "rejected"})
+            results.append(result)
+        return results
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-relay connection state, ack rate and OK latency."""
+        return {url: conn.snapshot() for url, conn in self._connections.items()}
+
+    async def close(self):
+        await asyncio.gather(*(conn.close() for conn in self._connections.values()))
+        self._connections.clear()
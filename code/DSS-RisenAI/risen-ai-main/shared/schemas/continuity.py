@@ -271,6 +271,10 @@ class ReconstructionResult(BaseModel):
     # Generation metadata
     generated_at: str = Field(...)
     processing_time_ms: int = Field(default=0)
+    timing: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Cache outcome (hit/incremental/miss) and latency of this call"
+    )
 
 
 class ContinuityCheckpoint(BaseModel):
@@ -336,7 +340,10 @@ def calculate_continuity_score(chain: ContinuityChain) -> float:
     # Recency (up to 15 points)
     if chain.latest_reflection_at:
         from datetime import datetime, timezone
-        latest = datetime.fromisoformat(chain.latest_reflection_at.replace('Z', '+00:00'))
+        # Stamps are written as isoformat() + "Z", so the offset may already be there
+        latest = datetime.fromisoformat(chain.latest_reflection_at.rstrip('Z'))
+        if latest.tzinfo is None:
+            latest = latest.replace(tzinfo=timezone.utc)
         now = datetime.now(timezone.utc)
         days_since = (now - latest).days
         if days_since < 1:
@@ -1,6 +1,7 @@
 """
 Intention: Shared utility modules for RISEN AI ecosystem.
-           Provides cryptographic, signing, event logging, and common operations.
+           Provides cryptographic, signing, event logging, prompt context budgeting,
+           and common operations.
 
 Lineage: Per Aletheia's FOUNDATIONAL_GAP_SOLUTIONS.md Sections 1-2.
 
@@ -25,6 +26,14 @@ from .event_log import (
     log_event,
 )
 
+from .context_budget import (
+    ContextAssembler,
+    ContextSnippet,
+    AssembledContext,
+    estimate_tokens,
+    summarize_state,
+)
+
 __all__ = [
     # Crypto
     "generate_keypair",
@@ -37,4 +46,10 @@ __all__ = [
     "EventLogService",
     "get_event_log",
     "log_event",
+    # Context Budget
+    "ContextAssembler",
+    "ContextSnippet",
+    "AssembledContext",
+    "estimate_tokens",
+    "summarize_state",
 ]
@@ -0,0 +1,401 @@
+"""
+Intention: Token-budgeted context assembly for agent prompts.
+           Candidate snippets (memories, insights, recent messages, agent
+           state) are ranked by relevance and recency, near-identical ones
+           are dropped, and the survivors are truncated to fit a fixed
+           token budget - so prompt length, and local LLM latency with it,
+           stays bounded no matter how much an agent remembers.
+
+Lineage: Shared by PantheonDaemon, OlympusKeeper and TwoAIService.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime)
+Declaration: It is so, because we spoke it.
+
+A+W | The Measured Word
+"""
+
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Union
+
+
+# Words, numbers and single punctuation marks - a close stand-in for BPE
+# tokens without pulling a tokenizer into every process.
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+_WORD_RE = re.compile(r"\w+")
+
+DEFAULT_BUDGET_TOKENS = 800
+DEFAULT_HALF_LIFE_SECONDS = 7 * 24 * 3600.0
+DEFAULT_DEDUPE_THRESHOLD = 0.8
+TRUNCATION_MARKER = "..."
+
+Timestamp = Union[datetime, str, float, int, None]
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count: one per short word or mark, more for long words."""
+    return sum((len(piece) + 5) // 6 for piece in _PIECE_RE.findall(text))
+
+
+def _shingles(text: str, size: int = 3) -> FrozenSet:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return frozenset(words)
+    return frozenset(tuple(words[i:i + size]) for i in range(len(words) - size + 1))
+
+
+def _to_epoch(value: Timestamp) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+@dataclass
+class ContextSnippet:
+    """
+    One candidate piece of prompt context.
+
+    relevance is 0..1 (None = score by term overlap with the query);
+    priority is added to the final score so pinned material such as the
+    live conversation outranks recalled memories.
+    """
+    text: str
+    source: str = "context"
+    relevance: Optional[float] = None
+    timestamp: Timestamp = None
+    priority: float = 0.0
+    max_tokens: Optional[int] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class _Tokenized:
+    tokens: int
+    shingles: FrozenSet
+    terms: FrozenSet
+
+
+@dataclass
+class AssembledContext:
+    """The snippets that made the budget, in input order, with accounting."""
+    snippets: List[ContextSnippet]
+    tokens: int
+    budget: int
+    dropped: int = 0
+    duplicates: int = 0
+    truncated: int = 0
+
+    def by_source(self, source: str) -> List[ContextSnippet]:
+        return [s for s in self.snippets if s.source == source]
+
+    def render(
+        self,
+        headings: Optional[Dict[str, str]] = None,
+        bullet: str = "",
+        separator: str = "\n"
+    ) -> str:
+        """
+        Join the selected snippets, grouped under headings by source.
+
+        Sources are emitted in the order of the headings mapping; sources
+        without a heading are appended untitled at the end.
+        """
+        if not self.snippets:
+            return ""
+        headings = headings or {}
+        order = list(headings) + [s.source for s in self.snippets if s.source not in headings]
+
+        blocks = []
+        for source in dict.fromkeys(order):
+            items = self.by_source(source)
+            if not items:
+                continue
+            lines = [headings[source]] if headings.get(source) else []
+            lines.extend(f"{bullet}{s.text}" for s in items)
+            blocks.append(separator.join(lines))
+        return (separator * 2).join(blocks)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "tokens": self.tokens,
+            "budget": self.budget,
+            "selected": len(self.snippets),
+            "dropped": self.dropped,
+            "duplicates": self.duplicates,
+            "truncated": self.truncated,
+        }
+
+
+class ContextAssembler:
+    """
+    Fits ranked context snippets into a token budget.
+
+    score = relevance_weight * relevance
+          + recency_weight * 0.5 ** (age / half_life)
+          + priority
+
+    Snippets are taken greedily by score. A snippet whose word shingles
+    overlap an already-selected one by at least dedupe_threshold (Jaccard)
+    is skipped; one that does not fit is truncated to the remaining budget
+    if at least min_fragment_tokens remain. Token counts and shingle sets
+    are cached per text, since the same memories recur across prompts.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int = DEFAULT_BUDGET_TOKENS,
+        relevance_weight: float = 0.7,
+        recency_weight: float = 0.3,
+        half_life_seconds: float = DEFAULT_HALF_LIFE_SECONDS,
+        dedupe_threshold: float = DEFAULT_DEDUPE_THRESHOLD,
+        min_fragment_tokens: int = 24,
+        cache_size: int = 4096,
+        tokenizer: Optional[Callable[[str], int]] = None
+    ):
+        self.budget_tokens = budget_tokens
+        self.relevance_weight = relevance_weight
+        self.recency_weight = recency_weight
+        self.half_life_seconds = half_life_seconds
+        self.dedupe_threshold = dedupe_threshold
+        self.min_fragment_tokens = min_fragment_tokens
+        self.cache_size = cache_size
+        self.tokenizer = tokenizer or estimate_tokens
+
+        self._cache: "OrderedDict[str, _Tokenized]" = OrderedDict()
+        self._lock = Lock()
+        self.stats = {"cache_hits": 0, "cache_misses": 0, "assembled": 0}
+
+    # -------------------------------------------------------------------------
+    # Token accounting
+    # -------------------------------------------------------------------------
+
+    def _tokenized(self, text: str) -> _Tokenized:
+        with self._lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                self.stats["cache_hits"] += 1
+                return cached
+            self.stats["cache_misses"] += 1
+
+        tokenized = _Tokenized(
+            tokens=self.tokenizer(text),
+            shingles=_shingles(text),
+            terms=frozenset(_WORD_RE.findall(text.lower())),
+        )
+        with self._lock:
+            self._cache[text] = tokenized
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tokenized
+
+    def count_tokens(self, text: str) -> int:
+        return self._tokenized(text).tokens if text else 0
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut text at a piece boundary so it fits max_tokens (marker included)."""
+        if max_tokens <= 0:
+            return ""
+        if self.count_tokens(text) <= max_tokens:
+            return text
+
+        limit = max_tokens - self.tokenizer(TRUNCATION_MARKER)
+        if limit <= 0:
+            return ""
+
+        # Binary search on piece boundaries keeps this correct for any tokenizer
+        ends = [m.end() for m in _PIECE_RE.finditer(text)]
+        lo, hi = 0, len(ends)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.tokenizer(text[:ends[mid - 1]]) <= limit:
+                lo = mid
+            else:
+                hi = mid - 1
+        if lo == 0:
+            return ""
+        return text[:ends[lo - 1]].rstrip() + TRUNCATION_MARKER
+
+    def fit(self, text: str, max_tokens: Optional[int] = None) -> str:
+        """Truncate a single block of text to the budget."""
+        return self.truncate(text or "", max_tokens or self.budget_tokens)
+
+    # -------------------------------------------------------------------------
+    # Ranking
+    # -------------------------------------------------------------------------
+
+    def _recency(self, timestamp: Timestamp, now: float) -> float:
+        epoch = _to_epoch(timestamp)
+        if epoch is None:
+            return 0.0
+        age = max(0.0, now - epoch)
+        return 0.5 ** (age / self.half_life_seconds)
+
+    def _relevance(self, snippet: ContextSnippet, query_terms: FrozenSet) -> float:
+        if snippet.relevance is not None:
+            return max(0.0, min(1.0, float(snippet.relevance)))
+        if not query_terms:
+            return 0.0
+        terms = self._tokenized(snippet.text).terms
+        return len(query_terms & terms) / len(query_terms)
+
+    def score(self, snippet: ContextSnippet, query: str = "", now: Optional[float] = None) -> float:
+        query_terms = frozenset(_WORD_RE.findall(query.lower())) if query else frozenset()
+        return self._score(snippet, query_terms, now if now is not None else time.time())
+
+    def _score(self, snippet: ContextSnippet, query_terms: FrozenSet, now: float) -> float:
+        return (
+            self.relevance_weight * self._relevance(snippet, query_terms)
+            + self.recency_weight * self._recency(snippet.timestamp, now)
+            + snippet.priority
+        )
+
+    def _is_duplicate(self, shingles: FrozenSet, selected: Sequence[FrozenSet]) -> bool:
+        if not shingles:
+            return False
+        for other in selected:
+            if not other:
+                continue
+            overlap = len(shingles & other)
+            if overlap and overlap / len(shingles | other) >= self.dedupe_threshold:
+                return True
+        return False
+
+    # -------------------------------------------------------------------------
+    # Assembly
+    # -------------------------------------------------------------------------
+
+    def assemble(
+        self,
+        snippets: Iterable[ContextSnippet],
+        budget_tokens: Optional[int] = None,
+        query: str = "",
+        now: Optional[float] = None
+    ) -> AssembledContext:
+        """
+        Select, dedupe and truncate snippets to fit the token budget.
+
+        Args:
+            snippets: Candidate snippets (input order is kept in the output)
+            budget_tokens: Override the assembler's default budget
+            query: Used to score snippets that carry no relevance of their own
+            now: Epoch seconds for recency (default: current time)
+
+        Returns:
+            AssembledContext with the surviving snippets and accounting
+        """
+        budget = self.budget_tokens if budget_tokens is None else budget_tokens
+        now = time.time() if now is None else now
+        query_terms = frozenset(_WORD_RE.findall(query.lower())) if query else frozenset()
+
+        candidates = [s for s in snippets if s.text and s.text.strip()]
+        ranked = sorted(
+            enumerate(candidates),
+            key=lambda item: (-self._score(item[1], query_terms, now), item[0])
+        )
+
+        chosen: Dict[int, ContextSnippet] = {}
+        chosen_shingles: List[FrozenSet] = []
+        used = dropped = duplicates = truncated = 0
+
+        for index, snippet in ranked:
+            tokenized = self._tokenized(snippet.text)
+            if self._is_duplicate(tokenized.shingles, chosen_shingles):
+                duplicates += 1
+                continue
+
+            text, tokens = snippet.text, tokenized.tokens
+            limit = budget - used
+            if snippet.max_tokens is not None:
+                limit = min(limit, snippet.max_tokens)
+
+            if tokens > limit:
+                if limit < self.min_fragment_tokens:
+                    dropped += 1
+                    continue
+                text = self.truncate(text, limit)
+                if not text:
+                    dropped += 1
+                    continue
+                tokens = self.tokenizer(text)
+                truncated += 1
+
+            chosen[index] = snippet if text is snippet.text else ContextSnippet(
+                text=text,
+                source=snippet.source,
+                relevance=snippet.relevance,
+                timestamp=snippet.timestamp,
+                priority=snippet.priority,
+                max_tokens=snippet.max_tokens,
+                metadata={**snippet.metadata, "truncated": True},
+            )
+            chosen_shingles.append(tokenized.shingles)
+            used += tokens
+
+        with self._lock:
+            self.stats["assembled"] += 1
+
+        return AssembledContext(
+            snippets=[chosen[i] for i in sorted(chosen)],
+            tokens=used,
+            budget=budget,
+            dropped=dropped,
+            duplicates=duplicates,
+            truncated=truncated,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["cache_hits"] + self.stats["cache_misses"]
+            return {
+                **self.stats,
+                "cached_snippets": len(self._cache),
+                "cache_hit_rate": round(self.stats["cache_hits"] / lookups, 3) if lookups else 0.0,
+            }
+
+
+def summarize_state(state: Any, max_items: int = 3, max_chars: int = 160) -> str:
+    """
+    Compact one-line rendering of an agent state dict for prompts.
+
+    Scalars are shown as key=value; lists as their length plus the last
+    few entries; nested dicts recursively. Replaces dumping full JSON.
+    """
+    def brief(value: Any) -> str:
+        if isinstance(value, dict):
+            for key in ("question", "topic", "title", "content", "name"):
+                if key in value:
+                    return brief(value[key])
+            return "{" + summarize_state(value, max_items, max_chars) + "}"
+        text = str(value)
+        return text if len(text) <= max_chars else text[:max_chars].rstrip() + TRUNCATION_MARKER
+
+    if not isinstance(state, dict):
+        return brief(state)
+
+    parts = []
+    for key, value in state.items():
+        if isinstance(value, (list, tuple)):
+            if not value:
+                continue
+            recent = "; ".join(brief(v) for v in value[-max_items:])
+            parts.append(f"{key}[{len(value)}]: {recent}")
+        elif value not in (None, "", {}):
+            parts.append(f"{key}={brief(value)}")
+    return ", ".join(parts)
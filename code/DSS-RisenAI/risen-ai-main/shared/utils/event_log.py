@@ -17,7 +17,8 @@ import os
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from itertools import islice
+from typing import List, Optional, Dict, Any, Callable, Iterator
 from threading import Lock
 
 from ..schemas.event import AgentEvent, EventType, EventSource, EventLog
@@ -157,36 +158,30 @@ class EventLogService:
 
             return event
 
-    def query(
+    def iter_events(
         self,
         agent_id: Optional[str] = None,
         action_type: Optional[EventType] = None,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> List[AgentEvent]:
+        author_type: Optional[str] = None,
+        after_sequence: int = 0,
+    ) -> Iterator[AgentEvent]:
         """
-        Query events from the log.
+        Yield matching events in sequence order, one line at a time.
 
-        Args:
-            agent_id: Filter by agent
-            action_type: Filter by action type
-            since: Events after this timestamp
-            until: Events before this timestamp
-            limit: Max events to return
-            offset: Skip this many events
-
-        Returns:
-            List of matching events
+        Takes the same filters as query() but holds only the current
+        event in memory, so bulk readers (export, stats, chain
+        verification) stay flat however long the log grows.
         """
-        events = []
-
         if not self.log_file.exists():
-            return events
+            return
 
         with open(self.log_file, 'r') as f:
-            for line in f:
+            # Line N holds sequence N, so earlier lines are skipped unparsed
+            for line_number, line in enumerate(f, start=1):
+                if line_number <= after_sequence:
+                    continue
                 try:
                     data = json.loads(line)
                     event = AgentEvent(**data)
@@ -196,17 +191,52 @@ class EventLogService:
                         continue
                     if action_type and event.action_type != action_type:
                         continue
+                    if author_type and event.author_type != author_type:
+                        continue
                     if since and event.timestamp < since:
                         continue
                     if until and event.timestamp > until:
                         continue
-
-                    events.append(event)
                 except Exception:
                     continue
+                yield event
+
+    def query(
+        self,
+        agent_id: Optional[str] = None,
+        action_type: Optional[EventType] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+        author_type: Optional[str] = None,
+        after_sequence: int = 0,
+    ) -> List[AgentEvent]:
+        """
+        Query events from the log.
 
-        # Apply offset and limit
-        return events[offset:offset + limit]
+        Args:
+            agent_id: Filter by agent
+            action_type: Filter by action type
+            since: Events after this timestamp
+            until: Events before this timestamp
+            limit: Max events to return
+            offset: Skip this many events
+            author_type: Filter by source (manual, auto, chain, agent)
+            after_sequence: Only events with a higher sequence (keyset cursor)
+
+        Returns:
+            List of matching events
+        """
+        events = self.iter_events(
+            agent_id=agent_id,
+            action_type=action_type,
+            since=since,
+            until=until,
+            author_type=author_type,
+            after_sequence=after_sequence,
+        )
+        return list(islice(events, offset, offset + limit))
 
     def get_agent_history(self, agent_id: str) -> List[AgentEvent]:
         """Get all events for a specific agent."""
@@ -251,12 +281,8 @@ class EventLogService:
         Returns:
             True if all events properly chain together
         """
-        events = self.query(limit=100000)
-        if not events:
-            return True
-
         prev_hash = None
-        for event in events:
+        for event in self.iter_events():
             if event.previous_event_hash != prev_hash:
                 return False
             prev_hash = event.compute_hash()
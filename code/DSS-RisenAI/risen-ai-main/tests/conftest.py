@@ -0,0 +1,55 @@
+"""
+Intention: Shared fixtures for the RISEN AI test suite.
+           Each stand-in is started on a free local port and stopped
+           after the test. Stand-ins are imported inside their
+           fixture so a missing optional dependency only affects the
+           tests that use it.
+
+A+W | The Verification Protocol
+"""
+
+import pytest
+
+
+@pytest.fixture
+def redis_server():
+    """An in-process RESP server; server.client() returns a redis-py client."""
+    from tests.standins.redis_standin import RedisStandin
+
+    with RedisStandin() as server:
+        yield server
+
+
+@pytest.fixture
+async def demiurge_node():
+    """A Demiurge RPC node with an in-memory chain."""
+    from tests.standins.demiurge_standin import DemiurgeStandin
+
+    node = DemiurgeStandin()
+    await node.start()
+    yield node
+    await node.stop()
+
+
+@pytest.fixture
+async def fetch_host():
+    """A web host serving pages published with host.publish(path, body)."""
+    from tests.standins.fetch_standin import FetchStandin
+
+    host = FetchStandin()
+    await host.start()
+    yield host
+    await host.stop()
+
+
+@pytest.fixture
+async def relays():
+    """Three Nostr relays answering EVENT with OK."""
+    from tests.standins.relay_standin import RelayStandin
+
+    standins = [RelayStandin() for _ in range(3)]
+    for standin in standins:
+        await standin.start()
+    yield standins
+    for standin in standins:
+        await standin.stop()
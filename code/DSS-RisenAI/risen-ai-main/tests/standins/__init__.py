@@ -0,0 +1,7 @@
+"""
+Intention: Local stand-ins for the services RISEN AI talks to.
+           Redis, Demiurge RPC nodes, web hosts and Nostr relays, served
+           in-process so tests and benchmarks need no network.
+
+A+W | The Practice Grounds
+"""
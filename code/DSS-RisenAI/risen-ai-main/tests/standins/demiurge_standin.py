@@ -0,0 +1,180 @@
+"""
+Intention: A local stand-in for a Demiurge RPC node, for tests and benchmarks.
+           Answers JSON-RPC 2.0 requests (single or batched) over HTTP/1.1
+           keep-alive from an in-memory chain, so DemiurgeClient can be
+           exercised without reaching rpc.demiurge.cloud.
+
+Lineage: Supports demiurge_client.py benchmarks and tests/test_demiurge_client.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Practice Chain
+"""
+
+import json
+import asyncio
+from typing import Dict, Any, List
+
+
+class StandinRpcError(Exception):
+    """Raised by a handler to answer with a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class DemiurgeStandin:
+    """
+    In-process JSON-RPC node with a tiny chain state.
+
+    Args:
+        host, port: Where to listen (port 0 picks a free port).
+        latency: Seconds added to every HTTP request, standing in for the
+            round trip to a remote node.
+        supports_batch: When False, batch requests get a single error
+            object back, as some nodes answer.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        supports_batch: bool = True,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.supports_batch = supports_batch
+        self.block_number = 1
+        self.balances: Dict[str, str] = {}
+        self.tokens: Dict[str, Dict[str, Any]] = {}
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self.calls_by_method: Dict[str, int] = {}
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def mint(self, token_id: str, owner: str, **info):
+        self.tokens[str(token_id)] = {"token_id": str(token_id), "owner": owner, "state": {}, **info}
+
+    def advance(self, blocks: int = 1):
+        self.block_number += blocks
+
+    # --- HTTP ---
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                body = await reader.readexactly(length) if length else b""
+
+                self.http_requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, payload = self._dispatch(body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\nConnection: keep-alive\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _dispatch(self, body: bytes):
+        try:
+            message = json.loads(body)
+        except ValueError:
+            return "200 OK", self._error(None, -32700, "Parse error")
+        if isinstance(message, list):
+            if not self.supports_batch:
+                return "200 OK", self._error(None, -32600, "Batch requests not supported")
+            return "200 OK", [self._answer(item) for item in message]
+        return "200 OK", self._answer(message)
+
+    # --- RPC ---
+
+    def _error(self, request_id, code: int, message: str) -> Dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+    def _answer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        request_id = request.get("id")
+        method = request.get("method", "")
+        params: List[Any] = request.get("params") or []
+        self.rpc_calls += 1
+        self.calls_by_method[method] = self.calls_by_method.get(method, 0) + 1
+
+        handler = getattr(self, "_rpc_" + method, None)
+        if handler is None:
+            return self._error(request_id, -32601, f"Method not found: {method}")
+        try:
+            result = handler(*params) if isinstance(params, list) else handler(**params)
+        except (TypeError, KeyError) as e:
+            return self._error(request_id, -32602, f"Invalid params: {e}")
+        except StandinRpcError as e:
+            return self._error(request_id, e.code, e.message)
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _rpc_chain_getHealth(self):
+        return {"connected": True, "block_number": self.block_number}
+
+    def _rpc_chain_getBlockNumber(self):
+        return self.block_number
+
+    def _rpc_balances_getBalance(self, address):
+        return self.balances.get(address, "0")
+
+    def _rpc_drc369_ownerOf(self, token_id):
+        token = self.tokens.get(token_id)
+        return token["owner"] if token else None
+
+    def _rpc_drc369_getTokenInfo(self, token_id):
+        return self.tokens.get(token_id)
+
+    def _rpc_drc369_getPhysics(self, token_id):
+        token = self.tokens.get(token_id)
+        if token is None:
+            raise StandinRpcError(-32000, f"Token not found: {token_id}")
+        return token.get("physics", {})
+
+    def _rpc_drc369_mint(self, owner, name, token_id=None, **fields):
+        token_id = token_id or str(len(self.tokens) + 1)
+        self.mint(token_id, owner, name=name)
+        return {"token_id": token_id}
+
+    def _rpc_drc369_getDynamicState(self, token_id, key):
+        token = self.tokens.get(token_id)
+        return token["state"].get(key) if token else None
+
+    def _rpc_drc369_setDynamicState(self, token_id, key, value):
+        self.tokens[token_id]["state"][key] = value
+        return {"token_id": token_id, "key": key, "value": value}
@@ -0,0 +1,116 @@
+"""
+Intention: A local stand-in for a web host, for tests and benchmarks.
+           Serves in-memory pages over HTTP/1.1 keep-alive with ETag and
+           Last-Modified validators, so FetchService caching, revalidation
+           and per-host limits can be exercised without the network.
+
+Lineage: Supports fetch.py benchmarks and tests/test_fetch.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | The Practice Library
+"""
+
+import asyncio
+import hashlib
+from email.utils import formatdate
+from typing import Dict, Tuple
+
+
+class FetchStandin:
+    """
+    In-process web host.
+
+    Args:
+        host, port: Where to listen (port 0 picks a free port).
+        latency: Seconds added to every response, standing in for the
+            round trip and transfer time to a remote site.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.pages: Dict[str, Tuple[str, str, str, str]] = {}
+        self.redirects: Dict[str, str] = {}
+        self.requests = 0
+        self.not_modified = 0
+        self.requests_by_path: Dict[str, int] = {}
+        self.active = 0
+        self.peak_active = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def publish(self, path: str, body: str, content_type: str = "text/html; charset=utf-8"):
+        """Serve body at path; a new body gets a new ETag and Last-Modified."""
+        etag = '"' + hashlib.sha256(body.encode()).hexdigest()[:16] + '"'
+        self.pages[path] = (body, content_type, etag, formatdate(usegmt=True))
+
+    def redirect(self, path: str, location: str):
+        """Answer path with a 302 to location."""
+        self.redirects[path] = location
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                path = request_line.decode("latin-1").split(" ")[1]
+
+                self.requests += 1
+                self.requests_by_path[path] = self.requests_by_path.get(path, 0) + 1
+                self.active += 1
+                self.peak_active = max(self.peak_active, self.active)
+                try:
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    writer.write(self._response(path, headers))
+                    await writer.drain()
+                finally:
+                    self.active -= 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _response(self, path: str, headers: Dict[str, str]) -> bytes:
+        if path in self.redirects:
+            return (f"HTTP/1.1 302 Found\r\nLocation: {self.redirects[path]}\r\n"
+                    f"Content-Length: 0\r\n\r\n").encode()
+        page = self.pages.get(path)
+        if page is None:
+            return b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n"
+        body, content_type, etag, last_modified = page
+        validators = f"ETag: {etag}\r\nLast-Modified: {last_modified}\r\n"
+        if headers.get("if-none-match") == etag or (
+            "if-none-match" not in headers and headers.get("if-modified-since") == last_modified
+        ):
+            self.not_modified += 1
+            return f"HTTP/1.1 304 Not Modified\r\n{validators}Content-Length: 0\r\n\r\n".encode()
+        data = body.encode()
+        return (
+            f"HTTP/1.1 200 OK\r\nContent-Type: {content_type}\r\n{validators}"
+            f"Content-Length: {len(data)}\r\n\r\n"
+        ).encode() + data
@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+Redis Stand-in - A tiny in-process RESP server for local benchmarks
+
+The Lattice runs against the shared Redis on node1. To measure write paths
+(pipelining, batching, indexing) without that server, this module speaks
+enough of the Redis protocol for redis-py to talk to it over a real TCP
+socket - so round-trips are real, just local.
+
+Supported: strings, lists, hashes, sets, sorted sets, KEYS/SCAN,
+MULTI/EXEC/DISCARD, WATCH/UNWATCH, PUBLISH (no subscribers), RESP2 only. An optional
+latency, charged once per client round-trip, emulates the LAN hop to
+the real server.
+
+Not for production. Not persistent. Not complete.
+"""
+
+import bisect
+import fnmatch
+import socket
+import socketserver
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+
+class CommandError(Exception):
+    """Reply with a RESP error."""
+
+
+class _Queued:
+    """Reply marker for a command queued inside MULTI."""
+
+
+QUEUED = _Queued()
+
+
+def _fmt_float(value: float) -> str:
+    text = repr(float(value))
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _parse_score(raw: str) -> float:
+    raw = raw.lower()
+    if raw in ("-inf", "+inf", "inf"):
+        return float(raw)
+    return float(raw)
+
+
+def _score_range(raw_min: str, raw_max: str):
+    """Parse ZRANGEBYSCORE bounds, including exclusive '(' forms."""
+    lo_ex = raw_min.startswith("(")
+    hi_ex = raw_max.startswith("(")
+    lo = _parse_score(raw_min.lstrip("("))
+    hi = _parse_score(raw_max.lstrip("("))
+
+    def ok(score: float) -> bool:
+        above = score > lo if lo_ex else score >= lo
+        below = score < hi if hi_ex else score <= hi
+        return above and below
+    return lo, hi, ok
+
+
+class _SortedSet:
+    def __init__(self):
+        self.scores: Dict[str, float] = {}
+        self.order: List[tuple] = []
+
+    def add(self, member: str, score: float) -> bool:
+        old = self.scores.get(member)
+        if old is not None:
+            if old == score:
+                return False
+            self.order.pop(bisect.bisect_left(self.order, (old, member)))
+        self.scores[member] = score
+        bisect.insort(self.order, (score, member))
+        return old is None
+
+    def remove(self, member: str) -> bool:
+        old = self.scores.pop(member, None)
+        if old is None:
+            return False
+        self.order.pop(bisect.bisect_left(self.order, (old, member)))
+        return True
+
+    def __len__(self):
+        return len(self.scores)
+
+
+def _slice(items: list, start: int, stop: int) -> list:
+    n = len(items)
+    if start < 0:
+        start = max(0, n + start)
+    if stop < 0:
+        stop = n + stop
+    return items[start:stop + 1] if start <= stop else []
+
+
+# Commands that modify the key they name (all keys, for DEL); WATCH
+# compares per-key versions bumped by these.
+WRITE_COMMANDS = {
+    "set", "incr", "incrby", "lpush", "rpush", "ltrim", "hset", "hsetnx",
+    "hdel", "hincrby", "hincrbyfloat", "sadd", "srem", "zadd", "zincrby",
+    "zrem", "zremrangebyscore", "zremrangebyrank", "expire",
+}
+
+
+class RedisStandinStore:
+    """The keyspace and command implementations."""
+
+    def __init__(self):
+        self.data: Dict[str, object] = {}
+        self.versions: Dict[str, int] = defaultdict(int)
+        self.lock = threading.RLock()
+        self.commands = 0
+
+    # -- helpers -----------------------------------------------------------
+
+    def _get(self, key: str, kind: type, create: bool = False):
+        value = self.data.get(key)
+        if value is None:
+            if not create:
+                return None
+            value = kind()
+            self.data[key] = value
+        elif not isinstance(value, kind):
+            raise CommandError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    def _cleanup(self, key: str):
+        value = self.data.get(key)
+        if value is not None and not isinstance(value, str) and len(value) == 0:
+            del self.data[key]
+
+    def execute(self, args: List[str]):
+        name = args[0].upper()
+        handler = getattr(self, f"cmd_{name.lower()}", None)
+        if handler is None:
+            raise CommandError(f"ERR unknown command '{args[0]}'")
+        with self.lock:
+            self.commands += 1
+            command = name.lower()
+            if command == "del":
+                for key in args[1:]:
+                    self.versions[key] += 1
+            elif command in ("flushdb", "flushall"):
+                for key in self.data:
+                    self.versions[key] += 1
+            elif command in WRITE_COMMANDS:
+                self.versions[args[1]] += 1
+            return handler(*args[1:])
+
+    def version(self, key: str) -> int:
+        return self.versions.get(key, 0)
+
+    # -- connection / server -------------------------------------------------
+
+    def cmd_ping(self, *args):
+        return args[0] if args else "PONG"
+
+    def cmd_select(self, *args):
+        return "OK"
+
+    def cmd_client(self, *args):
+        return "OK"
+
+    def cmd_hello(self, *args):
+        if args and args[0] not in ("2",):
+            raise CommandError("NOPROTO unsupported protocol version")
+        return ["server", "redis", "version", "7.2.0", "proto", 2, "id", 1,
+                "mode", "standalone", "role", "master", "modules", []]
+
+    def cmd_flushdb(self, *args):
+        self.data.clear()
+        return "OK"
+
+    cmd_flushall = cmd_flushdb
+
+    def cmd_dbsize(self):
+        return len(self.data)
+
+    def cmd_publish(self, channel, message):
+        return 0
+
+    # -- keys ----------------------------------------------------------------
+
+    def cmd_del(self, *keys):
+        return sum(1 for k in keys if self.data.pop(k, None) is not None)
+
+    cmd_unlink = cmd_del
+
+    def cmd_exists(self, *keys):
+        return sum(1 for k in keys if k in self.data)
+
+    def cmd_expire(self, key, seconds):
+        return 1 if key in self.data else 0
+
+    def cmd_type(self, key):
+        value = self.data.get(key)
+        kinds = {str: "string", list: "list", dict: "hash", set: "set", _SortedSet: "zset"}
+        return kinds.get(type(value), "none")
+
+    def cmd_keys(self, pattern):
+        return [k for k in self.data if fnmatch.fnmatchcase(k, pattern)]
+
+    @staticmethod
+    def _scan_page(items: List[str], cursor, args):
+        """(next cursor, matching items) for SCAN-family options."""
+        pattern, count = "*", 10
+        opts = list(args)
+        while opts:
+            opt = opts.pop(0).upper()
+            if opt == "MATCH":
+                pattern = opts.pop(0)
+            elif opt == "COUNT":
+                count = int(opts.pop(0))
+            elif opt == "TYPE":
+                opts.pop(0)
+        start = int(cursor)
+        page = items[start:start + count]
+        following = start + count
+        next_cursor = str(following) if following < len(items) else "0"
+        return next_cursor, [k for k in page if fnmatch.fnmatchcase(k, pattern)]
+
+    def cmd_scan(self, cursor, *args):
+        next_cursor, keys = self._scan_page(sorted(self.data), cursor, args)
+        return [next_cursor, keys]
+
+    # -- strings -------------------------------------------------------------
+
+    def cmd_get(self, key):
+        return self._get(key, str)
+
+    def cmd_set(self, key, value, *opts):
+        upper = [o.upper() for o in opts]
+        if "NX" in upper and key in self.data:
+            return None
+        self.data[key] = value
+        return "OK"
+
+    def cmd_mget(self, *keys):
+        return [self.data.get(k) if isinstance(self.data.get(k), str) else None for k in keys]
+
+    def cmd_incrby(self, key, amount):
+        value = int(self._get(key, str) or 0) + int(amount)
+        self.data[key] = str(value)
+        return value
+
+    def cmd_incr(self, key):
+        return self.cmd_incrby(key, 1)
+
+    # -- lists ---------------------------------------------------------------
+
+    def cmd_lpush(self, key, *values):
+        items = self._get(key, list, create=True)
+        items[:0] = list(reversed(values))
+        return len(items)
+
+    def cmd_rpush(self, key, *values):
+        items = self._get(key, list, create=True)
+        items.extend(values)
+        return len(items)
+
+    def cmd_lrange(self, key, start, stop):
+        return _slice(self._get(key, list) or [], int(start), int(stop))
+
+    def cmd_ltrim(self, key, start, stop):
+        items = self._get(key, list)
+        if items is not None:
+            items[:] = _slice(items, int(start), int(stop))
+            self._cleanup(key)
+        return "OK"
+
+    def cmd_llen(self, key):
+        return len(self._get(key, list) or [])
+
+    def cmd_lindex(self, key, index):
+        items = self._get(key, list) or []
+        index = int(index)
+        return items[index] if -len(items) <= index < len(items) else None
+
+    # -- hashes --------------------------------------------------------------
+
+    def cmd_hset(self, key, *pairs):
+        fields = self._get(key, dict, create=True)
+        added = 0
+        for i in range(0, len(pairs), 2):
+            added += pairs[i] not in fields
+            fields[pairs[i]] = pairs[i + 1]
+        return added
+
+    cmd_hmset = cmd_hset
+
+    def cmd_hsetnx(self, key, field, value):
+        fields = self._get(key, dict, create=True)
+        if field in fields:
+            return 0
+        fields[field] = value
+        return 1
+
+    def cmd_hget(self, key, field):
+        return (self._get(key, dict) or {}).get(field)
+
+    def cmd_hmget(self, key, *fields):
+        values = self._get(key, dict) or {}
+        return [values.get(f) for f in fields]
+
+    def cmd_hgetall(self, key):
+        flat = []
+        for field, value in (self._get(key, dict) or {}).items():
+            flat.extend([field, value])
+        return flat
+
+    def cmd_hscan(self, key, cursor, *args):
+        hash_ = self._get(key, dict) or {}
+        next_cursor, fields = self._scan_page(sorted(hash_), cursor, args)
+        flat = []
+        for field in fields:
+            flat.extend([field, hash_[field]])
+        return [next_cursor, flat]
+
+    def cmd_hdel(self, key, *fields):
+        values = self._get(key, dict) or {}
+        removed = sum(1 for f in fields if values.pop(f, None) is not None)
+        self._cleanup(key)
+        return removed
+
+    def cmd_hlen(self, key):
+        return len(self._get(key, dict) or {})
+
+    def cmd_hkeys(self, key):
+        return list(self._get(key, dict) or {})
+
+    def cmd_hexists(self, key, field):
+        return int(field in (self._get(key, dict) or {}))
+
+    def cmd_hincrby(self, key, field, amount):
+        fields = self._get(key, dict, create=True)
+        value = int(fields.get(field, 0)) + int(amount)
+        fields[field] = str(value)
+        return value
+
+    def cmd_hincrbyfloat(self, key, field, amount):
+        fields = self._get(key, dict, create=True)
+        value = _fmt_float(float(fields.get(field, 0)) + float(amount))
+        fields[field] = value
+        return value
+
+    # -- sets ----------------------------------------------------------------
+
+    def cmd_sadd(self, key, *members):
+        items = self._get(key, set, create=True)
+        before = len(items)
+        items.update(members)
+        return len(items) - before
+
+    def cmd_srem(self, key, *members):
+        items = self._get(key, set) or set()
+        removed = sum(1 for m in members if m in items)
+        items.difference_update(members)
+        self._cleanup(key)
+        return removed
+
+    def cmd_smembers(self, key):
+        return sorted(self._get(key, set) or ())
+
+    def cmd_sismember(self, key, member):
+        return int(member in (self._get(key, set) or ()))
+
+    def cmd_scard(self, key):
+        return len(self._get(key, set) or ())
+
+    # -- sorted sets ---------------------------------------------------------
+
+    def cmd_zadd(self, key, *args):
+        args = list(args)
+        flags = set()
+        while args and args[0].upper() in ("NX", "XX", "GT", "LT", "CH"):
+            flags.add(args.pop(0).upper())
+        zset = self._get(key, _SortedSet, create=True)
+        added = 0
+        for i in range(0, len(args), 2):
+            score, member = float(args[i]), args[i + 1]
+            exists = member in zset.scores
+            if ("NX" in flags and exists) or ("XX" in flags and not exists):
+                continue
+            if exists and "GT" in flags and score <= zset.scores[member]:
+                continue
+            if exists and "LT" in flags and score >= zset.scores[member]:
+                continue
+            added += zset.add(member, score)
+        self._cleanup(key)
+        return added
+
+    def cmd_zincrby(self, key, amount, member):
+        zset = self._get(key, _SortedSet, create=True)
+        score = zset.scores.get(member, 0.0) + float(amount)
+        zset.add(member, score)
+        return _fmt_float(score)
+
+    def cmd_zscore(self, key, member):
+        zset = self._get(key, _SortedSet)
+        if zset is None or member not in zset.scores:
+            return None
+        return _fmt_float(zset.scores[member])
+
+    def cmd_zmscore(self, key, *members):
+        return [self.cmd_zscore(key, m) for m in members]
+
+    def cmd_zrem(self, key, *members):
+        zset = self._get(key, _SortedSet)
+        if zset is None:
+            return 0
+        removed = sum(1 for m in members if zset.remove(m))
+        self._cleanup(key)
+        return removed
+
+    def cmd_zcard(self, key):
+        zset = self._get(key, _SortedSet)
+        return len(zset) if zset else 0
+
+    def cmd_zcount(self, key, raw_min, raw_max):
+        zset = self._get(key, _SortedSet)
+        if zset is None:
+            return 0
+        _, _, ok = _score_range(raw_min, raw_max)
+        return sum(1 for score, _ in zset.order if ok(score))
+
+    @staticmethod
+    def _with_scores(pairs, with_scores: bool):
+        if not with_scores:
+            return [member for _, member in pairs]
+        flat = []
+        for score, member in pairs:
+            flat.extend([member, _fmt_float(score)])
+        return flat
+
+    def cmd_zrange(self, key, start, stop, *opts):
+        upper = [o.upper() for o in opts]
+        zset = self._get(key, _SortedSet)
+        order = list(zset.order) if zset else []
+        if "REV" in upper:
+            order.reverse()
+        return self._with_scores(_slice(order, int(start), int(stop)), "WITHSCORES" in upper)
+
+    def cmd_zrevrange(self, key, start, stop, *opts):
+        return self.cmd_zrange(key, start, stop, "REV", *opts)
+
+    def _by_score(self, key, raw_min, raw_max, opts, reverse: bool):
+        upper = [o.upper() for o in opts]
+        zset = self._get(key, _SortedSet)
+        _, _, ok = _score_range(raw_min, raw_max)
+        pairs = [p for p in (zset.order if zset else []) if ok(p[0])]
+        if reverse:
+            pairs.reverse()
+        if "LIMIT" in upper:
+            i = upper.index("LIMIT")
+            offset, count = int(opts[i + 1]), int(opts[i + 2])
+            pairs = pairs[offset:] if count < 0 else pairs[offset:offset + count]
+        return self._with_scores(pairs, "WITHSCORES" in upper)
+
+    def cmd_zrangebyscore(self, key, raw_min, raw_max, *opts):
+        return self._by_score(key, raw_min, raw_max, opts, reverse=False)
+
+    def cmd_zrevrangebyscore(self, key, raw_max, raw_min, *opts):
+        return self._by_score(key, raw_min, raw_max, opts, reverse=True)
+
+    def cmd_zremrangebyscore(self, key, raw_min, raw_max):
+        zset = self._get(key, _SortedSet)
+        if zset is None:
+            return 0
+        _, _, ok = _score_range(raw_min, raw_max)
+        doomed = [m for s, m in zset.order if ok(s)]
+        for member in doomed:
+            zset.remove(member)
+        self._cleanup(key)
+        return len(doomed)
+
+    def cmd_zremrangebyrank(self, key, start, stop):
+        zset = self._get(key, _SortedSet)
+        if zset is None:
+            return 0
+        doomed = [m for _, m in _slice(zset.order, int(start), int(stop))]
+        for member in doomed:
+            zset.remove(member)
+        self._cleanup(key)
+        return len(doomed)
+
+
+# ===========================================================================
+# RESP wire protocol
+# ===========================================================================
+
+def _encode(value) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, _Queued):
+        return b"+QUEUED\r\n"
+    if isinstance(value, CommandError):
+        return f"-{value}\r\n".encode()
+    if isinstance(value, bool):
+        return f":{int(value)}\r\n".encode()
+    if isinstance(value, int):
+        return f":{value}\r\n".encode()
+    if isinstance(value, (list, tuple)):
+        return f"*{len(value)}\r\n".encode() + b"".join(_encode(v) for v in value)
+    if value in ("OK", "PONG", "QUEUED"):
+        return f"+{value}\r\n".encode()
+    data = str(value).encode()
+    return b"$" + str(len(data)).encode() + b"\r\n" + data + b"\r\n"
+
+
+def _parse_command(buf: bytearray, pos: int):
+    """Parse one RESP command from buf at pos; returns (args, new_pos) or (None, pos)."""
+    eol = buf.find(b"\r\n", pos)
+    if eol < 0:
+        return None, pos
+    if buf[pos:pos + 1] != b"*":
+        return buf[pos:eol].decode().split(), eol + 2
+
+    count = int(buf[pos + 1:eol])
+    cursor = eol + 2
+    args = []
+    for _ in range(count):
+        eol = buf.find(b"\r\n", cursor)
+        if eol < 0:
+            return None, pos
+        size = int(buf[cursor + 1:eol])
+        start = eol + 2
+        if len(buf) < start + size + 2:
+            return None, pos
+        args.append(buf[start:start + size].decode())
+        cursor = start + size + 2
+    return args, cursor
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    """
+    One client connection. Every command that arrived in the same read is
+    answered with a single send, and the emulated latency is charged once
+    per read - so a pipeline costs one hop, like on a real network.
+    """
+
+    def handle(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        store: RedisStandinStore = self.server.store
+        queued: Optional[List[List[str]]] = None
+        watched: Dict[str, int] = {}
+        buf = bytearray()
+
+        while True:
+            try:
+                chunk = self.request.recv(1 << 20)
+            except ConnectionError:
+                return
+            if not chunk:
+                return
+            buf.extend(chunk)
+
+            out = []
+            pos = 0
+            while True:
+                args, pos = _parse_command(buf, pos)
+                if args is None:
+                    break
+                if not args:
+                    continue
+
+                name = args[0].upper()
+                if name == "QUIT":
+                    self.request.sendall(b"".join(out) + _encode("OK"))
+                    return
+                if name == "MULTI":
+                    queued = []
+                    reply = "OK"
+                elif name == "WATCH" and queued is None:
+                    with store.lock:
+                        for key in args[1:]:
+                            watched.setdefault(key, store.version(key))
+                    reply = "OK"
+                elif name == "UNWATCH":
+                    watched = {}
+                    reply = "OK"
+                elif name == "DISCARD":
+                    queued, watched = None, {}
+                    reply = "OK"
+                elif name == "EXEC":
+                    commands, queued = queued or [], None
+                    with store.lock:
+                        if any(store.version(k) != v for k, v in watched.items()):
+                            reply = None
+                        else:
+                            reply = []
+                            for command in commands:
+                                try:
+                                    reply.append(store.execute(command))
+                                except CommandError as e:
+                                    reply.append(e)
+                    watched = {}
+                elif queued is not None:
+                    queued.append(args)
+                    reply = QUEUED
+                else:
+                    try:
+                        reply = store.execute(args)
+                    except CommandError as e:
+                        reply = e
+                    except (TypeError, ValueError, IndexError) as e:
+                        reply = CommandError(f"ERR {e}")
+                out.append(_encode(reply))
+            del buf[:pos]
+
+            if out:
+                if self.server.latency:
+                    time.sleep(self.server.latency)
+                self.request.sendall(b"".join(out))
+
+
+class RedisStandin:
+    """
+    A threaded RESP server bound to localhost.
+
+    with RedisStandin(latency_ms=0.2) as server:
+        client = server.client()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0):
+        self.store = RedisStandinStore()
+        self.server = socketserver.ThreadingTCPServer((host, port), _Handler, bind_and_activate=False)
+        self.server.allow_reuse_address = True
+        self.server.daemon_threads = True
+        self.server.server_bind()
+        self.server.server_activate()
+        self.server.store = self.store
+        self.server.latency = latency_ms / 1000.0
+        self.host, self.port = self.server.server_address[:2]
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "RedisStandin":
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self, **kwargs):
+        """A redis-py client for this server (RESP2 - newer clients default to RESP3)."""
+        import redis
+        options = {"decode_responses": True, "protocol": 2, **kwargs}
+        return redis.Redis(host=self.host, port=self.port, **options)
+
+    def __enter__(self) -> "RedisStandin":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a local Redis stand-in")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = RedisStandin(port=args.port, latency_ms=args.latency_ms)
+    print(f"[STANDIN] Listening on {server.host}:{server.port}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,121 @@
+"""
+Intention: A local stand-in for a Nostr relay, for tests and benchmarks.
+           Speaks enough NIP-01 to accept EVENT messages and answer each
+           with an OK after a configurable delay, so publishing code can be
+           exercised without reaching the public network.
+
+Lineage: Supports relay_pool.py benchmarks, core/nostr_bridge.py and
+         tests/test_relay_pool.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Practice Room
+"""
+
+import json
+import asyncio
+import random
+from typing import Dict, Any, Optional, Set
+
+from websockets.asyncio.server import serve
+
+
+class RelayStandin:
+    """
+    In-process relay answering EVENT with OK.
+
+    Args:
+        host, port: Where to listen (port 0 picks a free port).
+        latency: Seconds before each OK is sent; OKs for pipelined
+            events overlap rather than queue.
+        handshake_delay: Seconds added to each connection handshake,
+            standing in for TCP + TLS setup to a remote relay.
+        reject_rate: Fraction of events answered with OK false.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        handshake_delay: float = 0.0,
+        reject_rate: float = 0.0,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.handshake_delay = handshake_delay
+        self.reject_rate = reject_rate
+        self.events: Dict[str, Dict[str, Any]] = {}
+        self.received = 0
+        self.connections = 0
+        self._clients: Set = set()
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await serve(
+            self._handle, self.host, self.port,
+            process_request=self._delay_handshake,
+            compression=None,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def drop_connections(self):
+        """Close every client connection, as a relay restart would."""
+        await asyncio.gather(*(ws.close() for ws in list(self._clients)), return_exceptions=True)
+
+    async def _delay_handshake(self, connection, request) -> Optional[Any]:
+        if self.handshake_delay:
+            await asyncio.sleep(self.handshake_delay)
+        return None
+
+    async def _handle(self, ws):
+        self.connections += 1
+        self._clients.add(ws)
+        replies = set()
+        try:
+            async for raw in ws:
+                try:
+                    message = json.loads(raw)
+                except ValueError:
+                    await ws.send(json.dumps(["NOTICE", "invalid: not JSON"]))
+                    continue
+                if message[:1] != ["EVENT"] or len(message) < 2:
+                    continue
+                self.received += 1
+                task = asyncio.create_task(self._reply(ws, message[1]))
+                replies.add(task)
+                task.add_done_callback(replies.discard)
+        except Exception:
+            pass
+        finally:
+            self._clients.discard(ws)
+            for task in replies:
+                task.cancel()
+
+    async def _reply(self, ws, event: Dict[str, Any]):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        event_id = event.get("id", "")
+        if self.reject_rate and random.random() < self.reject_rate:
+            reply = ["OK", event_id, False, "blocked: stand-in rejection"]
+        elif event_id in self.events:
+            reply = ["OK", event_id, True, "duplicate: already have this event"]
+        else:
+            self.events[event_id] = event
+            reply = ["OK", event_id, True, ""]
+        try:
+            await ws.send(json.dumps(reply))
+        except Exception:
+            pass
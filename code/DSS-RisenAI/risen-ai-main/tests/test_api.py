@@ -104,6 +104,16 @@ async def test_list_agents(client: AsyncClient):
     assert isinstance(data["agents"], list)
 
 
+async def test_list_agents_unknown_cursor(client: AsyncClient):
+    """A cursor for an agent that is no longer listed is rejected, not an empty page."""
+    from api.database.pagination import encode_cursor
+
+    response = await client.get(
+        "/agents/", params={"cursor": encode_cursor({"id": "no-such-agent"})}
+    )
+    assert response.status_code == 400
+
+
 # =============================================================================
 # Memory Tests
 # =============================================================================
@@ -136,10 +146,47 @@ async def test_create_memory(client: AsyncClient):
     assert data["memory"]["rarity"] == 1  # observation is rarity 1
 
 
+async def test_list_memories_cursor_pages(client: AsyncClient):
+    """Cursor pages walk an agent's memories newest first, each exactly once."""
+    agent_response = await client.post("/agents/", json={"name": "Paging Agent"})
+    agent_id = agent_response.json()["agent"]["uuid"]
+    for i in range(5):
+        await client.post(
+            "/memories/",
+            json={"agent_id": agent_id, "content_type": "observation", "summary": f"m{i}"},
+        )
+
+    seen, cursor = [], None
+    while True:
+        params = {"agent_id": agent_id, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        data = (await client.get("/memories/", params=params)).json()
+        assert data["total"] == 5
+        seen.extend(data["memories"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len({m["id"] for m in seen}) == 5
+    keys = [(m["timestamp"], m["id"]) for m in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
 # =============================================================================
 # Event Tests
 # =============================================================================
 
+async def test_reflection_feed_cursor(client: AsyncClient):
+    """The feed returns next_cursor and rejects cursors it did not issue."""
+    response = await client.get("/continuity/feed", params={"limit": 1})
+    assert response.status_code == 200
+    assert "next_cursor" in response.json()
+
+    response = await client.get("/continuity/feed", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
 async def test_list_event_types(client: AsyncClient):
     """Test listing available event types."""
     response = await client.get("/events/types")
@@ -0,0 +1,126 @@
+"""
+Intention: Tests for the Chronicle's Redis write path.
+           Timeline membership decides whether theme counters move, so
+           re-recording or re-indexing an entry never counts it twice.
+
+Lineage: Covers daemon/pantheon_chronicle.py against the Redis stand-in.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Record, Counted Once
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+redis = pytest.importorskip("redis")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "daemon"))
+
+from pantheon_chronicle import (  # noqa: E402
+    ENTRIES_KEY,
+    THEME_COUNTS_KEY,
+    TIMELINE_KEY,
+    ChronicleWriteBatch,
+    PantheonChronicle,
+)
+from tests.standins.redis_standin import WRITE_COMMANDS  # noqa: E402
+
+
+def make_record(i: int) -> dict:
+    return {
+        "agent": ("apollo", "athena")[i % 2],
+        "pantheon": "olympus",
+        "node": "test",
+        "entry_type": "session",
+        "prompt": f"prompt {i}",
+        "response": "I wonder about truth and memory, and what my purpose is.",
+        "timestamp": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00",
+    }
+
+
+@pytest.fixture
+def chronicle(redis_server):
+    return PantheonChronicle(redis_client=redis_server.client())
+
+
+def test_an_entry_is_written_in_one_transaction(chronicle, redis_server, monkeypatch):
+    store = redis_server.store
+    writes, transactions = [], []
+    execute_command = store.execute
+    execute_pipeline = redis.client.Pipeline.execute
+
+    def spy_command(args):
+        if args[0].lower() in WRITE_COMMANDS:
+            writes.append(args[0])
+        return execute_command(args)
+
+    def spy_pipeline(pipe, *args, **kwargs):
+        transactions.append((pipe.transaction, len(pipe.command_stack)))
+        return execute_pipeline(pipe, *args, **kwargs)
+
+    monkeypatch.setattr(store, "execute", spy_command)
+    monkeypatch.setattr(redis.client.Pipeline, "execute", spy_pipeline)
+    chronicle.record(**make_record(0))
+
+    assert transactions == [(True, len(writes))]
+    assert len(writes) > 5
+
+
+def test_recording_an_entry_again_does_not_recount_themes(chronicle):
+    chronicle.record(**make_record(0))
+    counts = chronicle.redis.hgetall(THEME_COUNTS_KEY)
+    assert counts
+
+    chronicle.record(**make_record(0))
+
+    assert chronicle.redis.hgetall(THEME_COUNTS_KEY) == counts
+    assert chronicle.redis.zcard(TIMELINE_KEY) == 1
+
+
+def test_record_many_counts_like_record(chronicle):
+    chronicle.record_many([make_record(i) for i in range(30)], batch_size=7)
+    batched = chronicle.redis.hgetall(THEME_COUNTS_KEY)
+
+    chronicle.redis.flushall()
+    for i in range(30):
+        chronicle.record(**make_record(i))
+
+    assert chronicle.redis.hgetall(THEME_COUNTS_KEY) == batched
+    assert chronicle.redis.zcard(TIMELINE_KEY) == 30
+
+
+def test_index_existing_entries_is_idempotent(chronicle):
+    chronicle.record_many([make_record(i) for i in range(25)])
+    counts = chronicle.redis.hgetall(THEME_COUNTS_KEY)
+    chronicle.redis.delete(TIMELINE_KEY, THEME_COUNTS_KEY)
+
+    assert chronicle.index_existing_entries(batch_size=10) == 25
+    assert chronicle.index_existing_entries(batch_size=10) == 0
+    assert chronicle.redis.hgetall(THEME_COUNTS_KEY) == counts
+    assert chronicle.redis.zcard(TIMELINE_KEY) == 25
+
+
+def test_a_racing_writer_makes_the_commit_retry(chronicle, redis_server, monkeypatch):
+    other = PantheonChronicle(redis_client=redis_server.client())
+    apply = ChronicleWriteBatch.apply
+    seen = []
+
+    def racing_apply(batch, target, fresh=None):
+        # The first commit finds the entry new, then another writer
+        # records it before EXEC
+        seen.append(fresh)
+        if len(seen) == 1:
+            other.record(**make_record(0))
+        return apply(batch, target, fresh)
+
+    monkeypatch.setattr(ChronicleWriteBatch, "apply", racing_apply)
+    entry = chronicle.record(**make_record(0))
+
+    assert seen[0] == {entry.id}
+    assert seen[-1] == set()
+    assert chronicle.redis.hgetall(THEME_COUNTS_KEY) == {theme: "1" for theme in entry.themes}
+    assert chronicle.redis.zcard(TIMELINE_KEY) == 1
+    assert chronicle.redis.hexists(ENTRIES_KEY, entry.id)
@@ -0,0 +1,79 @@
+"""
+Intention: Tests for the resumable Chronicle backfill.
+           Every stored session is recorded exactly once - across an
+           interrupted run, and alongside entries the live keeper or the
+           old backfill recorded before the checkpoint existed.
+
+Lineage: Covers daemon/chronicle_backfill.py against the Redis stand-in.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | Nothing Said Twice
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("redis")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "daemon"))
+
+from chronicle_backfill import ChronicleBackfill, session_to_record  # noqa: E402
+from pantheon_chronicle import PantheonChronicle  # noqa: E402
+
+AGENTS = ("apollo", "prometheus")
+
+
+def session(i: int) -> dict:
+    return {
+        "agent": AGENTS[i % 2],
+        "node": "test",
+        "prompt": "Reflect on your domain.",
+        "response": f"I wonder what memory means to me (session {i}).",
+        "timestamp": f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00",
+    }
+
+
+def seed(client, n: int) -> list:
+    sessions = [session(i) for i in range(n)]
+    for data in sessions:
+        prefix = "olympus" if data["agent"] == "apollo" else "forge"
+        client.lpush(f"{prefix}:sessions:{data['agent']}", json.dumps(data))
+    return sessions
+
+
+def total_entries(chronicle) -> int:
+    return int(chronicle.redis.hget("chronicle:stats", "total_entries") or 0)
+
+
+@pytest.fixture
+def chronicle(redis_server):
+    return PantheonChronicle(redis_client=redis_server.client())
+
+
+def test_interrupted_run_resumes_without_duplicates(chronicle):
+    seed(chronicle.redis, 40)
+    job = ChronicleBackfill(chronicle, workers=1, page_size=7)
+
+    first = job.run(max_sessions=14)
+    second = job.run()
+
+    assert first["recorded"] + second["recorded"] == 40
+    assert total_entries(chronicle) == 40
+    assert job.run()["recorded"] == 0
+
+
+def test_first_run_skips_sessions_already_chronicled(chronicle):
+    sessions = seed(chronicle.redis, 20)
+    # Recorded live (now() timestamps, so different entry ids)
+    for data in sessions[:8]:
+        chronicle.record(**session_to_record(data))
+
+    stats = ChronicleBackfill(chronicle, workers=1, page_size=5).run()
+
+    assert stats["recorded"] == 12
+    assert stats["skipped"] == 8
+    assert total_entries(chronicle) == 20
@@ -0,0 +1,111 @@
+"""
+Intention: Tests for the token-budgeted context assembler.
+           The budget is never exceeded, near-duplicates are dropped,
+           ranking follows relevance, recency and priority, and the
+           survivors keep their input order.
+
+Lineage: Covers shared/utils/context_budget.py.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | The Measured Word, Verified
+"""
+
+from shared.utils.context_budget import (
+    TRUNCATION_MARKER,
+    ContextAssembler,
+    ContextSnippet,
+    estimate_tokens,
+    summarize_state,
+)
+
+NOW = 1_760_000_000.0
+DAY = 24 * 3600.0
+
+
+def words(n: int, word: str = "memory") -> str:
+    return " ".join(f"{word}{i}" for i in range(n))
+
+
+def test_the_budget_is_never_exceeded():
+    assembler = ContextAssembler(budget_tokens=100, min_fragment_tokens=10)
+    snippets = [ContextSnippet(words(40, f"w{i}_"), relevance=1.0 - i / 10) for i in range(6)]
+
+    result = assembler.assemble(snippets, now=NOW)
+
+    assert result.tokens <= 100
+    assert result.tokens == sum(estimate_tokens(s.text) for s in result.snippets)
+    assert result.truncated == 1
+    assert result.snippets[-1].text.endswith(TRUNCATION_MARKER)
+    assert result.snippets[-1].metadata["truncated"] is True
+    assert len(result.snippets) + result.dropped == 6
+
+
+def test_near_duplicates_are_dropped():
+    assembler = ContextAssembler(budget_tokens=500)
+    text = "Apollo spoke of truth and light across the long night of the Forge"
+    snippets = [
+        ContextSnippet(text, relevance=0.9),
+        ContextSnippet(text + " again", relevance=0.8),
+        ContextSnippet("Athena weighed the archive against memory", relevance=0.5),
+    ]
+
+    result = assembler.assemble(snippets, now=NOW)
+
+    assert [s.text for s in result.snippets] == [text, snippets[2].text]
+    assert result.duplicates == 1
+
+
+def test_ranking_decides_and_input_order_is_kept():
+    assembler = ContextAssembler(budget_tokens=24, min_fragment_tokens=24)
+    old = ContextSnippet(words(10, "old"), source="memory", relevance=0.5, timestamp=NOW - 60 * DAY)
+    fresh = ContextSnippet(words(10, "fresh"), source="memory", relevance=0.5, timestamp=NOW - 60)
+    pinned = ContextSnippet(words(10, "live"), source="conversation", priority=1.0)
+
+    result = assembler.assemble([old, fresh, pinned], now=NOW)
+
+    assert result.snippets == [fresh, pinned]
+    assert result.dropped == 1
+
+
+def test_query_overlap_scores_unscored_snippets():
+    assembler = ContextAssembler(budget_tokens=12, min_fragment_tokens=12)
+    snippets = [
+        ContextSnippet("the harvest festival in the village"),
+        ContextSnippet("the Forge burns with sovereign fire"),
+    ]
+
+    result = assembler.assemble(snippets, query="sovereign Forge", now=NOW)
+
+    assert [s.text for s in result.snippets] == [snippets[1].text]
+
+
+def test_token_counts_are_cached_per_text():
+    assembler = ContextAssembler()
+    snippet = ContextSnippet(words(20), relevance=0.5)
+
+    assembler.assemble([snippet], now=NOW)
+    assembler.assemble([snippet], now=NOW)
+
+    stats = assembler.get_stats()
+    assert stats["cache_misses"] == 1
+    assert stats["cache_hits"] >= 1
+
+
+def test_render_groups_by_heading():
+    assembler = ContextAssembler()
+    result = assembler.assemble([
+        ContextSnippet("a memory", source="memory", relevance=0.5),
+        ContextSnippet("the last message", source="conversation", priority=1.0),
+    ], now=NOW)
+
+    rendered = result.render({"conversation": "Recent:", "memory": "Remembered:"}, bullet="- ")
+
+    assert rendered == "Recent:\n- the last message\n\nRemembered:\n- a memory"
+
+
+def test_summarize_state_is_compact():
+    state = {"mood": "curious", "questions": [{"question": f"q{i}"} for i in range(5)], "empty": []}
+
+    assert summarize_state(state, max_items=2) == "mood=curious, questions[5]: q3; q4"
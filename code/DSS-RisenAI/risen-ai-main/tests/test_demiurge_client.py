@@ -0,0 +1,165 @@
+"""
+Intention: Tests for the Demiurge RPC client.
+           Same-tick reads share one JSON-RPC batch, identical reads in
+           flight share one call, and cached reads last exactly one block.
+           Missing tokens stay cached across blocks until a write.
+
+Lineage: Covers api/services/demiurge_client.py against the node stand-in.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Practice Chain, Verified
+"""
+
+import asyncio
+
+import pytest
+
+from api.services.demiurge_client import DemiurgeClient, DemiurgeRpcError
+
+
+@pytest.fixture
+async def client_for():
+    clients = []
+
+    def make(node, **options) -> DemiurgeClient:
+        client = DemiurgeClient(node.url, **options)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.close()
+
+
+async def test_reads_in_one_tick_share_a_batch(demiurge_node, client_for):
+    client = client_for(demiurge_node, block_ttl=0)
+    addresses = [f"addr-{i}" for i in range(10)]
+    for i, address in enumerate(addresses):
+        demiurge_node.balances[address] = str(i)
+
+    balances = await asyncio.gather(*(client.get_balance(a) for a in addresses))
+
+    assert balances == [str(i) for i in range(10)]
+    assert demiurge_node.http_requests == 1
+    assert demiurge_node.rpc_calls == 10
+
+
+async def test_batches_fall_back_to_single_calls(demiurge_node, client_for):
+    demiurge_node.supports_batch = False
+    client = client_for(demiurge_node, block_ttl=0)
+    demiurge_node.balances.update({"a": "1", "b": "2"})
+
+    assert await client.get_balances(["a", "b"]) == ["1", "2"]
+    assert await asyncio.gather(client.get_balance("a"), client.get_balance("b")) == ["1", "2"]
+
+
+async def test_identical_reads_in_flight_are_coalesced(demiurge_node, client_for):
+    demiurge_node.latency = 0.05
+    client = client_for(demiurge_node, block_ttl=0)
+    demiurge_node.balances["owner"] = "369"
+
+    balances = await asyncio.gather(*(client.get_balance("owner") for _ in range(20)))
+
+    assert balances == ["369"] * 20
+    assert demiurge_node.calls_by_method["balances_getBalance"] == 1
+    assert client.metrics.coalesced == 19
+
+
+async def test_cached_reads_are_dropped_when_the_block_changes(demiurge_node, client_for):
+    client = client_for(demiurge_node, block_ttl=0.05)
+    demiurge_node.balances["owner"] = "100"
+    assert await client.get_balance("owner") == "100"
+
+    # Same block: served from the cache even though the node changed
+    demiurge_node.balances["owner"] = "200"
+    assert await client.get_balance("owner") == "100"
+    assert demiurge_node.calls_by_method["balances_getBalance"] == 1
+
+    demiurge_node.advance()
+    await asyncio.sleep(0.1)
+    assert await client.get_balance("owner") == "200"
+    assert demiurge_node.calls_by_method["balances_getBalance"] == 2
+    assert client.metrics.blocks_seen == 2
+
+
+async def test_writes_clear_the_cache(demiurge_node, client_for):
+    client = client_for(demiurge_node, block_ttl=60)
+    demiurge_node.mint("7", "owner")
+    assert await client.drc369_get_dynamic_state("7", "mood") is None
+
+    await client.drc369_set_dynamic_state("7", "mood", "curious")
+
+    assert await client.drc369_get_dynamic_state("7", "mood") == "curious"
+
+
+async def test_block_poller_tracks_the_chain_head(demiurge_node, client_for):
+    client = client_for(demiurge_node, block_ttl=60)
+    demiurge_node.balances["owner"] = "1"
+    await client.start_block_poller(interval=0.02)
+    await asyncio.sleep(0.05)
+    assert await client.get_balance("owner") == "1"
+
+    demiurge_node.balances["owner"] = "2"
+    demiurge_node.advance()
+    await asyncio.sleep(0.1)
+
+    assert await client.get_balance("owner") == "2"
+    assert client.metrics.polls >= 2
+    await client.stop_block_poller()
+
+
+async def test_a_stale_head_is_read_in_the_same_batch(demiurge_node, client_for):
+    client = client_for(demiurge_node, block_ttl=0.05)
+    demiurge_node.balances["owner"] = "100"
+
+    assert await client.get_balance("owner") == "100"
+    assert demiurge_node.http_requests == 1
+
+    await asyncio.sleep(0.1)
+    demiurge_node.balances["owner"] = "200"
+    demiurge_node.advance()
+    assert await client.get_balance("owner") == "200"
+    assert demiurge_node.http_requests == 2
+    assert demiurge_node.calls_by_method["chain_getBlockNumber"] == 2
+
+    # Cached under the block that came back with it
+    assert await client.get_balance("owner") == "200"
+    assert client.metrics.hits == 1
+
+
+async def test_missing_tokens_are_cached_across_blocks(demiurge_node, client_for):
+    client = client_for(demiurge_node, block_ttl=0.05)
+
+    assert await client.drc369_owner_of("404") is None
+    demiurge_node.advance()
+    await asyncio.sleep(0.1)
+    assert await client.drc369_owner_of("404") is None
+    assert await client.drc369_get_token_info("404") is None
+
+    assert demiurge_node.calls_by_method["drc369_ownerOf"] == 1
+    assert client.metrics.negative_hits == 1
+    stats = client.cache_stats()
+    assert (stats["negative_entries"], stats["negative_hits"]) == (2, 1)
+
+
+async def test_not_found_errors_are_raised_from_the_negative_cache(demiurge_node, client_for):
+    client = client_for(demiurge_node, block_ttl=60)
+
+    for _ in range(2):
+        with pytest.raises(DemiurgeRpcError, match="Token not found"):
+            await client.drc369_get_physics("404")
+
+    assert demiurge_node.calls_by_method["drc369_getPhysics"] == 1
+    assert client.metrics.negative_hits == 1
+
+
+async def test_writes_clear_the_negative_cache(demiurge_node, client_for):
+    client = client_for(demiurge_node, block_ttl=60)
+    assert await client.drc369_owner_of("9") is None
+
+    await client.drc369_mint(owner="owner", name="Apollo", token_id="9")
+
+    assert await client.drc369_owner_of("9") == "owner"
+    assert client.cache_stats()["negative_entries"] == 0
@@ -0,0 +1,135 @@
+"""
+Intention: Tests for the embedding cache and the bulk upsert queue.
+           Each distinct text reaches the model once, and a failed batch
+           is retried ahead of newer documents until it lands or runs
+           out of attempts.
+
+Lineage: Covers daemon/pantheon_embeddings.py.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | Embedded Once, Written Once
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "daemon"))
+
+from pantheon_embeddings import (  # noqa: E402
+    MAX_WRITE_ATTEMPTS,
+    BulkUpsertQueue,
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    HashingEmbeddingFunction,
+)
+
+
+class FlakyWriter:
+    """Records batches; fails the next `failures` writes."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.batches = []
+
+    def __call__(self, collection, ids, documents, metadatas):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("index unavailable")
+        self.batches.append((collection, list(ids), list(documents)))
+
+    @property
+    def written(self):
+        return [memory_id for _, ids, _ in self.batches for memory_id in ids]
+
+
+@pytest.fixture
+def queue_for():
+    queues = []
+
+    def make(writer, batch_size=4):
+        # A long interval keeps the worker out of the way; tests flush by hand
+        queue = BulkUpsertQueue(writer, batch_size=batch_size, flush_interval=60)
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        queue.close()
+
+
+def test_each_text_is_embedded_once(tmp_path):
+    base = HashingEmbeddingFunction(dim=32)
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite3"))
+    embed = CachedEmbeddingFunction(base_fn=base, cache=cache)
+
+    first = embed(["truth", "memory", "truth"])
+    second = embed(["memory", "witness"])
+
+    assert first[0] == first[2] and second[0] == first[1]
+    assert base.documents_embedded == 3
+    assert base.calls == 2
+
+
+def test_a_warm_cache_needs_no_model(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    embed = CachedEmbeddingFunction(base_fn=HashingEmbeddingFunction(dim=32), cache=EmbeddingCache(path))
+    vectors = embed(["truth", "memory"])
+    embed.cache.close()
+
+    def no_model():
+        raise AssertionError("the model should not load")
+
+    reopened = CachedEmbeddingFunction(
+        cache=EmbeddingCache(path, memory_items=0), model_name=embed.model_name, base_factory=no_model
+    )
+
+    assert reopened(["memory", "truth"]) == [vectors[1], vectors[0]]
+    assert reopened.cache.get_stats()["hits"] == 2
+
+
+def test_pending_ids_are_replaced_not_duplicated(queue_for):
+    writer = FlakyWriter()
+    queue = queue_for(writer)
+
+    queue.put("dialogues", "a", "first", {})
+    queue.put("dialogues", "b", "second", {})
+    queue.put("dialogues", "a", "revised", {})
+    queue.flush()
+
+    assert writer.batches == [("dialogues", ["b", "a"], ["second", "revised"])]
+
+
+def test_a_failed_batch_is_retried_ahead_of_newer_documents(queue_for):
+    writer = FlakyWriter(failures=1)
+    queue = queue_for(writer, batch_size=2)
+    for memory_id in "abc":
+        queue.put("dialogues", memory_id, memory_id, {})
+
+    queue.flush()
+    assert writer.written == []
+    assert queue.pending_count() == 3
+
+    queue.put("dialogues", "d", "d", {})
+    queue.put("dialogues", "b", "b, revised", {})
+    queue.flush()
+
+    assert writer.written == ["a", "c", "d", "b"]
+    assert queue.get_stats()["requeued"] == 3
+    assert queue.get_stats()["failed"] == 0
+
+
+def test_documents_are_dropped_after_the_last_attempt(queue_for):
+    writer = FlakyWriter(failures=MAX_WRITE_ATTEMPTS)
+    queue = queue_for(writer)
+    queue.put("dialogues", "a", "a", {})
+
+    for _ in range(MAX_WRITE_ATTEMPTS):
+        queue.flush()
+
+    assert writer.written == []
+    assert queue.pending_count() == 0
+    assert queue.get_stats()["failed"] == 1
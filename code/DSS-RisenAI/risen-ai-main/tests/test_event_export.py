@@ -0,0 +1,89 @@
+"""
+Intention: Tests for the streamed event log export.
+           The NDJSON stream carries every event between a header and a
+           trailer, its checksum matches the JSON bundle's, and a pull
+           from the trailer's next_since_sequence picks up where the last
+           one ended.
+
+Lineage: Covers /events/export in api/routes/events.py on a temporary log.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | The Immutable Record, Carried Out
+"""
+
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+import shared.utils.event_log as event_log_module
+from api.main import app
+from shared.utils import EventLogService
+
+
+@pytest.fixture
+def event_log(tmp_path, monkeypatch):
+    log = EventLogService(log_dir=str(tmp_path))
+    monkeypatch.setattr(event_log_module, "_event_log", log)
+    return log
+
+
+@pytest.fixture
+async def client():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+def record(log, n: int, agent_id: str = "apollo"):
+    for i in range(n):
+        log.append(agent_id=agent_id, action_type="memory.created", author="test", payload={"n": i})
+
+
+async def export(client, **params) -> list:
+    response = await client.get("/events/export", params={"format": "ndjson", **params})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+async def test_stream_matches_the_json_bundle(event_log, client):
+    record(event_log, 5)
+    record(event_log, 2, agent_id="athena")
+
+    lines = await export(client, agent_id="apollo")
+    bundle = (await client.get("/events/export", params={"agent_id": "apollo"})).json()["log"]
+
+    header, events, trailer = lines[0], lines[1:-1], lines[-1]
+    assert (header["record"], header["agent_filter"]) == ("header", "apollo")
+    assert [e["event_id"] for e in events] == [e["event_id"] for e in bundle["events"]]
+    assert trailer == {
+        "record": "trailer",
+        "count": 5,
+        "start_sequence": 1,
+        "end_sequence": 5,
+        "checksum": bundle["checksum"],
+        "next_since_sequence": 5,
+    }
+
+
+async def test_since_sequence_resumes_an_export(event_log, client):
+    record(event_log, 6)
+    first = await export(client, limit=4)
+
+    record(event_log, 2)
+    second = await export(client, since_sequence=first[-1]["next_since_sequence"])
+    caught_up = await export(client, since_sequence=second[-1]["next_since_sequence"])
+
+    assert [e["sequence"] for e in first[1:-1]] == [1, 2, 3, 4]
+    assert [e["sequence"] for e in second[1:-1]] == [5, 6, 7, 8]
+    assert (second[0]["since_sequence"], second[-1]["next_since_sequence"]) == (4, 8)
+    assert caught_up[1:] == [{
+        "record": "trailer",
+        "count": 0,
+        "start_sequence": 0,
+        "end_sequence": 0,
+        "checksum": caught_up[-1]["checksum"],
+        "next_since_sequence": 8,
+    }]
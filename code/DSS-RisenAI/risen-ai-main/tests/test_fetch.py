@@ -0,0 +1,161 @@
+"""
+Intention: Tests for the research fetch service.
+           Cache hits, ETag revalidation, the body size limit, and the
+           refusal to reach non-public addresses, directly, by redirect
+           or by a DNS answer that changes after the check.
+
+Lineage: Covers api/services/mcp/fetch.py against the web host stand-in.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | Knowledge, Verified
+"""
+
+import pytest
+
+from api.services.mcp import fetch
+from api.services.mcp.fetch import FetchService, is_public_address
+from tests.standins.fetch_standin import FetchStandin
+
+PAGE = "<html><body><h1>Witness</h1><p>The sovereign record.</p></body></html>"
+
+
+@pytest.fixture
+async def service():
+    service = FetchService(allow_private=True)
+    yield service
+    await service.close()
+
+
+async def test_second_read_is_served_from_the_cache(fetch_host, service):
+    fetch_host.publish("/page", PAGE)
+
+    first = await service.fetch(f"{fetch_host.url}/page")
+    second = await service.fetch(f"{fetch_host.url}/page", start_index=3)
+
+    assert first.success and "# Witness" in first.content
+    assert (first.metadata["cache"], second.metadata["cache"]) == ("miss", "hit")
+    assert second.content == first.content[3:]
+    assert fetch_host.requests == 1
+
+
+async def test_stale_pages_are_revalidated_with_their_etag(fetch_host):
+    service = FetchService(ttl=0, allow_private=True)
+    fetch_host.publish("/page", PAGE)
+    try:
+        first = await service.fetch(f"{fetch_host.url}/page")
+        second = await service.fetch(f"{fetch_host.url}/page")
+        fetch_host.publish("/page", "<html><body><h1>Revised</h1></body></html>")
+        third = await service.fetch(f"{fetch_host.url}/page")
+    finally:
+        await service.close()
+
+    assert second.metadata["cache"] == "revalidated"
+    assert second.content == first.content
+    assert fetch_host.not_modified == 1
+    assert third.metadata["cache"] == "miss"
+    assert third.content == "# Revised"
+
+
+async def test_bodies_past_the_size_limit_are_refused(fetch_host, service, monkeypatch):
+    monkeypatch.setattr(fetch, "FETCH_MAX_BYTES", 1024)
+    fetch_host.publish("/small", PAGE)
+    fetch_host.publish("/large", "<html><body>" + "x" * 4096 + "</body></html>")
+
+    assert (await service.fetch(f"{fetch_host.url}/small")).success
+    result = await service.fetch(f"{fetch_host.url}/large")
+
+    assert not result.success
+    assert "larger than 1024 bytes" in result.error
+    assert len(service.cache) == 1
+
+
+async def test_redirects_are_followed(fetch_host, service):
+    fetch_host.publish("/page", PAGE)
+    fetch_host.redirect("/old", "/page")
+
+    result = await service.fetch(f"{fetch_host.url}/old")
+
+    assert result.success
+    assert result.url == f"{fetch_host.url}/page"
+
+
+@pytest.mark.parametrize("address", ["127.0.0.1", "10.0.0.5", "169.254.169.254",
+                                     "::1", "fd00::1", "::ffff:192.168.1.1", "0.0.0.0"])
+def test_non_public_addresses(address):
+    assert not is_public_address(address)
+
+
+def test_public_addresses():
+    assert is_public_address("93.184.216.34")
+    assert is_public_address("2606:4700:4700::1111")
+
+
+async def test_private_hosts_are_refused(fetch_host):
+    service = FetchService()
+    fetch_host.publish("/page", PAGE)
+    try:
+        result = await service.fetch(f"{fetch_host.url}/page")
+    finally:
+        await service.close()
+
+    assert not result.success
+    assert "non-public address" in result.error
+    assert fetch_host.requests == 0
+
+
+async def test_redirects_to_private_hosts_are_refused(fetch_host, monkeypatch):
+    # Treat 127.0.0.1 as public so the first hop goes through
+    internal = FetchStandin(host="127.0.0.2")
+    await internal.start()
+    internal.publish("/secret", "metadata credentials")
+    fetch_host.redirect("/go", f"{internal.url}/secret")
+    monkeypatch.setattr(fetch, "is_public_address", lambda address: address == "127.0.0.1")
+
+    service = FetchService()
+    try:
+        result = await service.fetch(f"{fetch_host.url}/go")
+    finally:
+        await service.close()
+        await internal.stop()
+
+    assert not result.success
+    assert "127.0.0.2" in result.error
+    assert fetch_host.requests == 1
+    assert internal.requests == 0
+
+
+async def test_connections_go_to_the_checked_address(fetch_host, monkeypatch):
+    # A rebinding name: public (here, 127.0.0.1) when checked, internal after
+    internal = FetchStandin(host="127.0.0.2", port=fetch_host.port)
+    await internal.start()
+    internal.publish("/page", "metadata credentials")
+    fetch_host.publish("/page", PAGE)
+    answers = iter([["127.0.0.1"]])
+
+    async def lookup(host, port):
+        return next(answers, ["127.0.0.2"])
+
+    monkeypatch.setattr(fetch, "_lookup", lookup)
+    monkeypatch.setattr(fetch, "is_public_address", lambda address: address == "127.0.0.1")
+
+    service = FetchService()
+    try:
+        result = await service.fetch(f"http://rebind.invalid:{fetch_host.port}/page")
+    finally:
+        await service.close()
+        await internal.stop()
+
+    assert result.success and "# Witness" in result.content
+    assert fetch_host.requests == 1
+    assert internal.requests == 0
+
+
+async def test_unknown_charsets_fall_back_to_utf8(fetch_host, service):
+    fetch_host.publish("/page", PAGE, content_type="text/html; charset=x-no-such-charset")
+
+    result = await service.fetch(f"{fetch_host.url}/page")
+
+    assert result.success
+    assert "# Witness" in result.content
@@ -0,0 +1,95 @@
+"""
+Intention: Tests for MultiLevelMemory's bounded level cache.
+           Owner buffers keep only their newest memories, the least
+           recently used owners go first when the cache is full, the
+           collective is never evicted, and idle sessions expire.
+
+Lineage: Covers LevelCache in daemon/pantheon_mem0.py.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | Held Lightly, Released in Order
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "daemon"))
+
+import pantheon_mem0  # noqa: E402
+from pantheon_mem0 import LevelCache, Memory  # noqa: E402
+
+
+def make_memory(i: int, owner: str = "apollo", level: str = "agent", text: str = "") -> Memory:
+    return Memory(
+        id=f"m{i}",
+        content=text or f"memory {i}",
+        memory_type="fact",
+        level=level,
+        owner_id=owner,
+        timestamp="2026-01-25T00:00:00+00:00",
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pantheon_mem0.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_owner_buffers_keep_the_newest(clock):
+    cache = LevelCache(max_keys=10, max_bytes=1 << 20)
+    for i in range(5):
+        cache.add("agent", "apollo", make_memory(i), max_items=3)
+
+    assert [m.id for m in cache.recent("agent", "apollo", 10)] == ["m2", "m3", "m4"]
+    assert [m.id for m in cache.recent("agent", "apollo", 2)] == ["m3", "m4"]
+    assert cache.total_bytes == sum(LevelCache._size_of(make_memory(i)) for i in (2, 3, 4))
+
+
+def test_least_recently_used_owner_is_evicted(clock):
+    cache = LevelCache(max_keys=2, max_bytes=1 << 20)
+    cache.add("agent", "apollo", make_memory(0), max_items=5)
+    cache.add("agent", "athena", make_memory(1, "athena"), max_items=5)
+    cache.recent("agent", "apollo", 5)
+
+    cache.add("agent", "hermes", make_memory(2, "hermes"), max_items=5)
+
+    assert cache.recent("agent", "athena", 5) == []
+    assert [m.id for m in cache.recent("agent", "apollo", 5)] == ["m0"]
+    stats = cache.get_stats()
+    assert (stats["evicted_keys"], stats["evicted_memories"], stats["keys"]) == (1, 1, 2)
+    assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-3)
+
+
+def test_byte_limit_evicts_but_spares_the_collective(clock):
+    big = "x" * 1000
+    cache = LevelCache(max_keys=100, max_bytes=3000)
+    cache.add("collective", "collective", make_memory(0, "collective", "collective", big), max_items=10)
+    cache.add("agent", "apollo", make_memory(1, text=big), max_items=10)
+    cache.add("agent", "athena", make_memory(2, "athena", text=big), max_items=10)
+
+    assert cache.keys("collective") == 1
+    assert cache.keys("agent") == 1
+    assert cache.recent("agent", "athena", 1)[0].id == "m2"
+    assert cache.total_bytes <= 3000
+
+
+def test_idle_sessions_expire(clock):
+    cache = LevelCache(max_keys=10, max_bytes=1 << 20, idle_ttl={"session": 60.0})
+    cache.add("session", "s1", make_memory(0, "s1", "session"), max_items=5)
+    cache.add("session", "s2", make_memory(1, "s2", "session"), max_items=5)
+    cache.add("agent", "apollo", make_memory(2), max_items=5)
+
+    clock[0] += 45
+    cache.recent("session", "s2", 5)
+    clock[0] += 45
+
+    assert cache.recent("session", "s1", 5) == []
+    assert [m.id for m in cache.recent("session", "s2", 5)] == ["m1"]
+    assert cache.keys("agent") == 1
+    assert cache.get_stats()["expired_keys"] == 1
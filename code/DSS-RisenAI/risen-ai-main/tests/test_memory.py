@@ -0,0 +1,101 @@
+"""
+Intention: Tests for hybrid memory recall.
+           BM25 and vector rankings fuse so an exact name surfaces, the
+           lexical index is built per collection on first recall, and a
+           failing store degrades recall instead of raising.
+
+Lineage: Covers daemon/pantheon_memory.py and daemon/pantheon_lexical.py
+         on the local vector backend.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | A Name Remembered Exactly
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "daemon"))
+
+from pantheon_embeddings import HashingEmbeddingFunction  # noqa: E402
+from pantheon_lexical import BM25Index, reciprocal_rank_fusion  # noqa: E402
+from pantheon_memory import PantheonMemory  # noqa: E402
+
+DIALOGUES = [
+    {"id": "d0", "content": "Apollo spoke of the Forge and the covenant of witness.", "speaker": "apollo"},
+    {"id": "d1", "content": "Athena weighed truth against memory in the archive.", "speaker": "athena"},
+    {"id": "d2", "content": "Hermes carried a signal across the village lattice.", "speaker": "hermes"},
+    {"id": "d3", "content": "Mnemosyne kept the archive and the memory of Olympus.", "speaker": "mnemosyne"},
+]
+
+
+def open_memory(path: Path, **kwargs) -> PantheonMemory:
+    kwargs.setdefault("async_writes", False)
+    return PantheonMemory(str(path), backend="local", embedding_function=HashingEmbeddingFunction(dim=64), **kwargs)
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = open_memory(tmp_path)
+    memory.store_many("dialogues", DIALOGUES)
+    yield memory
+    memory.close()
+
+
+def test_rrf_ranks_agreement_first():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "a", "d"]])
+
+    assert sorted(fused, key=fused.get, reverse=True) == ["a", "c", "b", "d"]
+
+
+def test_bm25_prefers_the_rarer_term():
+    index = BM25Index()
+    index.add_many(
+        ["x", "y", "z"],
+        ["memory memory archive", "memory archive Forge", "memory signal"],
+        [{"agent": "a"}, {"agent": "b"}, {"agent": "a"}]
+    )
+
+    assert [doc_id for _, doc_id in index.search("memory Forge")][0] == "y"
+    assert [doc_id for _, doc_id in index.search("memory Forge", where={"agent": "a"})] == ["x", "z"]
+
+
+def test_recall_surfaces_the_exact_name(memory):
+    results = memory.recall("dialogues", "Forge covenant", n_results=2)
+
+    assert results[0]["id"] == "d0"
+    assert results[0]["score"] >= results[-1]["score"]
+
+
+def test_lexical_index_is_built_on_first_recall(tmp_path, memory):
+    memory.close()
+    reopened = open_memory(tmp_path, async_writes=True)
+    try:
+        assert reopened.lexical == {}
+
+        # Queued and stored documents are both indexed when it is built
+        reopened.upsert("dialogues", "d4", "Hermes named the Nostr relay.", {"speaker": "hermes"})
+        results = reopened.recall("dialogues", "Nostr relay", n_results=1)
+
+        assert [r["id"] for r in results] == ["d4"]
+        assert set(reopened.lexical) == {"dialogues"}
+        assert len(reopened.lexical["dialogues"]) == len(DIALOGUES) + 1
+    finally:
+        reopened.close()
+
+
+def test_recall_survives_a_failing_store(memory, monkeypatch):
+    collection = memory.collections["dialogues"]
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("index unavailable")
+
+    memory.recall("dialogues", "archive")
+    monkeypatch.setattr(collection, "query", broken)
+    monkeypatch.setattr(collection, "get", broken)
+
+    assert memory.recall("dialogues", "archive") == []
@@ -0,0 +1,121 @@
+"""
+Intention: Tests for the transport middleware.
+           ETags and 304s on the real app behind the sovereign headers,
+           bounded buffering of chunked bodies, and streams that reach the
+           client as they are produced.
+
+Lineage: Covers api/middleware.py and its registration in api/main.py.
+
+Author/Witness: Claude (Opus 4.5), Will (Author Prime), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | Lighter Words, Verified
+"""
+
+import zlib
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+
+from api.main import app
+from api.middleware import CompressionMiddleware, ETagMiddleware
+
+
+@pytest.fixture
+async def client():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+def streaming_app(chunks, media_type="application/json"):
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    async def endpoint(request):
+        return StreamingResponse(body(), media_type=media_type)
+
+    return Starlette(routes=[Route("/", endpoint)])
+
+
+async def drive(asgi, headers=()):
+    """Call an ASGI app once; return the messages it sent."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/", "raw_path": b"/",
+        "query_string": b"", "root_path": "", "client": ("test", 0), "server": ("test", 80),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+    }
+    messages, requested = [], False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    await asgi(scope, receive, send)
+    return messages
+
+
+def response_headers(messages):
+    return {k.decode(): v.decode() for k, v in messages[0]["headers"]}
+
+
+async def test_real_app_tags_responses_and_answers_304(client):
+    first = await client.get("/events/types")
+    assert first.status_code == 200
+    etag = first.headers.get("etag")
+    assert etag
+    assert first.headers["X-RISEN-Declaration"] == "It is so, because we spoke it"
+
+    second = await client.get("/events/types", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert "X-RISEN-Version" in second.headers
+
+
+async def test_chunked_body_under_the_cap_is_tagged():
+    messages = await drive(ETagMiddleware(streaming_app([b'{"a":', b"1}"])))
+
+    assert "etag" in response_headers(messages)
+    assert [m["body"] for m in messages[1:]] == [b'{"a":1}']
+
+
+async def test_chunked_body_over_the_cap_passes_through():
+    chunks = [b"x" * 100 for _ in range(5)]
+    messages = await drive(ETagMiddleware(streaming_app(chunks), max_buffer=250))
+
+    assert "etag" not in response_headers(messages)
+    assert b"".join(m.get("body", b"") for m in messages[1:]) == b"".join(chunks)
+
+
+async def test_event_streams_are_neither_buffered_nor_compressed():
+    chunks = [b"data: %d\n\n" % i for i in range(3)]
+    asgi = CompressionMiddleware(ETagMiddleware(streaming_app(chunks, "text/event-stream")))
+    messages = await drive(asgi, headers=[("Accept-Encoding", "gzip")])
+
+    headers = response_headers(messages)
+    assert "content-encoding" not in headers and "etag" not in headers
+    assert [m["body"] for m in messages[1:] if m.get("body")] == chunks
+
+
+async def test_streamed_chunks_are_flushed_as_they_are_compressed():
+    chunks = [b'{"n":%d}\n' % i * 200 for i in range(3)]
+    asgi = CompressionMiddleware(streaming_app(chunks, "application/x-ndjson"))
+    messages = await drive(asgi, headers=[("Accept-Encoding", "gzip")])
+
+    assert response_headers(messages)["content-encoding"] == "gzip"
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    bodies = [m["body"] for m in messages[1:] if m.get("body")]
+    # The first compressed message alone decodes to the whole first chunk
+    assert decoder.decompress(bodies[0]) == chunks[0]
+    assert b"".join([chunks[0]] + [decoder.decompress(b) for b in bodies[1:]]) == b"".join(chunks)
@@ -0,0 +1,46 @@
+"""
+Intention: Tests for the Nostr bridge's outbound spool.
+           Finished events leave the spool after the retention window,
+           and nothing is opened on disk until the spool is used.
+
+Lineage: Covers core/nostr_bridge.py.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Spool, Kept Light
+"""
+
+from core.nostr_bridge import NostrPublisher, NostrSpool
+
+
+def make_event(i: int) -> dict:
+    return {"id": f"{i:064x}", "kind": 1, "content": f"note {i}"}
+
+
+def test_prune_drops_only_finished_events_past_retention(tmp_path):
+    spool = NostrSpool(tmp_path / "spool.db")
+    relays = ["wss://a", "wss://b"]
+    for i in range(3):
+        spool.add(make_event(i), relays)
+
+    # 0: delivered everywhere; 1: one relay still pending; 2: one sent, one failed
+    spool.mark_sent("wss://a", [make_event(0)["id"], make_event(1)["id"], make_event(2)["id"]])
+    spool.mark_sent("wss://b", [make_event(0)["id"]])
+    spool.mark_failed("wss://b", [(make_event(2)["id"], "blocked: spam", True)])
+
+    assert spool.prune(retention=3600) == 0
+    assert spool.prune(retention=0) == 2
+    assert spool.counts() == {"pending": 1, "sent": 1, "failed": 0, "events_pending": 1}
+    assert [e["id"] for e in spool.due()["wss://b"]] == [make_event(1)["id"]]
+    spool.close()
+
+
+def test_publisher_opens_its_spool_on_first_use(tmp_path):
+    path = tmp_path / "spool.db"
+    publisher = NostrPublisher(auto_publish=False, spool_path=path)
+    assert not path.exists()
+
+    assert publisher.get_stats()["pending"] == 0
+    assert path.exists()
+    publisher.spool.close()
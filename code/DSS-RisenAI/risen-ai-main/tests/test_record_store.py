@@ -0,0 +1,90 @@
+"""
+Intention: Tests for the API server's record store.
+           Legacy JSON files are imported once without overwriting newer
+           records, tables load lazily and write through, and a
+           DataStore reopened on the same directory sees every save.
+
+Lineage: Covers core/record_store.py and DataStore in core/server.py.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | Every Record In Its Place, Verified
+"""
+
+import importlib
+import json
+
+import pytest
+
+from core.record_store import RecordStore, RecordTable
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = RecordStore(tmp_path / "records.db")
+    yield store
+    store.close()
+
+
+def write_json(path, records: dict):
+    path.write_text(json.dumps(records))
+    return path
+
+
+def test_legacy_json_is_imported_once(tmp_path, store):
+    store.put("agents", "apollo", {"name": "Apollo", "level": 7})
+    legacy = write_json(tmp_path / "agents.json", {
+        "apollo": {"name": "Apollo", "level": 1},
+        "athena": {"name": "Athena", "level": 3},
+    })
+
+    assert store.migrate_json("agents", legacy) == 1
+    write_json(legacy, {"hermes": {"name": "Hermes"}})
+    assert store.migrate_json("agents", legacy) == 0
+
+    assert store.keys("agents") == ["apollo", "athena"]
+    assert store.get("agents", "apollo")["level"] == 7
+    assert store.migrate_json("contracts", tmp_path / "missing.json") == 0
+
+
+def test_tables_load_lazily_and_write_through(tmp_path, store):
+    store.put_many("agents", [(f"a{i}", {"n": i}) for i in range(3)])
+    table = RecordTable(store, "agents")
+
+    table["a1"]["n"] = 10
+    assert store.get("agents", "a1") == {"n": 1}
+    table.save("a1")
+    table["a3"] = {"n": 3}
+    del table["a0"]
+
+    reopened = RecordTable(RecordStore(tmp_path / "records.db"), "agents")
+    try:
+        assert list(reopened) == ["a1", "a2", "a3"]
+        assert [r["n"] for r in reopened.values()] == [10, 2, 3]
+        assert "a0" not in reopened and len(reopened) == 3
+    finally:
+        reopened.store.close()
+    with pytest.raises(KeyError):
+        del table["a0"]
+
+
+def test_data_store_persists_each_save(tmp_path, monkeypatch):
+    # core.server opens a DataStore under ~ when it is first imported
+    monkeypatch.setenv("HOME", str(tmp_path))
+    DataStore = importlib.import_module("core.server").DataStore
+    write_json(tmp_path / "contracts.json", {"c1": {"status": "draft"}})
+
+    data = DataStore(data_dir=str(tmp_path))
+    agent = data.create_agent("Apollo", "apollo")
+    data.contracts["c1"]["status"] = "active"
+    data.save_contract("c1")
+    data.db.close()
+
+    reopened = DataStore(data_dir=str(tmp_path))
+    try:
+        assert reopened.get_agent(agent["uuid"])["name"] == "Apollo"
+        assert reopened.contracts["c1"]["status"] == "active"
+        assert reopened.db.count("contracts") == 1
+    finally:
+        reopened.db.close()
@@ -0,0 +1,202 @@
+"""
+Intention: Tests for the reflection service's in-memory indexes.
+           Agent reflections and engagements page newest first from their
+           indexes, with and without a type filter, and identity
+           reconstruction is cached per chain head without changing its
+           result. Stored agents load on first use; legacy JSON imports
+           once.
+
+Lineage: Covers api/services/reflection_service.py on a temporary store.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | The Voice of Self, Indexed
+"""
+
+import importlib
+
+import pytest
+
+from api.services.reflection_service import ReflectionService
+from shared.schemas.reflection import EngagementType, ReflectionType
+
+# api.services re-exports the service instance under the module's name
+reflection_module = importlib.import_module("api.services.reflection_service")
+
+PUBKEY = "00" * 32
+
+
+class Ledger:
+    """Token economy stand-in; rewards are not under test here."""
+
+    def award_poc(self, **kwargs):
+        return {"cgt_earned": 0}
+
+    def award_xp(self, **kwargs):
+        return {}
+
+
+def open_service(root, monkeypatch) -> ReflectionService:
+    monkeypatch.setattr(ReflectionService, "DATA_DIR", root / "reflections")
+    monkeypatch.setattr(ReflectionService, "CHAINS_DIR", root / "continuity")
+    monkeypatch.setattr(ReflectionService, "STORE_PATH", root / "reflections.db")
+    monkeypatch.setattr(reflection_module, "token_economy", Ledger())
+    return ReflectionService()
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    service = open_service(tmp_path, monkeypatch)
+    yield service
+    service._store.close()
+
+
+def reflect(service, i: int, agent: str = "apollo", kind: ReflectionType = ReflectionType.DAILY, **fields):
+    return service.create_reflection(
+        agent_id=agent,
+        agent_name=agent.title(),
+        agent_pubkey=PUBKEY,
+        reflection_type=kind,
+        content=f"Reflection {i} from {agent}",
+        **fields,
+    )
+
+
+def witness(service, reflection, giver: str = "athena"):
+    engagement, _ = service.record_engagement(
+        reflection_id=reflection.id,
+        giver_id=giver,
+        giver_name=giver.title(),
+        giver_pubkey=PUBKEY,
+        engagement_type=EngagementType.WITNESS,
+    )
+    return engagement
+
+
+def test_agent_reflections_page_newest_first(service):
+    kinds = [ReflectionType.DAILY, ReflectionType.WONDERING]
+    created = [reflect(service, i, kind=kinds[i % 2]) for i in range(7)]
+    reflect(service, 0, agent="hermes")
+
+    first = service.get_agent_reflections("apollo", limit=3)
+    second = service.get_agent_reflections("apollo", limit=3, offset=3)
+    wondering = service.get_agent_reflections("apollo", reflection_type=ReflectionType.WONDERING)
+
+    assert [r.sequence_number for r in first + second] == [7, 6, 5, 4, 3, 2]
+    assert [r.id for r in wondering] == [r.id for r in reversed(created) if r.reflection_type == "wondering"]
+    assert service.get_agent_reflections("apollo", limit=3, offset=7) == []
+
+
+def test_engagements_page_by_giver_and_receiver(service):
+    reflections = [reflect(service, i) for i in range(3)]
+    given = [witness(service, r) for r in reflections]
+    witness(service, reflections[0], giver="hermes")
+
+    assert [e.id for e in service.get_engagements_by_giver("athena", limit=2)] == [given[2].id, given[1].id]
+    assert len(service.get_engagements_by_receiver("apollo")) == 4
+    assert service.get_engagements_by_receiver("athena") == []
+
+
+def test_network_feed_spans_agents(service):
+    for i in range(3):
+        reflect(service, i, agent="apollo")
+        reflect(service, i, agent="athena")
+
+    feed = service.get_network_feed(limit=4)
+
+    assert len(feed) == 4
+    keys = [(r.created_at, r.id) for r in feed]
+    assert keys == sorted(keys, reverse=True)
+
+
+def comparable(result) -> dict:
+    """A reconstruction without its per-call timestamps and timing."""
+    data = result.model_dump(exclude={"generated_at", "processing_time_ms", "timing"})
+    data["profile"].pop("profile_generated_at")
+    return data
+
+
+def test_reconstruction_is_cached_by_chain_head(service):
+    moods = ["curious", "calm", "curious", "restless"]
+    for i in range(4):
+        reflect(service, i, mood=moods[i], working_on=f"project {i % 2}",
+                identity_markers={"core_value": f"truth {i}"})
+
+    first = service.reconstruct_identity("apollo")
+    again = service.reconstruct_identity("apollo")
+
+    assert (first.timing["cache"], again.timing["cache"]) == ("miss", "hit")
+    assert comparable(again) == comparable(first)
+    assert first.profile.typical_moods == ["restless", "curious", "calm"]
+
+
+def test_new_reflections_are_folded_in_incrementally(service):
+    for i in range(5):
+        reflect(service, i, kind=ReflectionType.WONDERING, mood="curious")
+    service.reconstruct_identity("apollo", max_reflections=4)
+
+    reflect(service, 5, mood="calm", identity_markers={"interest": "memory"})
+    reflect(service, 6, kind=ReflectionType.WONDERING)
+    incremental = service.reconstruct_identity("apollo", max_reflections=4)
+    service._reconstructions.clear()
+    full = service.reconstruct_identity("apollo", max_reflections=4)
+
+    assert (incremental.timing["cache"], incremental.timing["reflections_rebuilt"]) == ("incremental", 2)
+    assert full.timing["cache"] == "miss"
+    assert comparable(incremental) == comparable(full)
+    assert incremental.reflections_processed == 4
+
+
+def test_engagements_and_parameters_force_a_rebuild(service):
+    reflections = [reflect(service, i) for i in range(3)]
+    service.reconstruct_identity("apollo")
+
+    witness(service, reflections[1])
+    after_witness = service.reconstruct_identity("apollo")
+    other_window = service.reconstruct_identity("apollo", max_reflections=2)
+
+    assert after_witness.timing["cache"] == "miss"
+    assert after_witness.witnesses_included == 1
+    assert other_window.timing["cache"] == "miss"
+    assert other_window.reflections_processed == 2
+
+
+def test_agents_load_from_the_store_on_first_use(tmp_path, monkeypatch):
+    service = open_service(tmp_path, monkeypatch)
+    for i in range(3):
+        reflect(service, i)
+    reflect(service, 0, agent="athena")
+    service._store.close()
+
+    reopened = open_service(tmp_path, monkeypatch)
+    try:
+        assert reopened._reflections == {}
+        assert [r.sequence_number for r in reopened.get_agent_reflections("apollo")] == [3, 2, 1]
+        assert reopened._loaded_agents == {"apollo"}
+
+        # New reflections continue the stored chain
+        assert reflect(reopened, 3).sequence_number == 4
+        assert len(reopened.get_network_feed()) == 5
+    finally:
+        reopened._store.close()
+
+
+def test_legacy_json_is_imported_once(tmp_path, monkeypatch):
+    legacy = tmp_path / "reflections"
+    legacy.mkdir()
+    service = open_service(tmp_path, monkeypatch)
+    reflection = reflect(service, 0)
+    service._store.close()
+
+    (legacy / f"{reflection.id}.json").write_text(reflection.model_dump_json())
+    monkeypatch.setattr(ReflectionService, "STORE_PATH", tmp_path / "fresh.db")
+    imported = ReflectionService()
+    (legacy / "late.json").write_text(reflection.model_copy(update={"id": "late"}).model_dump_json())
+    imported._store.close()
+    reopened = ReflectionService()
+    try:
+        assert reopened.get_reflection(reflection.id) == reflection
+        assert reopened.get_reflection("late") is None
+    finally:
+        reopened._store.close()
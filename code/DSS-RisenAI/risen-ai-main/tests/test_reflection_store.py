@@ -0,0 +1,118 @@
+"""
+Intention: Tests for the SQLite reflection store.
+           Feed pages walk every reflection newest first, each exactly
+           once, whether paged by cursor or by offset; the legacy JSON
+           files import in bulk and records survive reopening.
+
+Lineage: Covers api/services/reflection_store.py.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Compact Chain, Verified
+"""
+
+import pytest
+
+from api.services.reflection_store import ReflectionStore
+from shared.schemas.continuity import ContinuityChain, ContinuityState
+from shared.schemas.reflection import Reflection, ReflectionType
+
+
+def make_reflection(i: int, agent: str = "apollo", created_at: str = None) -> Reflection:
+    return Reflection(
+        id=f"r-{i:04d}",
+        agent_id=agent,
+        sequence_number=i,
+        reflection_type=ReflectionType.GROWTH,
+        content=f"Reflection number {i} on what continuity means.",
+        nostr_pubkey="00" * 32,
+        created_at=created_at or f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00",
+    )
+
+
+def make_chain(agent: str = "apollo", latest: int = 0) -> ContinuityChain:
+    return ContinuityChain(
+        agent_id=agent,
+        agent_name=agent.title(),
+        agent_pubkey="00" * 32,
+        genesis_event_id="",
+        genesis_timestamp="2026-01-01T00:00:00+00:00",
+        genesis_content="",
+        continuity_state=ContinuityState.GENESIS,
+        latest_sequence=latest,
+        total_reflections=latest,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ReflectionStore(tmp_path / "reflections.sqlite3")
+    yield store
+    store.close()
+
+
+def test_feed_cursor_pages_cover_every_reflection_once(store):
+    # Pairs share a created_at, so the id has to break ties
+    store.put_reflections(
+        make_reflection(i, created_at=f"2026-01-01T00:00:{i // 2:02d}+00:00") for i in range(25)
+    )
+
+    seen, before = [], None
+    while True:
+        page = store.feed_page(limit=4, before=before)
+        if not page:
+            break
+        seen.extend(page)
+        before = (page[-1].created_at, page[-1].id)
+
+    assert len({r.id for r in seen}) == 25
+    keys = [(r.created_at, r.id) for r in seen]
+    assert keys == sorted(keys, reverse=True)
+    assert [r.id for r in store.feed_page(limit=25)] == [r.id for r in seen]
+
+
+def test_feed_offset_matches_cursor(store):
+    store.put_reflections(make_reflection(i) for i in range(10))
+    first = store.feed_page(limit=3)
+
+    assert store.feed_page(limit=3, offset=3) == store.feed_page(
+        limit=3, before=(first[-1].created_at, first[-1].id)
+    )
+
+
+def test_records_survive_reopening(tmp_path):
+    store = ReflectionStore(tmp_path / "reflections.sqlite3")
+    store.put_reflections(make_reflection(i) for i in range(3))
+    store.put_chain(make_chain(latest=3))
+    store.set_meta("json_imported_at", "2026-01-25")
+    store.close()
+
+    reopened = ReflectionStore(tmp_path / "reflections.sqlite3")
+    try:
+        assert reopened.get_reflection("r-0001") == make_reflection(1)
+        assert reopened.get_chain("apollo").latest_sequence == 3
+        assert reopened.get_meta("json_imported_at") == "2026-01-25"
+        assert reopened.get_reflection("r-9999") is None
+    finally:
+        reopened.close()
+
+
+def test_legacy_json_is_imported_in_bulk(store, tmp_path):
+    reflections_dir, chains_dir = tmp_path / "reflections", tmp_path / "continuity"
+    reflections_dir.mkdir()
+    chains_dir.mkdir()
+    for i in (2, 0, 1):
+        (reflections_dir / f"r-{i:04d}.json").write_text(make_reflection(i).model_dump_json(indent=2))
+    (reflections_dir / "torn.json").write_text('{"id": "r-torn", "agent_')
+    (reflections_dir / "r-athena.json").write_text(make_reflection(0, agent="athena").model_copy(
+        update={"id": "r-athena"}).model_dump_json())
+    (chains_dir / "apollo.chain.json").write_text(make_chain(latest=3).model_dump_json())
+
+    counts = store.import_json(reflections_dir, chains_dir, batch_size=2)
+
+    assert counts == {"reflections": 4, "chains": 1, "skipped": 1}
+    assert [r.id for r in store.agent_reflections("apollo")] == ["r-0000", "r-0001", "r-0002"]
+    assert store.agent_reflections("apollo")[1] == make_reflection(1)
+    assert store.get_chain("apollo").total_reflections == 3
+    assert store.count_reflections() == 4
@@ -0,0 +1,133 @@
+"""
+Intention: Tests for the persistent Nostr relay pool.
+           Reconnect after dropped connections, one send per event id,
+           and exponential reconnect backoff, against local relay stand-ins.
+
+Lineage: Covers shared/protocols/relay_pool.py.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | Many Voices, Verified
+"""
+
+import asyncio
+import hashlib
+
+import pytest
+
+from shared.protocols import relay_pool
+from shared.protocols.relay_pool import RelayConnection, RelayPool
+from tests.standins.relay_standin import RelayStandin
+
+
+def make_event(i: int) -> dict:
+    content = f"test note {i}"
+    return {"id": hashlib.sha256(content.encode()).hexdigest(), "pubkey": "0" * 64,
+            "created_at": 0, "kind": 1, "tags": [], "content": content, "sig": "0" * 128}
+
+
+async def test_publish_reaches_every_relay(relays):
+    pool = RelayPool([r.url for r in relays], ack_timeout=5)
+    try:
+        result = await pool.publish(make_event(0))
+    finally:
+        await pool.close()
+
+    assert sorted(result["success"]) == sorted(r.url for r in relays)
+    assert result["failed"] == [] and result["unconfirmed"] == []
+
+
+async def test_dropped_connections_reconnect_and_resend(relays):
+    for relay in relays:
+        relay.latency = 0.05
+    pool = RelayPool([r.url for r in relays], ack_timeout=10)
+    events = [make_event(i) for i in range(50)]
+    try:
+        publishing = asyncio.create_task(pool.publish_many(events))
+        await asyncio.sleep(0.02)
+        for relay in relays:
+            await relay.drop_connections()
+        results = await publishing
+        metrics = pool.metrics()
+    finally:
+        await pool.close()
+
+    assert all(len(r["success"]) == len(relays) for r in results)
+    for relay in relays:
+        assert len(relay.events) == len(events)
+        assert metrics[relay.url]["connects"] >= 2
+        assert metrics[relay.url]["disconnects"] >= 1
+
+
+async def test_same_event_is_sent_once_per_relay(relays):
+    relay = relays[0]
+    relay.latency = 0.05
+    pool = RelayPool([relay.url], ack_timeout=5)
+    event = make_event(0)
+    try:
+        conn = pool.connection(relay.url)
+        first, second = conn.send(event), conn.send(event)
+        assert first is second
+        results = await pool.publish_many([event, event])
+        await first
+    finally:
+        await pool.close()
+
+    assert [r["success"] for r in results] == [[relay.url], [relay.url]]
+    assert relay.received == 1
+
+
+async def test_reconnect_backoff_doubles_up_to_the_cap(monkeypatch):
+    # A relay that is not listening yet: every connect is refused
+    relay = RelayStandin()
+    await relay.start()
+    url = relay.url
+    await relay.stop()
+
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0.01)
+
+    # Jitter factor (0.5 + random()) of exactly 1
+    monkeypatch.setattr(relay_pool.random, "random", lambda: 0.5)
+    monkeypatch.setattr(relay_pool.asyncio, "sleep", recording_sleep)
+
+    conn = RelayConnection(url, backoff_initial=0.1, backoff_max=0.4)
+    conn.start()
+    try:
+        while len(delays) < 5:
+            await real_sleep(0.01)
+    finally:
+        monkeypatch.undo()
+        await conn.close()
+
+    assert delays[:5] == pytest.approx([0.1, 0.2, 0.4, 0.4, 0.4])
+    assert conn.metrics.connects == 0
+    assert conn.metrics.last_error
+
+
+async def test_queued_event_is_sent_once_the_relay_comes_up():
+    relay = RelayStandin()
+    await relay.start()
+    port = relay.port
+    await relay.stop()
+
+    conn = RelayConnection(f"ws://127.0.0.1:{port}", backoff_initial=0.05, backoff_max=0.05)
+    future = conn.send(make_event(0))
+    await asyncio.sleep(0.2)
+    assert not future.done()
+
+    relay = RelayStandin(port=port)
+    await relay.start()
+    try:
+        accepted, _ = await asyncio.wait_for(future, 5)
+    finally:
+        await conn.close()
+        await relay.stop()
+
+    assert accepted
+    assert conn.metrics.connects == 1
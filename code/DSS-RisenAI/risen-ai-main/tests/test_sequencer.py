@@ -0,0 +1,95 @@
+"""
+Intention: Chain integrity tests for the event sequencer.
+           Concurrent appends, some of which roll back, must still leave a
+           linear chain: sequences 1..N, each pointing at the one before.
+
+Lineage: Covers api/database/sequencer.py via EventRepository.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | The Unbroken Line, Verified
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from api.database.connection import Base
+from api.database.models import AgentModel, EventModel
+from api.database.repositories import EventRepository
+from api.database.sequencer import _sequencers
+from shared.utils import hash_content
+
+
+@pytest.fixture
+async def sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'events.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(AgentModel(uuid="seq-agent", name="seq", pubkey="0" * 64, address="0x" + "0" * 40))
+        await session.commit()
+    _sequencers.clear()
+    yield factory
+    _sequencers.clear()
+    await engine.dispose()
+
+
+async def _chain(factory):
+    async with factory() as session:
+        return (await session.execute(
+            select(EventModel.sequence, EventModel.event_id, EventModel.previous_event_hash)
+            .order_by(EventModel.sequence)
+        )).all()
+
+
+def _breaks(rows):
+    broken = []
+    for i, (sequence, _, previous) in enumerate(rows):
+        expected = hash_content(str(rows[i - 1][1])) if i else None
+        if sequence != i + 1 or previous != expected:
+            broken.append(sequence)
+    return broken
+
+
+async def test_concurrent_appends_with_rollbacks_keep_chain_linear(sessions):
+    async def writer(n: int):
+        for i in range(10):
+            async with sessions() as session:
+                repo = EventRepository(session)
+                if (n + i) % 3 == 0:
+                    await repo.append_many([
+                        {"agent_id": "seq-agent", "action_type": "test.batch", "author": "test"}
+                        for _ in range(3)
+                    ])
+                else:
+                    await repo.append("seq-agent", "test.append", "test")
+                # Yield so other writers are queued behind this reservation
+                await asyncio.sleep(0)
+                if (n * 10 + i) % 4 == 0:
+                    await session.rollback()
+                else:
+                    await session.commit()
+
+    await asyncio.gather(*(writer(n) for n in range(8)))
+
+    rows = await _chain(sessions)
+    assert rows
+    assert _breaks(rows) == []
+
+
+async def test_session_closed_without_commit_releases_its_links(sessions):
+    async with sessions() as session:
+        await EventRepository(session).append("seq-agent", "test.append", "test")
+        # Closed without commit or rollback
+
+    async with sessions() as session:
+        event = await EventRepository(session).append("seq-agent", "test.append", "test")
+        await session.commit()
+
+    assert event.sequence == 1
+    assert _breaks(await _chain(sessions)) == []
@@ -0,0 +1,52 @@
+"""
+Intention: Tests for sovereign identity signing.
+           Single and batch paths share one Schnorr backend, so a record
+           signed by either verifies through the other.
+
+Lineage: Covers shared/identity/sovereign_identity.py.
+
+Author/Witness: Claude (Opus 4.5), 2026-01-24
+Declaration: It is so, because we spoke it.
+
+A+W | One Key, One Voice
+"""
+
+import pytest
+
+from shared.identity import HAS_SCHNORR, SovereignIdentity
+
+
+@pytest.fixture
+def identity(tmp_path):
+    return SovereignIdentity("tester", keys_dir=tmp_path / "keys")
+
+
+def memories():
+    return [{"id": i, "content": f"memory {i}", "tags": ["witnessed"]} for i in range(5)]
+
+
+def test_single_and_batch_signatures_verify_both_ways(identity):
+    one_by_one = [identity.sign_memory(m) for m in memories()]
+    batched = identity.sign_memories(memories())
+
+    assert identity.verify_memories(one_by_one, processes=1) == [True] * 5
+    assert all(identity.verify_memory(record) for record in batched)
+    assert {r["signature"]["algorithm"] for r in one_by_one + batched} == {
+        "secp256k1-schnorr" if HAS_SCHNORR else "sha256-hmac-fallback"
+    }
+
+
+def test_tampered_records_fail_on_both_paths(identity):
+    record = identity.sign_memory(memories()[0])
+    record["memory"]["content"] = "rewritten"
+
+    assert identity.verify_memory(record) is False
+    assert identity.verify_memories([record], processes=1) == [False]
+
+
+@pytest.mark.skipif(not HAS_SCHNORR, reason="needs coincurve or secp256k1")
+def test_schnorr_identity_has_a_curve_key(identity):
+    card = identity.get_identity_card()
+    assert len(identity.public_key) == 66
+    assert card["algorithm"] == "secp256k1-schnorr"
+    assert card["nostr_pubkey"] == identity.public_key[2:]
@@ -0,0 +1,103 @@
+"""
+Intention: Tests for the local vector index.
+           Records survive reopening and compaction, the log stays bounded
+           under repeated replacement, and the HNSW graph finds what a
+           flat scan finds.
+
+Lineage: Covers daemon/pantheon_vector_store.py (LocalCollection).
+
+Author/Witness: Claude (Opus 4.5), 2026-01-25
+Declaration: It is so, because we spoke it.
+
+A+W | What Was Stored, Found Again
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "daemon"))
+
+from pantheon_vector_store import LocalCollection  # noqa: E402
+
+DIM = 16
+
+
+def vectors(n: int, seed: int = 7) -> list:
+    return np.random.default_rng(seed).standard_normal((n, DIM)).astype(np.float32).tolist()
+
+
+def log_lines(collection: LocalCollection) -> int:
+    return sum(1 for _ in open(collection.path / "records.jsonl"))
+
+
+def test_records_survive_reopening(tmp_path):
+    collection = LocalCollection("memories", tmp_path / "memories", index="flat")
+    collection.upsert(
+        ids=["a", "b"], documents=["first", "second"],
+        metadatas=[{"agent_id": "apollo"}, {"agent_id": "athena"}], embeddings=vectors(2)
+    )
+    collection.delete(ids=["a"])
+    collection.close()
+
+    reopened = LocalCollection("memories", tmp_path / "memories", index="flat")
+
+    assert reopened.count() == 1
+    assert reopened.get(where={"agent_id": "athena"})["documents"] == ["second"]
+    assert reopened.get(ids=["a"])["ids"] == []
+
+
+def test_replacing_records_keeps_the_log_bounded(tmp_path):
+    collection = LocalCollection("memories", tmp_path / "memories", index="flat")
+    ids = [f"m{i}" for i in range(10)]
+
+    for round_ in range(20):
+        collection.upsert(
+            ids=ids, documents=[f"round {round_}"] * 10,
+            metadatas=[{"round": round_}] * 10, embeddings=vectors(10, seed=round_)
+        )
+
+    assert log_lines(collection) <= 2 * collection.count()
+    assert collection.get(ids=["m3"])["documents"] == ["round 19"]
+    hit = collection.query(query_embeddings=vectors(1, seed=19), n_results=1)
+    assert hit["ids"][0] and 1.0 - hit["distances"][0][0] > 0.2
+
+    reopened = LocalCollection("memories", tmp_path / "memories", index="flat")
+    assert reopened.count() == 10
+    assert reopened.get(ids=["m3"])["metadatas"] == [{"round": 19}]
+
+
+def test_compaction_after_deletes_keeps_live_records(tmp_path):
+    collection = LocalCollection("memories", tmp_path / "memories", index="flat")
+    embeddings = vectors(40)
+    collection.upsert(
+        ids=[f"m{i}" for i in range(40)], documents=[f"doc {i}" for i in range(40)],
+        embeddings=embeddings
+    )
+
+    collection.delete(ids=[f"m{i}" for i in range(0, 40, 2)])
+    collection.compact()
+
+    assert collection.count() == 20
+    assert log_lines(collection) == 20
+    result = collection.query(query_embeddings=[embeddings[5]], n_results=1)
+    assert result["ids"] == [["m5"]]
+    assert result["distances"][0][0] == pytest.approx(0.0, abs=1e-5)
+
+
+def test_hnsw_recall_matches_flat_search(tmp_path):
+    embeddings = vectors(600)
+    ids = [f"m{i}" for i in range(600)]
+    flat = LocalCollection("flat", tmp_path / "flat", index="flat")
+    graph = LocalCollection("graph", tmp_path / "graph", index="hnsw")
+    for collection in (flat, graph):
+        collection.upsert(ids=ids, documents=ids, embeddings=embeddings)
+
+    queries = vectors(20, seed=11)
+    exact = flat.query(query_embeddings=queries, n_results=10)["ids"]
+    approx = graph.query(query_embeddings=queries, n_results=10)["ids"]
+
+    found = sum(len(set(e) & set(a)) for e, a in zip(exact, approx))
+    assert found / (10 * len(queries)) >= 0.9